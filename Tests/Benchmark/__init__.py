@@ -0,0 +1,9 @@
+# -*- coding: utf-8 -*-
+"""Benchmarks of the core simulation pipelines
+
+They are excluded by default (addopts of pytest.ini), run them with:
+python -m pytest Tests/Benchmark -m benchmark
+The timings are saved in Tests/Results/Benchmark/benchmark.json (or in the
+folder of the environment variable PYLEECAN_BENCHMARK_DIR) and two result files
+can be compared with: python Tests/Benchmark/compare_benchmark.py ref.json new.json
+"""
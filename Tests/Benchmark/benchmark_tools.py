@@ -0,0 +1,280 @@
+# -*- coding: utf-8 -*-
+import json
+import platform
+from datetime import datetime
+from os import cpu_count, makedirs
+from os.path import dirname, isdir
+from statistics import mean, median, pstdev
+from subprocess import DEVNULL, check_output
+from time import perf_counter
+
+import numpy as np
+import scipy
+import SciDataTool
+from SciDataTool import Data1D
+
+import pyleecan
+from pyleecan.Classes.CellMat import CellMat
+from pyleecan.Classes.MeshMat import MeshMat
+from pyleecan.Classes.MeshSolution import MeshSolution
+from pyleecan.Classes.NodeMat import NodeMat
+from pyleecan.Classes.RefTriangle3 import RefTriangle3
+from pyleecan.Functions.MeshSolution.build_solution_vector import (
+    build_solution_vector,
+)
+from pyleecan.definitions import MAIN_DIR
+
+# Version of the result file format
+BENCHMARK_VERSION = 1
+
+
+class Benchmark(object):
+    """Time a function over several rounds (same call API as the benchmark
+    fixture of pytest-benchmark: benchmark(fct, *args, **kwargs) and
+    benchmark.pedantic(fct, args, kwargs, setup, rounds, warmup_rounds))"""
+
+    def __init__(self, name, group=None, min_rounds=5, max_time=1.0, warmup_rounds=1):
+        """Create a Benchmark
+
+        Parameters
+        ----------
+        name : str
+            name of the benchmark (test name)
+        group : str
+            name of the group of the benchmark (test module)
+        min_rounds : int
+            minimum number of timed rounds
+        max_time : float
+            the rounds are repeated until max_time is reached [s]
+        warmup_rounds : int
+            number of rounds run before the timed ones (imports, caches...)
+        """
+        self.name = name
+        self.group = group
+        self.min_rounds = min_rounds
+        self.max_time = max_time
+        self.warmup_rounds = warmup_rounds
+        self.extra_info = dict()  # Additional data saved with the timings
+        self.time_list = list()
+
+    def __call__(self, fct, *args, **kwargs):
+        """Time fct(*args, **kwargs) and return its result"""
+        return self.pedantic(fct, args=args, kwargs=kwargs)
+
+    def pedantic(
+        self, fct, args=(), kwargs=None, setup=None, rounds=None, warmup_rounds=None
+    ):
+        """Time fct(*args, **kwargs) and return its result
+
+        Parameters
+        ----------
+        self : Benchmark
+            A Benchmark object
+        fct : callable
+            function to time
+        args : tuple
+            positional arguments of fct
+        kwargs : dict
+            keyword arguments of fct
+        setup : callable
+            called (not timed) before each round, returns the (args, kwargs) of
+            the round if not None (e.g. fresh objects for functions with caches)
+        rounds : int
+            number of timed rounds (None to use min_rounds and max_time)
+        warmup_rounds : int
+            number of rounds run before the timed ones (None for the default)
+
+        Returns
+        -------
+        result : object
+            result of the last call of fct
+        """
+        if kwargs is None:
+            kwargs = dict()
+        if warmup_rounds is None:
+            warmup_rounds = self.warmup_rounds
+
+        def run_round():
+            if setup is None:
+                round_args, round_kwargs = args, kwargs
+            else:
+                round_args, round_kwargs = setup() or (args, kwargs)
+            start = perf_counter()
+            result = fct(*round_args, **round_kwargs)
+            return perf_counter() - start, result
+
+        for _ in range(warmup_rounds):
+            run_round()
+
+        self.time_list = list()
+        result = None
+        if rounds is None:  # At least min_rounds, more until max_time
+            while (
+                len(self.time_list) < self.min_rounds
+                or sum(self.time_list) < self.max_time
+            ):
+                duration, result = run_round()
+                self.time_list.append(duration)
+        else:
+            for _ in range(rounds):
+                duration, result = run_round()
+                self.time_list.append(duration)
+        return result
+
+    def get_stats(self):
+        """Return the statistics of the timed rounds [s]"""
+        if len(self.time_list) == 0:
+            return None
+        return {
+            "min": min(self.time_list),
+            "max": max(self.time_list),
+            "mean": mean(self.time_list),
+            "median": median(self.time_list),
+            "stddev": pstdev(self.time_list),
+            "rounds": len(self.time_list),
+            "total": sum(self.time_list),
+        }
+
+    def as_dict(self):
+        """Return the result of the benchmark to save it"""
+        return {
+            "name": self.name,
+            "group": self.group,
+            "stats": self.get_stats(),
+            "extra_info": self.extra_info,
+        }
+
+
+def get_commit_info():
+    """Return the current git commit of pyleecan (None if not available)"""
+    try:
+        commit_id = check_output(
+            ["git", "rev-parse", "HEAD"], cwd=MAIN_DIR, stderr=DEVNULL
+        )
+        status = check_output(
+            ["git", "status", "--porcelain", "--untracked-files=no"],
+            cwd=MAIN_DIR,
+            stderr=DEVNULL,
+        )
+    except Exception:
+        return None
+    return {"id": commit_id.decode().strip(), "dirty": len(status.strip()) > 0}
+
+
+def get_machine_info():
+    """Return the description of the computer and of the environment that
+    produced the timings"""
+    return {
+        "node": platform.node(),
+        "machine": platform.machine(),
+        "processor": platform.processor(),
+        "system": platform.system(),
+        "release": platform.release(),
+        "cpu_count": cpu_count(),
+        "python_implementation": platform.python_implementation(),
+        "python_version": platform.python_version(),
+        "pyleecan": pyleecan.__version__,
+        "numpy": np.__version__,
+        "scipy": scipy.__version__,
+        "SciDataTool": getattr(SciDataTool, "__version__", None),
+    }
+
+
+def save_benchmark(bench_list, file_path):
+    """Save the results of benchmarks in a json file
+
+    Parameters
+    ----------
+    bench_list : [Benchmark]
+        benchmarks to save (the ones without timed rounds are skipped)
+    file_path : str
+        path of the json file
+    """
+    if not isdir(dirname(file_path)):
+        makedirs(dirname(file_path))
+    bench_dict = {
+        "version": BENCHMARK_VERSION,
+        "datetime": datetime.now().isoformat(),
+        "machine_info": get_machine_info(),
+        "commit_info": get_commit_info(),
+        "benchmarks": [bench.as_dict() for bench in bench_list if bench.time_list],
+    }
+    with open(file_path, "w") as json_file:
+        json.dump(bench_dict, json_file, indent=4)
+
+
+def gen_meshsolution(nb_div=40, Nt=32, f0=50):
+    """Return a MeshSolution on a unit square meshed with 2*nb_div**2 triangles
+    with a rotating flux density "B" and two groups ("stator" for the lower
+    half of the square, "rotor" for the upper half)
+
+    Parameters
+    ----------
+    nb_div : int
+        number of divisions of each side of the square
+    Nt : int
+        number of time steps (one electrical period)
+    f0 : float
+        electrical frequency [Hz]
+
+    Returns
+    -------
+    meshsol : MeshSolution
+        MeshSolution with the solution "B" (Nt, nb_cell, 2)
+    """
+    # Regular grid of triangles
+    x, y = np.meshgrid(np.linspace(0, 1, nb_div + 1), np.linspace(0, 1, nb_div + 1))
+    coordinate = np.column_stack((x.ravel(), y.ravel()))
+    corner = (np.arange(nb_div)[:, None] * (nb_div + 1) + np.arange(nb_div)).ravel()
+    connectivity = np.concatenate(
+        (
+            np.column_stack((corner, corner + 1, corner + nb_div + 2)),
+            np.column_stack((corner, corner + nb_div + 2, corner + nb_div + 1)),
+        )
+    )
+    nb_cell = connectivity.shape[0]
+
+    mesh = MeshMat(dimension=2)
+    mesh.node = NodeMat(
+        coordinate=coordinate,
+        nb_node=coordinate.shape[0],
+        indice=np.arange(coordinate.shape[0]),
+    )
+    mesh.cell["triangle"] = CellMat(
+        connectivity=connectivity,
+        nb_node_per_cell=3,
+        nb_cell=nb_cell,
+        indice=np.arange(nb_cell),
+    )
+    mesh.cell["triangle"].interpolation.ref_cell = RefTriangle3(epsilon=1e-9)
+
+    # Rotating flux density with a 5th harmonic, amplitude varying in space
+    center = coordinate[connectivity].mean(axis=1)
+    time = np.linspace(0, 1 / f0, Nt, endpoint=False)
+    wt = 2 * np.pi * f0 * time[:, None]
+    amp = 1 + 0.5 * center[None, :, 0]
+    B = np.zeros((Nt, nb_cell, 2))
+    B[..., 0] = amp * (np.cos(wt) + 0.1 * np.cos(5 * wt))
+    B[..., 1] = amp * (np.sin(wt) - 0.1 * np.sin(5 * wt))
+    B_sol = build_solution_vector(
+        field=B,
+        axis_list=[
+            Data1D(name="time", unit="s", values=time),
+            Data1D(name="indice", values=np.arange(nb_cell), is_components=True),
+        ],
+        name="Magnetic Flux Density",
+        symbol="B",
+        unit="T",
+    )
+
+    Istator = center[:, 1] < 0.5
+    return MeshSolution(
+        label="grid",
+        mesh=[mesh],
+        solution=[B_sol],
+        group={
+            "stator": np.nonzero(Istator)[0],
+            "rotor": np.nonzero(~Istator)[0],
+        },
+        dimension=2,
+    )
@@ -0,0 +1,90 @@
+# -*- coding: utf-8 -*-
+"""Compare two benchmark result files (Tests/Benchmark or pytest-benchmark json)
+
+Usage: python Tests/Benchmark/compare_benchmark.py ref.json new.json [--tol 0.2]
+The exit code is 1 if a benchmark is slower than the reference by more than tol
+(standalone script: nothing is imported from Tests to keep Tests/Results)
+"""
+import argparse
+import json
+import sys
+
+
+def load_stats(file_path, stat="min"):
+    """Return the dict {name: statistic} of a benchmark result file"""
+    with open(file_path, "r") as json_file:
+        bench_dict = json.load(json_file)
+    return {
+        bench["name"]: bench["stats"][stat]
+        for bench in bench_dict["benchmarks"]
+        if bench.get("stats") is not None
+    }
+
+
+def compare_benchmark(ref_path, new_path, tol=0.2, stat="min"):
+    """Compare the timings of two benchmark result files
+
+    Parameters
+    ----------
+    ref_path : str
+        path of the reference result file (previous release)
+    new_path : str
+        path of the result file to check
+    tol : float
+        relative slow down above which a benchmark is a regression
+    stat : str
+        statistic to compare ("min", "median", "mean"...)
+
+    Returns
+    -------
+    compare_list : [dict]
+        name, ref, new and ratio (new/ref) of the benchmarks of both files
+    regression_list : [str]
+        names of the benchmarks slower than the reference by more than tol
+    """
+    ref_dict = load_stats(ref_path, stat)
+    new_dict = load_stats(new_path, stat)
+
+    compare_list = list()
+    regression_list = list()
+    for name, new in new_dict.items():
+        if name not in ref_dict:
+            continue
+        ref = ref_dict[name]
+        ratio = new / ref if ref > 0 else float("inf")
+        compare_list.append({"name": name, "ref": ref, "new": new, "ratio": ratio})
+        if ratio > 1 + tol:
+            regression_list.append(name)
+    return compare_list, regression_list
+
+
+def print_compare(compare_list, regression_list):
+    """Print the comparison table"""
+    print(
+        "{:<70}{:>12}{:>12}{:>8}".format("Benchmark", "Ref [ms]", "New [ms]", "Ratio")
+    )
+    for comp in compare_list:
+        print(
+            "{:<70}{:>12.3f}{:>12.3f}{:>8.2f}{}".format(
+                comp["name"],
+                comp["ref"] * 1e3,
+                comp["new"] * 1e3,
+                comp["ratio"],
+                " REGRESSION" if comp["name"] in regression_list else "",
+            )
+        )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Compare two benchmark results")
+    parser.add_argument("ref_path", help="reference result file")
+    parser.add_argument("new_path", help="result file to check")
+    parser.add_argument("--tol", type=float, default=0.2, help="allowed slow down")
+    parser.add_argument("--stat", default="min", help="statistic to compare")
+    args = parser.parse_args()
+
+    compare_list, regression_list = compare_benchmark(
+        args.ref_path, args.new_path, tol=args.tol, stat=args.stat
+    )
+    print_compare(compare_list, regression_list)
+    sys.exit(1 if regression_list else 0)
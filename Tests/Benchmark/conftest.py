@@ -0,0 +1,29 @@
+# -*- coding: utf-8 -*-
+from os import environ
+from os.path import join
+
+import pytest
+
+from Tests import save_path
+from Tests.Benchmark.benchmark_tools import Benchmark, save_benchmark
+
+# Folder of the result file (keep the results of a release out of Tests/Results)
+BENCHMARK_DIR = environ.get("PYLEECAN_BENCHMARK_DIR", join(save_path, "Benchmark"))
+
+
+@pytest.fixture(scope="session")
+def benchmark_list():
+    """Benchmarks of the session, saved at the end of the session"""
+    bench_list = list()
+    yield bench_list
+    if bench_list:
+        save_benchmark(bench_list, join(BENCHMARK_DIR, "benchmark.json"))
+
+
+@pytest.fixture
+def benchmark(request, benchmark_list):
+    """Benchmark of the current test (replaces the pytest-benchmark fixture)"""
+    group = request.module.__name__.split(".")[-1]
+    bench = Benchmark(name=group + "::" + request.node.name, group=group)
+    benchmark_list.append(bench)
+    return bench
@@ -0,0 +1,101 @@
+# -*- coding: utf-8 -*-
+from os.path import join
+
+import pytest
+import numpy as np
+from SciDataTool import Data1D, DataTime, VectorField
+
+from pyleecan.Classes.ForceMT import ForceMT
+from pyleecan.Classes.ForceTensor import ForceTensor
+from pyleecan.Classes.Output import Output
+from pyleecan.Classes.Simu1 import Simu1
+from pyleecan.Functions.load import load
+from pyleecan.definitions import DATA_DIR
+from Tests.Benchmark.benchmark_tools import gen_meshsolution
+
+
+def _get_output(Nt=64, Na=1024, f0=50):
+    """Output of the Toyota Prius with an enforced rotating air-gap flux
+    density (no magnetic model needed)"""
+    Toyota_Prius = load(join(DATA_DIR, "Machine", "Toyota_Prius.json"))
+    p = Toyota_Prius.get_pole_pair_number()
+    simu = Simu1(name="benchmark_force", machine=Toyota_Prius)
+    simu.force = ForceMT(
+        is_periodicity_a=False, is_periodicity_t=False, is_agsf_transfer=True
+    )
+    output = Output(simu=simu)
+
+    time = np.linspace(0, 1 / f0, Nt, endpoint=False)
+    angle = np.linspace(0, 2 * np.pi, Na, endpoint=False)
+    Time = Data1D(name="time", unit="s", values=time)
+    Angle = Data1D(name="angle", unit="rad", values=angle)
+    phase = p * angle[None, :] - 2 * np.pi * f0 * time[:, None]
+    Br = DataTime(
+        name="Airgap radial flux density",
+        unit="T",
+        symbol="B_r",
+        axes=[Time, Angle],
+        values=np.cos(phase) + 0.1 * np.cos(5 * phase),
+    )
+    Bt = DataTime(
+        name="Airgap tangential flux density",
+        unit="T",
+        symbol="B_t",
+        axes=[Time, Angle],
+        values=0.2 * np.sin(phase),
+    )
+    output.mag.Time = Time
+    output.mag.Angle = Angle
+    output.mag.B = VectorField(
+        name="Airgap flux density",
+        symbol="B",
+        components={"radial": Br, "tangential": Bt},
+    )
+    output.mag.Rag = Toyota_Prius.comp_Rgap_mec()
+    return output
+
+
+@pytest.mark.benchmark
+@pytest.mark.ForceMT
+@pytest.mark.IPMSM
+def test_ForceMT(benchmark):
+    """Compute the air-gap surface force with the Maxwell tensor"""
+    output = _get_output()
+    benchmark(output.simu.force.run)
+    assert output.force.AGSF is not None
+
+
+@pytest.mark.benchmark
+@pytest.mark.ForceMT
+@pytest.mark.IPMSM
+def test_AGSF_transfer(benchmark):
+    """Transfer the air-gap surface force to the stator bore radius"""
+    output = _get_output()
+    force = output.simu.force
+    force.run()
+    AGSF = output.force.AGSF
+
+    def setup():
+        output.force.AGSF = AGSF  # Replaced by the transferred one
+        return (output, force.max_wavenumber_transfer), {}
+
+    benchmark.pedantic(force.comp_AGSF_transfer, setup=setup)
+    assert output.force.AGSF is not AGSF
+
+
+@pytest.mark.benchmark
+@pytest.mark.ForceTensor
+def test_ForceTensor_assembly(benchmark):
+    """Assemble the nodal magnetostrictive forces of a triangle mesh"""
+    Nt = 8
+    meshsol = gen_meshsolution(nb_div=10, Nt=Nt)
+    mesh = meshsol.get_mesh()
+    nb_cell = mesh.cell["triangle"].nb_cell
+    B = meshsol.get_solution(label="B").field.get_xyz_along("time", "indice")
+    B = np.stack((B["comp_x"].T, B["comp_y"].T), axis=1)  # (nb_cell, dim, Nt)
+    mu = 1000 * 4 * np.pi * 1e-7 * np.ones((nb_cell, Nt))
+    H = B / mu[:, None, :]
+
+    tensor = ForceTensor(tensor={"magnetostriction": True})
+    f, _ = benchmark(tensor.element_loop, mesh, B, H, mu, np.arange(nb_cell), 2, Nt)
+    assert f.shape == (mesh.node.nb_node, 2, Nt)
@@ -0,0 +1,51 @@
+# -*- coding: utf-8 -*-
+from os.path import join
+
+import pytest
+
+from pyleecan.Functions.load import load
+from pyleecan.definitions import DATA_DIR
+
+# One machine of each main topology
+MACHINE_LIST = ["Toyota_Prius", "SCIM_006", "SPMSM_003", "SIPMSM_001", "SynRM_001"]
+# Machines with a winding on the stator
+WIND_MACHINE_LIST = ["Toyota_Prius", "SCIM_006", "SPMSM_003"]
+
+
+def _load_machine(name):
+    return load(join(DATA_DIR, "Machine", name + ".json"))
+
+
+@pytest.mark.benchmark
+@pytest.mark.parametrize("name", MACHINE_LIST)
+def test_load_machine(benchmark, name):
+    """Load a machine of Data/Machine from its json file"""
+    machine = benchmark(_load_machine, name)
+    assert machine.name is not None
+
+
+@pytest.mark.benchmark
+@pytest.mark.parametrize("name", MACHINE_LIST)
+def test_build_geometry(benchmark, name):
+    """Build the surfaces of the full machine"""
+    machine = _load_machine(name)
+    surf_list = benchmark(machine.build_geometry)
+    assert len(surf_list) > 0
+
+
+@pytest.mark.benchmark
+@pytest.mark.parametrize("name", WIND_MACHINE_LIST)
+def test_comp_wind_function(benchmark, name):
+    """Compute the winding functions of the stator"""
+    stator = _load_machine(name).stator
+    wf = benchmark(stator.comp_wind_function, Na=2048)
+    assert wf.shape == (stator.winding.qs, 2048)
+
+
+@pytest.mark.benchmark
+@pytest.mark.parametrize("name", WIND_MACHINE_LIST)
+def test_comp_mmf_unit(benchmark, name):
+    """Compute the unit magnetomotive force of the stator"""
+    stator = _load_machine(name).stator
+    MMF_U, WF = benchmark(stator.comp_mmf_unit, Na=2048, Nt=128)
+    assert MMF_U.values.shape[-1] == 2048
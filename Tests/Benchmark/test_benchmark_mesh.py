@@ -0,0 +1,51 @@
+# -*- coding: utf-8 -*-
+from os import makedirs
+from os.path import isdir, join
+
+import pytest
+
+from pyleecan.Classes.LossModelBertotti import LossModelBertotti
+from pyleecan.Functions.load import load
+from Tests import save_path
+from Tests.Benchmark.benchmark_tools import gen_meshsolution
+
+save_path = join(save_path, "Benchmark")
+
+
+@pytest.fixture(scope="module")
+def meshsol_path():
+    """Path of a stored MeshSolution (9 800 triangles, 32 time steps)"""
+    if not isdir(save_path):
+        makedirs(save_path)
+    file_path = join(save_path, "meshsolution.pkl")
+    gen_meshsolution(nb_div=70, Nt=32).save(file_path)
+    return file_path
+
+
+@pytest.mark.benchmark
+@pytest.mark.MeshSol
+def test_get_group(benchmark, meshsol_path):
+    """Extract a group of a MeshSolution"""
+    meshsol = load(meshsol_path)
+    meshsol_grp = benchmark(meshsol.get_group, "stator")
+    nb_cell = meshsol_grp.get_mesh().cell["triangle"].nb_cell
+    assert nb_cell == len(meshsol.group["stator"])
+
+
+@pytest.mark.benchmark
+@pytest.mark.Loss
+def test_Bertotti_loss(benchmark, meshsol_path):
+    """Compute the Bertotti losses of a stored MeshSolution for a speed sweep"""
+    model = LossModelBertotti(
+        k_hy=0.01, alpha_hy=2, k_ed=5e-5, alpha_ed=2, k_ex=1e-4, alpha_ex=1.5
+    )
+    meshsol = load(meshsol_path)
+    solution = meshsol.solution
+
+    def setup():
+        # Remove the loss density stored by the previous round
+        meshsol.solution = list(solution)
+        return (meshsol,), {"k_freq": [0.5, 1, 2], "group_names": ["stator", "rotor"]}
+
+    LossSum = benchmark.pedantic(model.comp_loss_sum, setup=setup)
+    assert LossSum.values.shape[:2] == (3, 2)
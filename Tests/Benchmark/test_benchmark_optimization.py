@@ -0,0 +1,84 @@
+# -*- coding: utf-8 -*-
+from os.path import join
+import random
+
+import pytest
+
+from pyleecan.Classes.OptiConstraint import OptiConstraint
+from pyleecan.Classes.OptiDesignVar import OptiDesignVar
+from pyleecan.Classes.OptiGenAlgNsga2Deap import OptiGenAlgNsga2Deap
+from pyleecan.Classes.OptiObjective import OptiObjective
+from pyleecan.Classes.OptiProblem import OptiProblem
+from pyleecan.Classes.Simu1 import Simu1
+from pyleecan.Functions.load import load
+from pyleecan.definitions import DATA_DIR
+
+
+def evaluate(output):
+    """Binh and Korn function (no simulation run)"""
+    x = output.simu.machine.rotor.slot.H0
+    y = output.simu.machine.stator.slot.H0
+    output.mag.Tem_av = 4 * x ** 2 + 4 * y ** 2
+    output.mag.Tem_rip_norm = (x - 5) ** 2 + (y - 5) ** 2
+
+
+@pytest.mark.benchmark
+@pytest.mark.SCIM
+def test_NSGA2(benchmark):
+    """NSGA-II with a cheap evaluation function: cost of the optimization
+    loop itself (copy of the simulations, selection, mutation...)"""
+    SCIM_001 = load(join(DATA_DIR, "Machine", "SCIM_001.json"))
+    simu = Simu1(name="benchmark_NSGA2", machine=SCIM_001)
+
+    my_vars = [
+        OptiDesignVar(
+            name="Rotor slot height",
+            symbol="RH0",
+            type_var="interval",
+            space=[0, 5],
+            get_value="lambda space: random.uniform(*space)",
+            setter="simu.machine.rotor.slot.H0",
+        ),
+        OptiDesignVar(
+            name="Stator slot height",
+            symbol="SH0",
+            type_var="interval",
+            space=[0, 3],
+            get_value="lambda space: random.uniform(*space)",
+            setter="simu.machine.stator.slot.H0",
+        ),
+    ]
+    cstrs = [
+        OptiConstraint(
+            name="first",
+            get_variable="lambda output: (output.simu.machine.rotor.slot.H0 - 5) ** 2 + output.simu.machine.stator.slot.H0 ** 2",
+            type_const="<=",
+            value=25,
+        )
+    ]
+    objs = [
+        OptiObjective(
+            name="Objective 1",
+            symbol="obj1",
+            keeper="lambda output: output.mag.Tem_av",
+        ),
+        OptiObjective(
+            name="Objective 2",
+            symbol="obj2",
+            keeper="lambda output: output.mag.Tem_rip_norm",
+        ),
+    ]
+    my_prob = OptiProblem(
+        simu=simu,
+        design_var=my_vars,
+        obj_func=objs,
+        constraint=cstrs,
+        eval_func=evaluate,
+    )
+    solver = OptiGenAlgNsga2Deap(problem=my_prob, size_pop=12, nb_gen=4, p_mutate=0.5)
+
+    def setup():
+        random.seed(0)  # Same individuals for each round
+
+    res = benchmark.pedantic(solver.solve, setup=setup, rounds=3)
+    assert res.nb_simu >= 12
@@ -0,0 +1,49 @@
+# -*- coding: utf-8 -*-
+from os import makedirs
+from os.path import isdir, join
+
+import pytest
+
+from pyleecan.Functions.load import load
+from pyleecan.definitions import DATA_DIR
+from Tests import save_path
+from Tests.Benchmark.benchmark_tools import gen_meshsolution
+
+TYPE_LIST = ["json", "h5", "pkl"]
+save_path = join(save_path, "Benchmark")
+
+
+@pytest.fixture(scope="module")
+def obj_dict():
+    """Objects to save: a machine (many small objects) and a MeshSolution
+    (a few large arrays)"""
+    if not isdir(save_path):
+        makedirs(save_path)
+    return {
+        "machine": load(join(DATA_DIR, "Machine", "Toyota_Prius.json")),
+        "meshsolution": gen_meshsolution(nb_div=40, Nt=32),
+    }
+
+
+def _get_path(obj_name, file_type):
+    return join(save_path, "save_load_" + obj_name + "." + file_type)
+
+
+@pytest.mark.benchmark
+@pytest.mark.parametrize("file_type", TYPE_LIST)
+@pytest.mark.parametrize("obj_name", ["machine", "meshsolution"])
+def test_save(benchmark, obj_dict, obj_name, file_type):
+    """Save a pyleecan object in each file format"""
+    file_path = _get_path(obj_name, file_type)
+    benchmark(obj_dict[obj_name].save, file_path)
+
+
+@pytest.mark.benchmark
+@pytest.mark.parametrize("file_type", TYPE_LIST)
+@pytest.mark.parametrize("obj_name", ["machine", "meshsolution"])
+def test_load(benchmark, obj_dict, obj_name, file_type):
+    """Load a pyleecan object from each file format"""
+    file_path = _get_path(obj_name, file_type)
+    obj_dict[obj_name].save(file_path)
+    obj = benchmark(load, file_path)
+    assert type(obj) is type(obj_dict[obj_name])
@@ -0,0 +1,139 @@
+import pytest
+
+import numpy as np
+from SciDataTool import Data1D
+
+from pyleecan.Classes.CellMat import CellMat
+from pyleecan.Classes.MeshMat import MeshMat
+from pyleecan.Classes.NodeMat import NodeMat
+from pyleecan.Classes.RefTriangle3 import RefTriangle3
+from pyleecan.Functions.MeshSolution.build_meshsolution import build_meshsolution
+from pyleecan.Functions.MeshSolution.build_solution_data import build_solution_data
+from pyleecan.Functions.Magnetics.airgap_harmonic_fit import (
+    AirgapFitError,
+    comp_airgap_flux_fit,
+    fit_airgap_potential,
+    get_airgap_potential,
+    get_airgap_wavenumber,
+)
+
+Rint, Rext = 0.08, 0.081  # Air-gap radii [m]
+Rref = (Rint + Rext) / 2
+p = 4  # Pole pairs
+time = np.array([0, 1e-3, 2e-3])
+w = 2 * np.pi * 50
+
+
+def comp_A(radius, angle):
+    """Laplace solution in the annulus: fundamental and 3rd harmonic rotating"""
+    rho = radius / Rref
+    wt = w * time[:, None]
+    A = (0.01 * rho ** p + 0.008 * rho ** -p) * np.cos(p * angle - wt)
+    A += (1e-3 * rho ** (3 * p) - 2e-4 * rho ** (-3 * p)) * np.sin(3 * p * angle + wt)
+    return A
+
+
+def comp_B(radius, angle):
+    """Analytic flux density of comp_A: Br = dA/dtheta/r, Bt = -dA/dr"""
+    rho = radius / Rref
+    wt = w * time[:, None]
+    n = 3 * p
+    Br = -p * (0.01 * rho ** p + 0.008 * rho ** -p) * np.sin(p * angle - wt)
+    Br += n * (1e-3 * rho ** n - 2e-4 * rho ** -n) * np.cos(n * angle + wt)
+    Bt = -p * (0.01 * rho ** p - 0.008 * rho ** -p) * np.cos(p * angle - wt)
+    Bt -= n * (1e-3 * rho ** n + 2e-4 * rho ** -n) * np.sin(n * angle + wt)
+    return Br / radius, Bt / radius
+
+
+def gen_annulus_meshsolution(type_cell):
+    """MeshSolution of the potential on a triangle mesh of the rotor, air-gap
+    and stator (the points out of the air-gap are not on the Laplace solution)"""
+    radius, angle = np.meshgrid(
+        np.linspace(0.078, 0.083, 21), np.linspace(0, 2 * np.pi, 181)[:-1]
+    )
+    radius, angle = radius.T.ravel(), angle.T.ravel()
+    coordinate = np.column_stack((radius * np.cos(angle), radius * np.sin(angle)))
+    Na = 180
+    corner = (np.arange(20)[:, None] * Na + np.arange(Na)).ravel()
+    next_ = corner - corner % Na + (corner + 1) % Na
+    connectivity = np.concatenate(
+        (
+            np.column_stack((corner, next_, next_ + Na)),
+            np.column_stack((corner, next_ + Na, corner + Na)),
+        )
+    )
+    mesh = MeshMat(dimension=2)
+    # Nodes indices not ordered as the coordinates
+    mesh.node = NodeMat(
+        coordinate=coordinate,
+        nb_node=coordinate.shape[0],
+        indice=np.arange(coordinate.shape[0])[::-1],
+    )
+    mesh.cell["triangle"] = CellMat(
+        connectivity=coordinate.shape[0] - 1 - connectivity,
+        nb_node_per_cell=3,
+        nb_cell=connectivity.shape[0],
+        indice=np.arange(connectivity.shape[0]),
+    )
+    mesh.cell["triangle"].interpolation.ref_cell = RefTriangle3(epsilon=1e-9)
+
+    if type_cell in ["point", "node"]:
+        point = coordinate
+        indice = mesh.node.indice
+    else:
+        point = coordinate[connectivity].mean(axis=1)
+        indice = mesh.cell["triangle"].indice
+    r_point = np.hypot(point[:, 0], point[:, 1])
+    A = comp_A(r_point, np.arctan2(point[:, 1], point[:, 0]))
+    A[:, (r_point < Rint) | (r_point > Rext)] = 1  # Not harmonic
+    A_sol = build_solution_data(
+        field=A,
+        axis_list=[
+            Data1D(name="time", unit="s", values=time),
+            Data1D(name="indice", values=indice, is_components=True),
+        ],
+        name="Magnetic Vector Potential",
+        symbol="A",
+        unit="Wb/m",
+    )
+    A_sol.type_cell = type_cell
+    A_sol.label = "A"
+    return build_meshsolution(list_solution=[A_sol], list_mesh=[mesh])
+
+
+def test_airgap_wavenumber():
+    """Check the wavenumbers of the fit with the periodicities"""
+    assert get_airgap_wavenumber(6).tolist() == list(range(7))
+    assert get_airgap_wavenumber(20, per_a=4).tolist() == [0, 4, 8, 12, 16, 20]
+    assert get_airgap_wavenumber(20, per_a=4, is_antiper_a=True).tolist() == [4, 12, 20]
+
+
+@pytest.mark.parametrize("type_cell", ["point", "node", "triangle"])
+def test_airgap_harmonic_fit(type_cell):
+    """Check the air-gap flux density reconstructed from the potential of a
+    MeshSolution (nodes or cell centers) against the analytic one"""
+    meshsol = gen_annulus_meshsolution(type_cell)
+    point, A = get_airgap_potential(meshsol, Rint, Rext)
+    assert A.shape == (time.size, point.shape[0])
+    radius = np.hypot(point[:, 0], point[:, 1])
+    assert radius.min() > Rint and radius.max() < Rext
+
+    wavenumber = get_airgap_wavenumber(30, per_a=p, is_antiper_a=True)
+    coeff = fit_airgap_potential(point, A, wavenumber, Rref)
+    assert coeff.shape == (time.size, 4 * wavenumber.size)
+
+    # Any resolution and radius in the air-gap
+    for Na, Rag in [(1024, Rref), (77, Rint + 0.2e-3)]:
+        angle = np.linspace(0, 2 * np.pi, Na, endpoint=False)
+        Br, Bt = comp_airgap_flux_fit(coeff, wavenumber, Rref, Rag, angle)
+        Br_ref, Bt_ref = comp_B(Rag, angle)
+        assert Br.shape == (time.size, Na)
+        np.testing.assert_allclose(Br, Br_ref, atol=1e-6 * np.abs(Br_ref).max())
+        np.testing.assert_allclose(Bt, Bt_ref, atol=1e-6 * np.abs(Br_ref).max())
+
+
+def test_airgap_harmonic_fit_error():
+    """Check the error when there are too many coefficients for the points"""
+    point = np.array([[Rref, 0], [0, Rref], [-Rref, 0]])
+    with pytest.raises(AirgapFitError):
+        fit_airgap_potential(point, np.ones(3), get_airgap_wavenumber(2), Rref)
@@ -7,7 +7,10 @@ Author: Sebastian Guenther
 """
 
 
-from numpy import pi, array
+from timeit import timeit
+
+from numpy import pi, array, linspace, stack
+from numpy.random import default_rng
 from numpy.testing import assert_array_almost_equal
 
 from pyleecan.Functions.Electrical.coordinate_transformation import (
@@ -15,6 +18,9 @@ from pyleecan.Functions.Electrical.coordinate_transformation import (
     n2ab,
     dq2ab,
     ab2dq,
+    dq2n,
+    n2dq,
+    get_ab2n_matrix,
 )
 
 import pytest
@@ -44,3 +50,40 @@ def test_coordinate_transformation_Ok():
     assert_array_almost_equal(ab2dq(X_ab, th_180), X_dq180)
 
     assert_array_almost_equal(ab2dq(X_ab_wrong, th_90), X_dq90_wrong)
+
+
+@pytest.mark.parametrize("n", [3, 5, 6])
+@pytest.mark.parametrize("rot_dir", [-1, 1])
+def test_coordinate_transformation_batch(n, rot_dir):
+    """Check the batched (N_op, Nt, 2) dq/n transformations against the step by step ones"""
+
+    rng = default_rng(0)
+    theta = linspace(0, 2 * pi, 64, endpoint=False)
+    Z_dq = rng.random((4, theta.size, 2))
+
+    Z_n = dq2n(Z_dq, theta, n=n, rot_dir=rot_dir, is_n_rms=True)
+    assert Z_n.shape == (4, theta.size, n)
+    for ii in range(Z_dq.shape[0]):
+        Z_n_ref = ab2n(dq2ab(Z_dq[ii], theta), n=n, rot_dir=rot_dir)
+        assert_array_almost_equal(Z_n[ii], Z_n_ref)
+
+    Z_dq_back = n2dq(Z_n, theta, n=n, rot_dir=rot_dir, is_dq_rms=False)
+    assert_array_almost_equal(Z_dq_back, Z_dq)
+
+    # Constant dq values on the whole time vector
+    Z_n_cst = dq2n(array([1, 2]), theta, n=n, rot_dir=rot_dir)
+    assert Z_n_cst.shape == (theta.size, n)
+
+    # Clarke matrices are computed once and can't be modified
+    assert get_ab2n_matrix(n, rot_dir) is get_ab2n_matrix(n, rot_dir)
+    assert not get_ab2n_matrix(n, rot_dir).flags.writeable
+
+
+if __name__ == "__main__":
+    # Microbenchmark of the batched dq to n phase transformation
+    theta = linspace(0, 2 * pi, 2048, endpoint=False)
+    Z_dq = default_rng(0).random((50, theta.size, 2))
+    t_loop = timeit(lambda: stack([dq2n(Z, theta) for Z in Z_dq]), number=20) / 20
+    t_batch = timeit(lambda: dq2n(Z_dq, theta), number=20) / 20
+    print("dq2n loop over 50 OP: %.2f ms" % (t_loop * 1e3))
+    print("dq2n batched 50 OP: %.2f ms" % (t_batch * 1e3))
@@ -0,0 +1,73 @@
+# -*- coding: utf-8 -*-
+import sys
+from logging import getLogger
+from os import makedirs
+from os.path import isdir, join
+from time import time
+
+import pytest
+
+from Tests import save_path
+from pyleecan.Functions.Simulation.run_FEA_job import run_FEA_job, FEAJobError
+
+# Stub solver: read the case file, print some lines and write the results
+STUB_SOLVER = """
+import sys
+from time import sleep
+with open("case.sif") as case:
+    value = float(case.read())
+print("Solving case", value)
+sys.stdout.flush()
+sleep(float(sys.argv[1]))
+if value < 0:
+    sys.stderr.write("negative value")
+    sys.exit(2)
+with open("result.txt", "w") as result:
+    result.write(str(2 * value))
+"""
+
+
+def _get_cmd(path, value, duration=0.1):
+    """Case directory with a stub solver to run"""
+    if not isdir(path):
+        makedirs(path)
+    stub = join(save_path, "stub_solver.py")
+    with open(stub, "w") as stub_file:
+        stub_file.write(STUB_SOLVER)
+    with open(join(path, "case.sif"), "w") as case:
+        case.write(str(value))
+    return [sys.executable, stub, duration]
+
+
+def test_run_FEA_job(caplog):
+    """Check the run of a solver process and the streaming of its output"""
+    logger = getLogger("Pyleecan.test_run_FEA_job")
+    path = join(save_path, "test_run_FEA_job")
+    cmd = _get_cmd(path, 5)
+    with caplog.at_level("INFO", logger=logger.name):
+        run_FEA_job(cmd, cwd=path, name="Case", logger=logger)
+
+    with open(join(path, "result.txt")) as result:
+        assert float(result.read()) == 10
+    # The solver output is streamed to the logger
+    assert "Case: Solving case 5.0" in caplog.messages
+    assert "Case call complete!" in caplog.messages
+
+
+def test_run_FEA_job_error(caplog):
+    """Check the errors and the timeout"""
+    logger = getLogger("Pyleecan.test_run_FEA_job")
+    path = join(save_path, "test_run_FEA_job_error")
+    with caplog.at_level("INFO", logger=logger.name):
+        with pytest.raises(FEAJobError, match="Return Code"):
+            run_FEA_job(_get_cmd(path, -1), cwd=path, name="Case", logger=logger)
+    assert "Case [Error]: negative value" in caplog.messages
+
+    start = time()
+    with pytest.raises(FEAJobError, match="timeout"):
+        run_FEA_job(_get_cmd(path, 1, duration=30), cwd=path, timeout=0.5)
+    assert time() - start < 10
+
+
+if __name__ == "__main__":
+    test_run_FEA_job_error()
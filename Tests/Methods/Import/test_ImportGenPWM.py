@@ -5,7 +5,7 @@ from os.path import isdir, join
 
 import matplotlib.pyplot as plt
 import pytest
-from numpy import linspace
+from numpy import linspace, exp, pi, abs as np_abs, array_equal, int8
 from pyleecan.Classes.ImportGenPWM import ImportGenPWM
 from Tests import save_plot_path as save_path
 
@@ -85,6 +85,59 @@ def testDPWM():
         fig.savefig(join(save_path, "test_ImportGenPWM_" + str(ii) + ".png"))
 
 
+def test_PWM_chunks():
+    """Check that the block generation matches the full signal"""
+    for typePWM in [7, 8]:
+        test_obj = ImportGenPWM(
+            fs=96000,
+            duration=2,
+            f=1,
+            fmax=5,
+            fmode=1 if typePWM == 8 else 0,
+            fswimode=1 if typePWM == 8 else 0,
+            fswi=10,
+            fswi_max=30,
+            typePWM=typePWM,
+            Vdc1=2,
+            U0=0.77,
+        )
+        result = test_obj.get_data(Nt_chunk=2 * 96000)
+        result_chunk = test_obj.get_data(is_int8=True, Nt_chunk=10007)
+        assert result_chunk.dtype == int8
+        assert array_equal(result, result_chunk)
+
+
+def test_PWM_spectrum():
+    """Check the accumulated spectrum against the DFT of the PWM signal"""
+    test_obj = ImportGenPWM(
+        fs=20000, duration=1, f=50, fswi=1000, typePWM=8, Vdc1=2, U0=0.5
+    )
+    freqs, Vspec = test_obj.comp_spectrum(freqs=[0, 50, 1000], Nt_chunk=777)
+    assert Vspec.shape == (3, 3)
+
+    result = test_obj.get_data()
+    Nt = result.shape[0]
+    time = linspace(start=0, stop=1, num=Nt, endpoint=True)
+    V50 = 2 / Nt * test_obj.Vdc1 / 2 * result[:, 0].dot(exp(-2j * pi * 50 * time))
+    assert Vspec[0, 1] == pytest.approx(V50)
+    # Fundamental amplitude is sqrt(2)*U0
+    assert np_abs(Vspec[:, 1]) == pytest.approx(0.707, rel=1e-3)
+
+
+@pytest.mark.parametrize("typePWM", [8, 7, 0, 3, 4, 5, 6])
+def test_PWM_harmonics(typePWM):
+    """Check the analytical spectrum against the numerical PWM signal"""
+    test_obj = ImportGenPWM(
+        fs=200000, duration=1, f=50, fswi=1000, typePWM=typePWM, Vdc1=2, U0=0.5
+    )
+    Us = test_obj.comp_harmonics(fmax=3000)
+    freqs = Us.axes[1].values
+    assert Us.values.shape == (3, freqs.size)
+
+    _, Vspec = test_obj.comp_spectrum(freqs=freqs)
+    assert np_abs(Us.values - Vspec).max() < 5e-3
+
+
 if __name__ == "__main__":
     testDPWM()
     testSPWM()
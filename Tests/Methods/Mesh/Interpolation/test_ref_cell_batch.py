@@ -0,0 +1,152 @@
+# -*- coding: utf-8 -*-
+
+import pytest
+import numpy as np
+
+from pyleecan.Classes.RefTriangle3 import RefTriangle3
+from pyleecan.Classes.RefTriangle6 import RefTriangle6
+from pyleecan.Classes.RefQuad4 import RefQuad4
+from pyleecan.Classes.RefQuad9 import RefQuad9
+from pyleecan.Classes.RefLine3 import RefLine3
+from pyleecan.Classes.RefSegmentP1 import RefSegmentP1
+from pyleecan.Classes.ScalarProductL2 import ScalarProductL2
+from pyleecan.Classes.FPGNSeg import FPGNSeg
+
+# Reference cells with the reference coordinates of their nodes
+REF_LIST = [
+    (RefTriangle3(), [[0, 0], [1, 0], [0, 1]]),
+    (RefTriangle6(), [[0, 0], [1, 0], [0, 1], [0.5, 0], [0.5, 0.5], [0, 0.5]]),
+    (RefQuad4(), [[-1, -1], [1, -1], [1, 1], [-1, 1]]),
+    (
+        RefQuad9(),
+        [[-1, -1], [1, -1], [1, 1], [-1, 1], [0, -1], [1, 0], [0, 1], [-1, 0], [0, 0]],
+    ),
+    (RefSegmentP1(), [[-1, 0], [1, 0]]),
+    (RefLine3(), [[-1, 0], [1, 0], [0, 0]]),
+]
+
+
+def _get_cells(ref_node, Ncell=50, seed=0):
+    """Random distorted cells (affine map + small perturbation of the nodes)"""
+    rng = np.random.default_rng(seed)
+    ref_node = np.array(ref_node, dtype=float)
+    if np.all(ref_node[:, 1] == 0):  # line cells: the normal coordinate is 0
+        ref_node = ref_node[:, :1]
+        A = rng.uniform(0.5, 2, (Ncell, 1, 2))
+    else:
+        A = rng.uniform(-0.3, 0.3, (Ncell, 2, 2)) + np.eye(2)
+    vertice = np.matmul(ref_node[np.newaxis], A)
+    vertice += rng.uniform(-5, 5, (Ncell, 1, 2))
+    if ref_node.shape[0] > 4 or ref_node.shape[1] == 1:  # curved cells
+        vertice += rng.uniform(-0.03, 0.03, vertice.shape)
+    return vertice
+
+
+@pytest.mark.MeshSol
+@pytest.mark.parametrize("ref_cell, ref_node", REF_LIST)
+def test_shape_function_batch(ref_cell, ref_node):
+    """Check the shape functions and their gradients at many points"""
+    ref_node = np.array(ref_node, dtype=float)
+    Nnode = ref_node.shape[0]
+    # Kronecker delta at the nodes
+    np.testing.assert_allclose(
+        ref_cell.shape_function_batch(ref_node), np.eye(Nnode), atol=1e-14
+    )
+
+    points = np.random.default_rng(1).uniform(0, 0.5, (4, 7, 2))
+    values = ref_cell.shape_function_batch(points)
+    assert values.shape == (4, 7, Nnode)
+    np.testing.assert_allclose(np.sum(values, axis=-1), 1)
+
+    # Gradient by finite differences
+    grad = ref_cell.grad_shape_function_batch(points)
+    dim_ref = grad.shape[-2]
+    assert grad.shape == (4, 7, dim_ref, Nnode)
+    for ii in range(dim_ref):
+        delta = np.zeros(2)
+        delta[ii] = 1e-6
+        grad_fd = (
+            ref_cell.shape_function_batch(points + delta)
+            - ref_cell.shape_function_batch(points - delta)
+        ) / 2e-6
+        np.testing.assert_allclose(grad[..., ii, :], grad_fd, atol=1e-8)
+
+
+@pytest.mark.MeshSol
+@pytest.mark.parametrize("ref_cell, ref_node", REF_LIST)
+def test_ref_point_batch(ref_cell, ref_node):
+    """Check the real/reference points of many points in many cells"""
+    vertice = _get_cells(ref_node)
+    Ncell = vertice.shape[0]
+    if ref_cell.grad_shape_function_batch(np.zeros(2)).shape[0] == 1:  # lines
+        ref_pt = np.array([[-0.8, 0], [0, 0], [0.5, 0]])
+    else:
+        ref_pt = np.array([[0.1, 0.2], [0.3, 0.3], [0.6, 0.1]])
+
+    # Same reference points for all the cells
+    real_pt = ref_cell.get_real_point_batch(vertice, ref_pt)
+    assert real_pt.shape == (Ncell, 3, 2)
+    np.testing.assert_allclose(
+        ref_cell.get_ref_point_batch(vertice, real_pt),
+        np.broadcast_to(ref_pt, (Ncell, 3, 2)),
+        atol=1e-10,
+    )
+    # One point per cell
+    np.testing.assert_allclose(
+        ref_cell.get_ref_point_batch(vertice, real_pt[:, 1]),
+        np.broadcast_to(ref_pt[1], (Ncell, 2)),
+        atol=1e-10,
+    )
+
+    is_inside, _, _ = ref_cell.is_inside_batch(vertice, real_pt)
+    assert is_inside.shape == (Ncell, 3)
+    assert np.all(is_inside)
+    # Points of the next cell are outside (the cells are far from each other)
+    is_inside, _, _ = ref_cell.is_inside_batch(vertice, np.roll(real_pt, 1, axis=0))
+    assert np.sum(is_inside) < Ncell / 5
+
+
+@pytest.mark.MeshSol
+def test_batch_single_cell_methods():
+    """Check the batched kernels against the single cell methods"""
+    for ref_cell, ref_node in REF_LIST[:1] + REF_LIST[4:5]:
+        vertice = _get_cells(ref_node, Ncell=10)
+        point = vertice[:, 0] * 0.3 + vertice[:, 1] * 0.6 + [0.01, -0.02]
+        jacob, detJ = ref_cell.jacobian_batch(np.array(ref_node[:1]), vertice)
+        is_inside, a, b = ref_cell.is_inside_batch(vertice, point)
+        ref_pt = ref_cell.get_ref_point_batch(vertice, point)
+        for ii in range(vertice.shape[0]):
+            jacob_ii, detJ_ii = ref_cell.jacobian(np.array(ref_node[0]), vertice[ii])
+            np.testing.assert_allclose(jacob[ii, 0], jacob_ii[: jacob.shape[2]])
+            assert detJ[ii, 0] == pytest.approx(detJ_ii)
+            np.testing.assert_allclose(
+                ref_pt[ii], ref_cell.get_ref_point(vertice[ii], point[ii]), atol=1e-12
+            )
+            is_inside_ii, a_ii, b_ii = ref_cell.is_inside(vertice[ii], point[ii])
+            assert is_inside[ii] == is_inside_ii
+            assert a[ii] == pytest.approx(a_ii)
+            assert b[ii] == pytest.approx(b_ii)
+
+
+@pytest.mark.MeshSol
+def test_scalar_product_batch():
+    """Check the mass matrices of many segments at once"""
+    ref_cell = RefSegmentP1()
+    scal = ScalarProductL2()
+    gauss_pts, weights, nb_gauss = FPGNSeg(nb_gauss_point=4).get_gauss_points()
+    vertice = _get_cells([[-1, 0], [1, 0]])
+
+    func = ref_cell.shape_function_batch(gauss_pts)
+    _, detJ = ref_cell.jacobian_batch(gauss_pts, vertice)
+    mass = scal.scalar_product_batch(func, func, detJ, weights)
+
+    length = np.linalg.norm(vertice[:, 1] - vertice[:, 0], axis=-1)
+    assert mass.shape == (vertice.shape[0], 2, 2)
+    np.testing.assert_allclose(
+        mass, length[:, None, None] * np.array([[2, 1], [1, 2]]) / 6
+    )
+    # Same result as the single cell scalar product
+    func_ref, _ = ref_cell.shape_function(gauss_pts, nb_gauss)
+    np.testing.assert_allclose(
+        mass[3], scal.scalar_product(func_ref, func_ref, detJ[3], weights, nb_gauss)
+    )
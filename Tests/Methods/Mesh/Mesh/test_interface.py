@@ -1,11 +1,15 @@
 # -*- coding: utf-8 -*-
 
+from time import perf_counter
+
 import pytest
 from pyleecan.Classes.MeshMat import MeshMat
 from pyleecan.Classes.NodeMat import NodeMat
 from pyleecan.Classes.CellMat import CellMat
 import numpy as np
 
+from Tests.Methods.Mesh.Mesh.test_renum import _grid_mesh
+
 
 @pytest.mark.MeshSol
 class Test_interface(object):
@@ -128,3 +132,45 @@ class Test_interface(object):
         msg = "Wrong result: returned " + str(result) + ", expected: " + str(solution)
         DELTA = 1e-10
         assert abs(testA - 0) < DELTA, msg
+
+
+def _split_grid(N):
+    """Left and right halves of a N x N grid mesh (interface at x = N // 2)"""
+    mesh, vert = _grid_mesh(N)
+    connect = mesh.cell["triangle"].connectivity
+    is_left = np.max(vert[:, :, 0], axis=1) <= N // 2
+    mesh_list = list()
+    for Isel in [is_left, ~is_left]:
+        mesh_grp = mesh.copy()
+        mesh_grp.cell["triangle"] = CellMat(
+            connectivity=connect[Isel],
+            nb_cell=int(np.sum(Isel)),
+            nb_node_per_cell=3,
+            indice=np.nonzero(Isel)[0],
+        )
+        mesh_list.append(mesh_grp)
+    return mesh_list
+
+
+@pytest.mark.MeshSol
+def test_interface_scaling():
+    """Check the interface of two halves of a grid (20k to 200k cells)"""
+    duration = list()
+    for N in [101, 317]:
+        mesh_left, mesh_right = _split_grid(N)
+        start = perf_counter()
+        interf = mesh_left.interface(mesh_right)
+        duration.append(perf_counter() - start)
+
+        # The N-1 vertical edges at x = N // 2
+        connect = interf.cell["line"].connectivity
+        assert connect.shape == (N - 1, 2)
+        np.testing.assert_array_equal(interf.cell["line"].indice, np.arange(N - 1))
+        coord = interf.get_node(connect)
+        np.testing.assert_array_equal(coord[:, :, 0], N // 2)
+        np.testing.assert_array_equal(
+            np.sort(np.min(coord[:, :, 1], axis=1)), np.arange(N - 1)
+        )
+
+    # 10 times more cells: O(N log N)
+    assert duration[1] < 40 * duration[0] + 0.1
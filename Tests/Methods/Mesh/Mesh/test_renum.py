@@ -0,0 +1,70 @@
+# -*- coding: utf-8 -*-
+from time import perf_counter
+
+import pytest
+import numpy as np
+
+from pyleecan.Classes.MeshMat import MeshMat
+from pyleecan.Classes.CellMat import CellMat
+from pyleecan.Classes.NodeMat import NodeMat
+
+
+def _grid_mesh(N, seed=0):
+    """Triangle mesh of a N x N grid (2*(N-1)**2 cells) with shuffled node indices"""
+    x, y = np.meshgrid(np.arange(N), np.arange(N), indexing="ij")
+    coord = np.array([x.ravel(), y.ravel()], dtype=float).T
+    ind = np.arange(N * N).reshape((N, N))
+    a, b, c, d = ind[:-1, :-1], ind[1:, :-1], ind[1:, 1:], ind[:-1, 1:]
+    connect = np.concatenate(
+        [np.array([a, b, c]).reshape(3, -1).T, np.array([a, c, d]).reshape(3, -1).T]
+    )
+
+    # nodes indices are not their position (e.g. after get_group)
+    indice = np.random.default_rng(seed).permutation(N * N) * 3 + 7
+    mesh = MeshMat(_is_renum=True)
+    mesh.node = NodeMat(coordinate=coord, nb_node=N * N, indice=indice)
+    mesh.cell["triangle"] = CellMat(
+        connectivity=indice[connect],
+        nb_cell=connect.shape[0],
+        nb_node_per_cell=3,
+        indice=np.arange(connect.shape[0]),
+    )
+    return mesh, coord[connect]
+
+
+@pytest.mark.MeshSol
+def test_renum_get_vertice():
+    """Check renum and get_vertice on a mesh with shuffled node indices"""
+    mesh, vert_ref = _grid_mesh(6)
+
+    vert = mesh.get_vertice()["triangle"]
+    assert vert.shape == (50, 3, 2)
+    np.testing.assert_array_equal(vert, vert_ref)
+    np.testing.assert_array_equal(mesh.get_vertice([3])["triangle"], vert_ref[3])
+
+    mesh.renum()
+    np.testing.assert_array_equal(mesh.node.indice, np.arange(36))
+    np.testing.assert_array_equal(mesh.get_vertice()["triangle"], vert_ref)
+
+    with pytest.raises(IndexError):
+        mesh.get_node([36])
+
+
+@pytest.mark.MeshSol
+def test_renum_scaling():
+    """Check that renum and get_vertice scale linearly (20k to 200k cells)"""
+    duration = list()
+    for N in [101, 317]:  # 20000 and 200312 cells
+        mesh, vert_ref = _grid_mesh(N)
+        start = perf_counter()
+        vert = mesh.get_vertice()["triangle"]
+        mesh.renum()
+        duration.append(perf_counter() - start)
+        np.testing.assert_array_equal(vert, vert_ref)
+
+    # 10 times more cells: O(N log N), far from the O(N**2) of the node loop
+    assert duration[1] < 40 * duration[0] + 0.1
+
+
+if __name__ == "__main__":
+    test_renum_scaling()
@@ -111,5 +111,64 @@ def test_MeshMat_2group():
     assert testA == pytest.approx(0, rel=DELTA), msg
 
 
+@pytest.mark.MeshSol
+def test_get_group_update():
+    """Check that the groups follow the changes of the MeshSolution"""
+    mesh = MeshMat()
+    mesh.cell["triangle"] = CellMat(nb_node_per_cell=3)
+    mesh.node = NodeMat()
+    for node in [[0, 0], [1, 0], [1, 1], [0, 1], [2, 0], [2, 1]]:
+        mesh.node.add_node(np.array(node))
+    mesh.add_cell(np.array([0, 1, 2]), "triangle")
+    mesh.add_cell(np.array([0, 2, 3]), "triangle")
+    mesh.add_cell(np.array([1, 4, 5]), "triangle")
+    mesh.add_cell(np.array([1, 5, 2]), "triangle")
+
+    solution = SolutionMat(
+        field=np.arange(6, dtype=float),
+        axis_name=["indice"],
+        axis_size=[6],
+        indice=np.arange(6),
+        type_cell="node",
+        label="T",
+    )
+    meshsol = MeshSolution(mesh=[mesh], solution=[solution])
+    meshsol.group = {"left": np.array([0, 1]), "right": np.array([2, 3])}
+
+    MS_grp = meshsol.get_group("right")
+    assert MS_grp.get_mesh().node.nb_node == 4
+    np.testing.assert_array_equal(MS_grp.get_field(), [1, 2, 4, 5])
+
+    # Interface between the two groups: the nodes 1 and 2
+    MS_interf = meshsol.get_group(["left", "/", "right"])
+    cells, _, _ = MS_interf.get_mesh().get_cell()
+    assert cells["line"].tolist() in [[1, 2], [2, 1]]
+    np.testing.assert_array_equal(MS_interf.get_field(), [1, 2])
+
+    # Field values modified in place
+    solution.field[:] = 2 * np.arange(6, dtype=float)
+    np.testing.assert_array_equal(meshsol.get_group("right").get_field(), [2, 4, 8, 10])
+    np.testing.assert_array_equal(
+        meshsol.get_group(["left", "/", "right"]).get_field(), [2, 4]
+    )
+
+    # New field
+    meshsol.solution[0].field = 3 * np.arange(6, dtype=float)
+    np.testing.assert_array_equal(
+        meshsol.get_group("right").get_field(), [3, 6, 12, 15]
+    )
+
+    # Node coordinates modified in place
+    mesh.node.coordinate[4] = [3, 0]
+    node_grp = meshsol.get_group("right").get_mesh().node
+    np.testing.assert_array_equal(node_grp.coordinate, [[1, 0], [1, 1], [3, 0], [2, 1]])
+
+    # Modifying the group doesn't affect the MeshSolution
+    MS_grp.solution[0].field[:] = 0
+    np.testing.assert_array_equal(
+        meshsol.get_group("right").get_field(), [3, 6, 12, 15]
+    )
+
+
 if __name__ == "__main__":
     Xout = test_MeshMat_2group()
@@ -0,0 +1,146 @@
+# -*- coding: utf-8 -*-
+from math import factorial
+
+import pytest
+import numpy as np
+from SciDataTool import Data1D, DataTime
+
+from pyleecan.Classes.CellMat import CellMat
+from pyleecan.Classes.FPGNTri import FPGNTri
+from pyleecan.Classes.MeshMat import MeshMat
+from pyleecan.Classes.MeshSolution import MeshSolution
+from pyleecan.Classes.NodeMat import NodeMat
+from pyleecan.Classes.SolutionData import SolutionData
+from pyleecan.Classes.SolutionMat import SolutionMat
+from pyleecan.Functions.MeshSolution.build_solution_vector import (
+    build_solution_vector,
+)
+from pyleecan.Methods.Mesh.MeshSolution import MeshSolutionError
+from Tests.Methods.Mesh.Mesh.test_renum import _grid_mesh
+
+
+def _get_meshsol(N=11):
+    """Triangle mesh of [0, N-1]^2 with a node solution f = (1 + t) * x and a
+    node vector solution B = [1, (1 + t) * y] for 3 time steps"""
+    mesh, _ = _grid_mesh(N)
+    x, y = mesh.node.coordinate.T
+    time = np.arange(3.0)
+    Time = Data1D(name="time", unit="s", values=time)
+    Indice = Data1D(name="indice", values=mesh.node.indice, is_components=True)
+
+    f = DataTime(
+        name="f",
+        unit="",
+        symbol="f",
+        axes=[Time, Indice],
+        values=(1 + time)[:, None] * x[None, :],
+    )
+    f_sol = SolutionData(field=f, label="f", type_cell="node")
+    B = np.stack([np.ones((3, x.size)), (1 + time)[:, None] * y[None, :]], axis=-1)
+    B_sol = build_solution_vector(field=B, axis_list=[Time, Indice], symbol="B")
+    B_sol.type_cell = "node"
+
+    # first half of the lower triangles: x in [0, 5]
+    group = {"left": list(range((N - 1) ** 2 // 2))}
+    return MeshSolution(mesh=[mesh], solution=[f_sol, B_sol], group=group)
+
+
+@pytest.mark.MeshSol
+def test_FPGNTri():
+    """Check the exactness of the triangle quadrature rules"""
+    for nb_pt, degree in [(1, 1), (3, 2), (4, 3), (6, 4), (7, 5)]:
+        points, weights, _ = FPGNTri(nb_gauss_point=nb_pt).get_gauss_points()
+        assert points.shape == (nb_pt, 2)
+        for a in range(degree + 1):
+            for b in range(degree + 1 - a):
+                exact = factorial(a) * factorial(b) / factorial(a + b + 2)
+                assert np.sum(
+                    weights * points[:, 0] ** a * points[:, 1] ** b
+                ) == pytest.approx(exact, abs=1e-12)
+
+    with pytest.raises(ValueError):
+        FPGNTri(nb_gauss_point=5).get_gauss_points()
+
+
+@pytest.mark.MeshSol
+def test_integrate_node():
+    """Check the integral and norm of node solutions for all the time steps"""
+    meshsol = _get_meshsol()
+    factor = 1 + np.arange(3.0)
+
+    # integral of x over [0, 10]^2
+    np.testing.assert_allclose(meshsol.integrate(label="f"), 500 * factor)
+    np.testing.assert_allclose(meshsol.integrate(label="f", order=1), 500 * factor)
+    # L2 norm: integral of x**2 is exact at order 2
+    np.testing.assert_allclose(
+        meshsol.norm(label="f"), np.sqrt(1e4 / 3) * factor, rtol=1e-12
+    )
+    np.testing.assert_allclose(
+        meshsol.norm(label="f", is_rms=True), np.sqrt(100 / 3) * factor, rtol=1e-12
+    )
+    # Average over the group (lower triangles with x in [0, 5])
+    np.testing.assert_allclose(
+        meshsol.integrate(label="f", group="left", is_average=True),
+        (2 + 2 / 3) * factor,
+    )
+
+    # Vector solution: the components are integrated separately (time, component)
+    np.testing.assert_allclose(
+        meshsol.integrate(label="B"), np.array([100 * factor ** 0, 500 * factor]).T
+    )
+    np.testing.assert_allclose(
+        meshsol.norm(label="B"), np.sqrt(100 + 1e4 / 3 * factor ** 2), rtol=1e-12
+    )
+
+    with pytest.raises(MeshSolutionError):
+        meshsol.integrate(label="f", group="right")
+
+
+@pytest.mark.MeshSol
+def test_integrate_cell():
+    """Check the integral of cell solutions on quadrangles and lines"""
+    # 2 x 1 quadrangles and a line along the bottom edge
+    mesh = MeshMat(_is_renum=True)
+    mesh.node = NodeMat(
+        coordinate=np.array([[0, 0], [1, 0], [2, 0], [0, 1], [1, 1], [2, 1.5]]),
+        nb_node=6,
+        indice=np.arange(6),
+    )
+    mesh.cell["quad"] = CellMat(
+        connectivity=np.array([[0, 1, 4, 3], [1, 2, 5, 4]]),
+        nb_cell=2,
+        nb_node_per_cell=4,
+        indice=np.array([0, 1]),
+    )
+    mesh.cell["line"] = CellMat(
+        connectivity=np.array([[0, 1], [1, 2]]),
+        nb_cell=2,
+        nb_node_per_cell=2,
+        indice=np.array([2, 3]),
+    )
+    # Loss density like solution (freqs, indice)
+    field = np.array([[1.0, 2.0], [10.0, 20.0]])
+    quad_sol = SolutionMat(
+        field=field,
+        indice=np.array([0, 1]),
+        axis_name=["freqs", "indice"],
+        axis_size=[2, 2],
+        type_cell="quad",
+        label="dens",
+    )
+    line_sol = SolutionMat(
+        field=np.array([3.0, 4.0]),
+        indice=np.array([2, 3]),
+        axis_name=["indice"],
+        axis_size=[2],
+        type_cell="line",
+        label="lin",
+    )
+    meshsol = MeshSolution(mesh=[mesh], solution=[quad_sol, line_sol], group={"A": [1]})
+
+    # areas 1 and 1.25
+    np.testing.assert_allclose(meshsol.integrate(label="dens"), [3.5, 35])
+    np.testing.assert_allclose(meshsol.integrate(label="dens", group="A"), [2.5, 25])
+    # lengths 1 and 1
+    assert meshsol.integrate(label="lin") == pytest.approx(7)
+    assert meshsol.integrate(label="lin", is_average=True) == pytest.approx(3.5)
@@ -0,0 +1,124 @@
+import pytest
+from os.path import join
+
+import numpy as np
+
+from pyleecan.Functions.load import load
+from pyleecan.definitions import DATA_DIR
+from pyleecan.Classes.Simu1 import Simu1
+from pyleecan.Classes.InputCurrent import InputCurrent
+from pyleecan.Classes.VarLoadCurrent import VarLoadCurrent
+from pyleecan.Classes.DataKeeper import DataKeeper
+from pyleecan.Classes.OutInterp import OutInterp
+from pyleecan.Methods.Output.OutInterp import OutInterpError
+from pyleecan.Methods.Output.XOutput import XOutputError
+
+
+@pytest.fixture(scope="module")
+def xout():
+    """Variable load on an Id/Iq grid with analytic results"""
+    Toyota_Prius = load(join(DATA_DIR, "Machine", "Toyota_Prius.json"))
+    simu = Simu1(name="test_OutInterp", machine=Toyota_Prius)
+    simu.input = InputCurrent(N0=2000, Id_ref=0, Iq_ref=0, Nt_tot=4, Na_tot=64)
+    simu.mag = None
+    simu.force = None
+    simu.struct = None
+    Id, Iq = np.meshgrid(np.linspace(-200, 0, 5), np.linspace(0, 200, 4))
+    OP_matrix = np.column_stack((2000 * np.ones(Id.size), Id.ravel(), Iq.ravel()))
+    simu.var_simu = VarLoadCurrent(
+        OP_matrix=OP_matrix[::-1],  # Not sorted
+        type_OP_matrix=1,
+        datakeeper_list=[
+            DataKeeper(
+                symbol="P",
+                unit="W",
+                keeper="lambda output: 2 * output.simu.input.Id_ref + 3 * output.simu.input.Iq_ref + 1",
+            ),
+            DataKeeper(
+                symbol="Phi",
+                keeper="lambda output: np.array([output.simu.input.Id_ref, output.simu.input.Iq_ref])",
+            ),
+        ],
+    )
+    return simu.run()
+
+
+@pytest.mark.IPMSM
+@pytest.mark.VarLoadCurrent
+@pytest.mark.parametrize("method", ["grid", "linear", "rbf"])
+def test_OutInterp(xout, method):
+    """Check the interpolation of the results at any Id/Iq (vectorized)"""
+    interp = xout.get_interp("P", method=method)
+    assert interp.param_list == ["Id", "Iq"]  # N0 is constant
+    assert interp.unit == "W"
+    assert interp.point.shape == (20, 2)
+
+    rng = np.random.default_rng(0)
+    point = rng.uniform([-200, 0], [0, 200], size=(100000, 2))
+    np.testing.assert_allclose(
+        interp.get_value(point), 2 * point[:, 0] + 3 * point[:, 1] + 1, atol=1e-6
+    )
+    # Any shape, results of a sample not scalar
+    interp = xout.get_interp("Phi", method=method)
+    value = interp.get_value(point.reshape((1000, 100, 2)))
+    assert value.shape == (1000, 100, 2)
+    np.testing.assert_allclose(value.reshape((-1, 2)), point, atol=1e-6)
+
+
+@pytest.mark.IPMSM
+@pytest.mark.VarLoadCurrent
+def test_OutInterp_save(xout, tmp_path):
+    """Check that the interpolation table is saved without the XOutput"""
+    interp = xout.get_interp("P", method="linear")
+    file_path = join(str(tmp_path), "interp.json")
+    interp.save(file_path)
+    interp_load = load(file_path)
+    assert isinstance(interp_load, OutInterp)
+    assert interp_load == interp
+    point = np.array([[-130, 35], [-10, 190], [-250, 0]])
+    value = interp_load.get_value(point)
+    assert value[:2] == pytest.approx([-154, 551])
+    assert np.isnan(value[2])  # Out of the samples
+
+    # 1D interpolation: mean of the results of the samples with the same Iq
+    for method in ["grid", "linear", "rbf"]:
+        interp_1D = xout.get_interp("P", param_list=["Iq"], method=method)
+        assert interp_1D.point.shape == (20, 1)
+        value = interp_1D.get_value([35, 190])
+        assert value == pytest.approx([3 * 35 - 199, 3 * 190 - 199], rel=1e-6)
+
+
+@pytest.mark.parametrize("method", ["linear", "rbf"])
+def test_OutInterp_collinear(method):
+    """Check the interpolation of aligned samples (Id and Iq varying together)"""
+    Iq = np.linspace(0, 200, 5)
+    point = np.column_stack((-Iq / 2, Iq))
+    interp = OutInterp(
+        symbol="P",
+        param_list=["Id", "Iq"],
+        point=np.concatenate((point, point[:2])),  # Duplicated samples
+        value=np.concatenate((Iq, Iq[:2])) ** 2,
+        method=method,
+    )
+    value = interp.get_value([[-25, 50], [-37.5, 75], [-50, 50]])
+    assert value[0] == pytest.approx(2500)
+    if method == "linear":
+        assert value[1] == pytest.approx((2500 + 10000) / 2)
+        assert np.isnan(value[2])  # Out of the line of the samples
+    else:
+        assert value[1] == pytest.approx(75 ** 2, rel=1e-2)
+
+
+def test_OutInterp_error(xout):
+    """Check the errors of the interpolation table"""
+    with pytest.raises(XOutputError):
+        xout.get_interp("Q")
+    with pytest.raises(XOutputError):
+        xout.get_interp("P", param_list=["In"])  # Not scalar
+    point = np.array([[0, 0], [1, 0], [0, 1]])
+    with pytest.raises(OutInterpError):
+        OutInterp(point=point, value=np.ones(3), method="grid").get_value(point)
+    with pytest.raises(OutInterpError):
+        OutInterp(point=point, value=np.ones(3), method="cubic").get_value(point)
+    with pytest.raises(OutInterpError):  # Same coordinates for all the samples
+        OutInterp(point=np.zeros((3, 2)), value=np.ones(3)).get_value(point)
@@ -0,0 +1,87 @@
+# -*- coding: utf-8 -*-
+
+import pytest
+
+from os import makedirs
+from os.path import join
+from meshio import Mesh, write
+from numpy import array, arange, ones, stack
+from numpy.testing import assert_array_equal
+from SciDataTool import Data1D
+
+from Tests import save_path
+from pyleecan.Classes.ElmerResultsVTU import ElmerResultsVTU
+from pyleecan.Methods.Elmer.ElmerResultsVTU import ElmerResultsVTUError
+
+
+def _write_steps(path, Nt):
+    """Write Nt VTU files of a mesh with a triangle and a quad block"""
+    makedirs(path, exist_ok=True)
+    points = array(
+        [[0, 0, 0], [1, 0, 0], [1, 1, 0], [0, 1, 0], [2, 0, 0], [2, 1, 0]], dtype=float
+    )
+    cells = [
+        ("triangle", array([[0, 1, 2], [0, 2, 3]])),
+        ("quad", array([[1, 4, 5, 2]])),
+    ]
+    for ii in range(Nt):
+        B = ii * ones((3, 3)) + arange(3)[:, None]
+        write(
+            join(path, "step_t" + str(ii + 1) + ".vtu"),
+            Mesh(
+                points,
+                cells,
+                point_data={"potential": ii + arange(6, dtype=float)},
+                cell_data={"flux density e": [B[:2], B[2:]]},
+            ),
+        )
+
+
+@pytest.mark.MagElmer
+@pytest.mark.parametrize("nb_worker", [1, 2])
+def test_ElmerResultsVTU_steps(nb_worker):
+    """Check that all the time steps are read and stacked on the same mesh"""
+    Nt = 11  # step_t10 after step_t9
+    path = join(save_path, "test_ElmerResultsVTU")
+    _write_steps(path, Nt)
+
+    res = ElmerResultsVTU(
+        label="Elmer test",
+        file_path=join(path, "step_t*.vtu"),
+        nb_worker=nb_worker,
+        is_cell_data=True,
+        store_dict={
+            "flux density e": {"name": "B", "unit": "T", "symbol": "B", "norm": 1}
+        },
+    )
+    assert len(res.get_file_list()) == Nt
+    time = arange(Nt) * 1e-3
+    meshsol = res.build_meshsolution(Time=Data1D(name="time", unit="s", values=time))
+
+    assert meshsol.is_same_mesh
+    assert len(meshsol.mesh) == 1
+    assert meshsol.mesh[0].name == "step_t1"
+    B = meshsol.solution[0].field
+    Bx = B.components["comp_x"].get_along("time", "indice")["Bx"]
+    assert Bx.shape == (Nt, 3)
+    assert_array_equal(Bx, arange(Nt)[:, None] + arange(3)[None, :])
+
+    # Point data of a single step
+    res.file_path = join(path, "step_t3.vtu")
+    res.is_cell_data = False
+    res.store_dict = {
+        "potential": {"name": "A", "unit": "Wb", "symbol": "A", "norm": 1}
+    }
+    meshsol = res.build_meshsolution()
+    A = meshsol.solution[0].field.get_along("indice")["A"]
+    assert_array_equal(A, 2 + arange(6))
+
+    # Time axis must match the number of steps
+    res.file_path = join(path, "step_t*.vtu")
+    with pytest.raises(ElmerResultsVTUError):
+        res.build_meshsolution(Time=Data1D(name="time", unit="s", values=time[:2]))
+
+
+# To run it without pytest
+if __name__ == "__main__":
+    test_ElmerResultsVTU_steps(2)
@@ -0,0 +1,210 @@
+# -*- coding: utf-8 -*-
+import re
+from os.path import basename, dirname, join
+from random import Random
+from threading import Lock
+from time import sleep
+
+import pytest
+import numpy as np
+
+from pyleecan.Classes.MagFEMM import MagFEMM
+from pyleecan.Classes.Output import Output
+from pyleecan.Classes.Simu1 import Simu1
+from pyleecan.Functions.load import load
+from pyleecan.Functions.FEMM.handler_pool import (
+    get_handler_list,
+    release_handler_list,
+    close_handler_pool,
+)
+from pyleecan.definitions import DATA_DIR
+from Tests import save_path
+
+Nelem = 8  # Number of elements of the fake mesh
+_RANDOM = Random(0)
+_RANDOM_LOCK = Lock()
+
+
+class FakeFEMMHandler(object):
+    """FEMM handler without FEMM: the results only depend on the rotor angle of
+    the sliding band and each resolution takes a random time"""
+
+    open_count = 0  # Number of FEMM instances started
+
+    def __init__(self):
+        self.is_open = False
+        self.document = None
+        self.angle = 0  # Rotor angle [deg]
+        self.time_list = list()  # Rotor angles solved by the handler
+
+    def __getattr__(self, name):
+        # Other FEMM commands: nothing to do
+        return lambda *args: None
+
+    def openfemm(self, *args):
+        if self.is_open:
+            raise Exception("An instance FEMM is already open")
+        self.is_open = True
+        FakeFEMMHandler.open_count += 1
+
+    def closefemm(self):
+        self.is_open = False
+
+    def opendocument(self, filename):
+        assert self.is_open
+        self.document = filename
+
+    def mi_modifyboundprop(self, name, prop, value):
+        self.angle = value
+
+    def mi_analyze(self):
+        assert self.is_open and self.document is not None
+        with _RANDOM_LOCK:
+            latency = _RANDOM.choice([0.001, 0.005, 0.04])
+        sleep(latency)
+        self.time_list.append(self.angle)
+
+    def mo_getgapb(self, bc_name, angle):
+        return [np.cos(np.radians(angle - self.angle)), self.angle]
+
+    def mo_blockintegral(self, integral):
+        return self.angle
+
+    def mo_getcircuitproperties(self, name):
+        return [0, 0, self.angle + int(name[-1])]
+
+    def callfemm(self, command):
+        """Write the mesh and results files of get_meshsolution"""
+        path_lua = re.match(r'dofile\("(.*)"\)', command).group(1)
+        path = dirname(path_lua)
+        idworker = re.match(r"get_mesh_data_FEMM(\d+).lua", basename(path_lua))
+        idworker = idworker.group(1)
+        nodes = np.array([[0, 0], [1, 0], [0, 1], [1, 1]])
+        np.savetxt(join(path, "nodes" + idworker + ".txt"), nodes, delimiter=" ")
+        elements = np.tile([1, 2, 3, 0, 0, 0, 20], (Nelem, 1))
+        np.savetxt(
+            join(path, "elements" + idworker + ".txt"),
+            elements,
+            fmt="%d",
+            delimiter=" ",
+        )
+        results = self.angle * np.ones((Nelem, 5)) + np.arange(5)
+        np.savetxt(join(path, "results" + idworker + ".txt"), results, delimiter=" ")
+
+
+def _solve(mag, output, Nt, Na=16):
+    """Call solve_FEMM_parallel with the fake handler"""
+    machine = output.simu.machine
+    qs = machine.stator.winding.qs
+    angle = np.linspace(0, 2 * np.pi, Na, endpoint=False)
+    out_dict = {
+        "Br": np.zeros((Nt, Na)),
+        "Bt": np.zeros((Nt, Na)),
+        "Tem": np.zeros(Nt),
+        "Phi_wind": {"Stator_0": np.zeros((Nt, qs))},
+    }
+    FEMM_dict = {
+        "groups": {"GROUP_RC": 20, "GROUP_RH": 26, "GROUP_RW": 21, "GROUP_RM": 22},
+        "circuits": ["Circs" + str(q) for q in range(qs)],
+        "Lfemm": machine.stator.comp_length(),
+    }
+    # Empty model (copied for each worker)
+    open(mag.get_path_save_fem(output), "w").close()
+
+    B, H, mu, mesh, groups = mag.solve_FEMM_parallel(
+        FakeFEMMHandler(),
+        output,
+        out_dict,
+        FEMM_dict=FEMM_dict,
+        sym=1,
+        Nt=Nt,
+        angle=angle,
+        Is=None,
+        Ir=None,
+        angle_rotor=np.radians(np.arange(Nt)),  # 1 degree per time step
+    )
+    return out_dict, B, H, mu, mesh, groups
+
+
+@pytest.mark.MagFEMM
+def test_handler_pool():
+    """Check that the idle handlers are reused"""
+    close_handler_pool()
+    FakeFEMMHandler.open_count = 0
+    handler_list = get_handler_list(3, FakeFEMMHandler)
+    assert FakeFEMMHandler.open_count == 3
+    assert all([femm.is_open for femm in handler_list])
+
+    release_handler_list(handler_list[:2])
+    release_handler_list(handler_list[2:], is_keep=False)
+    assert not handler_list[2].is_open
+    handler_list2 = get_handler_list(3, FakeFEMMHandler)
+    assert FakeFEMMHandler.open_count == 4
+    assert handler_list2[:2] == handler_list[:2]
+
+    release_handler_list(handler_list2)
+    close_handler_pool()
+    assert not any([femm.is_open for femm in handler_list2])
+    assert get_handler_list(1, FakeFEMMHandler)[0] not in handler_list2
+
+
+@pytest.mark.MagFEMM
+@pytest.mark.IPMSM
+def test_solve_FEMM_parallel():
+    """Check the dynamic scheduling of the time steps on FEMM workers with a
+    random resolution time and the reuse of the workers"""
+    # OutMagFEMM imports the FEMM handler (but FEMM itself is not needed)
+    pytest.importorskip("win32com")
+    from pyleecan.Classes.OutMagFEMM import OutMagFEMM
+
+    close_handler_pool()
+    FakeFEMMHandler.open_count = 0
+    Toyota_Prius = load(join(DATA_DIR, "Machine", "Toyota_Prius.json"))
+    simu = Simu1(name="test_solve_FEMM_parallel", machine=Toyota_Prius, layer=1)
+    output = Output(simu=simu, path_result=join(save_path, "test_FEMM_parallel"))
+    output.mag.internal = OutMagFEMM()
+    mag = MagFEMM(nb_worker=4, is_get_meshsolution=True)
+    Nt = 40
+    qs = Toyota_Prius.stator.winding.qs
+
+    out_dict, B, H, mu, mesh, groups = _solve(mag, output, Nt)
+
+    # Each result is stored at the index of its time step
+    time = np.arange(Nt, dtype=float)
+    assert out_dict["Br"][:, 0] == pytest.approx(np.cos(np.radians(time)))
+    assert out_dict["Bt"][:, 3] == pytest.approx(time)
+    assert out_dict["Tem"] == pytest.approx(time)
+    Npcp = Toyota_Prius.stator.winding.Npcp
+    np.testing.assert_allclose(
+        out_dict["Phi_wind"]["Stator_0"] * Npcp,
+        time[:, None] + np.arange(qs)[None, :],
+        atol=1e-12,
+    )
+    assert B.shape == (Nt, Nelem, 3)
+    ones = np.ones((1, Nelem))
+    np.testing.assert_allclose(B[:, :, 0], time[:, None] * ones)
+    np.testing.assert_allclose(H[:, :, 1], (time[:, None] + 3) * ones)
+    np.testing.assert_allclose(mu, (time[:, None] + 4) * ones)
+    assert B[:, :, 2].max() == 0
+    assert mesh[0].cell["triangle"].nb_cell == Nelem
+    assert list(groups.values()) == [list(range(Nelem))]
+
+    # Handlers are kept open in the pool (simulation of a multi-simulation)
+    assert FakeFEMMHandler.open_count == 4
+    assert output.mag.internal.handler_list == list()
+    handler_list = get_handler_list(4, FakeFEMMHandler)
+    assert FakeFEMMHandler.open_count == 4
+    # Each time step is solved once, all the workers got some time steps
+    time_list = [femm.time_list for femm in handler_list]
+    assert sorted(sum(time_list, [])) == pytest.approx(time)
+    assert all([len(tl) > 0 for tl in time_list])
+    release_handler_list(handler_list)
+
+    # Next simulation: same FEMM instances, closed for a top simulation
+    simu.layer = 0
+    out_dict2, B2, _, _, _, _ = _solve(mag, output, Nt)
+    assert FakeFEMMHandler.open_count == 4
+    assert not any([femm.is_open for femm in handler_list])
+    np.testing.assert_allclose(out_dict2["Tem"], out_dict["Tem"])
+    np.testing.assert_allclose(B2, B)
+    close_handler_pool()
@@ -0,0 +1,228 @@
+# -*- coding: utf-8 -*-
+import re
+from os import listdir, makedirs
+from os.path import join
+
+import pytest
+import numpy as np
+
+from pyleecan.Classes.MagFEMM import MagFEMM
+from pyleecan.Classes.Output import Output
+from pyleecan.Classes.Simu1 import Simu1
+from pyleecan.Functions.load import load
+from pyleecan.Functions.FEMM.comp_FEMM_results_batch import (
+    comp_FEMM_results_batch,
+    gen_FEMM_results_lua,
+    FEMMResultsError,
+)
+from pyleecan.definitions import DATA_DIR
+from Tests import save_path
+
+FEMM_DICT = {
+    "groups": {"GROUP_RC": 20, "GROUP_RH": 26, "GROUP_RW": 21, "GROUP_RM": 22},
+    "circuits": ["Circs0", "Circs1", "Circs2"],
+    "Lfemm": 0.5,
+}
+
+
+class ReplayFEMMHandler(object):
+    """FEMM handler without FEMM: the post-processing commands return analytic
+    values and the batch Lua scripts are replayed with these commands (the
+    preprocessing commands are ignored)"""
+
+    def __init__(self):
+        self.nb_call = 0  # Number of calls to FEMM (IPC round trips)
+        self.group_list = list()
+
+    def __getattr__(self, name):
+        # mi_* commands: nothing to do
+        def no_op(*args):
+            self.nb_call += 1
+
+        return no_op
+
+    def mi_loadsolution(self):
+        # New postprocessor view: no block selected
+        self.nb_call += 1
+        self.group_list = list()
+
+    def mo_getb(self, x, y):
+        self.nb_call += 1
+        return [x + 2 * y, x * y - 1]
+
+    def mo_getgapb(self, bc_name, angle):
+        self.nb_call += 1
+        return [np.cos(np.radians(angle)), 0.1 * angle]
+
+    def mo_seteditmode(self, mode):
+        self.nb_call += 1
+
+    def mo_groupselectblock(self, group):
+        self.nb_call += 1
+        self.group_list.append(group)
+
+    def mo_clearblock(self):
+        self.nb_call += 1
+        self.group_list = list()
+
+    def mo_blockintegral(self, integral):
+        self.nb_call += 1
+        return float(integral * sum(self.group_list))
+
+    def mo_getcircuitproperties(self, name):
+        self.nb_call += 1
+        q = int(name[-1])
+        return [10.0 * q, 0.0, 0.01 * (q + 1)]
+
+    def callfemm(self, command):
+        """Replay the Lua script of gen_FEMM_results_lua (a single call)"""
+        nb_call = self.nb_call + 1
+        path_lua = re.match(r'dofile\("(.*)"\)', command).group(1)
+        with open(path_lua, "r") as file_lua:
+            script = file_lua.read()
+
+        def get_table(name):
+            table = re.search(name + r" = \{(.*)\}", script).group(1)
+            return [float(val) for val in table.split(",")]
+
+        lines = list()
+        if "mo_getgapb" in script:
+            bc_name = re.search(r'mo_getgapb\("(\w+)"', script).group(1)
+            for ang in get_table("ang"):
+                lines.append("%r %r" % tuple(self.mo_getgapb(bc_name, ang)))
+        else:
+            for x, y in zip(get_table("px"), get_table("py")):
+                lines.append("%r %r" % tuple(self.mo_getb(x, y)))
+        for group in re.findall(r"mo_groupselectblock\((\d+)\)", script):
+            self.mo_groupselectblock(int(group))
+        lines.append(repr(self.mo_blockintegral(22)))
+        self.mo_clearblock()
+        for name in re.findall(r'mo_getcircuitproperties\("(\w+)"\)', script):
+            lines.append("%r %r %r" % tuple(self.mo_getcircuitproperties(name)))
+
+        path_results = re.search(r'openfile\("(.*)", "w"\)', script).group(1)
+        with open(path_results, "w") as result_file:
+            result_file.write("\n".join(lines) + "\n")
+        self.nb_call = nb_call
+
+
+@pytest.mark.MagFEMM
+def test_gen_FEMM_results_lua():
+    """Check the content of the batch Lua script"""
+    angle = np.linspace(0, np.pi, 4, endpoint=False)
+    script = gen_FEMM_results_lua(
+        "C:\\res\\out.txt", angle, 0.1, True, [20, 26], ["Circs0", "Circs1"]
+    )
+    assert script.startswith('fp = openfile("C:/res/out.txt", "w")')
+    assert "ang = {0.0, 45.0, 90.0, 135.0}" in script
+    assert "for k = 1, 4 do" in script
+    assert 'mo_getgapb("bc_ag2", ang[k])' in script
+    assert "mo_groupselectblock(20)\nmo_groupselectblock(26)" in script
+    assert script.count("mo_getcircuitproperties") == 2
+    assert script.endswith("closefile(fp)\n")
+
+    script = gen_FEMM_results_lua("out.txt", angle, 0.1, False, [20], [])
+    assert "mo_getb(px[k], py[k])" in script
+    assert "mo_getcircuitproperties" not in script
+
+
+@pytest.mark.MagFEMM
+@pytest.mark.parametrize("is_sliding_band", [True, False])
+def test_comp_FEMM_results_batch(is_sliding_band):
+    """Check the batch results against the point by point FEMM commands"""
+    path = join(save_path, "test_FEMM_results_batch")
+    makedirs(path, exist_ok=True)
+    angle = np.linspace(0, 2 * np.pi, 64, endpoint=False)
+    Rag = 0.05
+    femm = ReplayFEMMHandler()
+    circuits = ["Circs0", "Circs1", "Circs2", "Circr0"]  # no rotor circuit
+
+    results = comp_FEMM_results_batch(
+        femm, path, angle, Rag, is_sliding_band, FEMM_DICT, circuits, sym=2
+    )
+    assert femm.nb_call == 1
+    # Lua script and results file are removed
+    assert not [name for name in listdir(path) if "batch" in name or ".lua" in name]
+
+    if is_sliding_band:
+        Br_ref = np.cos(angle)
+        Bt_ref = 0.1 * np.degrees(angle)
+    else:
+        x, y = Rag * np.cos(angle), Rag * np.sin(angle)
+        Bx, By = x + 2 * y, x * y - 1
+        Br_ref = Bx * np.cos(angle) + By * np.sin(angle)
+        Bt_ref = -Bx * np.sin(angle) + By * np.cos(angle)
+    np.testing.assert_allclose(results["Br"], Br_ref, rtol=1e-14, atol=1e-15)
+    np.testing.assert_allclose(results["Bt"], Bt_ref, rtol=1e-14, atol=1e-15)
+    assert results["Tem"] == 2 * 22 * (20 + 26 + 21 + 22)
+    np.testing.assert_allclose(
+        results["circuit"][:3], [[0, 0, 0.01], [10, 0, 0.02], [20, 0, 0.03]]
+    )
+    assert np.all(np.isnan(results["circuit"][3]))
+
+
+@pytest.mark.MagFEMM
+def test_comp_FEMM_results_batch_error():
+    """Check the error when the results file is not written"""
+    path = join(save_path, "test_FEMM_results_batch")
+    makedirs(path, exist_ok=True)
+    femm = ReplayFEMMHandler()
+    femm.callfemm = lambda command: None
+    with pytest.raises(FEMMResultsError):
+        comp_FEMM_results_batch(
+            femm, path, np.zeros(4), 0.05, True, FEMM_DICT, ["Circs0"]
+        )
+
+
+@pytest.mark.MagFEMM
+@pytest.mark.IPMSM
+@pytest.mark.parametrize("is_sliding_band", [True, False])
+def test_solve_FEMM_batch_post(is_sliding_band):
+    """Check that solve_FEMM gives the same results with and without the batch
+    post-processing (one FEMM call per time step instead of one per point)"""
+    # solve_FEMM imports the FEMM handler (but FEMM itself is not needed)
+    pytest.importorskip("win32com")
+    Toyota_Prius = load(join(DATA_DIR, "Machine", "Toyota_Prius.json"))
+    simu = Simu1(name="test_solve_FEMM_batch_post", machine=Toyota_Prius)
+    output = Output(simu=simu, path_result=join(save_path, "test_FEMM_batch_post"))
+    Nt, Na = 3, 32
+    angle = np.linspace(0, 2 * np.pi, Na, endpoint=False)
+    qs = Toyota_Prius.stator.winding.qs
+    FEMM_dict = dict(FEMM_DICT)
+    FEMM_dict["circuits"] = ["Circs" + str(q) for q in range(qs)]
+
+    out_list = list()
+    nb_call_list = list()
+    for is_batch_post in [False, True]:
+        mag = MagFEMM(is_sliding_band=is_sliding_band, is_batch_post=is_batch_post)
+        out_dict = {
+            "Br": np.zeros((Nt, Na)),
+            "Bt": np.zeros((Nt, Na)),
+            "Tem": np.zeros(Nt),
+            "Phi_wind": {"Stator_0": np.zeros((Nt, qs))},
+        }
+        femm = ReplayFEMMHandler()
+        mag.solve_FEMM(
+            femm=femm,
+            output=output,
+            out_dict=out_dict,
+            FEMM_dict=FEMM_dict,
+            sym=4,
+            Nt=Nt,
+            angle=angle,
+            Is=np.zeros((qs, Nt)),
+            Ir=None,
+            angle_rotor=np.linspace(0, 1, Nt),
+            is_close_femm=False,
+        )
+        out_list.append(out_dict)
+        nb_call_list.append(femm.nb_call)
+
+    ref, batch = out_list
+    for key in ["Br", "Bt", "Tem", "Rag"]:
+        np.testing.assert_allclose(batch[key], ref[key], rtol=1e-14, atol=1e-15)
+    np.testing.assert_allclose(
+        batch["Phi_wind"]["Stator_0"], ref["Phi_wind"]["Stator_0"], rtol=1e-14
+    )
+    # One call per time step instead of Na (flux) + 6 (torque) + qs (circuits)
+    assert nb_call_list[0] - nb_call_list[1] == Nt * (Na + 6 + qs - 1)
@@ -13,15 +13,18 @@ from numpy import (
     zeros,
     abs as np_abs,
     angle as np_angle,
+    exp,
 )
 from numpy.testing import assert_array_almost_equal
 import matplotlib.pyplot as plt
 from pyleecan.Classes.ImportGenMatrixSin import ImportGenMatrixSin
 from pyleecan.Classes.ImportGenVectLin import ImportGenVectLin
 from pyleecan.Classes.ImportGenVectSin import ImportGenVectSin
+from pyleecan.Classes.ImportData import ImportData
 from pyleecan.Classes.ImportMatrixVal import ImportMatrixVal
 from pyleecan.Classes.InputCurrent import InputCurrent
 from pyleecan.Classes.LamSlotWind import LamSlotWind
+from pyleecan.Classes.LossModelWinding import LossModelWinding
 from pyleecan.Classes.MachineDFIM import MachineDFIM
 from pyleecan.Classes.Output import Output
 from pyleecan.Classes.Simulation import Simulation
@@ -29,6 +32,8 @@ from pyleecan.definitions import DATA_DIR
 from pyleecan.Functions.load import load
 from pyleecan.Functions.Plot import dict_2D
 from pyleecan.Methods.Simulation.Input import InputError
+from pyleecan.Methods.Simulation.LossModelWinding.comp_loss import _square_harm
+from SciDataTool import DataFreq
 import pytest
 from Tests import save_plot_path as save_path
 
@@ -306,6 +311,78 @@ class Test_InCurrent_meth(object):
 
         return out
 
+    def test_InputCurrent_harm(self):
+        """Enforce Is as harmonics, check Id/Iq and the synthesized time samples"""
+        test_obj = Simulation(machine=Toyota_Prius)
+        output = Output(simu=test_obj)
+        Nt_tot = 64
+        N0 = 2000
+        qs = Toyota_Prius.stator.winding.qs
+        p = Toyota_Prius.stator.get_pole_pair_number()
+        felec = p * N0 / 60
+        rot_dir = Toyota_Prius.stator.comp_rot_dir()
+
+        # Fundamental (Id=0, Iq=10 Arms) and 5th harmonic
+        freqs = array([felec, 5 * felec])
+        shift = exp(1j * rot_dir * 2 * pi / qs * array([0, 1, 2]))
+        Is_harm = array(
+            [10 * sqrt(2) * 1j * shift, 2 * shift ** 5]
+        ).T  # (qs, Nf) complex amplitudes
+        test_obj.input = InputCurrent(
+            Nt_tot=Nt_tot,
+            Na_tot=20,
+            Is=None,
+            Is_harm=ImportData(
+                axes=[
+                    ImportData(
+                        name="phase",
+                        field=ImportMatrixVal(value=array(["A", "B", "C"])),
+                    ),
+                    ImportData(name="freqs", field=ImportMatrixVal(value=freqs)),
+                ],
+                field=ImportMatrixVal(value=Is_harm),
+                name="Stator current",
+                symbol="Is",
+                unit="A",
+            ),
+            N0=N0,
+        )
+        test_obj.input.gen_input()
+        assert output.elec.Is is None
+        assert output.elec.Id_ref == pytest.approx(0, abs=1e-9)
+        assert output.elec.Iq_ref == pytest.approx(10)
+
+        # Time samples are only computed on demand
+        time = output.elec.Time.get_values(is_oneperiod=True)
+        Is_exp = (Is_harm @ exp(2j * pi * freqs[:, None] * time[None, :])).real
+        I_mag = output.elec.comp_I_mag(time, is_stator=True)
+        assert_array_almost_equal(I_mag, Is_exp)
+        assert output.elec.Is is None
+        assert_array_almost_equal(output.elec.get_Is().values, Is_exp)
+
+        # Winding losses R*I**2 are computed on the harmonics
+        output.elec.Is = None
+        R = 0.1
+        freqs_sq, I2 = _square_harm(freqs, Is_harm)
+        I2_time = (I2 @ exp(2j * pi * freqs_sq[:, None] * time[None, :])).real
+        assert_array_almost_equal(R * I2_time, R * Is_exp ** 2)
+
+        # Same losses as from the current time samples
+        loss_model = LossModelWinding(name="Joule", temperature=20)
+        loss_harm, _ = loss_model.comp_loss(output, "Stator")
+        assert isinstance(loss_harm, DataFreq)
+        assert output.elec.Is is None
+        output.elec.get_Is()
+        loss_time, _ = loss_model.comp_loss(output, "Stator")
+        R = Toyota_Prius.stator.comp_resistance_wind(T=20)
+        loss_mean = loss_time.get_along("phase", "time")["Loss"].mean(axis=1)
+        assert_array_almost_equal(loss_harm.values[:, 0].real, loss_mean)
+        # Time data on request
+        result = loss_harm.get_along(
+            "time=axis_data", "phase", axis_data={"time": time}
+        )
+        assert_array_almost_equal(result["Loss"], R * Is_exp ** 2)
+
 
 # To run it without pytest
 if __name__ == "__main__":
@@ -0,0 +1,105 @@
+import pytest
+
+import numpy as np
+from SciDataTool import Data1D
+
+from pyleecan.Classes.CellMat import CellMat
+from pyleecan.Classes.LossModelBertotti import LossModelBertotti
+from pyleecan.Classes.MeshMat import MeshMat
+from pyleecan.Classes.MeshSolution import MeshSolution
+from pyleecan.Classes.NodeMat import NodeMat
+from pyleecan.Classes.RefTriangle3 import RefTriangle3
+from pyleecan.Functions.MeshSolution.build_solution_vector import (
+    build_solution_vector,
+)
+
+
+@pytest.mark.Loss
+def test_LossModelBertotti_sum():
+    """Check the speed sweep and group breakdown of the Bertotti losses"""
+    # 3 triangles mesh with 2 groups
+    mesh = MeshMat()
+    mesh.cell["triangle"] = CellMat(nb_node_per_cell=3)
+    mesh.cell["triangle"].interpolation.ref_cell = RefTriangle3(epsilon=1e-9)
+    mesh.node = NodeMat()
+    for node in [[0, 0], [1, 0], [1, 2], [2, 3], [3, 3]]:
+        mesh.node.add_node(np.array(node))
+    mesh.add_cell(np.array([0, 1, 2]), "triangle")
+    mesh.add_cell(np.array([1, 2, 3]), "triangle")
+    mesh.add_cell(np.array([4, 2, 3]), "triangle")
+    area = mesh.get_cell_area()
+
+    # Flux density with a fundamental and a 3rd harmonic in each element
+    f0 = 50
+    Nt = 40
+    time = np.linspace(0, 1 / f0, Nt, endpoint=False)
+    Bx_amp = np.array([1.0, 0.5, 1.5])
+    By_amp = np.array([0.2, 0.1, 0.3])
+    B = np.zeros((Nt, 3, 2))
+    B[..., 0] = Bx_amp[None, :] * np.cos(2 * np.pi * f0 * time[:, None])
+    B[..., 1] = By_amp[None, :] * np.sin(2 * np.pi * 3 * f0 * time[:, None])
+    Time = Data1D(name="time", unit="s", values=time)
+    Indice = Data1D(name="indice", values=[0, 1, 2], is_components=True)
+    B_sol = build_solution_vector(
+        field=B, axis_list=[Time, Indice], name="Magnetic Flux Density", symbol="B"
+    )
+    meshsol = MeshSolution(
+        label="core", mesh=[mesh], solution=[B_sol], group={"A": [0, 1], "B": [2]}
+    )
+
+    model = LossModelBertotti(
+        k_hy=2, alpha_hy=2, k_ed=0.5, alpha_ed=2, k_ex=0.1, alpha_ex=1.5
+    )
+    k_freq = [1, 2, 3]
+    LossSum = model.comp_loss_sum(meshsol, k_freq, group_names=["A", "B"], coeff=2)
+    assert LossSum.values.shape[:2] == (3, 2)
+
+    # Reference losses computed from the analytic spectrum
+    def loss_ref(f, Bamp):
+        f_norm = f / model.F_REF
+        B_norm = Bamp / model.B_REF
+        return np.array(
+            [
+                model.k_hy * f_norm * B_norm ** model.alpha_hy,
+                model.k_ed * (f_norm * B_norm) ** model.alpha_ed,
+                model.k_ex * (f_norm * B_norm) ** model.alpha_ex,
+            ]
+        )
+
+    for ik, k in enumerate(k_freq):
+        dens = loss_ref(k * f0, Bx_amp) + loss_ref(k * 3 * f0, By_amp)
+        ref_A = 2 * (dens[:, :2] * area[:2]).sum()
+        ref_B = 2 * (dens[:, 2] * area[2]).sum()
+        assert LossSum.values[ik, 0].sum() == pytest.approx(ref_A, rel=1e-6)
+        assert LossSum.values[ik, 1].sum() == pytest.approx(ref_B, rel=1e-6)
+
+    # The loss density is stored in the MeshSolution
+    labels = [sol.label for sol in meshsol.solution]
+    assert "LossDensComps" in labels
+    LossSum_stored = model.comp_loss_sum(meshsol, k_freq, coeff=2, is_stored=True)
+    assert LossSum_stored.values.sum() == pytest.approx(LossSum.values.sum())
+
+    # Other coefficients
+    model_10 = model.copy()
+    model_10.k_hy, model_10.k_ed, model_10.k_ex = 20, 5, 1
+    LossSum_10 = model_10.comp_loss_sum(meshsol, k_freq, coeff=2)
+    assert LossSum_10.values.sum() == pytest.approx(10 * LossSum.values.sum())
+
+    # Flux density modified in place
+    for comp in B_sol.field.components.values():
+        comp.values[:] = 2 * comp.values
+    LossSum_B = model.comp_loss_sum(meshsol, k_freq=[1], coeff=2)
+    dens = loss_ref(f0, 2 * Bx_amp) + loss_ref(3 * f0, 2 * By_amp)
+    assert LossSum_B.values.sum() == pytest.approx(2 * (dens * area).sum(), rel=1e-6)
+
+    # Per harmonic breakdown
+    freqs = LossSum.axes[2].values
+    ifreq = np.argmin(np.abs(freqs - 3 * f0))
+    assert LossSum.values[0, :, ifreq].sum() == pytest.approx(
+        2 * (loss_ref(3 * f0, By_amp) * area).sum(), rel=1e-6
+    )
+
+
+# To run it without pytest
+if __name__ == "__main__":
+    test_LossModelBertotti_sum()
@@ -0,0 +1,157 @@
+# -*- coding: utf-8 -*-
+from os.path import join
+from numpy import pi, linspace, sqrt, meshgrid, arange, array, cos, sin, roll
+import pytest
+from Tests import save_path
+from pyleecan.definitions import DATA_DIR
+
+from pyleecan.Classes.Simu1 import Simu1
+from pyleecan.Classes.StructModal import StructModal
+from pyleecan.Classes.Mode import Mode
+from pyleecan.Classes.Output import Output
+from pyleecan.Functions.load import load
+from pyleecan.Functions.Structural.comp_modes import comp_modes
+
+
+# get the machine
+machine_1 = load(join(DATA_DIR, "Machine", "Toyota_Prius.json"))
+
+
+def _ring_mesh(Rint, Rext, Nr=3, Nt=180):
+    """Ring quadrangle mesh dict (cf StructPlaneStress.gen_mesh)"""
+    r = linspace(Rint, Rext, Nr + 1)
+    t = linspace(0, 2 * pi, Nt, endpoint=False)
+    R, T = meshgrid(r, t, indexing="ij")
+    nodes = array([(R * cos(T)).ravel(), (R * sin(T)).ravel()]).T
+    ind = arange(nodes.shape[0]).reshape(R.shape)
+    ind_next = roll(ind, -1, axis=1)
+    quad = array(
+        [
+            ind[:-1].ravel(),
+            ind[1:].ravel(),
+            ind_next[1:].ravel(),
+            ind_next[:-1].ravel(),
+        ]
+    ).T
+    return {
+        "node": nodes,
+        "cell": {"quad": quad},
+        "body": {"quad": array(["Lamination"] * quad.shape[0])},
+        "boundary": dict(),
+    }
+
+
+@pytest.mark.StructElmer
+@pytest.mark.SingleOP
+def test_StructModal_ring():
+    """Check the modes of a thin ring against the analytical solution"""
+    machine = machine_1.copy()
+    mat = machine.stator.mat_type.struct
+    Rint, Rext = 0.1, 0.11
+
+    simu = Simu1(name="test_StructModal_ring", machine=machine)
+    output = Output(simu=simu)
+    simu.struct = StructModal(Nmode=8)
+    simu.input.N0 = 1000  # rpm
+    simu.struct.comp_axes(output)
+
+    mesh_dict = _ring_mesh(Rint, Rext)
+    freqs, shapes = simu.struct.solve_FEA(output, mesh_dict)
+    simu.struct.get_meshsolution(output, mesh_dict, freqs, shapes)
+
+    # Modes are stored in the meshsolution, by pairs of same order (n=2,3..)
+    mode_list = output.struct.meshsolution.solution
+    assert len(mode_list) == 8
+    assert all([isinstance(mode, Mode) for mode in mode_list])
+    assert [mode.order_circ for mode in mode_list] == [2, 2, 3, 3, 4, 4, 5, 5]
+
+    # Thin ring bending modes (plane stress)
+    h = Rext - Rint
+    Rm = (Rint + Rext) / 2
+    Ep = mat.Ex / (1 - mat.nu_xy ** 2)
+    for mode in mode_list:
+        n = mode.order_circ
+        f_ref = (
+            sqrt(Ep * h ** 2 / (12 * mat.rho * Rm ** 4))
+            * n
+            * (n ** 2 - 1)
+            / sqrt(n ** 2 + 1)
+            / (2 * pi)
+        )
+        assert mode.nat_freq == pytest.approx(f_ref, rel=5e-2)
+
+    # Material scaling solved with the stored factorization
+    factorization = simu.struct.factorization
+    assert factorization.nb_factorization == 1
+    nu = {"quad": mat.nu_xy}
+    freqs2, _ = comp_modes(
+        mesh_dict["node"],
+        mesh_dict["cell"],
+        {"quad": 4 * mat.Ex},
+        nu,
+        {"quad": mat.rho},
+        Nmode=8,
+        freq_min=1,
+        factorization=factorization,
+    )
+    assert factorization.nb_factorization == 1
+    assert freqs2 == pytest.approx(2 * freqs)
+
+    # Modes below freq_min after the scaling are removed
+    freqs3, _ = comp_modes(
+        mesh_dict["node"],
+        mesh_dict["cell"],
+        {"quad": mat.Ex},
+        nu,
+        {"quad": mat.rho * (freqs[0] / 0.5) ** 2},
+        Nmode=8,
+        freq_min=1,
+        factorization=factorization,
+    )
+    assert factorization.nb_factorization == 1
+    assert freqs3.min() >= 1
+    assert freqs3 == pytest.approx(freqs[2:] * 0.5 / freqs[0])
+
+    # Other Poisson ratio: new factorization
+    comp_modes(
+        mesh_dict["node"],
+        mesh_dict["cell"],
+        {"quad": mat.Ex},
+        {"quad": 0.2},
+        {"quad": mat.rho},
+        Nmode=8,
+        freq_min=1,
+        factorization=factorization,
+    )
+    assert factorization.nb_factorization == 2
+
+    # The factorization is shared by the copies, not saved
+    assert simu.struct.copy().factorization is factorization
+    file_path = join(save_path, "test_StructModal_ring.json")
+    simu.struct.save(file_path)
+    assert load(file_path).factorization is None
+
+
+@pytest.mark.long_5s
+@pytest.mark.StructElmer
+@pytest.mark.IPMSM
+@pytest.mark.SingleOP
+def test_StructModal_Prius():
+    """Test StructModal on the Toyota Prius stator"""
+    machine = machine_1.copy()
+
+    simu = Simu1(name="test_StructModal_Prius", machine=machine)
+    output = Output(simu=simu)
+    output.path_result = save_path
+
+    simu.struct = StructModal(Nmode=10, is_get_mesh=True)
+    simu.input.N0 = 1000  # rpm
+    simu.run()
+
+    assert len(output.struct.meshsolution.solution) == 10
+    return output
+
+
+# To run it without pytest
+if __name__ == "__main__":
+    test_StructModal_ring()
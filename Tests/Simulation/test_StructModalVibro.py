@@ -0,0 +1,108 @@
+# -*- coding: utf-8 -*-
+from os.path import join
+from numpy import pi, linspace, meshgrid, cos, exp, zeros, argmin, abs as np_abs
+from scipy.sparse.linalg import spsolve
+import pytest
+from SciDataTool import DataTime, Data1D, VectorField
+
+from pyleecan.definitions import DATA_DIR
+from pyleecan.Classes.Simu1 import Simu1
+from pyleecan.Classes.StructModalVibro import StructModalVibro
+from pyleecan.Classes.Output import Output
+from pyleecan.Classes.OutForce import OutForce
+from pyleecan.Functions.load import load
+from pyleecan.Functions.Structural.assemble_plane_stress import assemble_plane_stress
+from pyleecan.Functions.Structural.comp_modal_response import get_circle_nodes
+from Tests.Simulation.test_StructModal import _ring_mesh
+
+
+# get the machine
+machine_1 = load(join(DATA_DIR, "Machine", "Toyota_Prius.json"))
+
+
+@pytest.mark.StructElmer
+@pytest.mark.SingleOP
+def test_StructModalVibro_ring():
+    """Check the modal superposition against a direct harmonic solution on a ring
+    loaded by a rotating force wave of order 2"""
+    machine = machine_1.copy()
+    stator = machine.stator
+    mat = stator.mat_type.struct
+    N0 = 1000  # rpm
+    P0 = 1e4  # N/m^2
+    f0, r0 = 50, 2
+
+    simu = Simu1(name="test_StructModalVibro_ring", machine=machine)
+    output = Output(simu=simu)
+    simu.struct = StructModalVibro(Nmode=6, damping=0, N0_list=[N0, 2 * N0])
+    simu.input.N0 = N0
+    simu.struct.comp_axes(output)
+
+    # Rotating force wave on the stator bore
+    time = linspace(0, 1 / 10, 40, endpoint=False)
+    angle = linspace(0, 2 * pi, 64, endpoint=False)
+    T, A = meshgrid(time, angle, indexing="ij")
+    Time = Data1D(name="time", unit="s", values=time)
+    Angle = Data1D(name="angle", unit="rad", values=angle)
+    output.force = OutForce()
+    output.force.AGSF = VectorField(name="Air gap Surface Force", symbol="AGSF")
+    output.force.AGSF.components["radial"] = DataTime(
+        name="Radial air gap surface force",
+        unit="N/m^2",
+        symbol="AGSF_r",
+        axes=[Time, Angle],
+        values=P0 * cos(2 * pi * f0 * T + r0 * A),
+    )
+
+    mesh_dict = _ring_mesh(stator.Rint, stator.Rext, Nr=4, Nt=120)
+    freqs_mode, shapes = simu.struct.solve_FEA(output, mesh_dict)
+    simu.struct.comp_response(output, mesh_dict, freqs_mode, shapes)
+
+    Yr = output.struct.Yr
+    freqs = Yr.axes[1].values
+    wavenumber = Yr.axes[2].values
+    assert Yr.values.shape == (2, freqs.size, wavenumber.size)
+    i_f = argmin(np_abs(freqs - f0))
+    i_r = argmin(np_abs(wavenumber - r0))
+
+    # Direct harmonic solution (K - w^2 M) U = F for both speeds
+    nodes = mesh_dict["node"]
+    cells = mesh_dict["cell"]
+    K, M, _ = assemble_plane_stress(
+        nodes,
+        cells,
+        {"quad": mat.Ex},
+        {"quad": mat.nu_xy},
+        {"quad": mat.rho},
+    )
+    ind, theta, dtheta = get_circle_nodes(nodes, stator.Rint)
+    F = zeros(2 * nodes.shape[0], dtype=complex)
+    Fn = P0 * exp(1j * r0 * theta) * stator.Rint * dtheta
+    F[2 * ind] = Fn * cos(theta)
+    F[2 * ind + 1] = Fn * cos(theta - pi / 2)
+    ind, theta, dtheta = get_circle_nodes(nodes, stator.Rext)
+    for ii, k in enumerate([1, 2]):
+        w = 2 * pi * f0 * k
+        U = spsolve((K - w ** 2 * M).tocsc(), F).reshape((-1, 2))
+        ur = U[ind, 0] * cos(theta) + U[ind, 1] * cos(theta - pi / 2)
+        Y_ref = (ur * exp(-1j * r0 * theta) * dtheta).sum() / (2 * pi)
+        assert Yr.values[ii, i_f, i_r] == pytest.approx(Y_ref, rel=2e-2)
+        # Only the force wavenumber responds on a ring
+        assert np_abs(Yr.values[ii, i_f, :]).sum() == pytest.approx(
+            np_abs(Y_ref), rel=2e-2
+        )
+
+    # Velocity and Equivalent Radiated Power
+    Vr = output.struct.Vr.values
+    assert Vr[1, i_f, i_r] == pytest.approx(4j * pi * f0 * Yr.values[1, i_f, i_r])
+    ERP = output.struct.ERP.values
+    assert ERP.shape == (2, freqs.size)
+    S = 2 * pi * stator.Rext * stator.L1
+    assert ERP[0, i_f] == pytest.approx(
+        1.2 * 343 * S * np_abs(Vr[0, i_f, i_r]) ** 2 / 2, rel=1e-3
+    )
+
+
+# To run it without pytest
+if __name__ == "__main__":
+    test_StructModalVibro_ring()
@@ -0,0 +1,118 @@
+# -*- coding: utf-8 -*-
+from os.path import join
+from numpy import pi, linspace, sqrt, meshgrid, arange, array, cos, sin, abs as np_abs
+import pytest
+from Tests import save_path
+from pyleecan.definitions import DATA_DIR
+
+from pyleecan.Classes.Simu1 import Simu1
+from pyleecan.Classes.StructPlaneStress import StructPlaneStress
+from pyleecan.Classes.Output import Output
+from pyleecan.Functions.load import load
+
+
+# get the machine
+machine_1 = load(join(DATA_DIR, "Machine", "Toyota_Prius.json"))
+
+
+def _quarter_disk_mesh(Rint, Rext, Nr=12, Nt=24):
+    """Quarter annulus quadrangle mesh dict (cf StructPlaneStress.gen_mesh)"""
+    r = linspace(Rint, Rext, Nr + 1)
+    t = linspace(0, pi / 2, Nt + 1)
+    R, T = meshgrid(r, t, indexing="ij")
+    nodes = array([(R * cos(T)).ravel(), (R * sin(T)).ravel()]).T
+    ind = arange(nodes.shape[0]).reshape(R.shape)
+    quad = array(
+        [
+            ind[:-1, :-1].ravel(),
+            ind[1:, :-1].ravel(),
+            ind[1:, 1:].ravel(),
+            ind[:-1, 1:].ravel(),
+        ]
+    ).T
+    return {
+        "node": nodes,
+        "cell": {"quad": quad},
+        "body": {"quad": array(["Lamination"] * quad.shape[0])},
+        "boundary": {
+            "MASTER_ROTOR_BOUNDARY": ind[:, 0],
+            "SLAVE_ROTOR_BOUNDARY": ind[:, -1],
+        },
+    }
+
+
+@pytest.mark.StructElmer
+@pytest.mark.SingleOP
+def test_StructPlaneStress_disk():
+    """Check the speed sweep on a rotating disk against the analytical solution"""
+    machine = machine_1.copy()
+    Rint, Rext = machine.rotor.Rint, machine.rotor.Rext
+    mat = machine.rotor.mat_type.struct
+    E, nu, rho = mat.Ex, mat.nu_xy, mat.rho
+
+    simu = Simu1(name="test_StructPlaneStress_disk", machine=machine)
+    output = Output(simu=simu)
+    simu.struct = StructPlaneStress(
+        N0_list=[5000, 10000, 20000], include_magnets=False, is_get_mesh=True
+    )
+    simu.input.N0 = 10000
+    simu.struct.comp_axes(output)
+
+    mesh_dict = _quarter_disk_mesh(Rint, Rext)
+    U, VM = simu.struct.solve_FEA(output, mesh_dict)
+    assert U.shape == (3, mesh_dict["node"].shape[0], 2)
+
+    # Analytical radial displacement of a rotating annular disk (plane stress)
+    nodes = mesh_dict["node"]
+    r = sqrt(nodes[:, 0] ** 2 + nodes[:, 1] ** 2)
+    for ii, N0 in enumerate(simu.struct.N0_list):
+        omega = 2 * pi * N0 / 60
+        C = (3 + nu) / 8 * rho * omega ** 2
+        s_r = C * (Rint ** 2 + Rext ** 2 - Rint ** 2 * Rext ** 2 / r ** 2 - r ** 2)
+        s_t = C * (
+            Rint ** 2
+            + Rext ** 2
+            + Rint ** 2 * Rext ** 2 / r ** 2
+            - (1 + 3 * nu) / (3 + nu) * r ** 2
+        )
+        u_r = r / E * (s_t - nu * s_r)
+        u_r_fea = (U[ii, :, 0] * nodes[:, 0] + U[ii, :, 1] * nodes[:, 1]) / r
+        assert np_abs(u_r_fea - u_r).max() < 1e-2 * u_r.max()
+
+        # max. von Mises stress is the hoop stress at inner radius
+        assert VM[ii].max() == pytest.approx(s_t.max(), rel=5e-2)
+
+    simu.struct.get_meshsolution(output, mesh_dict, U, VM)
+    meshsol = output.struct.meshsolution
+    assert meshsol.get_solution(label="vonmises").field.values.shape == VM.shape
+    assert len(meshsol.group["Lamination"]) == mesh_dict["cell"]["quad"].shape[0]
+
+
+@pytest.mark.long_5s
+@pytest.mark.StructElmer
+@pytest.mark.IPMSM
+@pytest.mark.SingleOP
+def test_StructPlaneStress_HoleM50():
+    """Test StructPlaneStress speed sweep without magnets on HoleM50 rotor"""
+    machine = machine_1.copy()
+    machine.rotor.hole[0].W2 = 1.0e-3
+
+    simu = Simu1(name="test_StructPlaneStress_HoleM50", machine=machine)
+    output = Output(simu=simu)
+    output.path_result = save_path
+
+    simu.struct = StructPlaneStress(
+        N0_list=[2000 * ii for ii in range(1, 11)],
+        include_magnets=False,
+        is_get_mesh=True,
+    )
+    simu.input.N0 = 10000  # rpm
+    simu.run()
+
+    assert output.struct.meshsolution is not None
+    return output
+
+
+# To run it without pytest
+if __name__ == "__main__":
+    test_StructPlaneStress_disk()
@@ -0,0 +1,150 @@
+import pytest
+from os.path import join
+
+import numpy as np
+
+from pyleecan.Classes.InputCurrent import InputCurrent
+from pyleecan.Classes.VarLoadCurrent import VarLoadCurrent
+from pyleecan.Classes.DataKeeper import DataKeeper
+from pyleecan.Functions.Simulation.VarLoad.comp_refined_OP import comp_refined_OP
+from pyleecan.Functions.load import load
+from pyleecan.definitions import DATA_DIR
+from pyleecan.Classes.Simu1 import Simu1
+
+
+@pytest.mark.IPMSM
+@pytest.mark.VarLoadCurrent
+def test_multisim_adaptive():
+    """Check that the operating points are added in batches where the results
+    vary quickly (steep variation around Iq=120 A) and along the limit on the
+    current amplitude, within the simulation budget"""
+    Toyota_Prius = load(join(DATA_DIR, "Machine", "Toyota_Prius.json"))
+    simu = Simu1(name="test_multisim_adaptive", machine=Toyota_Prius)
+    simu.input = InputCurrent(N0=2000, Id_ref=0, Iq_ref=0, Nt_tot=4, Na_tot=64)
+    Id, Iq = np.meshgrid(np.linspace(-200, 0, 3), np.linspace(0, 200, 3))
+    OP_matrix = np.column_stack((2000 * np.ones(Id.size), Id.ravel(), Iq.ravel()))
+    simu.var_simu = VarLoadCurrent(
+        OP_matrix=OP_matrix,
+        type_OP_matrix=1,
+        datakeeper_list=[
+            DataKeeper(
+                symbol="T",
+                keeper="lambda output: np.tanh((output.simu.input.Iq_ref - 120) / 10)",
+            ),
+            DataKeeper(
+                symbol="U",
+                keeper="lambda output: np.hypot(output.simu.input.Id_ref, output.simu.input.Iq_ref)",
+            ),
+        ],
+        is_keep_all_output=True,
+        adapt_symbol_list=["T"],
+        adapt_limit_symbol="U",
+        adapt_limit_value=150,
+        adapt_tol=0.1,
+        adapt_nb_simu_max=40,
+        adapt_batch_size=8,
+    )
+    xout = simu.run()
+    var_simu = xout.simu.var_simu
+    OP_matrix = var_simu.OP_matrix
+
+    # Budget respected, XOutput consistent with the operating points
+    assert 9 < xout.nb_simu <= 40
+    assert OP_matrix.shape == (xout.nb_simu, 3)
+    assert len(xout.paramexplorer_list[0].value) == xout.nb_simu
+    assert len(xout.output_list) == xout.nb_simu
+    for symbol in ["T", "U"]:
+        assert len(xout[symbol].result) == xout.nb_simu
+    np.testing.assert_allclose(xout["T"].result, np.tanh((OP_matrix[:, 2] - 120) / 10))
+    np.testing.assert_allclose(
+        xout["U"].result, np.hypot(OP_matrix[:, 1], OP_matrix[:, 2])
+    )
+    for ii in [9, xout.nb_simu - 1]:
+        assert xout.output_list[ii].simu.input.Iq_ref == OP_matrix[ii, 2]
+
+    # Added points in the steep region or close to the limit
+    OP_add = OP_matrix[9:]
+    assert len(np.unique(OP_add, axis=0)) == OP_add.shape[0]
+    is_steep = np.abs(OP_add[:, 2] - 120) < 60
+    is_limit = np.abs(np.hypot(OP_add[:, 1], OP_add[:, 2]) - 150) < 60
+    assert np.all(is_steep | is_limit)
+    assert np.sum(np.abs(OP_add[:, 2] - 120) < 30) >= 2
+
+
+@pytest.mark.IPMSM
+@pytest.mark.VarLoadCurrent
+def test_multisim_adaptive_tol():
+    """Check that the refinement stops once the tolerance is reached"""
+    Toyota_Prius = load(join(DATA_DIR, "Machine", "Toyota_Prius.json"))
+    simu = Simu1(name="test_multisim_adaptive_tol", machine=Toyota_Prius)
+    OP = np.column_stack((np.zeros(5), np.linspace(0, 1, 5)))
+    value = 2 * OP[:, 1]
+    assert comp_refined_OP(OP, value, tol=0.3, nb_max=10).shape == (0, 2)
+    OP_new = comp_refined_OP(OP, value, tol=0.2, nb_max=10)
+    np.testing.assert_allclose(OP_new[:, 1], [0.125, 0.375, 0.625, 0.875])
+    assert comp_refined_OP(OP, value, tol=0.2, nb_max=2).shape == (2, 2)
+
+    # Coarse grid already accurate: no simulation added
+    simu.input = InputCurrent(N0=2000, Id_ref=0, Iq_ref=0, Nt_tot=4, Na_tot=64)
+    Id, Iq = np.meshgrid(np.linspace(-200, 0, 3), np.linspace(0, 200, 3))
+    OP_matrix = np.column_stack((2000 * np.ones(Id.size), Id.ravel(), Iq.ravel()))
+    simu.var_simu = VarLoadCurrent(
+        OP_matrix=OP_matrix,
+        type_OP_matrix=1,
+        datakeeper_list=[
+            DataKeeper(
+                symbol="T",
+                keeper="lambda output: np.tanh((output.simu.input.Iq_ref - 120) / 10)",
+            ),
+            DataKeeper(
+                symbol="U",
+                keeper="lambda output: np.hypot(output.simu.input.Id_ref, output.simu.input.Iq_ref)",
+            ),
+        ],
+        is_keep_all_output=True,
+        adapt_symbol_list=["T"],
+        adapt_limit_symbol="U",
+        adapt_limit_value=1e6,
+        adapt_tol=2,
+    )
+    xout = simu.run()
+    assert xout.nb_simu == 9
+
+
+@pytest.mark.IPMSM
+@pytest.mark.VarLoadCurrent
+def test_multisim_adaptive_collinear():
+    """Check the refinement when the operating points are aligned (Id and Iq
+    varying together, speed varying with the current)"""
+    Toyota_Prius = load(join(DATA_DIR, "Machine", "Toyota_Prius.json"))
+    simu = Simu1(name="test_multisim_adaptive_collinear", machine=Toyota_Prius)
+    ratio = np.linspace(0, 1, 5)
+    OP = np.column_stack((1000 + 1000 * ratio, -100 * ratio, 200 * ratio))
+    OP_new = comp_refined_OP(OP, np.tanh((OP[:, 2] - 120) / 10), tol=0.1, nb_max=10)
+    np.testing.assert_allclose(OP_new, [[1625, -62.5, 125]])
+    # Duplicated operating point
+    OP_dup = np.concatenate((OP, OP[:1]))
+    assert comp_refined_OP(OP_dup, 2 * OP_dup[:, 2], tol=0.2, nb_max=10).shape == (4, 3)
+
+    simu.input = InputCurrent(N0=2000, Id_ref=0, Iq_ref=0, Nt_tot=4, Na_tot=64)
+    simu.var_simu = VarLoadCurrent(
+        OP_matrix=np.column_stack((2000 * np.ones(5), OP[:, 1:])),
+        type_OP_matrix=1,
+        datakeeper_list=[
+            DataKeeper(
+                symbol="T",
+                keeper="lambda output: np.tanh((output.simu.input.Iq_ref - 120) / 10)",
+            ),
+        ],
+        is_keep_all_output=True,
+        adapt_symbol_list=["T"],
+        adapt_tol=0.1,
+        adapt_nb_simu_max=12,
+    )
+    xout = simu.run()
+    OP_matrix = xout.simu.var_simu.OP_matrix
+    assert 5 < xout.nb_simu <= 12
+    # Added points on the line, in the steep region
+    np.testing.assert_allclose(OP_matrix[5:, 2], -2 * OP_matrix[5:, 1])
+    assert np.all(np.abs(OP_matrix[5:, 2] - 120) < 60)
+    np.testing.assert_allclose(xout["T"].result, np.tanh((OP_matrix[:, 2] - 120) / 10))
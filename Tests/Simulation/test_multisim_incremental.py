@@ -0,0 +1,132 @@
+import pytest
+from os.path import join
+
+import numpy as np
+
+from pyleecan.Classes.InputCurrent import InputCurrent
+from pyleecan.Classes.InputFlux import InputFlux
+from pyleecan.Classes.ImportMatrixVal import ImportMatrixVal
+from pyleecan.Classes.ForceMT import ForceMT
+from pyleecan.Classes.VarParam import VarParam
+from pyleecan.Classes.ParamExplorerSet import ParamExplorerSet
+from pyleecan.Classes.DataKeeper import DataKeeper
+from pyleecan.Functions.load import load
+from pyleecan.definitions import DATA_DIR
+from pyleecan.Classes.Simu1 import Simu1
+
+
+@pytest.mark.IPMSM
+@pytest.mark.VarParam
+@pytest.mark.ForceMT
+def test_multisim_incremental():
+    """Check that only the stages with modified inputs are computed"""
+    Toyota_Prius = load(join(DATA_DIR, "Machine", "Toyota_Prius.json"))
+    simu1 = Simu1(name="test_multisim_incremental", machine=Toyota_Prius)
+    Nt, Na, p = 16, 256, 4
+    time = np.linspace(0, 1 / 50, Nt, endpoint=False)
+    angle = np.linspace(0, 2 * np.pi, Na, endpoint=False)
+    phase = p * angle[None, :] - 2 * np.pi * 50 * time[:, None]
+    simu1.input = InputFlux(
+        time=ImportMatrixVal(value=time),
+        angle=ImportMatrixVal(value=angle),
+        B_dict={
+            "Br": ImportMatrixVal(value=np.cos(phase) + 0.1 * np.cos(5 * phase)),
+            "Bt": ImportMatrixVal(value=0.2 * np.sin(phase)),
+        },
+        OP=InputCurrent(N0=750, Id_ref=0, Iq_ref=0),
+    )
+    simu1.force = ForceMT(is_agsf_transfer=True)
+    simu1.is_profile = True
+    Rsbo = simu1.machine.stator.Rint
+
+    xout_list = list()
+    for is_incremental in [False, True]:
+        simu = simu1.copy()
+        simu.var_simu = VarParam(
+            paramexplorer_list=[
+                ParamExplorerSet(
+                    value=[Rsbo * 1.01, Rsbo * 1.02, Rsbo * 1.03],
+                    setter="simu.force.Rsbo_enforced_transfer",
+                    symbol="X",
+                ),
+            ],
+            datakeeper_list=[
+                DataKeeper(
+                    symbol="AGSF",
+                    keeper="lambda output: np.max(np.abs(output.force.AGSF.components['radial'].values))",
+                )
+            ],
+            is_keep_all_output=True,
+            is_incremental=is_incremental,
+        )
+        xout_list.append(simu.run())
+    xout_full, xout = xout_list
+
+    # Same results
+    assert xout["AGSF"].result == pytest.approx(xout_full["AGSF"].result)
+    assert xout["AGSF"].result[2] < xout["AGSF"].result[0]
+
+    # Input (flux density) reused, force computed for each simulation
+    profile = xout.profile
+    for index in range(3):
+        stage_list = [
+            stage
+            for stage, idx in zip(profile["stage"], profile["index"])
+            if idx == index
+        ]
+        assert "Input.gen_input" not in stage_list
+        assert "Force.run" in stage_list
+        assert xout.output_list[index].simu.reused_stage_list == [
+            "Electrical",
+            "Magnetics",
+        ]
+    assert profile["stage"].count("Input.gen_input") == 1  # Reference only
+    assert xout_full.profile["stage"].count("Input.gen_input") == 4
+    assert xout_full.output_list[0].simu.reused_stage_list == []
+
+    # Copy of the reference results
+    out_ref = xout.get_xoutput_ref()
+    assert xout.output_list[0].mag is not out_ref.mag
+    np.testing.assert_array_equal(
+        xout.output_list[0].mag.B.components["radial"].values,
+        out_ref.mag.B.components["radial"].values,
+    )
+
+
+@pytest.mark.IPMSM
+@pytest.mark.VarParam
+def test_multisim_incremental_input():
+    """Check that all the stages are computed when the input is modified"""
+    Toyota_Prius = load(join(DATA_DIR, "Machine", "Toyota_Prius.json"))
+    simu = Simu1(name="test_multisim_incremental_input", machine=Toyota_Prius)
+    Nt, Na, p = 16, 256, 4
+    time = np.linspace(0, 1 / 50, Nt, endpoint=False)
+    angle = np.linspace(0, 2 * np.pi, Na, endpoint=False)
+    phase = p * angle[None, :] - 2 * np.pi * 50 * time[:, None]
+    simu.input = InputFlux(
+        time=ImportMatrixVal(value=time),
+        angle=ImportMatrixVal(value=angle),
+        B_dict={
+            "Br": ImportMatrixVal(value=np.cos(phase) + 0.1 * np.cos(5 * phase)),
+            "Bt": ImportMatrixVal(value=0.2 * np.sin(phase)),
+        },
+        OP=InputCurrent(N0=750, Id_ref=0, Iq_ref=0),
+    )
+    simu.force = ForceMT(is_agsf_transfer=True)
+    simu.is_profile = True
+    simu.var_simu = VarParam(
+        paramexplorer_list=[
+            ParamExplorerSet(value=[1000, 2000], setter="simu.input.OP.N0", symbol="X"),
+        ],
+        datakeeper_list=[
+            DataKeeper(
+                symbol="AGSF",
+                keeper="lambda output: np.max(np.abs(output.force.AGSF.components['radial'].values))",
+            )
+        ],
+        is_keep_all_output=True,
+        is_incremental=True,
+    )
+    xout = simu.run()
+    assert xout.profile["stage"].count("Input.gen_input") == 3
+    assert xout.output_list[0].simu.reused_stage_list == []
@@ -0,0 +1,154 @@
+import pytest
+from os.path import join
+
+import numpy as np
+
+from pyleecan.Classes.InputCurrent import InputCurrent
+from pyleecan.Classes.InputElec import InputElec
+from pyleecan.Classes.VarLoadCurrent import VarLoadCurrent
+from pyleecan.Classes.VarParam import VarParam
+from pyleecan.Classes.ParamExplorerSet import ParamExplorerSet
+from pyleecan.Classes.DataKeeper import DataKeeper
+from pyleecan.Functions.load import load
+from pyleecan.definitions import DATA_DIR
+from pyleecan.Classes.Simu1 import Simu1
+
+
+@pytest.mark.IPMSM
+@pytest.mark.VarLoadCurrent
+def test_multisim_reuse_machine_VarLoadCurrent():
+    """Check that the machine and the geometry are shared between the
+    simulations of a variable load (same results as with the copies)"""
+    Toyota_Prius = load(join(DATA_DIR, "Machine", "Toyota_Prius.json"))
+    simu1 = Simu1(
+        name="test_multisim_reuse_machine_VarLoadCurrent", machine=Toyota_Prius
+    )
+    OP_matrix = np.zeros((4, 3))
+    OP_matrix[:, 0] = [1000, 2000, 3000, 4000]
+    OP_matrix[:, 2] = 100
+    simu1.input = InputCurrent(N0=2000, Id_ref=0, Iq_ref=100, Nt_tot=4, Na_tot=64)
+
+    xout_list = list()
+    for is_reuse_machine in [False, True]:
+        simu = simu1.copy()
+        simu.var_simu = VarLoadCurrent(
+            OP_matrix=OP_matrix,
+            type_OP_matrix=0,
+            is_reuse_machine=is_reuse_machine,
+            datakeeper_list=[
+                DataKeeper(symbol="Rgap", keeper="lambda output: output.geo.Rgap_mec"),
+                DataKeeper(
+                    symbol="Sslot", keeper="lambda output: output.geo.stator.S_slot"
+                ),
+            ],
+            is_keep_all_output=True,
+        )
+        xout_list.append(simu.run())
+    xout_copy, xout = xout_list
+
+    # Same results
+    for symbol in ["Rgap", "Sslot"]:
+        assert xout[symbol].result == pytest.approx(xout_copy[symbol].result)
+    assert xout["Rgap"].result[0] == pytest.approx(
+        simu.machine.comp_Rgap_mec(), rel=1e-12
+    )
+
+    # Shared machine, geometry computed only once (copied in each Output)
+    machine_ref = xout.get_xoutput_ref().simu.machine
+    geo_ref = xout.get_xoutput_ref().geo
+    for ii, out in enumerate(xout.output_list):
+        assert out.simu.machine is machine_ref
+        if ii != 1:  # Simulation 1 is the reference one
+            assert out.simu.geo_enforced is geo_ref
+            assert out.geo is not geo_ref
+            assert out.geo.parent is out
+            assert out.geo.stator.S_slot == geo_ref.stator.S_slot
+    assert geo_ref.parent is xout.get_xoutput_ref()
+    assert xout_copy.output_list[0].simu.machine is not machine_ref
+    assert xout_copy.output_list[0].geo is not xout_copy.output_list[2].geo
+    # The original simulation is not modified
+    assert simu.machine is not machine_ref
+    assert simu.geo_enforced is None
+
+
+@pytest.mark.IPMSM
+@pytest.mark.VarParam
+def test_multisim_reuse_machine_VarParam():
+    """Check that the machine is shared only if the setters don't modify it"""
+    Toyota_Prius = load(join(DATA_DIR, "Machine", "Toyota_Prius.json"))
+    simu1 = Simu1(name="test_multisim_reuse_machine_VarParam", machine=Toyota_Prius)
+    simu1.input = InputCurrent(N0=2000, Id_ref=0, Iq_ref=100, Nt_tot=4, Na_tot=64)
+    datakeeper_list = [
+        DataKeeper(symbol="Rgap", keeper="lambda output: output.geo.Rgap_mec"),
+        DataKeeper(symbol="Sslot", keeper="lambda output: output.geo.stator.S_slot"),
+    ]
+
+    # Speed sweep: same machine
+    simu = simu1.copy()
+    simu.var_simu = VarParam(
+        paramexplorer_list=[
+            ParamExplorerSet(value=[1000, 3000], setter="simu.input.N0", symbol="N0")
+        ],
+        datakeeper_list=[keeper.copy() for keeper in datakeeper_list],
+        is_keep_all_output=True,
+    )
+    xout = simu.run()
+    machine_ref = xout.get_xoutput_ref().simu.machine
+    assert [out.simu.machine is machine_ref for out in xout.output_list] == [
+        True,
+        True,
+    ]
+
+    # Slot height sweep: different machines
+    H2_ref = simu.machine.stator.slot.H2
+    simu = simu1.copy()
+    simu.var_simu = VarParam(
+        paramexplorer_list=[
+            ParamExplorerSet(
+                value=[H2_ref, 1.1 * H2_ref],
+                setter="simu.machine.stator.slot.H2",
+                symbol="H2",
+            )
+        ],
+        datakeeper_list=[keeper.copy() for keeper in datakeeper_list],
+        is_keep_all_output=True,
+    )
+    xout = simu.run()
+    machine_ref = xout.get_xoutput_ref().simu.machine
+    # First simulation matches the reference one (output reused)
+    assert xout.output_list[0].simu.machine is machine_ref
+    assert xout.output_list[1].simu.machine is not machine_ref
+    assert xout.output_list[1].simu.geo_enforced is None
+    assert xout["Sslot"].result[1] > xout["Sslot"].result[0]
+    assert xout["Rgap"].result[1] == pytest.approx(xout["Rgap"].result[0])
+
+
+@pytest.mark.IPMSM
+@pytest.mark.VarParam
+def test_multisim_reuse_machine_rot_dir():
+    """Check that the geometry updated by each simulation (rotation direction)
+    is not shared between the kept Outputs"""
+    Toyota_Prius = load(join(DATA_DIR, "Machine", "Toyota_Prius.json"))
+    simu = Simu1(name="test_multisim_reuse_machine_rot_dir", machine=Toyota_Prius)
+    simu.input = InputElec(
+        N0=2000, Id_ref=0, Iq_ref=100, Nt_tot=4, Na_tot=64, rot_dir=1
+    )
+    simu.var_simu = VarParam(
+        paramexplorer_list=[
+            ParamExplorerSet(
+                value=[-1, 1, -1], setter="simu.input.rot_dir", symbol="rot"
+            )
+        ],
+        datakeeper_list=[
+            DataKeeper(symbol="rot_dir", keeper="lambda output: output.geo.rot_dir")
+        ],
+        is_keep_all_output=True,
+    )
+    xout = simu.run()
+    machine_ref = xout.get_xoutput_ref().simu.machine
+    assert xout["rot_dir"].result == [-1, 1, -1]
+    assert [out.geo.rot_dir for out in xout.output_list] == [-1, 1, -1]
+    for out in xout.output_list:
+        assert out.simu.machine is machine_ref
+        assert out.geo.parent is out
+    assert xout.get_xoutput_ref().geo.rot_dir == 1
@@ -0,0 +1,127 @@
+import pytest
+from os import makedirs, remove
+from os.path import isdir, isfile, join
+
+import numpy as np
+
+from pyleecan.Functions.load import load
+from pyleecan.Functions.Simulation.VarSimu.result_store import (
+    ResultStoreError,
+    load_store,
+)
+from pyleecan.definitions import DATA_DIR
+from pyleecan.Classes.Simu1 import Simu1
+from pyleecan.Classes.InputElec import InputElec
+from pyleecan.Classes.VarParam import VarParam
+from pyleecan.Classes.ParamExplorerSet import ParamExplorerSet
+from pyleecan.Classes.DataKeeper import DataKeeper
+from Tests import save_path
+
+N0_list = [1000, 1500, 2000, 2500, 3000]
+CALL_LIST = list()  # Index of the simulations that called the keeper
+
+
+def keep_N0(output):
+    CALL_LIST.append(output.simu.index)
+    return output.elec.N0
+
+
+def keep_N0_error(output):
+    """Error at the simulation N0=2500"""
+    CALL_LIST.append(output.simu.index)
+    return 1 / (output.elec.N0 - 2500) + output.elec.N0
+
+
+@pytest.mark.IPMSM
+@pytest.mark.VarParam
+def test_multisim_store():
+    """Check the results streamed in the store and the resume of an
+    interrupted multi-simulation"""
+    folder = join(save_path, "test_multisim_store")
+    if not isdir(folder):
+        makedirs(folder)
+    path_store = join(folder, "store.h5")
+    if isfile(path_store):
+        remove(path_store)
+
+    # Multi-simulation interrupted at the fourth simulation
+    # (the third one is the reference simulation: not computed again)
+    CALL_LIST.clear()
+    Toyota_Prius = load(join(DATA_DIR, "Machine", "Toyota_Prius.json"))
+    simu = Simu1(name="test_multisim_store", machine=Toyota_Prius)
+    simu.input = InputElec(N0=2000, Id_ref=-100, Iq_ref=200, Nt_tot=4, Na_tot=64)
+    simu.var_simu = VarParam(
+        paramexplorer_list=[
+            ParamExplorerSet(value=N0_list, setter="simu.input.N0", symbol="N0")
+        ],
+        datakeeper_list=[
+            DataKeeper(name="Speed", symbol="N", unit="rpm", keeper=keep_N0_error),
+            DataKeeper(
+                symbol="N_array", keeper="lambda output: np.ones(3) * output.elec.N0"
+            ),
+            DataKeeper(symbol="none", keeper="lambda output: None"),
+        ],
+        is_keep_all_output=True,
+        stop_if_error=True,
+        path_store=path_store,
+    )
+    with pytest.raises(ZeroDivisionError):
+        simu.run()
+    assert CALL_LIST == [None, 0, 1, 3]
+
+    # Results of the first three simulations available in the store
+    xout = load_store(path_store)
+    assert len(xout) == len(N0_list)
+    assert xout["N"].name == "Speed"
+    assert xout["N"].unit == "rpm"
+    assert xout["N"].result[:3] == pytest.approx(
+        [1000 - 1 / 1500, 1500 - 1e-3, 2000 - 2e-3]
+    )
+    assert xout["N"].result[3:] == [None, None]
+    assert xout["N"].result_ref == pytest.approx(2000 - 2e-3)
+    assert xout[1].elec.N0 == 1500
+    assert xout[2] is None  # Reference Output not stored
+    assert xout[3] is None
+    assert xout.paramexplorer_list[0].value == N0_list
+
+    # Resume: only the missing simulations are computed
+    CALL_LIST.clear()
+    simu.var_simu.datakeeper_list[0].keeper = keep_N0
+    xout = simu.run()
+    assert CALL_LIST == [None, 3, 4]
+    assert xout["N"].result[3:] == N0_list[3:]
+    assert xout["N"].result[2] == pytest.approx(2000 - 2e-3)  # From the store
+    np.testing.assert_allclose(xout["N_array"].result[4], 3000 * np.ones(3))
+    assert xout["none"].result == [None] * len(N0_list)
+
+    # The Outputs are in the store only (loaded on demand)
+    assert xout.path_store == path_store
+    assert xout.output_list[3] is None
+    assert xout[3].elec.N0 == 2500
+    assert [out.elec.N0 for out in xout[3:]] == [2500, 3000]
+    assert [out.elec.N0 for out in reversed(xout)][:2] == [3000, 2500]
+    assert xout.get_xoutput_ref().elec.N0 == 2000  # Simulation 2 is the reference
+    assert "output_list[4]" not in xout.print_memory(detail_level=3, is_print=False)
+
+    # Complete store: no simulation computed (except the reference)
+    CALL_LIST.clear()
+    xout = simu.run()
+    assert CALL_LIST == [None]
+    assert xout["N"].result[3:] == N0_list[3:]
+
+    # Overwrite the store
+    simu.var_simu.is_resume = False
+    CALL_LIST.clear()
+    xout = simu.run()
+    assert CALL_LIST == [None, 0, 1, 3, 4]
+    assert xout["N"].result == N0_list
+    assert load_store(path_store)["N"].result == N0_list
+
+    # The store doesn't match the multi-simulation
+    simu.var_simu.is_resume = True
+    simu.var_simu.paramexplorer_list[0].value = N0_list[:3]
+    with pytest.raises(ResultStoreError):
+        simu.run()
+    simu.var_simu.paramexplorer_list[0].value = [N0 + 1 for N0 in N0_list]
+    with pytest.raises(ResultStoreError):
+        simu.run()
@@ -0,0 +1,114 @@
+import pytest
+from os.path import join
+
+import numpy as np
+from SciDataTool import Data1D, DataTime
+
+from pyleecan.Functions.get_memory_size import get_memory_size
+from pyleecan.Functions.Simulation.profile_stage import PROFILE_COLUMNS
+from pyleecan.Classes.Output import Output
+from pyleecan.Classes.PostFunction import PostFunction
+from pyleecan.Classes.InputElec import InputElec
+from pyleecan.Classes.VarParam import VarParam
+from pyleecan.Classes.ParamExplorerSet import ParamExplorerSet
+from pyleecan.Classes.DataKeeper import DataKeeper
+from pyleecan.Functions.load import load
+from pyleecan.definitions import DATA_DIR
+from pyleecan.Classes.Simu1 import Simu1
+
+STAGE_LIST = ["Machine.comp_output_geo", "Input.gen_input", "PostFunction.run"]
+
+
+@pytest.mark.IPMSM
+@pytest.mark.SingleOP
+def test_profile_simu():
+    """Check the profile of a single simulation"""
+    Toyota_Prius = load(join(DATA_DIR, "Machine", "Toyota_Prius.json"))
+    simu = Simu1(name="test_profile_simu", machine=Toyota_Prius)
+    simu.is_profile = True
+    simu.input = InputElec(
+        N0=2000, Id_ref=-100, Iq_ref=200, Nt_tot=10, Na_tot=2048, rot_dir=1
+    )
+    # Postprocessing that allocates and uses some memory
+    simu.postproc_list = [
+        PostFunction(run="lambda output: np.ones((1000, 1000)).sum()")
+    ]
+    out = simu.run()
+
+    assert list(out.profile.keys()) == PROFILE_COLUMNS
+    assert out.profile["stage"] == STAGE_LIST
+    assert out.profile["index"] == [None] * 3
+    for col in ["wall_time", "cpu_time"]:
+        assert all([val >= 0 for val in out.profile[col]])
+    if out.profile["max_rss"][0] is not None:
+        assert all([val > 2 ** 20 for val in out.profile["max_rss"]])
+        assert all([val >= 0 for val in out.profile["delta_max_rss"]])
+
+    profile_str = out.print_profile(is_print=False)
+    assert len(profile_str.split("\n")) == 5  # Header + 3 stages + ""
+    assert "PostFunction.run" in profile_str
+
+    # Only the profile of the last run is kept
+    out = simu.run()
+    assert out.profile["stage"] == STAGE_LIST
+
+    # No profile by default
+    simu.is_profile = False
+    out = simu.run()
+    assert out.profile is None
+    assert "No profile" in out.print_profile(is_print=False)
+
+
+@pytest.mark.IPMSM
+@pytest.mark.VarParam
+def test_profile_var_simu():
+    """Check the aggregation of the profile of the simulations of a XOutput"""
+    Toyota_Prius = load(join(DATA_DIR, "Machine", "Toyota_Prius.json"))
+    simu = Simu1(name="test_profile_var_simu", machine=Toyota_Prius)
+    simu.is_profile = True
+    simu.input = InputElec(
+        N0=2000, Id_ref=-100, Iq_ref=200, Nt_tot=10, Na_tot=2048, rot_dir=1
+    )
+    # Postprocessing that allocates and uses some memory
+    simu.postproc_list = [
+        PostFunction(run="lambda output: np.ones((1000, 1000)).sum()")
+    ]
+    simu.var_simu = VarParam(
+        paramexplorer_list=[
+            ParamExplorerSet(value=[1000, 3000], setter="simu.input.N0", symbol="N0")
+        ],
+        datakeeper_list=[
+            DataKeeper(symbol="N", keeper="lambda output: output.elec.N0")
+        ],
+        stop_if_error=True,
+        is_reuse_machine=False,  # Geometry computed for each simulation
+    )
+    xout = simu.run()
+
+    assert xout.profile["index"] == [None] * 3 + [0] * 3 + [1] * 3
+    assert xout.profile["stage"] == STAGE_LIST * 3
+    profile_str = xout.print_profile(is_print=False)
+    assert "     3" in profile_str.split("\n")[1]  # 3 calls of each stage
+
+
+@pytest.mark.IPMSM
+def test_print_memory():
+    """Check that the memory of the arrays of the Output is counted"""
+    out = Output()
+    time = Data1D(name="time", unit="s", values=np.linspace(0, 1, 10 ** 5))
+    out.mag.Tem = DataTime(
+        name="Torque", unit="Nm", symbol="T", axes=[time], values=np.ones(10 ** 5)
+    )
+    size = get_memory_size(out.mag)
+    assert size > 2 * 8 * 10 ** 5
+    assert size < 2 * 8 * 10 ** 5 + 10 ** 5
+
+    # Shared objects are counted once, views count their base array
+    array = np.ones(10 ** 5)
+    assert get_memory_size([array, array, array[10:]]) < 8 * 10 ** 5 + 10 ** 4
+
+    # Objects shared between the properties (e.g. None) are counted once
+    mem_str = out.print_memory(is_print=False)
+    mem_dict = dict([line.split(": ") for line in mem_str.split("\n")[1:-1]])
+    assert int(mem_dict["mag"][:-2]) == pytest.approx(size, rel=1e-3)
+    assert int(mem_str.split("\n")[0].split(": ")[1][:-2]) > size
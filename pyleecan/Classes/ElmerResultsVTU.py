@@ -22,6 +22,11 @@ try:
 except ImportError as error:
     build_meshsolution = error
 
+try:
+    from ..Methods.Elmer.ElmerResultsVTU.get_file_list import get_file_list
+except ImportError as error:
+    get_file_list = error
+
 
 from ._check import InitUnKnowClassError
 
@@ -31,6 +36,7 @@ class ElmerResultsVTU(Elmer):
 
     VERSION = 1
 
+    # Check ImportError to remove unnecessary dependencies in unused method
     # cf Methods.Elmer.ElmerResultsVTU.build_meshsolution
     if isinstance(build_meshsolution, ImportError):
         build_meshsolution = property(
@@ -43,6 +49,18 @@ class ElmerResultsVTU(Elmer):
         )
     else:
         build_meshsolution = build_meshsolution
+    # cf Methods.Elmer.ElmerResultsVTU.get_file_list
+    if isinstance(get_file_list, ImportError):
+        get_file_list = property(
+            fget=lambda x: raise_(
+                ImportError(
+                    "Can't use ElmerResultsVTU method get_file_list: "
+                    + str(get_file_list)
+                )
+            )
+        )
+    else:
+        get_file_list = get_file_list
     # save and copy methods are available in all object
     save = save
     copy = copy
@@ -54,6 +72,8 @@ class ElmerResultsVTU(Elmer):
         label="ElmerResults",
         file_path="",
         store_dict=-1,
+        nb_worker=1,
+        is_cell_data=False,
         logger_name="Pyleecan.Elmer",
         init_dict=None,
         init_str=None,
@@ -79,12 +99,18 @@ class ElmerResultsVTU(Elmer):
                 file_path = init_dict["file_path"]
             if "store_dict" in list(init_dict.keys()):
                 store_dict = init_dict["store_dict"]
+            if "nb_worker" in list(init_dict.keys()):
+                nb_worker = init_dict["nb_worker"]
+            if "is_cell_data" in list(init_dict.keys()):
+                is_cell_data = init_dict["is_cell_data"]
             if "logger_name" in list(init_dict.keys()):
                 logger_name = init_dict["logger_name"]
         # Set the properties (value check and convertion are done in setter)
         self.label = label
         self.file_path = file_path
         self.store_dict = store_dict
+        self.nb_worker = nb_worker
+        self.is_cell_data = is_cell_data
         # Call Elmer init
         super(ElmerResultsVTU, self).__init__(logger_name=logger_name)
         # The class is frozen (in Elmer init), for now it's impossible to
@@ -99,6 +125,8 @@ class ElmerResultsVTU(Elmer):
         ElmerResultsVTU_str += 'label = "' + str(self.label) + '"' + linesep
         ElmerResultsVTU_str += 'file_path = "' + str(self.file_path) + '"' + linesep
         ElmerResultsVTU_str += "store_dict = " + str(self.store_dict) + linesep
+        ElmerResultsVTU_str += "nb_worker = " + str(self.nb_worker) + linesep
+        ElmerResultsVTU_str += "is_cell_data = " + str(self.is_cell_data) + linesep
         return ElmerResultsVTU_str
 
     def __eq__(self, other):
@@ -116,6 +144,10 @@ class ElmerResultsVTU(Elmer):
             return False
         if other.store_dict != self.store_dict:
             return False
+        if other.nb_worker != self.nb_worker:
+            return False
+        if other.is_cell_data != self.is_cell_data:
+            return False
         return True
 
     def compare(self, other, name="self", ignore_list=None):
@@ -135,6 +167,10 @@ class ElmerResultsVTU(Elmer):
             diff_list.append(name + ".file_path")
         if other._store_dict != self._store_dict:
             diff_list.append(name + ".store_dict")
+        if other._nb_worker != self._nb_worker:
+            diff_list.append(name + ".nb_worker")
+        if other._is_cell_data != self._is_cell_data:
+            diff_list.append(name + ".is_cell_data")
         # Filter ignore differences
         diff_list = list(filter(lambda x: x not in ignore_list, diff_list))
         return diff_list
@@ -151,6 +187,8 @@ class ElmerResultsVTU(Elmer):
         if self.store_dict is not None:
             for key, value in self.store_dict.items():
                 S += getsizeof(value) + getsizeof(key)
+        S += getsizeof(self.nb_worker)
+        S += getsizeof(self.is_cell_data)
         return S
 
     def as_dict(self, **kwargs):
@@ -167,6 +205,8 @@ class ElmerResultsVTU(Elmer):
         ElmerResultsVTU_dict["store_dict"] = (
             self.store_dict.copy() if self.store_dict is not None else None
         )
+        ElmerResultsVTU_dict["nb_worker"] = self.nb_worker
+        ElmerResultsVTU_dict["is_cell_data"] = self.is_cell_data
         # The class name is added to the dict for deserialisation purpose
         # Overwrite the mother class name
         ElmerResultsVTU_dict["__class__"] = "ElmerResultsVTU"
@@ -178,6 +218,8 @@ class ElmerResultsVTU(Elmer):
         self.label = None
         self.file_path = None
         self.store_dict = None
+        self.nb_worker = None
+        self.is_cell_data = None
         # Set to None the properties inherited from Elmer
         super(ElmerResultsVTU, self)._set_None()
 
@@ -211,7 +253,7 @@ class ElmerResultsVTU(Elmer):
     file_path = property(
         fget=_get_file_path,
         fset=_set_file_path,
-        doc=u"""Filename of the results VTU data file
+        doc=u"""Filename of the results VTU data file, may contain a * wildcard to get all the time steps (e.g. step_t*.vtu)
 
         :Type: str
         """,
@@ -236,3 +278,39 @@ class ElmerResultsVTU(Elmer):
         :Type: dict
         """,
     )
+
+    def _get_nb_worker(self):
+        """getter of nb_worker"""
+        return self._nb_worker
+
+    def _set_nb_worker(self, value):
+        """setter of nb_worker"""
+        check_var("nb_worker", value, "int")
+        self._nb_worker = value
+
+    nb_worker = property(
+        fget=_get_nb_worker,
+        fset=_set_nb_worker,
+        doc=u"""Number of workers to read the VTU files in parallel
+
+        :Type: int
+        """,
+    )
+
+    def _get_is_cell_data(self):
+        """getter of is_cell_data"""
+        return self._is_cell_data
+
+    def _set_is_cell_data(self, value):
+        """setter of is_cell_data"""
+        check_var("is_cell_data", value, "bool")
+        self._is_cell_data = value
+
+    is_cell_data = property(
+        fget=_get_is_cell_data,
+        fset=_set_is_cell_data,
+        doc=u"""To read the cell data instead of the point data
+
+        :Type: bool
+        """,
+    )
@@ -22,6 +22,21 @@ try:
 except ImportError as error:
     get_data = error
 
+try:
+    from ..Methods.Import.ImportGenPWM.get_data_chunks import get_data_chunks
+except ImportError as error:
+    get_data_chunks = error
+
+try:
+    from ..Methods.Import.ImportGenPWM.comp_spectrum import comp_spectrum
+except ImportError as error:
+    comp_spectrum = error
+
+try:
+    from ..Methods.Import.ImportGenPWM.comp_harmonics import comp_harmonics
+except ImportError as error:
+    comp_harmonics = error
+
 
 from ._check import InitUnKnowClassError
 
@@ -31,6 +46,7 @@ class ImportGenPWM(ImportMatrix):
 
     VERSION = 1
 
+    # Check ImportError to remove unnecessary dependencies in unused method
     # cf Methods.Import.ImportGenPWM.get_data
     if isinstance(get_data, ImportError):
         get_data = property(
@@ -40,6 +56,41 @@ class ImportGenPWM(ImportMatrix):
         )
     else:
         get_data = get_data
+    # cf Methods.Import.ImportGenPWM.get_data_chunks
+    if isinstance(get_data_chunks, ImportError):
+        get_data_chunks = property(
+            fget=lambda x: raise_(
+                ImportError(
+                    "Can't use ImportGenPWM method get_data_chunks: "
+                    + str(get_data_chunks)
+                )
+            )
+        )
+    else:
+        get_data_chunks = get_data_chunks
+    # cf Methods.Import.ImportGenPWM.comp_spectrum
+    if isinstance(comp_spectrum, ImportError):
+        comp_spectrum = property(
+            fget=lambda x: raise_(
+                ImportError(
+                    "Can't use ImportGenPWM method comp_spectrum: " + str(comp_spectrum)
+                )
+            )
+        )
+    else:
+        comp_spectrum = comp_spectrum
+    # cf Methods.Import.ImportGenPWM.comp_harmonics
+    if isinstance(comp_harmonics, ImportError):
+        comp_harmonics = property(
+            fget=lambda x: raise_(
+                ImportError(
+                    "Can't use ImportGenPWM method comp_harmonics: "
+                    + str(comp_harmonics)
+                )
+            )
+        )
+    else:
+        comp_harmonics = comp_harmonics
     # save and copy methods are available in all object
     save = save
     copy = copy
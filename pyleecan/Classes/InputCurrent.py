@@ -39,6 +39,7 @@ from numpy import array, array_equal
 from ._check import InitUnKnowClassError
 from .ImportMatrix import ImportMatrix
 from .Import import Import
+from .ImportData import ImportData
 
 
 class InputCurrent(Input):
@@ -98,6 +99,7 @@ class InputCurrent(Input):
         Id_ref=None,
         Iq_ref=None,
         felec=None,
+        Is_harm=None,
         time=None,
         angle=None,
         Nt_tot=2048,
@@ -140,6 +142,8 @@ class InputCurrent(Input):
                 Iq_ref = init_dict["Iq_ref"]
             if "felec" in list(init_dict.keys()):
                 felec = init_dict["felec"]
+            if "Is_harm" in list(init_dict.keys()):
+                Is_harm = init_dict["Is_harm"]
             if "time" in list(init_dict.keys()):
                 time = init_dict["time"]
             if "angle" in list(init_dict.keys()):
@@ -162,6 +166,7 @@ class InputCurrent(Input):
         self.Id_ref = Id_ref
         self.Iq_ref = Iq_ref
         self.felec = felec
+        self.Is_harm = Is_harm
         # Call Input init
         super(InputCurrent, self).__init__(
             time=time, angle=angle, Nt_tot=Nt_tot, Nrev=Nrev, Na_tot=Na_tot, N0=N0
@@ -200,6 +205,11 @@ class InputCurrent(Input):
         InputCurrent_str += "Id_ref = " + str(self.Id_ref) + linesep
         InputCurrent_str += "Iq_ref = " + str(self.Iq_ref) + linesep
         InputCurrent_str += "felec = " + str(self.felec) + linesep
+        if self.Is_harm is not None:
+            tmp = self.Is_harm.__str__().replace(linesep, linesep + "\t").rstrip("\t")
+            InputCurrent_str += "Is_harm = " + tmp
+        else:
+            InputCurrent_str += "Is_harm = None" + linesep + linesep
         return InputCurrent_str
 
     def __eq__(self, other):
@@ -229,6 +239,8 @@ class InputCurrent(Input):
             return False
         if other.felec != self.felec:
             return False
+        if other.Is_harm != self.Is_harm:
+            return False
         return True
 
     def compare(self, other, name="self", ignore_list=None):
@@ -274,6 +286,14 @@ class InputCurrent(Input):
             diff_list.append(name + ".Iq_ref")
         if other._felec != self._felec:
             diff_list.append(name + ".felec")
+        if (other.Is_harm is None and self.Is_harm is not None) or (
+            other.Is_harm is not None and self.Is_harm is None
+        ):
+            diff_list.append(name + ".Is_harm None mismatch")
+        elif self.Is_harm is not None:
+            diff_list.extend(
+                self.Is_harm.compare(other.Is_harm, name=name + ".Is_harm")
+            )
         # Filter ignore differences
         diff_list = list(filter(lambda x: x not in ignore_list, diff_list))
         return diff_list
@@ -294,6 +314,7 @@ class InputCurrent(Input):
         S += getsizeof(self.Id_ref)
         S += getsizeof(self.Iq_ref)
         S += getsizeof(self.felec)
+        S += getsizeof(self.Is_harm)
         return S
 
     def as_dict(self, **kwargs):
@@ -323,6 +344,10 @@ class InputCurrent(Input):
         InputCurrent_dict["Id_ref"] = self.Id_ref
         InputCurrent_dict["Iq_ref"] = self.Iq_ref
         InputCurrent_dict["felec"] = self.felec
+        if self.Is_harm is None:
+            InputCurrent_dict["Is_harm"] = None
+        else:
+            InputCurrent_dict["Is_harm"] = self.Is_harm.as_dict(**kwargs)
         # The class name is added to the dict for deserialisation purpose
         # Overwrite the mother class name
         InputCurrent_dict["__class__"] = "InputCurrent"
@@ -343,6 +368,8 @@ class InputCurrent(Input):
         self.Id_ref = None
         self.Iq_ref = None
         self.felec = None
+        if self.Is_harm is not None:
+            self.Is_harm._set_None()
         # Set to None the properties inherited from Input
         super(InputCurrent, self)._set_None()
 
@@ -549,3 +576,33 @@ class InputCurrent(Input):
         :Type: float
         """,
     )
+
+    def _get_Is_harm(self):
+        """getter of Is_harm"""
+        return self._Is_harm
+
+    def _set_Is_harm(self, value):
+        """setter of Is_harm"""
+        if isinstance(value, str):  # Load from file
+            value = load_init_dict(value)[1]
+        if isinstance(value, dict) and "__class__" in value:
+            class_obj = import_class(
+                "pyleecan.Classes", value.get("__class__"), "Is_harm"
+            )
+            value = class_obj(init_dict=value)
+        elif type(value) is int and value == -1:  # Default constructor
+            value = ImportData()
+        check_var("Is_harm", value, "ImportData")
+        self._Is_harm = value
+
+        if self._Is_harm is not None:
+            self._Is_harm.parent = self
+
+    Is_harm = property(
+        fget=_get_Is_harm,
+        fset=_set_Is_harm,
+        doc=u"""Stator harmonic currents (DataFreq with phase and freqs axes) to import instead of Is
+
+        :Type: ImportData
+        """,
+    )
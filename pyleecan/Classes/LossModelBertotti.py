@@ -36,6 +36,21 @@ try:
 except ImportError as error:
     comp_loss_density = error
 
+try:
+    from ..Methods.Simulation.LossModelBertotti.get_loss_density import get_loss_density
+except ImportError as error:
+    get_loss_density = error
+
+try:
+    from ..Methods.Simulation.LossModelBertotti.comp_loss_sum import comp_loss_sum
+except ImportError as error:
+    comp_loss_sum = error
+
+try:
+    from ..Methods.Simulation.LossModelBertotti.get_loss_coeff import get_loss_coeff
+except ImportError as error:
+    get_loss_coeff = error
+
 
 from ._check import InitUnKnowClassError
 
@@ -83,6 +98,42 @@ class LossModelBertotti(LossModel):
         )
     else:
         comp_loss_density = comp_loss_density
+    # cf Methods.Simulation.LossModelBertotti.get_loss_density
+    if isinstance(get_loss_density, ImportError):
+        get_loss_density = property(
+            fget=lambda x: raise_(
+                ImportError(
+                    "Can't use LossModelBertotti method get_loss_density: "
+                    + str(get_loss_density)
+                )
+            )
+        )
+    else:
+        get_loss_density = get_loss_density
+    # cf Methods.Simulation.LossModelBertotti.comp_loss_sum
+    if isinstance(comp_loss_sum, ImportError):
+        comp_loss_sum = property(
+            fget=lambda x: raise_(
+                ImportError(
+                    "Can't use LossModelBertotti method comp_loss_sum: "
+                    + str(comp_loss_sum)
+                )
+            )
+        )
+    else:
+        comp_loss_sum = comp_loss_sum
+    # cf Methods.Simulation.LossModelBertotti.get_loss_coeff
+    if isinstance(get_loss_coeff, ImportError):
+        get_loss_coeff = property(
+            fget=lambda x: raise_(
+                ImportError(
+                    "Can't use LossModelBertotti method get_loss_coeff: "
+                    + str(get_loss_coeff)
+                )
+            )
+        )
+    else:
+        get_loss_coeff = get_loss_coeff
     # save and copy methods are available in all object
     save = save
     copy = copy
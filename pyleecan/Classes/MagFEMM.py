@@ -149,6 +149,7 @@ class MagFEMM(Magnetics):
         is_close_femm=True,
         nb_worker=1,
         Rag_enforced=None,
+        is_batch_post=False,
         is_remove_slotS=False,
         is_remove_slotR=False,
         is_remove_vent=False,
@@ -209,6 +210,8 @@ class MagFEMM(Magnetics):
                 nb_worker = init_dict["nb_worker"]
             if "Rag_enforced" in list(init_dict.keys()):
                 Rag_enforced = init_dict["Rag_enforced"]
+            if "is_batch_post" in list(init_dict.keys()):
+                is_batch_post = init_dict["is_batch_post"]
             if "is_remove_slotS" in list(init_dict.keys()):
                 is_remove_slotS = init_dict["is_remove_slotS"]
             if "is_remove_slotR" in list(init_dict.keys()):
@@ -249,6 +252,7 @@ class MagFEMM(Magnetics):
         self.is_close_femm = is_close_femm
         self.nb_worker = nb_worker
         self.Rag_enforced = Rag_enforced
+        self.is_batch_post = is_batch_post
         # Call Magnetics init
         super(MagFEMM, self).__init__(
             is_remove_slotS=is_remove_slotS,
@@ -309,6 +313,7 @@ class MagFEMM(Magnetics):
         MagFEMM_str += "is_close_femm = " + str(self.is_close_femm) + linesep
         MagFEMM_str += "nb_worker = " + str(self.nb_worker) + linesep
         MagFEMM_str += "Rag_enforced = " + str(self.Rag_enforced) + linesep
+        MagFEMM_str += "is_batch_post = " + str(self.is_batch_post) + linesep
         return MagFEMM_str
 
     def __eq__(self, other):
@@ -350,6 +355,8 @@ class MagFEMM(Magnetics):
             return False
         if other.Rag_enforced != self.Rag_enforced:
             return False
+        if other.is_batch_post != self.is_batch_post:
+            return False
         return True
 
     def compare(self, other, name="self", ignore_list=None):
@@ -405,6 +412,8 @@ class MagFEMM(Magnetics):
             diff_list.append(name + ".nb_worker")
         if other._Rag_enforced != self._Rag_enforced:
             diff_list.append(name + ".Rag_enforced")
+        if other._is_batch_post != self._is_batch_post:
+            diff_list.append(name + ".is_batch_post")
         # Filter ignore differences
         diff_list = list(filter(lambda x: x not in ignore_list, diff_list))
         return diff_list
@@ -435,6 +444,7 @@ class MagFEMM(Magnetics):
         S += getsizeof(self.is_close_femm)
         S += getsizeof(self.nb_worker)
         S += getsizeof(self.Rag_enforced)
+        S += getsizeof(self.is_batch_post)
         return S
 
     def as_dict(self, **kwargs):
@@ -473,6 +483,7 @@ class MagFEMM(Magnetics):
         MagFEMM_dict["is_close_femm"] = self.is_close_femm
         MagFEMM_dict["nb_worker"] = self.nb_worker
         MagFEMM_dict["Rag_enforced"] = self.Rag_enforced
+        MagFEMM_dict["is_batch_post"] = self.is_batch_post
         # The class name is added to the dict for deserialisation purpose
         # Overwrite the mother class name
         MagFEMM_dict["__class__"] = "MagFEMM"
@@ -498,6 +509,7 @@ class MagFEMM(Magnetics):
         self.is_close_femm = None
         self.nb_worker = None
         self.Rag_enforced = None
+        self.is_batch_post = None
         # Set to None the properties inherited from Magnetics
         super(MagFEMM, self)._set_None()
 
@@ -800,3 +812,21 @@ class MagFEMM(Magnetics):
         :Type: float
         """,
     )
+
+    def _get_is_batch_post(self):
+        """getter of is_batch_post"""
+        return self._is_batch_post
+
+    def _set_is_batch_post(self, value):
+        """setter of is_batch_post"""
+        check_var("is_batch_post", value, "bool")
+        self._is_batch_post = value
+
+    is_batch_post = property(
+        fget=_get_is_batch_post,
+        fset=_set_is_batch_post,
+        doc=u"""True to get the air-gap flux density, torque and winding flux of each time step with a single Lua script
+
+        :Type: bool
+        """,
+    )
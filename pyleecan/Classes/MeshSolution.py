@@ -77,6 +77,16 @@ try:
 except ImportError as error:
     get_glyph = error
 
+try:
+    from ..Methods.Mesh.MeshSolution.integrate import integrate
+except ImportError as error:
+    integrate = error
+
+try:
+    from ..Methods.Mesh.MeshSolution.norm import norm
+except ImportError as error:
+    norm = error
+
 
 from ._check import InitUnKnowClassError
 from .Mesh import Mesh
@@ -222,6 +232,26 @@ class MeshSolution(FrozenClass):
         )
     else:
         get_glyph = get_glyph
+    # cf Methods.Mesh.MeshSolution.integrate
+    if isinstance(integrate, ImportError):
+        integrate = property(
+            fget=lambda x: raise_(
+                ImportError(
+                    "Can't use MeshSolution method integrate: " + str(integrate)
+                )
+            )
+        )
+    else:
+        integrate = integrate
+    # cf Methods.Mesh.MeshSolution.norm
+    if isinstance(norm, ImportError):
+        norm = property(
+            fget=lambda x: raise_(
+                ImportError("Can't use MeshSolution method norm: " + str(norm))
+            )
+        )
+    else:
+        norm = norm
     # save and copy methods are available in all object
     save = save
     copy = copy
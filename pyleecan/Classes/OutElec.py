@@ -37,6 +37,11 @@ try:
 except ImportError as error:
     comp_I_mag = error
 
+try:
+    from ..Methods.Output.OutElec.get_Is_harm import get_Is_harm
+except ImportError as error:
+    get_Is_harm = error
+
 
 from numpy import array, array_equal
 from ._check import InitUnKnowClassError
@@ -85,6 +90,15 @@ class OutElec(FrozenClass):
         )
     else:
         comp_I_mag = comp_I_mag
+    # cf Methods.Output.OutElec.get_Is_harm
+    if isinstance(get_Is_harm, ImportError):
+        get_Is_harm = property(
+            fget=lambda x: raise_(
+                ImportError("Can't use OutElec method get_Is_harm: " + str(get_Is_harm))
+            )
+        )
+    else:
+        get_Is_harm = get_Is_harm
     # save and copy methods are available in all object
     save = save
     copy = copy
@@ -111,6 +125,7 @@ class OutElec(FrozenClass):
         Pem_av_ref=None,
         Us=None,
         internal=None,
+        Is_harm=None,
         init_dict=None,
         init_str=None,
     ):
@@ -165,6 +180,8 @@ class OutElec(FrozenClass):
                 Us = init_dict["Us"]
             if "internal" in list(init_dict.keys()):
                 internal = init_dict["internal"]
+            if "Is_harm" in list(init_dict.keys()):
+                Is_harm = init_dict["Is_harm"]
         # Set the properties (value check and convertion are done in setter)
         self.parent = None
         self.Time = Time
@@ -185,6 +202,7 @@ class OutElec(FrozenClass):
         self.Pem_av_ref = Pem_av_ref
         self.Us = Us
         self.internal = internal
+        self.Is_harm = Is_harm
 
         # The class is frozen, for now it's impossible to add new properties
         self._freeze()
@@ -227,6 +245,7 @@ class OutElec(FrozenClass):
             OutElec_str += "internal = " + tmp
         else:
             OutElec_str += "internal = None" + linesep + linesep
+        OutElec_str += "Is_harm = " + str(self.Is_harm) + linesep + linesep
         return OutElec_str
 
     def __eq__(self, other):
@@ -270,6 +289,8 @@ class OutElec(FrozenClass):
             return False
         if other.internal != self.internal:
             return False
+        if other.Is_harm != self.Is_harm:
+            return False
         return True
 
     def compare(self, other, name="self", ignore_list=None):
@@ -342,6 +363,14 @@ class OutElec(FrozenClass):
             diff_list.extend(
                 self.internal.compare(other.internal, name=name + ".internal")
             )
+        if (other.Is_harm is None and self.Is_harm is not None) or (
+            other.Is_harm is not None and self.Is_harm is None
+        ):
+            diff_list.append(name + ".Is_harm None mismatch")
+        elif self.Is_harm is not None:
+            diff_list.extend(
+                self.Is_harm.compare(other.Is_harm, name=name + ".Is_harm")
+            )
         # Filter ignore differences
         diff_list = list(filter(lambda x: x not in ignore_list, diff_list))
         return diff_list
@@ -368,6 +397,7 @@ class OutElec(FrozenClass):
         S += getsizeof(self.Pem_av_ref)
         S += getsizeof(self.Us)
         S += getsizeof(self.internal)
+        S += getsizeof(self.Is_harm)
         return S
 
     def as_dict(self, **kwargs):
@@ -417,6 +447,10 @@ class OutElec(FrozenClass):
             OutElec_dict["internal"] = None
         else:
             OutElec_dict["internal"] = self.internal.as_dict(**kwargs)
+        if self.Is_harm is None:
+            OutElec_dict["Is_harm"] = None
+        else:
+            OutElec_dict["Is_harm"] = self.Is_harm.as_dict()
         # The class name is added to the dict for deserialisation purpose
         OutElec_dict["__class__"] = "OutElec"
         return OutElec_dict
@@ -443,6 +477,7 @@ class OutElec(FrozenClass):
         self.Us = None
         if self.internal is not None:
             self.internal._set_None()
+        self.Is_harm = None
 
     def _get_Time(self):
         """getter of Time"""
@@ -831,3 +866,30 @@ class OutElec(FrozenClass):
         :Type: OutInternal
         """,
     )
+
+    def _get_Is_harm(self):
+        """getter of Is_harm"""
+        return self._Is_harm
+
+    def _set_Is_harm(self, value):
+        """setter of Is_harm"""
+        if isinstance(value, str):  # Load from file
+            value = load_init_dict(value)[1]
+        if isinstance(value, dict) and "__class__" in value:
+            class_obj = import_class(
+                "SciDataTool.Classes", value.get("__class__"), "Is_harm"
+            )
+            value = class_obj(init_dict=value)
+        elif type(value) is int and value == -1:  # Default constructor
+            value = DataND()
+        check_var("Is_harm", value, "DataND")
+        self._Is_harm = value
+
+    Is_harm = property(
+        fget=_get_Is_harm,
+        fset=_set_Is_harm,
+        doc=u"""Stator harmonic currents DataFreq object (only the present frequencies)
+
+        :Type: SciDataTool.Classes.DataND.DataND
+        """,
+    )
@@ -0,0 +1,457 @@
+# -*- coding: utf-8 -*-
+# File generated according to Generator/ClassesRef/Output/OutInterp.csv
+# WARNING! All changes made in this file will be lost!
+"""Method code available at https://github.com/Eomys/pyleecan/tree/master/pyleecan/Methods/Output/OutInterp
+"""
+
+from os import linesep
+from sys import getsizeof
+from logging import getLogger
+from ._check import set_array, check_var, raise_
+from ..Functions.get_logger import get_logger
+from ..Functions.save import save
+from ..Functions.copy import copy
+from ..Functions.load import load_init_dict
+from ..Functions.Load.import_class import import_class
+from ._frozen import FrozenClass
+
+# Import all class method
+# Try/catch to remove unnecessary dependencies in unused method
+try:
+    from ..Methods.Output.OutInterp.get_interpolant import get_interpolant
+except ImportError as error:
+    get_interpolant = error
+
+try:
+    from ..Methods.Output.OutInterp.get_value import get_value
+except ImportError as error:
+    get_value = error
+
+
+from numpy import array, array_equal
+from ._check import InitUnKnowClassError
+
+
+class OutInterp(FrozenClass):
+    """Interpolation table (surrogate model) of the results of a DataKeeper of a multi-simulation"""
+
+    VERSION = 1
+
+    # Check ImportError to remove unnecessary dependencies in unused method
+    # cf Methods.Output.OutInterp.get_interpolant
+    if isinstance(get_interpolant, ImportError):
+        get_interpolant = property(
+            fget=lambda x: raise_(
+                ImportError(
+                    "Can't use OutInterp method get_interpolant: "
+                    + str(get_interpolant)
+                )
+            )
+        )
+    else:
+        get_interpolant = get_interpolant
+    # cf Methods.Output.OutInterp.get_value
+    if isinstance(get_value, ImportError):
+        get_value = property(
+            fget=lambda x: raise_(
+                ImportError("Can't use OutInterp method get_value: " + str(get_value))
+            )
+        )
+    else:
+        get_value = get_value
+    # save and copy methods are available in all object
+    save = save
+    copy = copy
+    # get_logger method is available in all object
+    get_logger = get_logger
+
+    def __init__(
+        self,
+        symbol="",
+        unit="",
+        param_list=-1,
+        point=None,
+        value=None,
+        method="linear",
+        kernel="thin_plate_spline",
+        smoothing=0,
+        fill_value=None,
+        init_dict=None,
+        init_str=None,
+    ):
+        """Constructor of the class. Can be use in three ways :
+        - __init__ (arg1 = 1, arg3 = 5) every parameters have name and default values
+            for pyleecan type, -1 will call the default constructor
+        - __init__ (init_dict = d) d must be a dictionary with property names as keys
+        - __init__ (init_str = s) s must be a string
+        s is the file path to load
+
+        ndarray or list can be given for Vector and Matrix
+        object or dict can be given for pyleecan Object"""
+
+        if init_str is not None:  # Load from a file
+            init_dict = load_init_dict(init_str)[1]
+        if init_dict is not None:  # Initialisation by dict
+            assert type(init_dict) is dict
+            # Overwrite default value with init_dict content
+            if "symbol" in list(init_dict.keys()):
+                symbol = init_dict["symbol"]
+            if "unit" in list(init_dict.keys()):
+                unit = init_dict["unit"]
+            if "param_list" in list(init_dict.keys()):
+                param_list = init_dict["param_list"]
+            if "point" in list(init_dict.keys()):
+                point = init_dict["point"]
+            if "value" in list(init_dict.keys()):
+                value = init_dict["value"]
+            if "method" in list(init_dict.keys()):
+                method = init_dict["method"]
+            if "kernel" in list(init_dict.keys()):
+                kernel = init_dict["kernel"]
+            if "smoothing" in list(init_dict.keys()):
+                smoothing = init_dict["smoothing"]
+            if "fill_value" in list(init_dict.keys()):
+                fill_value = init_dict["fill_value"]
+        # Set the properties (value check and convertion are done in setter)
+        self.parent = None
+        self.symbol = symbol
+        self.unit = unit
+        self.param_list = param_list
+        self.point = point
+        self.value = value
+        self.method = method
+        self.kernel = kernel
+        self.smoothing = smoothing
+        self.fill_value = fill_value
+
+        # The class is frozen, for now it's impossible to add new properties
+        self._freeze()
+
+    def __str__(self):
+        """Convert this object in a readeable string (for print)"""
+
+        OutInterp_str = ""
+        if self.parent is None:
+            OutInterp_str += "parent = None " + linesep
+        else:
+            OutInterp_str += "parent = " + str(type(self.parent)) + " object" + linesep
+        OutInterp_str += 'symbol = "' + str(self.symbol) + '"' + linesep
+        OutInterp_str += 'unit = "' + str(self.unit) + '"' + linesep
+        OutInterp_str += (
+            "param_list = "
+            + linesep
+            + str(self.param_list).replace(linesep, linesep + "\t")
+            + linesep
+        )
+        OutInterp_str += (
+            "point = "
+            + linesep
+            + str(self.point).replace(linesep, linesep + "\t")
+            + linesep
+            + linesep
+        )
+        OutInterp_str += (
+            "value = "
+            + linesep
+            + str(self.value).replace(linesep, linesep + "\t")
+            + linesep
+            + linesep
+        )
+        OutInterp_str += 'method = "' + str(self.method) + '"' + linesep
+        OutInterp_str += 'kernel = "' + str(self.kernel) + '"' + linesep
+        OutInterp_str += "smoothing = " + str(self.smoothing) + linesep
+        OutInterp_str += "fill_value = " + str(self.fill_value) + linesep
+        return OutInterp_str
+
+    def __eq__(self, other):
+        """Compare two objects (skip parent)"""
+
+        if type(other) != type(self):
+            return False
+        if other.symbol != self.symbol:
+            return False
+        if other.unit != self.unit:
+            return False
+        if other.param_list != self.param_list:
+            return False
+        if not array_equal(other.point, self.point):
+            return False
+        if not array_equal(other.value, self.value):
+            return False
+        if other.method != self.method:
+            return False
+        if other.kernel != self.kernel:
+            return False
+        if other.smoothing != self.smoothing:
+            return False
+        if other.fill_value != self.fill_value:
+            return False
+        return True
+
+    def compare(self, other, name="self", ignore_list=None):
+        """Compare two objects and return list of differences"""
+
+        if ignore_list is None:
+            ignore_list = list()
+        if type(other) != type(self):
+            return ["type(" + name + ")"]
+        diff_list = list()
+        if other._symbol != self._symbol:
+            diff_list.append(name + ".symbol")
+        if other._unit != self._unit:
+            diff_list.append(name + ".unit")
+        if other._param_list != self._param_list:
+            diff_list.append(name + ".param_list")
+        if not array_equal(other.point, self.point):
+            diff_list.append(name + ".point")
+        if not array_equal(other.value, self.value):
+            diff_list.append(name + ".value")
+        if other._method != self._method:
+            diff_list.append(name + ".method")
+        if other._kernel != self._kernel:
+            diff_list.append(name + ".kernel")
+        if other._smoothing != self._smoothing:
+            diff_list.append(name + ".smoothing")
+        if other._fill_value != self._fill_value:
+            diff_list.append(name + ".fill_value")
+        # Filter ignore differences
+        diff_list = list(filter(lambda x: x not in ignore_list, diff_list))
+        return diff_list
+
+    def __sizeof__(self):
+        """Return the size in memory of the object (including all subobject)"""
+
+        S = 0  # Full size of the object
+        S += getsizeof(self.symbol)
+        S += getsizeof(self.unit)
+        if self.param_list is not None:
+            for value in self.param_list:
+                S += getsizeof(value)
+        S += getsizeof(self.point)
+        S += getsizeof(self.value)
+        S += getsizeof(self.method)
+        S += getsizeof(self.kernel)
+        S += getsizeof(self.smoothing)
+        S += getsizeof(self.fill_value)
+        return S
+
+    def as_dict(self, **kwargs):
+        """
+        Convert this object in a json serializable dict (can be use in __init__).
+        Optional keyword input parameter is for internal use only
+        and may prevent json serializability.
+        """
+
+        OutInterp_dict = dict()
+        OutInterp_dict["symbol"] = self.symbol
+        OutInterp_dict["unit"] = self.unit
+        OutInterp_dict["param_list"] = (
+            self.param_list.copy() if self.param_list is not None else None
+        )
+        if self.point is None:
+            OutInterp_dict["point"] = None
+        else:
+            OutInterp_dict["point"] = self.point.tolist()
+        if self.value is None:
+            OutInterp_dict["value"] = None
+        else:
+            OutInterp_dict["value"] = self.value.tolist()
+        OutInterp_dict["method"] = self.method
+        OutInterp_dict["kernel"] = self.kernel
+        OutInterp_dict["smoothing"] = self.smoothing
+        OutInterp_dict["fill_value"] = self.fill_value
+        # The class name is added to the dict for deserialisation purpose
+        OutInterp_dict["__class__"] = "OutInterp"
+        return OutInterp_dict
+
+    def _set_None(self):
+        """Set all the properties to None (except pyleecan object)"""
+
+        self.symbol = None
+        self.unit = None
+        self.param_list = None
+        self.point = None
+        self.value = None
+        self.method = None
+        self.kernel = None
+        self.smoothing = None
+        self.fill_value = None
+
+    def _get_symbol(self):
+        """getter of symbol"""
+        return self._symbol
+
+    def _set_symbol(self, value):
+        """setter of symbol"""
+        check_var("symbol", value, "str")
+        self._symbol = value
+
+    symbol = property(
+        fget=_get_symbol,
+        fset=_set_symbol,
+        doc=u"""Symbol of the interpolated DataKeeper
+
+        :Type: str
+        """,
+    )
+
+    def _get_unit(self):
+        """getter of unit"""
+        return self._unit
+
+    def _set_unit(self, value):
+        """setter of unit"""
+        check_var("unit", value, "str")
+        self._unit = value
+
+    unit = property(
+        fget=_get_unit,
+        fset=_set_unit,
+        doc=u"""Unit of the interpolated results
+
+        :Type: str
+        """,
+    )
+
+    def _get_param_list(self):
+        """getter of param_list"""
+        return self._param_list
+
+    def _set_param_list(self, value):
+        """setter of param_list"""
+        if type(value) is int and value == -1:
+            value = list()
+        check_var("param_list", value, "list")
+        self._param_list = value
+
+    param_list = property(
+        fget=_get_param_list,
+        fset=_set_param_list,
+        doc=u"""Symbols of the coordinates of the samples (ParamExplorer or DataKeeper)
+
+        :Type: list
+        """,
+    )
+
+    def _get_point(self):
+        """getter of point"""
+        return self._point
+
+    def _set_point(self, value):
+        """setter of point"""
+        if type(value) is int and value == -1:
+            value = array([])
+        elif type(value) is list:
+            try:
+                value = array(value)
+            except:
+                pass
+        check_var("point", value, "ndarray")
+        self._point = value
+
+    point = property(
+        fget=_get_point,
+        fset=_set_point,
+        doc=u"""Coordinates of the samples
+
+        :Type: ndarray
+        """,
+    )
+
+    def _get_value(self):
+        """getter of value"""
+        return self._value
+
+    def _set_value(self, value):
+        """setter of value"""
+        if type(value) is int and value == -1:
+            value = array([])
+        elif type(value) is list:
+            try:
+                value = array(value)
+            except:
+                pass
+        check_var("value", value, "ndarray")
+        self._value = value
+
+    value = property(
+        fget=_get_value,
+        fset=_set_value,
+        doc=u"""Results of the samples
+
+        :Type: ndarray
+        """,
+    )
+
+    def _get_method(self):
+        """getter of method"""
+        return self._method
+
+    def _set_method(self, value):
+        """setter of method"""
+        check_var("method", value, "str")
+        self._method = value
+
+    method = property(
+        fget=_get_method,
+        fset=_set_method,
+        doc=u"""Interpolation method: grid (tensor grid of the samples), linear (Delaunay triangulation of the samples) or rbf (radial basis functions)
+
+        :Type: str
+        """,
+    )
+
+    def _get_kernel(self):
+        """getter of kernel"""
+        return self._kernel
+
+    def _set_kernel(self, value):
+        """setter of kernel"""
+        check_var("kernel", value, "str")
+        self._kernel = value
+
+    kernel = property(
+        fget=_get_kernel,
+        fset=_set_kernel,
+        doc=u"""Kernel of the rbf method (cf scipy.interpolate.RBFInterpolator)
+
+        :Type: str
+        """,
+    )
+
+    def _get_smoothing(self):
+        """getter of smoothing"""
+        return self._smoothing
+
+    def _set_smoothing(self, value):
+        """setter of smoothing"""
+        check_var("smoothing", value, "float", Vmin=0)
+        self._smoothing = value
+
+    smoothing = property(
+        fget=_get_smoothing,
+        fset=_set_smoothing,
+        doc=u"""Smoothing parameter of the rbf method
+
+        :Type: float
+        :min: 0
+        """,
+    )
+
+    def _get_fill_value(self):
+        """getter of fill_value"""
+        return self._fill_value
+
+    def _set_fill_value(self, value):
+        """setter of fill_value"""
+        check_var("fill_value", value, "float")
+        self._fill_value = value
+
+    fill_value = property(
+        fget=_get_fill_value,
+        fset=_set_fill_value,
+        doc=u"""Value out of the samples for the grid and linear methods (if None: extrapolation for grid, nan for linear)
+
+        :Type: float
+        """,
+    )
@@ -27,6 +27,11 @@ try:
 except ImportError as error:
     get_loss_dist = error
 
+try:
+    from ..Methods.Output.OutLoss.get_loss_group import get_loss_group
+except ImportError as error:
+    get_loss_group = error
+
 
 from ._check import InitUnKnowClassError
 from .MeshSolution import MeshSolution
@@ -58,6 +63,17 @@ class OutLoss(FrozenClass):
         )
     else:
         get_loss_dist = get_loss_dist
+    # cf Methods.Output.OutLoss.get_loss_group
+    if isinstance(get_loss_group, ImportError):
+        get_loss_group = property(
+            fget=lambda x: raise_(
+                ImportError(
+                    "Can't use OutLoss method get_loss_group: " + str(get_loss_group)
+                )
+            )
+        )
+    else:
+        get_loss_group = get_loss_group
     # save and copy methods are available in all object
     save = save
     copy = copy
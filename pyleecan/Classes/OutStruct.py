@@ -42,6 +42,7 @@ class OutStruct(FrozenClass):
         Ar=None,
         meshsolution=-1,
         FEA_dict=None,
+        ERP=None,
         init_dict=None,
         init_str=None,
     ):
@@ -80,6 +81,8 @@ class OutStruct(FrozenClass):
                 meshsolution = init_dict["meshsolution"]
             if "FEA_dict" in list(init_dict.keys()):
                 FEA_dict = init_dict["FEA_dict"]
+            if "ERP" in list(init_dict.keys()):
+                ERP = init_dict["ERP"]
         # Set the properties (value check and convertion are done in setter)
         self.parent = None
         self.Time = Time
@@ -92,6 +95,7 @@ class OutStruct(FrozenClass):
         self.Ar = Ar
         self.meshsolution = meshsolution
         self.FEA_dict = FEA_dict
+        self.ERP = ERP
 
         # The class is frozen, for now it's impossible to add new properties
         self._freeze()
@@ -122,6 +126,7 @@ class OutStruct(FrozenClass):
         else:
             OutStruct_str += "meshsolution = None" + linesep + linesep
         OutStruct_str += "FEA_dict = " + str(self.FEA_dict) + linesep
+        OutStruct_str += "ERP = " + str(self.ERP) + linesep + linesep
         return OutStruct_str
 
     def __eq__(self, other):
@@ -149,6 +154,8 @@ class OutStruct(FrozenClass):
             return False
         if other.FEA_dict != self.FEA_dict:
             return False
+        if other.ERP != self.ERP:
+            return False
         return True
 
     def compare(self, other, name="self", ignore_list=None):
@@ -207,6 +214,12 @@ class OutStruct(FrozenClass):
             )
         if other._FEA_dict != self._FEA_dict:
             diff_list.append(name + ".FEA_dict")
+        if (other.ERP is None and self.ERP is not None) or (
+            other.ERP is not None and self.ERP is None
+        ):
+            diff_list.append(name + ".ERP None mismatch")
+        elif self.ERP is not None:
+            diff_list.extend(self.ERP.compare(other.ERP, name=name + ".ERP"))
         # Filter ignore differences
         diff_list = list(filter(lambda x: x not in ignore_list, diff_list))
         return diff_list
@@ -227,6 +240,7 @@ class OutStruct(FrozenClass):
         if self.FEA_dict is not None:
             for key, value in self.FEA_dict.items():
                 S += getsizeof(value) + getsizeof(key)
+        S += getsizeof(self.ERP)
         return S
 
     def as_dict(self, **kwargs):
@@ -267,6 +281,10 @@ class OutStruct(FrozenClass):
         OutStruct_dict["FEA_dict"] = (
             self.FEA_dict.copy() if self.FEA_dict is not None else None
         )
+        if self.ERP is None:
+            OutStruct_dict["ERP"] = None
+        else:
+            OutStruct_dict["ERP"] = self.ERP.as_dict()
         # The class name is added to the dict for deserialisation purpose
         OutStruct_dict["__class__"] = "OutStruct"
         return OutStruct_dict
@@ -285,6 +303,7 @@ class OutStruct(FrozenClass):
         if self.meshsolution is not None:
             self.meshsolution._set_None()
         self.FEA_dict = None
+        self.ERP = None
 
     def _get_Time(self):
         """getter of Time"""
@@ -524,3 +543,30 @@ class OutStruct(FrozenClass):
         :Type: dict
         """,
     )
+
+    def _get_ERP(self):
+        """getter of ERP"""
+        return self._ERP
+
+    def _set_ERP(self, value):
+        """setter of ERP"""
+        if isinstance(value, str):  # Load from file
+            value = load_init_dict(value)[1]
+        if isinstance(value, dict) and "__class__" in value:
+            class_obj = import_class(
+                "SciDataTool.Classes", value.get("__class__"), "ERP"
+            )
+            value = class_obj(init_dict=value)
+        elif type(value) is int and value == -1:  # Default constructor
+            value = DataND()
+        check_var("ERP", value, "DataND")
+        self._ERP = value
+
+    ERP = property(
+        fget=_get_ERP,
+        fset=_set_ERP,
+        doc=u"""Equivalent Radiated Power
+
+        :Type: SciDataTool.Classes.DataND.DataND
+        """,
+    )
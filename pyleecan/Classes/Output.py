@@ -71,6 +71,11 @@ try:
 except ImportError as error:
     print_memory = error
 
+try:
+    from ..Methods.Output.Output.print_profile import print_profile
+except ImportError as error:
+    print_profile = error
+
 
 from ._check import InitUnKnowClassError
 from .Simulation import Simulation
@@ -200,6 +205,17 @@ class Output(FrozenClass):
         )
     else:
         print_memory = print_memory
+    # cf Methods.Output.Output.print_profile
+    if isinstance(print_profile, ImportError):
+        print_profile = property(
+            fget=lambda x: raise_(
+                ImportError(
+                    "Can't use Output method print_profile: " + str(print_profile)
+                )
+            )
+        )
+    else:
+        print_profile = print_profile
     # save and copy methods are available in all object
     save = save
     copy = copy
@@ -218,6 +234,7 @@ class Output(FrozenClass):
         logger_name="Pyleecan.Output",
         force=-1,
         loss=-1,
+        profile=None,
         init_dict=None,
         init_str=None,
     ):
@@ -256,6 +273,8 @@ class Output(FrozenClass):
                 force = init_dict["force"]
             if "loss" in list(init_dict.keys()):
                 loss = init_dict["loss"]
+            if "profile" in list(init_dict.keys()):
+                profile = init_dict["profile"]
         # Set the properties (value check and convertion are done in setter)
         self.parent = None
         self.simu = simu
@@ -268,6 +287,7 @@ class Output(FrozenClass):
         self.logger_name = logger_name
         self.force = force
         self.loss = loss
+        self.profile = profile
 
         # The class is frozen, for now it's impossible to add new properties
         self._freeze()
@@ -322,6 +342,7 @@ class Output(FrozenClass):
             Output_str += "loss = " + tmp
         else:
             Output_str += "loss = None" + linesep + linesep
+        Output_str += "profile = " + str(self.profile) + linesep
         return Output_str
 
     def __eq__(self, other):
@@ -349,6 +370,8 @@ class Output(FrozenClass):
             return False
         if other.loss != self.loss:
             return False
+        if other.profile != self.profile:
+            return False
         return True
 
     def compare(self, other, name="self", ignore_list=None):
@@ -411,6 +434,8 @@ class Output(FrozenClass):
             diff_list.append(name + ".loss None mismatch")
         elif self.loss is not None:
             diff_list.extend(self.loss.compare(other.loss, name=name + ".loss"))
+        if other._profile != self._profile:
+            diff_list.append(name + ".profile")
         # Filter ignore differences
         diff_list = list(filter(lambda x: x not in ignore_list, diff_list))
         return diff_list
@@ -429,6 +454,9 @@ class Output(FrozenClass):
         S += getsizeof(self.logger_name)
         S += getsizeof(self.force)
         S += getsizeof(self.loss)
+        if self.profile is not None:
+            for key, value in self.profile.items():
+                S += getsizeof(value) + getsizeof(key)
         return S
 
     def as_dict(self, **kwargs):
@@ -473,6 +501,9 @@ class Output(FrozenClass):
             Output_dict["loss"] = None
         else:
             Output_dict["loss"] = self.loss.as_dict(**kwargs)
+        Output_dict["profile"] = (
+            self.profile.copy() if self.profile is not None else None
+        )
         # The class name is added to the dict for deserialisation purpose
         Output_dict["__class__"] = "Output"
         return Output_dict
@@ -498,6 +529,7 @@ class Output(FrozenClass):
             self.force._set_None()
         if self.loss is not None:
             self.loss._set_None()
+        self.profile = None
 
     def _get_simu(self):
         """getter of simu"""
@@ -762,3 +794,23 @@ class Output(FrozenClass):
         :Type: OutLoss
         """,
     )
+
+    def _get_profile(self):
+        """getter of profile"""
+        return self._profile
+
+    def _set_profile(self, value):
+        """setter of profile"""
+        if type(value) is int and value == -1:
+            value = dict()
+        check_var("profile", value, "dict")
+        self._profile = value
+
+    profile = property(
+        fget=_get_profile,
+        fset=_set_profile,
+        doc=u"""Time and memory of each stage of the simulation(s) (columns: index, stage, wall_time, cpu_time, max_rss, delta_max_rss), see Simulation.is_profile
+
+        :Type: dict
+        """,
+    )
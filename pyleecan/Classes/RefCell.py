@@ -22,6 +22,21 @@ try:
 except ImportError as error:
     interpolation = error
 
+try:
+    from ..Methods.Mesh.RefCell.jacobian_batch import jacobian_batch
+except ImportError as error:
+    jacobian_batch = error
+
+try:
+    from ..Methods.Mesh.RefCell.get_real_point_batch import get_real_point_batch
+except ImportError as error:
+    get_real_point_batch = error
+
+try:
+    from ..Methods.Mesh.RefCell.get_ref_point_batch import get_ref_point_batch
+except ImportError as error:
+    get_ref_point_batch = error
+
 
 from ._check import InitUnKnowClassError
 
@@ -31,6 +46,7 @@ class RefCell(FrozenClass):
 
     VERSION = 1
 
+    # Check ImportError to remove unnecessary dependencies in unused method
     # cf Methods.Mesh.RefCell.interpolation
     if isinstance(interpolation, ImportError):
         interpolation = property(
@@ -42,6 +58,41 @@ class RefCell(FrozenClass):
         )
     else:
         interpolation = interpolation
+    # cf Methods.Mesh.RefCell.jacobian_batch
+    if isinstance(jacobian_batch, ImportError):
+        jacobian_batch = property(
+            fget=lambda x: raise_(
+                ImportError(
+                    "Can't use RefCell method jacobian_batch: " + str(jacobian_batch)
+                )
+            )
+        )
+    else:
+        jacobian_batch = jacobian_batch
+    # cf Methods.Mesh.RefCell.get_real_point_batch
+    if isinstance(get_real_point_batch, ImportError):
+        get_real_point_batch = property(
+            fget=lambda x: raise_(
+                ImportError(
+                    "Can't use RefCell method get_real_point_batch: "
+                    + str(get_real_point_batch)
+                )
+            )
+        )
+    else:
+        get_real_point_batch = get_real_point_batch
+    # cf Methods.Mesh.RefCell.get_ref_point_batch
+    if isinstance(get_ref_point_batch, ImportError):
+        get_ref_point_batch = property(
+            fget=lambda x: raise_(
+                ImportError(
+                    "Can't use RefCell method get_ref_point_batch: "
+                    + str(get_ref_point_batch)
+                )
+            )
+        )
+    else:
+        get_ref_point_batch = get_ref_point_batch
     # save and copy methods are available in all object
     save = save
     copy = copy
@@ -47,6 +47,23 @@ try:
 except ImportError as error:
     is_inside = error
 
+try:
+    from ..Methods.Mesh.RefLine3.shape_function_batch import shape_function_batch
+except ImportError as error:
+    shape_function_batch = error
+
+try:
+    from ..Methods.Mesh.RefLine3.grad_shape_function_batch import (
+        grad_shape_function_batch,
+    )
+except ImportError as error:
+    grad_shape_function_batch = error
+
+try:
+    from ..Methods.Mesh.RefLine3.is_inside_batch import is_inside_batch
+except ImportError as error:
+    is_inside_batch = error
+
 
 from ._check import InitUnKnowClassError
 
@@ -120,6 +137,41 @@ class RefLine3(RefCell):
         )
     else:
         is_inside = is_inside
+    # cf Methods.Mesh.RefLine3.shape_function_batch
+    if isinstance(shape_function_batch, ImportError):
+        shape_function_batch = property(
+            fget=lambda x: raise_(
+                ImportError(
+                    "Can't use RefLine3 method shape_function_batch: "
+                    + str(shape_function_batch)
+                )
+            )
+        )
+    else:
+        shape_function_batch = shape_function_batch
+    # cf Methods.Mesh.RefLine3.grad_shape_function_batch
+    if isinstance(grad_shape_function_batch, ImportError):
+        grad_shape_function_batch = property(
+            fget=lambda x: raise_(
+                ImportError(
+                    "Can't use RefLine3 method grad_shape_function_batch: "
+                    + str(grad_shape_function_batch)
+                )
+            )
+        )
+    else:
+        grad_shape_function_batch = grad_shape_function_batch
+    # cf Methods.Mesh.RefLine3.is_inside_batch
+    if isinstance(is_inside_batch, ImportError):
+        is_inside_batch = property(
+            fget=lambda x: raise_(
+                ImportError(
+                    "Can't use RefLine3 method is_inside_batch: " + str(is_inside_batch)
+                )
+            )
+        )
+    else:
+        is_inside_batch = is_inside_batch
     # save and copy methods are available in all object
     save = save
     copy = copy
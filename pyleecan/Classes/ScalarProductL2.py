@@ -22,6 +22,11 @@ try:
 except ImportError as error:
     scalar_product = error
 
+try:
+    from ..Methods.Mesh.ScalarProductL2.scalar_product_batch import scalar_product_batch
+except ImportError as error:
+    scalar_product_batch = error
+
 
 from ._check import InitUnKnowClassError
 
@@ -31,6 +36,7 @@ class ScalarProductL2(ScalarProduct):
 
     VERSION = 1
 
+    # Check ImportError to remove unnecessary dependencies in unused method
     # cf Methods.Mesh.ScalarProductL2.scalar_product
     if isinstance(scalar_product, ImportError):
         scalar_product = property(
@@ -43,6 +49,18 @@ class ScalarProductL2(ScalarProduct):
         )
     else:
         scalar_product = scalar_product
+    # cf Methods.Mesh.ScalarProductL2.scalar_product_batch
+    if isinstance(scalar_product_batch, ImportError):
+        scalar_product_batch = property(
+            fget=lambda x: raise_(
+                ImportError(
+                    "Can't use ScalarProductL2 method scalar_product_batch: "
+                    + str(scalar_product_batch)
+                )
+            )
+        )
+    else:
+        scalar_product_batch = scalar_product_batch
     # save and copy methods are available in all object
     save = save
     copy = copy
@@ -33,6 +33,7 @@ from .Machine import Machine
 from .Input import Input
 from .VarSimu import VarSimu
 from .Post import Post
+from .OutGeo import OutGeo
 
 
 class Simu1(Simulation):
@@ -73,6 +74,9 @@ class Simu1(Simulation):
         path_result=None,
         layer=None,
         layer_log_warn=None,
+        is_profile=False,
+        geo_enforced=None,
+        reused_stage_list=-1,
         init_dict=None,
         init_str=None,
     ):
@@ -123,6 +127,12 @@ class Simu1(Simulation):
                 layer = init_dict["layer"]
             if "layer_log_warn" in list(init_dict.keys()):
                 layer_log_warn = init_dict["layer_log_warn"]
+            if "is_profile" in list(init_dict.keys()):
+                is_profile = init_dict["is_profile"]
+            if "geo_enforced" in list(init_dict.keys()):
+                geo_enforced = init_dict["geo_enforced"]
+            if "reused_stage_list" in list(init_dict.keys()):
+                reused_stage_list = init_dict["reused_stage_list"]
         # Set the properties (value check and convertion are done in setter)
         self.elec = elec
         self.mag = mag
@@ -142,6 +152,9 @@ class Simu1(Simulation):
             path_result=path_result,
             layer=layer,
             layer_log_warn=layer_log_warn,
+            is_profile=is_profile,
+            geo_enforced=geo_enforced,
+            reused_stage_list=reused_stage_list,
         )
         # The class is frozen (in Simulation init), for now it's impossible to
         # add new properties
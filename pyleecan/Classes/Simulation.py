@@ -33,6 +33,7 @@ from .Machine import Machine
 from .Input import Input
 from .VarSimu import VarSimu
 from .Post import Post
+from .OutGeo import OutGeo
 
 
 class Simulation(FrozenClass):
@@ -80,6 +81,9 @@ class Simulation(FrozenClass):
         path_result=None,
         layer=None,
         layer_log_warn=None,
+        is_profile=False,
+        geo_enforced=None,
+        reused_stage_list=-1,
         init_dict=None,
         init_str=None,
     ):
@@ -120,6 +124,12 @@ class Simulation(FrozenClass):
                 layer = init_dict["layer"]
             if "layer_log_warn" in list(init_dict.keys()):
                 layer_log_warn = init_dict["layer_log_warn"]
+            if "is_profile" in list(init_dict.keys()):
+                is_profile = init_dict["is_profile"]
+            if "geo_enforced" in list(init_dict.keys()):
+                geo_enforced = init_dict["geo_enforced"]
+            if "reused_stage_list" in list(init_dict.keys()):
+                reused_stage_list = init_dict["reused_stage_list"]
         # Set the properties (value check and convertion are done in setter)
         self.parent = None
         self.name = name
@@ -133,6 +143,9 @@ class Simulation(FrozenClass):
         self.path_result = path_result
         self.layer = layer
         self.layer_log_warn = layer_log_warn
+        self.is_profile = is_profile
+        self.geo_enforced = geo_enforced
+        self.reused_stage_list = reused_stage_list
 
         # The class is frozen, for now it's impossible to add new properties
         self._freeze()
@@ -177,6 +190,22 @@ class Simulation(FrozenClass):
         Simulation_str += 'path_result = "' + str(self.path_result) + '"' + linesep
         Simulation_str += "layer = " + str(self.layer) + linesep
         Simulation_str += "layer_log_warn = " + str(self.layer_log_warn) + linesep
+        Simulation_str += "is_profile = " + str(self.is_profile) + linesep
+        if self.geo_enforced is not None:
+            tmp = (
+                self.geo_enforced.__str__()
+                .replace(linesep, linesep + "\t")
+                .rstrip("\t")
+            )
+            Simulation_str += "geo_enforced = " + tmp
+        else:
+            Simulation_str += "geo_enforced = None" + linesep + linesep
+        Simulation_str += (
+            "reused_stage_list = "
+            + linesep
+            + str(self.reused_stage_list).replace(linesep, linesep + "\t")
+            + linesep
+        )
         return Simulation_str
 
     def __eq__(self, other):
@@ -206,6 +235,12 @@ class Simulation(FrozenClass):
             return False
         if other.layer_log_warn != self.layer_log_warn:
             return False
+        if other.is_profile != self.is_profile:
+            return False
+        if other.geo_enforced != self.geo_enforced:
+            return False
+        if other.reused_stage_list != self.reused_stage_list:
+            return False
         return True
 
     def compare(self, other, name="self", ignore_list=None):
@@ -268,6 +303,20 @@ class Simulation(FrozenClass):
             diff_list.append(name + ".layer")
         if other._layer_log_warn != self._layer_log_warn:
             diff_list.append(name + ".layer_log_warn")
+        if other._is_profile != self._is_profile:
+            diff_list.append(name + ".is_profile")
+        if (other.geo_enforced is None and self.geo_enforced is not None) or (
+            other.geo_enforced is not None and self.geo_enforced is None
+        ):
+            diff_list.append(name + ".geo_enforced None mismatch")
+        elif self.geo_enforced is not None:
+            diff_list.extend(
+                self.geo_enforced.compare(
+                    other.geo_enforced, name=name + ".geo_enforced"
+                )
+            )
+        if other._reused_stage_list != self._reused_stage_list:
+            diff_list.append(name + ".reused_stage_list")
         # Filter ignore differences
         diff_list = list(filter(lambda x: x not in ignore_list, diff_list))
         return diff_list
@@ -289,6 +338,11 @@ class Simulation(FrozenClass):
         S += getsizeof(self.path_result)
         S += getsizeof(self.layer)
         S += getsizeof(self.layer_log_warn)
+        S += getsizeof(self.is_profile)
+        S += getsizeof(self.geo_enforced)
+        if self.reused_stage_list is not None:
+            for value in self.reused_stage_list:
+                S += getsizeof(value)
         return S
 
     def as_dict(self, **kwargs):
@@ -327,6 +381,16 @@ class Simulation(FrozenClass):
         Simulation_dict["path_result"] = self.path_result
         Simulation_dict["layer"] = self.layer
         Simulation_dict["layer_log_warn"] = self.layer_log_warn
+        Simulation_dict["is_profile"] = self.is_profile
+        if self.geo_enforced is None:
+            Simulation_dict["geo_enforced"] = None
+        else:
+            Simulation_dict["geo_enforced"] = self.geo_enforced.as_dict(**kwargs)
+        Simulation_dict["reused_stage_list"] = (
+            self.reused_stage_list.copy()
+            if self.reused_stage_list is not None
+            else None
+        )
         # The class name is added to the dict for deserialisation purpose
         Simulation_dict["__class__"] = "Simulation"
         return Simulation_dict
@@ -348,6 +412,10 @@ class Simulation(FrozenClass):
         self.path_result = None
         self.layer = None
         self.layer_log_warn = None
+        self.is_profile = None
+        if self.geo_enforced is not None:
+            self.geo_enforced._set_None()
+        self.reused_stage_list = None
 
     def _get_name(self):
         """getter of name"""
@@ -600,3 +668,71 @@ class Simulation(FrozenClass):
         :min: 0
         """,
     )
+
+    def _get_is_profile(self):
+        """getter of is_profile"""
+        return self._is_profile
+
+    def _set_is_profile(self, value):
+        """setter of is_profile"""
+        check_var("is_profile", value, "bool")
+        self._is_profile = value
+
+    is_profile = property(
+        fget=_get_is_profile,
+        fset=_set_is_profile,
+        doc=u"""True to record the time and memory of each stage of the simulation in Output.profile
+
+        :Type: bool
+        """,
+    )
+
+    def _get_geo_enforced(self):
+        """getter of geo_enforced"""
+        return self._geo_enforced
+
+    def _set_geo_enforced(self, value):
+        """setter of geo_enforced"""
+        if isinstance(value, str):  # Load from file
+            value = load_init_dict(value)[1]
+        if isinstance(value, dict) and "__class__" in value:
+            class_obj = import_class(
+                "pyleecan.Classes", value.get("__class__"), "geo_enforced"
+            )
+            value = class_obj(init_dict=value)
+        elif type(value) is int and value == -1:  # Default constructor
+            value = OutGeo()
+        check_var("geo_enforced", value, "OutGeo")
+        self._geo_enforced = value
+
+        if self._geo_enforced is not None:
+            self._geo_enforced.parent = self
+
+    geo_enforced = property(
+        fget=_get_geo_enforced,
+        fset=_set_geo_enforced,
+        doc=u"""OutGeo to use instead of computing it from the machine (None to compute it), the machine must not be modified
+
+        :Type: OutGeo
+        """,
+    )
+
+    def _get_reused_stage_list(self):
+        """getter of reused_stage_list"""
+        return self._reused_stage_list
+
+    def _set_reused_stage_list(self, value):
+        """setter of reused_stage_list"""
+        if type(value) is int and value == -1:
+            value = list()
+        check_var("reused_stage_list", value, "list")
+        self._reused_stage_list = value
+
+    reused_stage_list = property(
+        fget=_get_reused_stage_list,
+        fset=_set_reused_stage_list,
+        doc=u"""Stages of the simulation not computed (Electrical, Magnetics...), their results are already in the Output (reused from the reference simulation of a multi-simulation)
+
+        :Type: list
+        """,
+    )
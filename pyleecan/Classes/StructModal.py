@@ -0,0 +1,358 @@
+# -*- coding: utf-8 -*-
+# File generated according to Generator/ClassesRef/Simulation/StructModal.csv
+# WARNING! All changes made in this file will be lost!
+"""Method code available at https://github.com/Eomys/pyleecan/tree/master/pyleecan/Methods/Simulation/StructModal
+"""
+
+from os import linesep
+from sys import getsizeof
+from logging import getLogger
+from ._check import check_var, raise_
+from ..Functions.get_logger import get_logger
+from ..Functions.save import save
+from ..Functions.copy import copy
+from ..Functions.load import load_init_dict
+from ..Functions.Load.import_class import import_class
+from .StructElmer import StructElmer
+
+# Import all class method
+# Try/catch to remove unnecessary dependencies in unused method
+try:
+    from ..Methods.Simulation.StructModal.run import run
+except ImportError as error:
+    run = error
+
+try:
+    from ..Methods.Simulation.StructModal.gen_mesh import gen_mesh
+except ImportError as error:
+    gen_mesh = error
+
+try:
+    from ..Methods.Simulation.StructModal.solve_FEA import solve_FEA
+except ImportError as error:
+    solve_FEA = error
+
+try:
+    from ..Methods.Simulation.StructModal.get_meshsolution import get_meshsolution
+except ImportError as error:
+    get_meshsolution = error
+
+
+import numpy as np
+from ._check import InitUnKnowClassError
+
+
+class StructModal(StructElmer):
+    """Structural module: in-process 2D plane stress modal analysis of the stator lamination"""
+
+    VERSION = 1
+
+    # Check ImportError to remove unnecessary dependencies in unused method
+    # cf Methods.Simulation.StructModal.run
+    if isinstance(run, ImportError):
+        run = property(
+            fget=lambda x: raise_(
+                ImportError("Can't use StructModal method run: " + str(run))
+            )
+        )
+    else:
+        run = run
+    # cf Methods.Simulation.StructModal.gen_mesh
+    if isinstance(gen_mesh, ImportError):
+        gen_mesh = property(
+            fget=lambda x: raise_(
+                ImportError("Can't use StructModal method gen_mesh: " + str(gen_mesh))
+            )
+        )
+    else:
+        gen_mesh = gen_mesh
+    # cf Methods.Simulation.StructModal.solve_FEA
+    if isinstance(solve_FEA, ImportError):
+        solve_FEA = property(
+            fget=lambda x: raise_(
+                ImportError("Can't use StructModal method solve_FEA: " + str(solve_FEA))
+            )
+        )
+    else:
+        solve_FEA = solve_FEA
+    # cf Methods.Simulation.StructModal.get_meshsolution
+    if isinstance(get_meshsolution, ImportError):
+        get_meshsolution = property(
+            fget=lambda x: raise_(
+                ImportError(
+                    "Can't use StructModal method get_meshsolution: "
+                    + str(get_meshsolution)
+                )
+            )
+        )
+    else:
+        get_meshsolution = get_meshsolution
+    # save and copy methods are available in all object
+    save = save
+    copy = copy
+    # get_logger method is available in all object
+    get_logger = get_logger
+
+    def __init__(
+        self,
+        Nmode=10,
+        freq_min=1,
+        factorization=None,
+        Kmesh_fineness=1,
+        path_name="",
+        FEA_dict_enforced=-1,
+        is_get_mesh=False,
+        is_save_FEA=True,
+        transform_list=-1,
+        include_magnets=True,
+        logger_name="Pyleecan.Structural",
+        init_dict=None,
+        init_str=None,
+    ):
+        """Constructor of the class. Can be use in three ways :
+        - __init__ (arg1 = 1, arg3 = 5) every parameters have name and default values
+            for pyleecan type, -1 will call the default constructor
+        - __init__ (init_dict = d) d must be a dictionary with property names as keys
+        - __init__ (init_str = s) s must be a string
+        s is the file path to load
+
+        ndarray or list can be given for Vector and Matrix
+        object or dict can be given for pyleecan Object"""
+
+        if init_str is not None:  # Load from a file
+            init_dict = load_init_dict(init_str)[1]
+        if init_dict is not None:  # Initialisation by dict
+            assert type(init_dict) is dict
+            # Overwrite default value with init_dict content
+            if "Nmode" in list(init_dict.keys()):
+                Nmode = init_dict["Nmode"]
+            if "freq_min" in list(init_dict.keys()):
+                freq_min = init_dict["freq_min"]
+            if "factorization" in list(init_dict.keys()):
+                factorization = init_dict["factorization"]
+            if "Kmesh_fineness" in list(init_dict.keys()):
+                Kmesh_fineness = init_dict["Kmesh_fineness"]
+            if "path_name" in list(init_dict.keys()):
+                path_name = init_dict["path_name"]
+            if "FEA_dict_enforced" in list(init_dict.keys()):
+                FEA_dict_enforced = init_dict["FEA_dict_enforced"]
+            if "is_get_mesh" in list(init_dict.keys()):
+                is_get_mesh = init_dict["is_get_mesh"]
+            if "is_save_FEA" in list(init_dict.keys()):
+                is_save_FEA = init_dict["is_save_FEA"]
+            if "transform_list" in list(init_dict.keys()):
+                transform_list = init_dict["transform_list"]
+            if "include_magnets" in list(init_dict.keys()):
+                include_magnets = init_dict["include_magnets"]
+            if "logger_name" in list(init_dict.keys()):
+                logger_name = init_dict["logger_name"]
+        # Set the properties (value check and convertion are done in setter)
+        self.Nmode = Nmode
+        self.freq_min = freq_min
+        self.factorization = factorization
+        # Call StructElmer init
+        super(StructModal, self).__init__(
+            Kmesh_fineness=Kmesh_fineness,
+            path_name=path_name,
+            FEA_dict_enforced=FEA_dict_enforced,
+            is_get_mesh=is_get_mesh,
+            is_save_FEA=is_save_FEA,
+            transform_list=transform_list,
+            include_magnets=include_magnets,
+            logger_name=logger_name,
+        )
+        # The class is frozen (in StructElmer init), for now it's impossible to
+        # add new properties
+
+    def __str__(self):
+        """Convert this object in a readeable string (for print)"""
+
+        StructModal_str = ""
+        # Get the properties inherited from StructElmer
+        StructModal_str += super(StructModal, self).__str__()
+        StructModal_str += "Nmode = " + str(self.Nmode) + linesep
+        StructModal_str += "freq_min = " + str(self.freq_min) + linesep
+        StructModal_str += (
+            "factorization = " + str(self.factorization) + linesep + linesep
+        )
+        return StructModal_str
+
+    def __eq__(self, other):
+        """Compare two objects (skip parent)"""
+
+        if type(other) != type(self):
+            return False
+
+        # Check the properties inherited from StructElmer
+        if not super(StructModal, self).__eq__(other):
+            return False
+        if other.Nmode != self.Nmode:
+            return False
+        if other.freq_min != self.freq_min:
+            return False
+        if isinstance(self.factorization, np.ndarray) and not np.array_equal(
+            other.factorization, self.factorization
+        ):
+            return False
+        elif other.factorization != self.factorization:
+            return False
+        return True
+
+    def compare(self, other, name="self", ignore_list=None):
+        """Compare two objects and return list of differences"""
+
+        if ignore_list is None:
+            ignore_list = list()
+        if type(other) != type(self):
+            return ["type(" + name + ")"]
+        diff_list = list()
+
+        # Check the properties inherited from StructElmer
+        diff_list.extend(super(StructModal, self).compare(other, name=name))
+        if other._Nmode != self._Nmode:
+            diff_list.append(name + ".Nmode")
+        if other._freq_min != self._freq_min:
+            diff_list.append(name + ".freq_min")
+        if (other.factorization is None and self.factorization is not None) or (
+            other.factorization is not None and self.factorization is None
+        ):
+            diff_list.append(name + ".factorization")
+        elif self.factorization is None:
+            pass
+        elif isinstance(self.factorization, np.ndarray) and not np.array_equal(
+            other.factorization, self.factorization
+        ):
+            diff_list.append(name + ".factorization")
+        elif hasattr(self.factorization, "compare"):
+            diff_list.extend(
+                self.factorization.compare(
+                    other.factorization, name=name + ".factorization"
+                )
+            )
+        elif other._factorization != self._factorization:
+            diff_list.append(name + ".factorization")
+        # Filter ignore differences
+        diff_list = list(filter(lambda x: x not in ignore_list, diff_list))
+        return diff_list
+
+    def __sizeof__(self):
+        """Return the size in memory of the object (including all subobject)"""
+
+        S = 0  # Full size of the object
+
+        # Get size of the properties inherited from StructElmer
+        S += super(StructModal, self).__sizeof__()
+        S += getsizeof(self.Nmode)
+        S += getsizeof(self.freq_min)
+        S += getsizeof(self.factorization)
+        return S
+
+    def as_dict(self, **kwargs):
+        """
+        Convert this object in a json serializable dict (can be use in __init__).
+        Optional keyword input parameter is for internal use only
+        and may prevent json serializability.
+        """
+
+        # Get the properties inherited from StructElmer
+        StructModal_dict = super(StructModal, self).as_dict(**kwargs)
+        StructModal_dict["Nmode"] = self.Nmode
+        StructModal_dict["freq_min"] = self.freq_min
+        if self.factorization is None:
+            StructModal_dict["factorization"] = None
+        elif isinstance(self.factorization, np.ndarray):
+            StructModal_dict["factorization"] = self.factorization.tolist()
+        elif hasattr(self.factorization, "as_dict"):
+            StructModal_dict["factorization"] = self.factorization.as_dict()
+        else:
+            StructModal_dict["factorization"] = self.factorization
+        # The class name is added to the dict for deserialisation purpose
+        # Overwrite the mother class name
+        StructModal_dict["__class__"] = "StructModal"
+        return StructModal_dict
+
+    def _set_None(self):
+        """Set all the properties to None (except pyleecan object)"""
+
+        self.Nmode = None
+        self.freq_min = None
+        if hasattr(self.factorization, "_set_None"):
+            self.factorization._set_None()
+        else:
+            self.factorization = None
+        # Set to None the properties inherited from StructElmer
+        super(StructModal, self)._set_None()
+
+    def _get_Nmode(self):
+        """getter of Nmode"""
+        return self._Nmode
+
+    def _set_Nmode(self, value):
+        """setter of Nmode"""
+        check_var("Nmode", value, "int", Vmin=1)
+        self._Nmode = value
+
+    Nmode = property(
+        fget=_get_Nmode,
+        fset=_set_Nmode,
+        doc=u"""Number of modes to compute
+
+        :Type: int
+        :min: 1
+        """,
+    )
+
+    def _get_freq_min(self):
+        """getter of freq_min"""
+        return self._freq_min
+
+    def _set_freq_min(self, value):
+        """setter of freq_min"""
+        check_var("freq_min", value, "float", Vmin=0)
+        self._freq_min = value
+
+    freq_min = property(
+        fget=_get_freq_min,
+        fset=_set_freq_min,
+        doc=u"""Modes below freq_min are considered as rigid body modes and removed
+
+        :Type: float
+        :min: 0
+        """,
+    )
+
+    def _get_factorization(self):
+        """getter of factorization"""
+        return self._factorization
+
+    def _set_factorization(self, value):
+        """setter of factorization"""
+        if isinstance(value, dict) and "__class__" in value:
+            try:
+                class_obj = import_class(
+                    "pyleecan.Classes", value.get("__class__"), "factorization"
+                )
+            except:
+                class_obj = import_class(
+                    "SciDataTool.Classes", value.get("__class__"), "factorization"
+                )
+            value = class_obj(init_dict=value)
+        elif type(value) is list:
+            try:
+                value = np.array(value)
+            except:
+                pass
+        check_var("factorization", value, "")
+        self._factorization = value
+
+        if hasattr(self._factorization, "parent"):
+            self._factorization.parent = self
+
+    factorization = property(
+        fget=_get_factorization,
+        fset=_set_factorization,
+        doc=u"""Matrices and factorization of the last modal analysis, reused when only the scale of the materials changes (not saved)
+
+        :Type: 
+        """,
+    )
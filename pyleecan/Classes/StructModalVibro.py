@@ -0,0 +1,333 @@
+# -*- coding: utf-8 -*-
+# File generated according to Generator/ClassesRef/Simulation/StructModalVibro.csv
+# WARNING! All changes made in this file will be lost!
+"""Method code available at https://github.com/Eomys/pyleecan/tree/master/pyleecan/Methods/Simulation/StructModalVibro
+"""
+
+from os import linesep
+from sys import getsizeof
+from logging import getLogger
+from ._check import check_var, raise_
+from ..Functions.get_logger import get_logger
+from ..Functions.save import save
+from ..Functions.copy import copy
+from ..Functions.load import load_init_dict
+from ..Functions.Load.import_class import import_class
+from .StructModal import StructModal
+
+# Import all class method
+# Try/catch to remove unnecessary dependencies in unused method
+try:
+    from ..Methods.Simulation.StructModalVibro.run import run
+except ImportError as error:
+    run = error
+
+try:
+    from ..Methods.Simulation.StructModalVibro.comp_response import comp_response
+except ImportError as error:
+    comp_response = error
+
+
+from ._check import InitUnKnowClassError
+
+
+class StructModalVibro(StructModal):
+    """Structural module: vibro-acoustic response of the stator to the air-gap surface force by modal superposition"""
+
+    VERSION = 1
+
+    # Check ImportError to remove unnecessary dependencies in unused method
+    # cf Methods.Simulation.StructModalVibro.run
+    if isinstance(run, ImportError):
+        run = property(
+            fget=lambda x: raise_(
+                ImportError("Can't use StructModalVibro method run: " + str(run))
+            )
+        )
+    else:
+        run = run
+    # cf Methods.Simulation.StructModalVibro.comp_response
+    if isinstance(comp_response, ImportError):
+        comp_response = property(
+            fget=lambda x: raise_(
+                ImportError(
+                    "Can't use StructModalVibro method comp_response: "
+                    + str(comp_response)
+                )
+            )
+        )
+    else:
+        comp_response = comp_response
+    # save and copy methods are available in all object
+    save = save
+    copy = copy
+    # get_logger method is available in all object
+    get_logger = get_logger
+
+    def __init__(
+        self,
+        damping=0.02,
+        N0_list=-1,
+        rho_air=1.2,
+        c_air=343,
+        Nmode=10,
+        freq_min=1,
+        factorization=None,
+        Kmesh_fineness=1,
+        path_name="",
+        FEA_dict_enforced=-1,
+        is_get_mesh=False,
+        is_save_FEA=True,
+        transform_list=-1,
+        include_magnets=True,
+        logger_name="Pyleecan.Structural",
+        init_dict=None,
+        init_str=None,
+    ):
+        """Constructor of the class. Can be use in three ways :
+        - __init__ (arg1 = 1, arg3 = 5) every parameters have name and default values
+            for pyleecan type, -1 will call the default constructor
+        - __init__ (init_dict = d) d must be a dictionary with property names as keys
+        - __init__ (init_str = s) s must be a string
+        s is the file path to load
+
+        ndarray or list can be given for Vector and Matrix
+        object or dict can be given for pyleecan Object"""
+
+        if init_str is not None:  # Load from a file
+            init_dict = load_init_dict(init_str)[1]
+        if init_dict is not None:  # Initialisation by dict
+            assert type(init_dict) is dict
+            # Overwrite default value with init_dict content
+            if "damping" in list(init_dict.keys()):
+                damping = init_dict["damping"]
+            if "N0_list" in list(init_dict.keys()):
+                N0_list = init_dict["N0_list"]
+            if "rho_air" in list(init_dict.keys()):
+                rho_air = init_dict["rho_air"]
+            if "c_air" in list(init_dict.keys()):
+                c_air = init_dict["c_air"]
+            if "Nmode" in list(init_dict.keys()):
+                Nmode = init_dict["Nmode"]
+            if "freq_min" in list(init_dict.keys()):
+                freq_min = init_dict["freq_min"]
+            if "factorization" in list(init_dict.keys()):
+                factorization = init_dict["factorization"]
+            if "Kmesh_fineness" in list(init_dict.keys()):
+                Kmesh_fineness = init_dict["Kmesh_fineness"]
+            if "path_name" in list(init_dict.keys()):
+                path_name = init_dict["path_name"]
+            if "FEA_dict_enforced" in list(init_dict.keys()):
+                FEA_dict_enforced = init_dict["FEA_dict_enforced"]
+            if "is_get_mesh" in list(init_dict.keys()):
+                is_get_mesh = init_dict["is_get_mesh"]
+            if "is_save_FEA" in list(init_dict.keys()):
+                is_save_FEA = init_dict["is_save_FEA"]
+            if "transform_list" in list(init_dict.keys()):
+                transform_list = init_dict["transform_list"]
+            if "include_magnets" in list(init_dict.keys()):
+                include_magnets = init_dict["include_magnets"]
+            if "logger_name" in list(init_dict.keys()):
+                logger_name = init_dict["logger_name"]
+        # Set the properties (value check and convertion are done in setter)
+        self.damping = damping
+        self.N0_list = N0_list
+        self.rho_air = rho_air
+        self.c_air = c_air
+        # Call StructModal init
+        super(StructModalVibro, self).__init__(
+            Nmode=Nmode,
+            freq_min=freq_min,
+            factorization=factorization,
+            Kmesh_fineness=Kmesh_fineness,
+            path_name=path_name,
+            FEA_dict_enforced=FEA_dict_enforced,
+            is_get_mesh=is_get_mesh,
+            is_save_FEA=is_save_FEA,
+            transform_list=transform_list,
+            include_magnets=include_magnets,
+            logger_name=logger_name,
+        )
+        # The class is frozen (in StructModal init), for now it's impossible to
+        # add new properties
+
+    def __str__(self):
+        """Convert this object in a readeable string (for print)"""
+
+        StructModalVibro_str = ""
+        # Get the properties inherited from StructModal
+        StructModalVibro_str += super(StructModalVibro, self).__str__()
+        StructModalVibro_str += "damping = " + str(self.damping) + linesep
+        StructModalVibro_str += (
+            "N0_list = "
+            + linesep
+            + str(self.N0_list).replace(linesep, linesep + "\t")
+            + linesep
+        )
+        StructModalVibro_str += "rho_air = " + str(self.rho_air) + linesep
+        StructModalVibro_str += "c_air = " + str(self.c_air) + linesep
+        return StructModalVibro_str
+
+    def __eq__(self, other):
+        """Compare two objects (skip parent)"""
+
+        if type(other) != type(self):
+            return False
+
+        # Check the properties inherited from StructModal
+        if not super(StructModalVibro, self).__eq__(other):
+            return False
+        if other.damping != self.damping:
+            return False
+        if other.N0_list != self.N0_list:
+            return False
+        if other.rho_air != self.rho_air:
+            return False
+        if other.c_air != self.c_air:
+            return False
+        return True
+
+    def compare(self, other, name="self", ignore_list=None):
+        """Compare two objects and return list of differences"""
+
+        if ignore_list is None:
+            ignore_list = list()
+        if type(other) != type(self):
+            return ["type(" + name + ")"]
+        diff_list = list()
+
+        # Check the properties inherited from StructModal
+        diff_list.extend(super(StructModalVibro, self).compare(other, name=name))
+        if other._damping != self._damping:
+            diff_list.append(name + ".damping")
+        if other._N0_list != self._N0_list:
+            diff_list.append(name + ".N0_list")
+        if other._rho_air != self._rho_air:
+            diff_list.append(name + ".rho_air")
+        if other._c_air != self._c_air:
+            diff_list.append(name + ".c_air")
+        # Filter ignore differences
+        diff_list = list(filter(lambda x: x not in ignore_list, diff_list))
+        return diff_list
+
+    def __sizeof__(self):
+        """Return the size in memory of the object (including all subobject)"""
+
+        S = 0  # Full size of the object
+
+        # Get size of the properties inherited from StructModal
+        S += super(StructModalVibro, self).__sizeof__()
+        S += getsizeof(self.damping)
+        if self.N0_list is not None:
+            for value in self.N0_list:
+                S += getsizeof(value)
+        S += getsizeof(self.rho_air)
+        S += getsizeof(self.c_air)
+        return S
+
+    def as_dict(self, **kwargs):
+        """
+        Convert this object in a json serializable dict (can be use in __init__).
+        Optional keyword input parameter is for internal use only
+        and may prevent json serializability.
+        """
+
+        # Get the properties inherited from StructModal
+        StructModalVibro_dict = super(StructModalVibro, self).as_dict(**kwargs)
+        StructModalVibro_dict["damping"] = self.damping
+        StructModalVibro_dict["N0_list"] = (
+            self.N0_list.copy() if self.N0_list is not None else None
+        )
+        StructModalVibro_dict["rho_air"] = self.rho_air
+        StructModalVibro_dict["c_air"] = self.c_air
+        # The class name is added to the dict for deserialisation purpose
+        # Overwrite the mother class name
+        StructModalVibro_dict["__class__"] = "StructModalVibro"
+        return StructModalVibro_dict
+
+    def _set_None(self):
+        """Set all the properties to None (except pyleecan object)"""
+
+        self.damping = None
+        self.N0_list = None
+        self.rho_air = None
+        self.c_air = None
+        # Set to None the properties inherited from StructModal
+        super(StructModalVibro, self)._set_None()
+
+    def _get_damping(self):
+        """getter of damping"""
+        return self._damping
+
+    def _set_damping(self, value):
+        """setter of damping"""
+        check_var("damping", value, "float", Vmin=0)
+        self._damping = value
+
+    damping = property(
+        fget=_get_damping,
+        fset=_set_damping,
+        doc=u"""Modal damping ratio
+
+        :Type: float
+        :min: 0
+        """,
+    )
+
+    def _get_N0_list(self):
+        """getter of N0_list"""
+        return self._N0_list
+
+    def _set_N0_list(self, value):
+        """setter of N0_list"""
+        if type(value) is int and value == -1:
+            value = list()
+        check_var("N0_list", value, "list")
+        self._N0_list = value
+
+    N0_list = property(
+        fget=_get_N0_list,
+        fset=_set_N0_list,
+        doc=u"""List of rotor speeds to compute (default: simulation speed)
+
+        :Type: list
+        """,
+    )
+
+    def _get_rho_air(self):
+        """getter of rho_air"""
+        return self._rho_air
+
+    def _set_rho_air(self, value):
+        """setter of rho_air"""
+        check_var("rho_air", value, "float", Vmin=0)
+        self._rho_air = value
+
+    rho_air = property(
+        fget=_get_rho_air,
+        fset=_set_rho_air,
+        doc=u"""Mass density of the surrounding air for the Equivalent Radiated Power
+
+        :Type: float
+        :min: 0
+        """,
+    )
+
+    def _get_c_air(self):
+        """getter of c_air"""
+        return self._c_air
+
+    def _set_c_air(self, value):
+        """setter of c_air"""
+        check_var("c_air", value, "float", Vmin=0)
+        self._c_air = value
+
+    c_air = property(
+        fget=_get_c_air,
+        fset=_set_c_air,
+        doc=u"""Speed of sound in the surrounding air for the Equivalent Radiated Power
+
+        :Type: float
+        :min: 0
+        """,
+    )
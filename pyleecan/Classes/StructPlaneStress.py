@@ -0,0 +1,260 @@
+# -*- coding: utf-8 -*-
+# File generated according to Generator/ClassesRef/Simulation/StructPlaneStress.csv
+# WARNING! All changes made in this file will be lost!
+"""Method code available at https://github.com/Eomys/pyleecan/tree/master/pyleecan/Methods/Simulation/StructPlaneStress
+"""
+
+from os import linesep
+from sys import getsizeof
+from logging import getLogger
+from ._check import check_var, raise_
+from ..Functions.get_logger import get_logger
+from ..Functions.save import save
+from ..Functions.copy import copy
+from ..Functions.load import load_init_dict
+from ..Functions.Load.import_class import import_class
+from .StructElmer import StructElmer
+
+# Import all class method
+# Try/catch to remove unnecessary dependencies in unused method
+try:
+    from ..Methods.Simulation.StructPlaneStress.run import run
+except ImportError as error:
+    run = error
+
+try:
+    from ..Methods.Simulation.StructPlaneStress.gen_mesh import gen_mesh
+except ImportError as error:
+    gen_mesh = error
+
+try:
+    from ..Methods.Simulation.StructPlaneStress.solve_FEA import solve_FEA
+except ImportError as error:
+    solve_FEA = error
+
+try:
+    from ..Methods.Simulation.StructPlaneStress.get_meshsolution import get_meshsolution
+except ImportError as error:
+    get_meshsolution = error
+
+
+from ._check import InitUnKnowClassError
+
+
+class StructPlaneStress(StructElmer):
+    """Structural module: in-process 2D plane stress model of the rotor under centrifugal load"""
+
+    VERSION = 1
+
+    # Check ImportError to remove unnecessary dependencies in unused method
+    # cf Methods.Simulation.StructPlaneStress.run
+    if isinstance(run, ImportError):
+        run = property(
+            fget=lambda x: raise_(
+                ImportError("Can't use StructPlaneStress method run: " + str(run))
+            )
+        )
+    else:
+        run = run
+    # cf Methods.Simulation.StructPlaneStress.gen_mesh
+    if isinstance(gen_mesh, ImportError):
+        gen_mesh = property(
+            fget=lambda x: raise_(
+                ImportError(
+                    "Can't use StructPlaneStress method gen_mesh: " + str(gen_mesh)
+                )
+            )
+        )
+    else:
+        gen_mesh = gen_mesh
+    # cf Methods.Simulation.StructPlaneStress.solve_FEA
+    if isinstance(solve_FEA, ImportError):
+        solve_FEA = property(
+            fget=lambda x: raise_(
+                ImportError(
+                    "Can't use StructPlaneStress method solve_FEA: " + str(solve_FEA)
+                )
+            )
+        )
+    else:
+        solve_FEA = solve_FEA
+    # cf Methods.Simulation.StructPlaneStress.get_meshsolution
+    if isinstance(get_meshsolution, ImportError):
+        get_meshsolution = property(
+            fget=lambda x: raise_(
+                ImportError(
+                    "Can't use StructPlaneStress method get_meshsolution: "
+                    + str(get_meshsolution)
+                )
+            )
+        )
+    else:
+        get_meshsolution = get_meshsolution
+    # save and copy methods are available in all object
+    save = save
+    copy = copy
+    # get_logger method is available in all object
+    get_logger = get_logger
+
+    def __init__(
+        self,
+        N0_list=-1,
+        Kmesh_fineness=1,
+        path_name="",
+        FEA_dict_enforced=-1,
+        is_get_mesh=False,
+        is_save_FEA=True,
+        transform_list=-1,
+        include_magnets=True,
+        logger_name="Pyleecan.Structural",
+        init_dict=None,
+        init_str=None,
+    ):
+        """Constructor of the class. Can be use in three ways :
+        - __init__ (arg1 = 1, arg3 = 5) every parameters have name and default values
+            for pyleecan type, -1 will call the default constructor
+        - __init__ (init_dict = d) d must be a dictionary with property names as keys
+        - __init__ (init_str = s) s must be a string
+        s is the file path to load
+
+        ndarray or list can be given for Vector and Matrix
+        object or dict can be given for pyleecan Object"""
+
+        if init_str is not None:  # Load from a file
+            init_dict = load_init_dict(init_str)[1]
+        if init_dict is not None:  # Initialisation by dict
+            assert type(init_dict) is dict
+            # Overwrite default value with init_dict content
+            if "N0_list" in list(init_dict.keys()):
+                N0_list = init_dict["N0_list"]
+            if "Kmesh_fineness" in list(init_dict.keys()):
+                Kmesh_fineness = init_dict["Kmesh_fineness"]
+            if "path_name" in list(init_dict.keys()):
+                path_name = init_dict["path_name"]
+            if "FEA_dict_enforced" in list(init_dict.keys()):
+                FEA_dict_enforced = init_dict["FEA_dict_enforced"]
+            if "is_get_mesh" in list(init_dict.keys()):
+                is_get_mesh = init_dict["is_get_mesh"]
+            if "is_save_FEA" in list(init_dict.keys()):
+                is_save_FEA = init_dict["is_save_FEA"]
+            if "transform_list" in list(init_dict.keys()):
+                transform_list = init_dict["transform_list"]
+            if "include_magnets" in list(init_dict.keys()):
+                include_magnets = init_dict["include_magnets"]
+            if "logger_name" in list(init_dict.keys()):
+                logger_name = init_dict["logger_name"]
+        # Set the properties (value check and convertion are done in setter)
+        self.N0_list = N0_list
+        # Call StructElmer init
+        super(StructPlaneStress, self).__init__(
+            Kmesh_fineness=Kmesh_fineness,
+            path_name=path_name,
+            FEA_dict_enforced=FEA_dict_enforced,
+            is_get_mesh=is_get_mesh,
+            is_save_FEA=is_save_FEA,
+            transform_list=transform_list,
+            include_magnets=include_magnets,
+            logger_name=logger_name,
+        )
+        # The class is frozen (in StructElmer init), for now it's impossible to
+        # add new properties
+
+    def __str__(self):
+        """Convert this object in a readeable string (for print)"""
+
+        StructPlaneStress_str = ""
+        # Get the properties inherited from StructElmer
+        StructPlaneStress_str += super(StructPlaneStress, self).__str__()
+        StructPlaneStress_str += (
+            "N0_list = "
+            + linesep
+            + str(self.N0_list).replace(linesep, linesep + "\t")
+            + linesep
+        )
+        return StructPlaneStress_str
+
+    def __eq__(self, other):
+        """Compare two objects (skip parent)"""
+
+        if type(other) != type(self):
+            return False
+
+        # Check the properties inherited from StructElmer
+        if not super(StructPlaneStress, self).__eq__(other):
+            return False
+        if other.N0_list != self.N0_list:
+            return False
+        return True
+
+    def compare(self, other, name="self", ignore_list=None):
+        """Compare two objects and return list of differences"""
+
+        if ignore_list is None:
+            ignore_list = list()
+        if type(other) != type(self):
+            return ["type(" + name + ")"]
+        diff_list = list()
+
+        # Check the properties inherited from StructElmer
+        diff_list.extend(super(StructPlaneStress, self).compare(other, name=name))
+        if other._N0_list != self._N0_list:
+            diff_list.append(name + ".N0_list")
+        # Filter ignore differences
+        diff_list = list(filter(lambda x: x not in ignore_list, diff_list))
+        return diff_list
+
+    def __sizeof__(self):
+        """Return the size in memory of the object (including all subobject)"""
+
+        S = 0  # Full size of the object
+
+        # Get size of the properties inherited from StructElmer
+        S += super(StructPlaneStress, self).__sizeof__()
+        if self.N0_list is not None:
+            for value in self.N0_list:
+                S += getsizeof(value)
+        return S
+
+    def as_dict(self, **kwargs):
+        """
+        Convert this object in a json serializable dict (can be use in __init__).
+        Optional keyword input parameter is for internal use only
+        and may prevent json serializability.
+        """
+
+        # Get the properties inherited from StructElmer
+        StructPlaneStress_dict = super(StructPlaneStress, self).as_dict(**kwargs)
+        StructPlaneStress_dict["N0_list"] = (
+            self.N0_list.copy() if self.N0_list is not None else None
+        )
+        # The class name is added to the dict for deserialisation purpose
+        # Overwrite the mother class name
+        StructPlaneStress_dict["__class__"] = "StructPlaneStress"
+        return StructPlaneStress_dict
+
+    def _set_None(self):
+        """Set all the properties to None (except pyleecan object)"""
+
+        self.N0_list = None
+        # Set to None the properties inherited from StructElmer
+        super(StructPlaneStress, self)._set_None()
+
+    def _get_N0_list(self):
+        """getter of N0_list"""
+        return self._N0_list
+
+    def _set_N0_list(self, value):
+        """setter of N0_list"""
+        if type(value) is int and value == -1:
+            value = list()
+        check_var("N0_list", value, "list")
+        self._N0_list = value
+
+    N0_list = property(
+        fget=_get_N0_list,
+        fset=_set_N0_list,
+        doc=u"""List of rotor speeds to compute (default: simulation speed)
+
+        :Type: list
+        """,
+    )
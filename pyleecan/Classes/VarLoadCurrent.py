@@ -41,6 +41,13 @@ try:
 except ImportError as error:
     get_elec_datakeeper = error
 
+try:
+    from ..Methods.Simulation.VarLoadCurrent.generate_refined_simulation_list import (
+        generate_refined_simulation_list,
+    )
+except ImportError as error:
+    generate_refined_simulation_list = error
+
 
 from numpy import array, array_equal
 from ._check import InitUnKnowClassError
@@ -102,6 +109,18 @@ class VarLoadCurrent(VarLoad):
         )
     else:
         get_elec_datakeeper = get_elec_datakeeper
+    # cf Methods.Simulation.VarLoadCurrent.generate_refined_simulation_list
+    if isinstance(generate_refined_simulation_list, ImportError):
+        generate_refined_simulation_list = property(
+            fget=lambda x: raise_(
+                ImportError(
+                    "Can't use VarLoadCurrent method generate_refined_simulation_list: "
+                    + str(generate_refined_simulation_list)
+                )
+            )
+        )
+    else:
+        generate_refined_simulation_list = generate_refined_simulation_list
     # save and copy methods are available in all object
     save = save
     copy = copy
@@ -114,6 +133,12 @@ class VarLoadCurrent(VarLoad):
         type_OP_matrix=0,
         is_torque=False,
         is_power=False,
+        adapt_symbol_list=-1,
+        adapt_tol=0.05,
+        adapt_limit_symbol=None,
+        adapt_limit_value=None,
+        adapt_nb_simu_max=100,
+        adapt_batch_size=10,
         name="",
         desc="",
         datakeeper_list=-1,
@@ -125,6 +150,10 @@ class VarLoadCurrent(VarLoad):
         postproc_list=-1,
         pre_keeper_postproc_list=None,
         post_keeper_postproc_list=None,
+        path_store=None,
+        is_resume=True,
+        is_reuse_machine=True,
+        is_incremental=True,
         init_dict=None,
         init_str=None,
     ):
@@ -151,6 +180,18 @@ class VarLoadCurrent(VarLoad):
                 is_torque = init_dict["is_torque"]
             if "is_power" in list(init_dict.keys()):
                 is_power = init_dict["is_power"]
+            if "adapt_symbol_list" in list(init_dict.keys()):
+                adapt_symbol_list = init_dict["adapt_symbol_list"]
+            if "adapt_tol" in list(init_dict.keys()):
+                adapt_tol = init_dict["adapt_tol"]
+            if "adapt_limit_symbol" in list(init_dict.keys()):
+                adapt_limit_symbol = init_dict["adapt_limit_symbol"]
+            if "adapt_limit_value" in list(init_dict.keys()):
+                adapt_limit_value = init_dict["adapt_limit_value"]
+            if "adapt_nb_simu_max" in list(init_dict.keys()):
+                adapt_nb_simu_max = init_dict["adapt_nb_simu_max"]
+            if "adapt_batch_size" in list(init_dict.keys()):
+                adapt_batch_size = init_dict["adapt_batch_size"]
             if "name" in list(init_dict.keys()):
                 name = init_dict["name"]
             if "desc" in list(init_dict.keys()):
@@ -173,11 +214,25 @@ class VarLoadCurrent(VarLoad):
                 pre_keeper_postproc_list = init_dict["pre_keeper_postproc_list"]
             if "post_keeper_postproc_list" in list(init_dict.keys()):
                 post_keeper_postproc_list = init_dict["post_keeper_postproc_list"]
+            if "path_store" in list(init_dict.keys()):
+                path_store = init_dict["path_store"]
+            if "is_resume" in list(init_dict.keys()):
+                is_resume = init_dict["is_resume"]
+            if "is_reuse_machine" in list(init_dict.keys()):
+                is_reuse_machine = init_dict["is_reuse_machine"]
+            if "is_incremental" in list(init_dict.keys()):
+                is_incremental = init_dict["is_incremental"]
         # Set the properties (value check and convertion are done in setter)
         self.OP_matrix = OP_matrix
         self.type_OP_matrix = type_OP_matrix
         self.is_torque = is_torque
         self.is_power = is_power
+        self.adapt_symbol_list = adapt_symbol_list
+        self.adapt_tol = adapt_tol
+        self.adapt_limit_symbol = adapt_limit_symbol
+        self.adapt_limit_value = adapt_limit_value
+        self.adapt_nb_simu_max = adapt_nb_simu_max
+        self.adapt_batch_size = adapt_batch_size
         # Call VarLoad init
         super(VarLoadCurrent, self).__init__(
             name=name,
@@ -191,6 +246,10 @@ class VarLoadCurrent(VarLoad):
             postproc_list=postproc_list,
             pre_keeper_postproc_list=pre_keeper_postproc_list,
             post_keeper_postproc_list=post_keeper_postproc_list,
+            path_store=path_store,
+            is_resume=is_resume,
+            is_reuse_machine=is_reuse_machine,
+            is_incremental=is_incremental,
         )
         # The class is frozen (in VarLoad init), for now it's impossible to
         # add new properties
@@ -211,6 +270,25 @@ class VarLoadCurrent(VarLoad):
         VarLoadCurrent_str += "type_OP_matrix = " + str(self.type_OP_matrix) + linesep
         VarLoadCurrent_str += "is_torque = " + str(self.is_torque) + linesep
         VarLoadCurrent_str += "is_power = " + str(self.is_power) + linesep
+        VarLoadCurrent_str += (
+            "adapt_symbol_list = "
+            + linesep
+            + str(self.adapt_symbol_list).replace(linesep, linesep + "\t")
+            + linesep
+        )
+        VarLoadCurrent_str += "adapt_tol = " + str(self.adapt_tol) + linesep
+        VarLoadCurrent_str += (
+            'adapt_limit_symbol = "' + str(self.adapt_limit_symbol) + '"' + linesep
+        )
+        VarLoadCurrent_str += (
+            "adapt_limit_value = " + str(self.adapt_limit_value) + linesep
+        )
+        VarLoadCurrent_str += (
+            "adapt_nb_simu_max = " + str(self.adapt_nb_simu_max) + linesep
+        )
+        VarLoadCurrent_str += (
+            "adapt_batch_size = " + str(self.adapt_batch_size) + linesep
+        )
         return VarLoadCurrent_str
 
     def __eq__(self, other):
@@ -230,6 +308,18 @@ class VarLoadCurrent(VarLoad):
             return False
         if other.is_power != self.is_power:
             return False
+        if other.adapt_symbol_list != self.adapt_symbol_list:
+            return False
+        if other.adapt_tol != self.adapt_tol:
+            return False
+        if other.adapt_limit_symbol != self.adapt_limit_symbol:
+            return False
+        if other.adapt_limit_value != self.adapt_limit_value:
+            return False
+        if other.adapt_nb_simu_max != self.adapt_nb_simu_max:
+            return False
+        if other.adapt_batch_size != self.adapt_batch_size:
+            return False
         return True
 
     def compare(self, other, name="self", ignore_list=None):
@@ -251,6 +341,18 @@ class VarLoadCurrent(VarLoad):
             diff_list.append(name + ".is_torque")
         if other._is_power != self._is_power:
             diff_list.append(name + ".is_power")
+        if other._adapt_symbol_list != self._adapt_symbol_list:
+            diff_list.append(name + ".adapt_symbol_list")
+        if other._adapt_tol != self._adapt_tol:
+            diff_list.append(name + ".adapt_tol")
+        if other._adapt_limit_symbol != self._adapt_limit_symbol:
+            diff_list.append(name + ".adapt_limit_symbol")
+        if other._adapt_limit_value != self._adapt_limit_value:
+            diff_list.append(name + ".adapt_limit_value")
+        if other._adapt_nb_simu_max != self._adapt_nb_simu_max:
+            diff_list.append(name + ".adapt_nb_simu_max")
+        if other._adapt_batch_size != self._adapt_batch_size:
+            diff_list.append(name + ".adapt_batch_size")
         # Filter ignore differences
         diff_list = list(filter(lambda x: x not in ignore_list, diff_list))
         return diff_list
@@ -266,6 +368,14 @@ class VarLoadCurrent(VarLoad):
         S += getsizeof(self.type_OP_matrix)
         S += getsizeof(self.is_torque)
         S += getsizeof(self.is_power)
+        if self.adapt_symbol_list is not None:
+            for value in self.adapt_symbol_list:
+                S += getsizeof(value)
+        S += getsizeof(self.adapt_tol)
+        S += getsizeof(self.adapt_limit_symbol)
+        S += getsizeof(self.adapt_limit_value)
+        S += getsizeof(self.adapt_nb_simu_max)
+        S += getsizeof(self.adapt_batch_size)
         return S
 
     def as_dict(self, **kwargs):
@@ -284,6 +394,16 @@ class VarLoadCurrent(VarLoad):
         VarLoadCurrent_dict["type_OP_matrix"] = self.type_OP_matrix
         VarLoadCurrent_dict["is_torque"] = self.is_torque
         VarLoadCurrent_dict["is_power"] = self.is_power
+        VarLoadCurrent_dict["adapt_symbol_list"] = (
+            self.adapt_symbol_list.copy()
+            if self.adapt_symbol_list is not None
+            else None
+        )
+        VarLoadCurrent_dict["adapt_tol"] = self.adapt_tol
+        VarLoadCurrent_dict["adapt_limit_symbol"] = self.adapt_limit_symbol
+        VarLoadCurrent_dict["adapt_limit_value"] = self.adapt_limit_value
+        VarLoadCurrent_dict["adapt_nb_simu_max"] = self.adapt_nb_simu_max
+        VarLoadCurrent_dict["adapt_batch_size"] = self.adapt_batch_size
         # The class name is added to the dict for deserialisation purpose
         # Overwrite the mother class name
         VarLoadCurrent_dict["__class__"] = "VarLoadCurrent"
@@ -296,6 +416,12 @@ class VarLoadCurrent(VarLoad):
         self.type_OP_matrix = None
         self.is_torque = None
         self.is_power = None
+        self.adapt_symbol_list = None
+        self.adapt_tol = None
+        self.adapt_limit_symbol = None
+        self.adapt_limit_value = None
+        self.adapt_nb_simu_max = None
+        self.adapt_batch_size = None
         # Set to None the properties inherited from VarLoad
         super(VarLoadCurrent, self)._set_None()
 
@@ -379,3 +505,116 @@ class VarLoadCurrent(VarLoad):
         :Type: bool
         """,
     )
+
+    def _get_adapt_symbol_list(self):
+        """getter of adapt_symbol_list"""
+        return self._adapt_symbol_list
+
+    def _set_adapt_symbol_list(self, value):
+        """setter of adapt_symbol_list"""
+        if type(value) is int and value == -1:
+            value = list()
+        check_var("adapt_symbol_list", value, "list")
+        self._adapt_symbol_list = value
+
+    adapt_symbol_list = property(
+        fget=_get_adapt_symbol_list,
+        fset=_set_adapt_symbol_list,
+        doc=u"""Symbols of the DataKeepers used to refine the operating points (adaptive sampling if not empty, the OP_matrix is then the initial coarse grid)
+
+        :Type: list
+        """,
+    )
+
+    def _get_adapt_tol(self):
+        """getter of adapt_tol"""
+        return self._adapt_tol
+
+    def _set_adapt_tol(self, value):
+        """setter of adapt_tol"""
+        check_var("adapt_tol", value, "float", Vmin=0)
+        self._adapt_tol = value
+
+    adapt_tol = property(
+        fget=_get_adapt_tol,
+        fset=_set_adapt_tol,
+        doc=u"""Variation of the DataKeeper results (relative to their range) between neighbouring operating points above which the operating points are refined
+
+        :Type: float
+        :min: 0
+        """,
+    )
+
+    def _get_adapt_limit_symbol(self):
+        """getter of adapt_limit_symbol"""
+        return self._adapt_limit_symbol
+
+    def _set_adapt_limit_symbol(self, value):
+        """setter of adapt_limit_symbol"""
+        check_var("adapt_limit_symbol", value, "str")
+        self._adapt_limit_symbol = value
+
+    adapt_limit_symbol = property(
+        fget=_get_adapt_limit_symbol,
+        fset=_set_adapt_limit_symbol,
+        doc=u"""Symbol of a DataKeeper with a limit (e.g. the voltage) whose boundary is refined (None to ignore)
+
+        :Type: str
+        """,
+    )
+
+    def _get_adapt_limit_value(self):
+        """getter of adapt_limit_value"""
+        return self._adapt_limit_value
+
+    def _set_adapt_limit_value(self, value):
+        """setter of adapt_limit_value"""
+        check_var("adapt_limit_value", value, "float")
+        self._adapt_limit_value = value
+
+    adapt_limit_value = property(
+        fget=_get_adapt_limit_value,
+        fset=_set_adapt_limit_value,
+        doc=u"""Value of the limit of adapt_limit_symbol
+
+        :Type: float
+        """,
+    )
+
+    def _get_adapt_nb_simu_max(self):
+        """getter of adapt_nb_simu_max"""
+        return self._adapt_nb_simu_max
+
+    def _set_adapt_nb_simu_max(self, value):
+        """setter of adapt_nb_simu_max"""
+        check_var("adapt_nb_simu_max", value, "int", Vmin=1)
+        self._adapt_nb_simu_max = value
+
+    adapt_nb_simu_max = property(
+        fget=_get_adapt_nb_simu_max,
+        fset=_set_adapt_nb_simu_max,
+        doc=u"""Maximum number of simulations of the adaptive sampling (initial grid included)
+
+        :Type: int
+        :min: 1
+        """,
+    )
+
+    def _get_adapt_batch_size(self):
+        """getter of adapt_batch_size"""
+        return self._adapt_batch_size
+
+    def _set_adapt_batch_size(self, value):
+        """setter of adapt_batch_size"""
+        check_var("adapt_batch_size", value, "int", Vmin=1)
+        self._adapt_batch_size = value
+
+    adapt_batch_size = property(
+        fget=_get_adapt_batch_size,
+        fset=_set_adapt_batch_size,
+        doc=u"""Maximum number of operating points added at each refinement
+
+        :Type: int
+        :min: 1
+        """,
+    )
@@ -103,6 +103,10 @@ class VarParam(VarSimu):
         postproc_list=-1,
         pre_keeper_postproc_list=None,
         post_keeper_postproc_list=None,
+        path_store=None,
+        is_resume=True,
+        is_reuse_machine=True,
+        is_incremental=True,
         init_dict=None,
         init_str=None,
     ):
@@ -145,6 +149,14 @@ class VarParam(VarSimu):
                 pre_keeper_postproc_list = init_dict["pre_keeper_postproc_list"]
             if "post_keeper_postproc_list" in list(init_dict.keys()):
                 post_keeper_postproc_list = init_dict["post_keeper_postproc_list"]
+            if "path_store" in list(init_dict.keys()):
+                path_store = init_dict["path_store"]
+            if "is_resume" in list(init_dict.keys()):
+                is_resume = init_dict["is_resume"]
+            if "is_reuse_machine" in list(init_dict.keys()):
+                is_reuse_machine = init_dict["is_reuse_machine"]
+            if "is_incremental" in list(init_dict.keys()):
+                is_incremental = init_dict["is_incremental"]
         # Set the properties (value check and convertion are done in setter)
         self.paramexplorer_list = paramexplorer_list
         # Call VarSimu init
@@ -160,6 +172,10 @@ class VarParam(VarSimu):
             postproc_list=postproc_list,
             pre_keeper_postproc_list=pre_keeper_postproc_list,
             post_keeper_postproc_list=post_keeper_postproc_list,
+            path_store=path_store,
+            is_resume=is_resume,
+            is_reuse_machine=is_reuse_machine,
+            is_incremental=is_incremental,
         )
         # The class is frozen (in VarSimu init), for now it's impossible to
         # add new properties
@@ -59,6 +59,18 @@ try:
 except ImportError as error:
     get_force_datakeeper = error
 
+try:
+    from ..Methods.Simulation.VarSimu.set_reused_output import set_reused_output
+except ImportError as error:
+    set_reused_output = error
+
+try:
+    from ..Methods.Simulation.VarSimu.generate_refined_simulation_list import (
+        generate_refined_simulation_list,
+    )
+except ImportError as error:
+    generate_refined_simulation_list = error
+
 
 from ._check import InitUnKnowClassError
 from .DataKeeper import DataKeeper
@@ -160,6 +172,30 @@ class VarSimu(FrozenClass):
         )
     else:
         get_force_datakeeper = get_force_datakeeper
+    # cf Methods.Simulation.VarSimu.set_reused_output
+    if isinstance(set_reused_output, ImportError):
+        set_reused_output = property(
+            fget=lambda x: raise_(
+                ImportError(
+                    "Can't use VarSimu method set_reused_output: "
+                    + str(set_reused_output)
+                )
+            )
+        )
+    else:
+        set_reused_output = set_reused_output
+    # cf Methods.Simulation.VarSimu.generate_refined_simulation_list
+    if isinstance(generate_refined_simulation_list, ImportError):
+        generate_refined_simulation_list = property(
+            fget=lambda x: raise_(
+                ImportError(
+                    "Can't use VarSimu method generate_refined_simulation_list: "
+                    + str(generate_refined_simulation_list)
+                )
+            )
+        )
+    else:
+        generate_refined_simulation_list = generate_refined_simulation_list
     # save and copy methods are available in all object
     save = save
     copy = copy
@@ -179,6 +215,10 @@ class VarSimu(FrozenClass):
         postproc_list=-1,
         pre_keeper_postproc_list=None,
         post_keeper_postproc_list=None,
+        path_store=None,
+        is_resume=True,
+        is_reuse_machine=True,
+        is_incremental=True,
         init_dict=None,
         init_str=None,
     ):
@@ -219,6 +259,14 @@ class VarSimu(FrozenClass):
                 pre_keeper_postproc_list = init_dict["pre_keeper_postproc_list"]
             if "post_keeper_postproc_list" in list(init_dict.keys()):
                 post_keeper_postproc_list = init_dict["post_keeper_postproc_list"]
+            if "path_store" in list(init_dict.keys()):
+                path_store = init_dict["path_store"]
+            if "is_resume" in list(init_dict.keys()):
+                is_resume = init_dict["is_resume"]
+            if "is_reuse_machine" in list(init_dict.keys()):
+                is_reuse_machine = init_dict["is_reuse_machine"]
+            if "is_incremental" in list(init_dict.keys()):
+                is_incremental = init_dict["is_incremental"]
         # Set the properties (value check and convertion are done in setter)
         self.parent = None
         self.name = name
@@ -232,6 +280,10 @@ class VarSimu(FrozenClass):
         self.postproc_list = postproc_list
         self.pre_keeper_postproc_list = pre_keeper_postproc_list
         self.post_keeper_postproc_list = post_keeper_postproc_list
+        self.path_store = path_store
+        self.is_resume = is_resume
+        self.is_reuse_machine = is_reuse_machine
+        self.is_incremental = is_incremental
 
         # The class is frozen, for now it's impossible to add new properties
         self._freeze()
@@ -297,6 +349,10 @@ class VarSimu(FrozenClass):
             VarSimu_str += (
                 "post_keeper_postproc_list[" + str(ii) + "] =" + tmp + linesep + linesep
             )
+        VarSimu_str += 'path_store = "' + str(self.path_store) + '"' + linesep
+        VarSimu_str += "is_resume = " + str(self.is_resume) + linesep
+        VarSimu_str += "is_reuse_machine = " + str(self.is_reuse_machine) + linesep
+        VarSimu_str += "is_incremental = " + str(self.is_incremental) + linesep
         return VarSimu_str
 
     def __eq__(self, other):
@@ -326,6 +382,14 @@ class VarSimu(FrozenClass):
             return False
         if other.post_keeper_postproc_list != self.post_keeper_postproc_list:
             return False
+        if other.path_store != self.path_store:
+            return False
+        if other.is_resume != self.is_resume:
+            return False
+        if other.is_reuse_machine != self.is_reuse_machine:
+            return False
+        if other.is_incremental != self.is_incremental:
+            return False
         return True
 
     def compare(self, other, name="self", ignore_list=None):
@@ -430,6 +494,14 @@ class VarSimu(FrozenClass):
                         name=name + ".post_keeper_postproc_list[" + str(ii) + "]",
                     )
                 )
+        if other._path_store != self._path_store:
+            diff_list.append(name + ".path_store")
+        if other._is_resume != self._is_resume:
+            diff_list.append(name + ".is_resume")
+        if other._is_reuse_machine != self._is_reuse_machine:
+            diff_list.append(name + ".is_reuse_machine")
+        if other._is_incremental != self._is_incremental:
+            diff_list.append(name + ".is_incremental")
         # Filter ignore differences
         diff_list = list(filter(lambda x: x not in ignore_list, diff_list))
         return diff_list
@@ -457,6 +529,10 @@ class VarSimu(FrozenClass):
         if self.post_keeper_postproc_list is not None:
             for value in self.post_keeper_postproc_list:
                 S += getsizeof(value)
+        S += getsizeof(self.path_store)
+        S += getsizeof(self.is_resume)
+        S += getsizeof(self.is_reuse_machine)
+        S += getsizeof(self.is_incremental)
         return S
 
     def as_dict(self, **kwargs):
@@ -517,6 +593,10 @@ class VarSimu(FrozenClass):
                     )
                 else:
                     VarSimu_dict["post_keeper_postproc_list"].append(None)
+        VarSimu_dict["path_store"] = self.path_store
+        VarSimu_dict["is_resume"] = self.is_resume
+        VarSimu_dict["is_reuse_machine"] = self.is_reuse_machine
+        VarSimu_dict["is_incremental"] = self.is_incremental
         # The class name is added to the dict for deserialisation purpose
         VarSimu_dict["__class__"] = "VarSimu"
         return VarSimu_dict
@@ -536,6 +616,10 @@ class VarSimu(FrozenClass):
         self.postproc_list = None
         self.pre_keeper_postproc_list = None
         self.post_keeper_postproc_list = None
+        self.path_store = None
+        self.is_resume = None
+        self.is_reuse_machine = None
+        self.is_incremental = None
 
     def _get_name(self):
         """getter of name"""
@@ -810,3 +894,75 @@ class VarSimu(FrozenClass):
         :Type: [Post]
         """,
     )
+
+    def _get_path_store(self):
+        """getter of path_store"""
+        return self._path_store
+
+    def _set_path_store(self, value):
+        """setter of path_store"""
+        check_var("path_store", value, "str")
+        self._path_store = value
+
+    path_store = property(
+        fget=_get_path_store,
+        fset=_set_path_store,
+        doc=u"""Path of a HDF5 file to stream the DataKeeper results (and the Outputs if is_keep_all_output) of each simulation, None to keep everything in memory
+
+        :Type: str
+        """,
+    )
+
+    def _get_is_resume(self):
+        """getter of is_resume"""
+        return self._is_resume
+
+    def _set_is_resume(self, value):
+        """setter of is_resume"""
+        check_var("is_resume", value, "bool")
+        self._is_resume = value
+
+    is_resume = property(
+        fget=_get_is_resume,
+        fset=_set_is_resume,
+        doc=u"""True to resume the multi-simulation from an existing path_store file (the simulations already stored are not computed again), False to overwrite it
+
+        :Type: bool
+        """,
+    )
+
+    def _get_is_reuse_machine(self):
+        """getter of is_reuse_machine"""
+        return self._is_reuse_machine
+
+    def _set_is_reuse_machine(self, value):
+        """setter of is_reuse_machine"""
+        check_var("is_reuse_machine", value, "bool")
+        self._is_reuse_machine = value
+
+    is_reuse_machine = property(
+        fget=_get_is_reuse_machine,
+        fset=_set_is_reuse_machine,
+        doc=u"""True to share the machine and the geometry output of the reference simulation with the simulations that don't modify the machine (read-only)
+
+        :Type: bool
+        """,
+    )
+
+    def _get_is_incremental(self):
+        """getter of is_incremental"""
+        return self._is_incremental
+
+    def _set_is_incremental(self, value):
+        """setter of is_incremental"""
+        check_var("is_incremental", value, "bool")
+        self._is_incremental = value
+
+    is_incremental = property(
+        fget=_get_is_incremental,
+        fset=_set_is_incremental,
+        doc=u"""True to reuse the results of the reference simulation for the stages whose inputs are unchanged (False to compute all the stages of each simulation)
+
+        :Type: bool
+        """,
+    )
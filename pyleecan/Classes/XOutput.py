@@ -67,6 +67,11 @@ try:
 except ImportError as error:
     count = error
 
+try:
+    from ..Methods.Output.XOutput.get_output import get_output
+except ImportError as error:
+    get_output = error
+
 try:
     from ..Methods.Output.XOutput.get_param_simu import get_param_simu
 except ImportError as error:
@@ -142,6 +147,11 @@ try:
 except ImportError as error:
     remove = error
 
+try:
+    from ..Methods.Output.XOutput.get_interp import get_interp
+except ImportError as error:
+    get_interp = error
+
 
 from ._check import InitUnKnowClassError
 from .ParamExplorer import ParamExplorer
@@ -255,6 +265,15 @@ class XOutput(Output):
         )
     else:
         count = count
+    # cf Methods.Output.XOutput.get_output
+    if isinstance(get_output, ImportError):
+        get_output = property(
+            fget=lambda x: raise_(
+                ImportError("Can't use XOutput method get_output: " + str(get_output))
+            )
+        )
+    else:
+        get_output = get_output
     # cf Methods.Output.XOutput.get_param_simu
     if isinstance(get_param_simu, ImportError):
         get_param_simu = property(
@@ -406,6 +425,15 @@ class XOutput(Output):
         )
     else:
         remove = remove
+    # cf Methods.Output.XOutput.get_interp
+    if isinstance(get_interp, ImportError):
+        get_interp = property(
+            fget=lambda x: raise_(
+                ImportError("Can't use XOutput method get_interp: " + str(get_interp))
+            )
+        )
+    else:
+        get_interp = get_interp
     # save and copy methods are available in all object
     save = save
     copy = copy
@@ -420,6 +448,7 @@ class XOutput(Output):
         nb_simu=0,
         xoutput_ref=None,
         xoutput_ref_index=None,
+        path_store=None,
         simu=-1,
         path_result="",
         geo=-1,
@@ -430,6 +459,7 @@ class XOutput(Output):
         logger_name="Pyleecan.Output",
         force=-1,
         loss=-1,
+        profile=None,
         init_dict=None,
         init_str=None,
     ):
@@ -460,6 +490,8 @@ class XOutput(Output):
                 xoutput_ref = init_dict["xoutput_ref"]
             if "xoutput_ref_index" in list(init_dict.keys()):
                 xoutput_ref_index = init_dict["xoutput_ref_index"]
+            if "path_store" in list(init_dict.keys()):
+                path_store = init_dict["path_store"]
             if "simu" in list(init_dict.keys()):
                 simu = init_dict["simu"]
             if "path_result" in list(init_dict.keys()):
@@ -480,6 +512,8 @@ class XOutput(Output):
                 force = init_dict["force"]
             if "loss" in list(init_dict.keys()):
                 loss = init_dict["loss"]
+            if "profile" in list(init_dict.keys()):
+                profile = init_dict["profile"]
         # Set the properties (value check and convertion are done in setter)
         self.paramexplorer_list = paramexplorer_list
         self.output_list = output_list
@@ -487,6 +521,7 @@ class XOutput(Output):
         self.nb_simu = nb_simu
         self.xoutput_ref = xoutput_ref
         self.xoutput_ref_index = xoutput_ref_index
+        self.path_store = path_store
         # Call Output init
         super(XOutput, self).__init__(
             simu=simu,
@@ -499,6 +534,7 @@ class XOutput(Output):
             logger_name=logger_name,
             force=force,
             loss=loss,
+            profile=profile,
         )
         # The class is frozen (in Output init), for now it's impossible to
         # add new properties
@@ -544,6 +580,7 @@ class XOutput(Output):
         else:
             XOutput_str += "xoutput_ref = None" + linesep + linesep
         XOutput_str += "xoutput_ref_index = " + str(self.xoutput_ref_index) + linesep
+        XOutput_str += 'path_store = "' + str(self.path_store) + '"' + linesep
         return XOutput_str
 
     def __eq__(self, other):
@@ -567,6 +604,8 @@ class XOutput(Output):
             return False
         if other.xoutput_ref_index != self.xoutput_ref_index:
             return False
+        if other.path_store != self.path_store:
+            return False
         return True
 
     def compare(self, other, name="self", ignore_list=None):
@@ -639,6 +678,8 @@ class XOutput(Output):
             )
         if other._xoutput_ref_index != self._xoutput_ref_index:
             diff_list.append(name + ".xoutput_ref_index")
+        if other._path_store != self._path_store:
+            diff_list.append(name + ".path_store")
         # Filter ignore differences
         diff_list = list(filter(lambda x: x not in ignore_list, diff_list))
         return diff_list
@@ -662,6 +703,7 @@ class XOutput(Output):
         S += getsizeof(self.nb_simu)
         S += getsizeof(self.xoutput_ref)
         S += getsizeof(self.xoutput_ref_index)
+        S += getsizeof(self.path_store)
         return S
 
     def as_dict(self, **kwargs):
@@ -706,6 +748,7 @@ class XOutput(Output):
         else:
             XOutput_dict["xoutput_ref"] = self.xoutput_ref.as_dict(**kwargs)
         XOutput_dict["xoutput_ref_index"] = self.xoutput_ref_index
+        XOutput_dict["path_store"] = self.path_store
         # The class name is added to the dict for deserialisation purpose
         # Overwrite the mother class name
         XOutput_dict["__class__"] = "XOutput"
@@ -721,6 +764,7 @@ class XOutput(Output):
         if self.xoutput_ref is not None:
             self.xoutput_ref._set_None()
         self.xoutput_ref_index = None
+        self.path_store = None
         # Set to None the properties inherited from Output
         super(XOutput, self)._set_None()
 
@@ -887,3 +931,21 @@ class XOutput(Output):
         :Type: int
         """,
     )
+
+    def _get_path_store(self):
+        """getter of path_store"""
+        return self._path_store
+
+    def _set_path_store(self, value):
+        """setter of path_store"""
+        check_var("path_store", value, "str")
+        self._path_store = value
+
+    path_store = property(
+        fget=_get_path_store,
+        fset=_set_path_store,
+        doc=u"""Path of the HDF5 file where the results of the multi-simulation are streamed (the Outputs not kept in output_list are loaded from it)
+
+        :Type: str
+        """,
+    )
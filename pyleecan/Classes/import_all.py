@@ -137,6 +137,7 @@ from ..Classes.OutForce import OutForce
 from ..Classes.OutGeo import OutGeo
 from ..Classes.OutGeoLam import OutGeoLam
 from ..Classes.OutInternal import OutInternal
+from ..Classes.OutInterp import OutInterp
 from ..Classes.OutLoss import OutLoss
 from ..Classes.OutMag import OutMag
 from ..Classes.OutMagElmer import OutMagElmer
@@ -205,6 +206,9 @@ from ..Classes.SolutionMat import SolutionMat
 from ..Classes.SolutionVector import SolutionVector
 from ..Classes.SolverInputFile import SolverInputFile
 from ..Classes.StructElmer import StructElmer
+from ..Classes.StructModal import StructModal
+from ..Classes.StructModalVibro import StructModalVibro
+from ..Classes.StructPlaneStress import StructPlaneStress
 from ..Classes.Structural import Structural
 from ..Classes.SurfLine import SurfLine
 from ..Classes.SurfRing import SurfRing
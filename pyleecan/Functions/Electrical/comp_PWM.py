@@ -1,5 +1,7 @@
 import numpy as np
 from scipy import signal
+from scipy.special import jv
+from ...Methods.Import.ImportGenPWM import PWMHarmError
 
 
 def comp_volt_PWM_NUM(
@@ -19,6 +21,7 @@ def comp_volt_PWM_NUM(
     fswi_max=0,
     freq0_max=0,
     type_carrier=0,
+    Tf=None,
 ):
     """
     Generalized DPWM using numerical method according to
@@ -63,17 +66,21 @@ def comp_volt_PWM_NUM(
     fswimode: int
         0: Fixed fswi
         1: Variable fswi
+    Tf: float
+        End time of the whole signal used for the variable speed/fswi ramps
+        (default Tpwmu[-1]). Set it to compute the PWM on a slice of the time
+        vector with the same carrier/reference phase as the whole signal.
     """
 
     Npsim = len(Tpwmu)
+    if Tf is None:
+        Tf = Tpwmu[-1]
 
     if fmode == 0:  # Fixed speed:
         ws = 2 * np.pi * freq0
     elif fmode == 1:  # Variable speed:
         if type_DPWM == 8:
-            freq0_array = (freq0_max - freq0) / Tpwmu[-1] * Tpwmu + freq0 * np.ones(
-                Npsim
-            )
+            freq0_array = (freq0_max - freq0) / Tf * Tpwmu + freq0 * np.ones(Npsim)
             ws = np.pi * freq0_array
         else:
             print("ERROR:only SPWM supports the varaible fundamental frequency")
@@ -88,8 +95,7 @@ def comp_volt_PWM_NUM(
     elif fswimode == 1:  # Variable fswi:
         if type_DPWM == 8:
             wswiT = (
-                np.pi * (fswi_max - fswi) / Tpwmu[-1] * Tpwmu ** 2
-                + 2 * np.pi * fswi * Tpwmu
+                np.pi * (fswi_max - fswi) / Tf * Tpwmu ** 2 + 2 * np.pi * fswi * Tpwmu
             )
             triangle = Vdc1 / 2 * signal.sawtooth(wswiT, 0.5)
         else:
@@ -99,6 +105,105 @@ def comp_volt_PWM_NUM(
 
     M_I = 2 * np.sqrt(2) * U0 / Vdc1  # [0,1]
 
+    Vas, Vbs, Vcs, V_offset = comp_volt_ref(
+        Tpwmu=Tpwmu,
+        ws=ws,
+        Vdc1=Vdc1,
+        M_I=M_I,
+        rot_dir=rot_dir,
+        type_DPWM=type_DPWM,
+        PF_angle=PF_angle,
+        is_sin=is_sin,
+    )
+
+    Van = Vas + V_offset
+    Vbn = Vbs + V_offset
+    Vcn = Vcs + V_offset
+
+    if type_DPWM == 8:
+        v_pwm = np.ones((qs, Npsim))
+
+        v_pwm[0] = np.where(Vas < triangle, -1, 1)
+        v_pwm[1] = np.where(Vbs < triangle, -1, 1)
+        v_pwm[2] = np.where(Vcs < triangle, -1, 1)
+
+    else:
+
+        T1 = Th / 4 - Th / (2 * Vdc1) * Van
+        T2 = Th / 4 - Th / (2 * Vdc1) * Vbn
+        T3 = Th / 4 - Th / (2 * Vdc1) * Vcn
+        n = np.floor(Tpwmu / Th).astype(int)
+        v_pwm = Vdc1 / 2 * np.ones((qs, Npsim))
+        v_pwm[0, Tpwmu < (T1 + n * Th)] = -Vdc1 / 2
+        v_pwm[0, Tpwmu > ((n + 1) * Th - T1)] = -Vdc1 / 2
+        v_pwm[1, Tpwmu < (T2 + n * Th)] = -Vdc1 / 2
+        v_pwm[1, Tpwmu > ((n + 1) * Th - T2)] = -Vdc1 / 2
+        v_pwm[2, Tpwmu < (T3 + n * Th)] = -Vdc1 / 2
+        v_pwm[2, Tpwmu > ((n + 1) * Th - T3)] = -Vdc1 / 2
+
+    if is_plot:
+        fig, axs = plt.subplots(2)
+        axs[0].plot(v_pwm[0])
+        axs[0].plot(Tpwmu, v_pwm[1])
+        axs[0].plot(Tpwmu, v_pwm[2])
+        axs[1].plot(Tpwmu, Van)
+        axs[1].plot(Tpwmu, V_offset)
+        axs[1].plot(Tpwmu, Vas)
+
+        fig.show()
+        plt.show()
+
+        if type_DPWM == 8:
+            fig, axs = plt.subplots(3)
+            axs[0].plot(Tpwmu, Vas, "red", label="Sine wave")
+            axs[0].plot(Tpwmu, triangle, "green", label="Carrier wave")
+            axs[1].plot(Tpwmu, v_pwm[0], "blue", label="Square wave")
+            axs[2].plot(Tpwmu, ws, "blue", label="Square wave")
+
+            axs[0].set_title("SPWM generation")
+            axs[0].set_ylabel("Frequency [Hz]")
+            axs[0].legend()
+            axs[1].set_xlabel("Time [s]")
+            axs[1].set_ylabel("Frequency [Hz]")
+            axs[1].legend()
+
+            fig.show()
+            plt.show()
+
+    return v_pwm, Vas, M_I
+
+
+def comp_volt_ref(Tpwmu, ws, Vdc1, M_I, rot_dir, type_DPWM, PF_angle=0, is_sin=True):
+    """Compute the 3 phase reference voltages and the DPWM/SVPWM zero-sequence offset
+    (cf comp_volt_PWM_NUM)
+
+    Parameters
+    ----------
+    Tpwmu : ndarray
+        Time vector
+    ws: float or ndarray
+        fundamental angular frequency [rad/s]
+    Vdc1: float
+        bus voltage
+    M_I: float
+        modulation index
+    rot_dir: int
+        rotation direction
+    type_DPWM : int
+        PWM strategy (cf comp_volt_PWM_NUM)
+    PF_angle: float
+        power factor angle
+    is_sin: bool
+        True to use sine references, cosine otherwise
+
+    Returns
+    -------
+    Vas, Vbs, Vcs: ndarray
+        Phase reference voltages without offset
+    V_offset: ndarray
+        Zero-sequence voltage added to each phase reference
+    """
+
     k = 1  # 2/sqrt(3)#2/sqrt(3) factor to have higher fundamental compared to SPWM
     if rot_dir == -1:
 
@@ -117,12 +222,9 @@ def comp_volt_PWM_NUM(
         Vbs = k * M_I * (Vdc1 / 2) * np.cos(ws * Tpwmu + Phase[1] * 2 * np.pi / 3)
         Vcs = k * M_I * (Vdc1 / 2) * np.cos(ws * Tpwmu + Phase[2] * 2 * np.pi / 3)
 
-    V_min = np.amin(
-        np.concatenate((Vas[:, None], Vbs[:, None], Vcs[:, None]), axis=1), axis=1
-    )
-    V_max = np.amax(
-        np.concatenate((Vas[:, None], Vbs[:, None], Vcs[:, None]), axis=1), axis=1
-    )
+    # Element-wise min/max to avoid (Npsim, 3) concatenated copies
+    V_min = np.minimum(np.minimum(Vas, Vbs), Vcs)
+    V_max = np.maximum(np.maximum(Vas, Vbs), Vcs)
 
     alpha_rad = 0
 
@@ -184,20 +286,10 @@ def comp_volt_PWM_NUM(
             * np.cos(ws * Tpwmu + Phase[2] * 2 * np.pi / 3 - alpha_rad)
         )
 
-    V_offset = np.zeros(Npsim)
+    V_offset = np.zeros(Tpwmu.size)
 
-    min_abc = np.squeeze(
-        np.amin(
-            np.concatenate((Vas_g[:, None], Vbs_g[:, None], Vcs_g[:, None]), axis=1),
-            axis=1,
-        )
-    )
-    max_abc = np.squeeze(
-        np.amax(
-            np.concatenate((Vas_g[:, None], Vbs_g[:, None], Vcs_g[:, None]), axis=1),
-            axis=1,
-        )
-    )
+    min_abc = np.minimum(np.minimum(Vas_g, Vbs_g), Vcs_g)
+    max_abc = np.maximum(np.maximum(Vas_g, Vbs_g), Vcs_g)
     i1 = min_abc + max_abc > 0
     i2 = min_abc + max_abc < 0
     V_offset[i1] = Vdc1 / 2 - V_max[i1]
@@ -209,12 +301,8 @@ def comp_volt_PWM_NUM(
     elif type_DPWM == 2:  # elif type_waveform==62 #DPWMMAX
         V_offset = -V_max + Vdc1 / 2
     elif type_DPWM == 6:  # elif type_waveform==66 #DPWM3
-        min_abc = np.amin(
-            np.concatenate((Vas[:, None], Vbs[:, None], Vcs[:, None]), axis=1), axis=1
-        )
-        max_abc = np.amax(
-            np.concatenate((Vas[:, None], Vbs[:, None], Vcs[:, None]), axis=1), axis=1
-        )
+        min_abc = V_min
+        max_abc = V_max
         i1 = min_abc + max_abc < 0
         i2 = min_abc + max_abc > 0
         V_offset[i1] = Vdc1 / 2 - V_max[i1]
@@ -224,61 +312,7 @@ def comp_volt_PWM_NUM(
     elif type_DPWM == 8:
         V_offset = 0 * (V_max + V_min)
 
-    Van = Vas + V_offset
-    Vbn = Vbs + V_offset
-    Vcn = Vcs + V_offset
-
-    if type_DPWM == 8:
-        v_pwm = np.ones((qs, Npsim))
-
-        v_pwm[0] = np.where(Vas < triangle, -1, 1)
-        v_pwm[1] = np.where(Vbs < triangle, -1, 1)
-        v_pwm[2] = np.where(Vcs < triangle, -1, 1)
-
-    else:
-
-        T1 = Th / 4 - Th / (2 * Vdc1) * Van
-        T2 = Th / 4 - Th / (2 * Vdc1) * Vbn
-        T3 = Th / 4 - Th / (2 * Vdc1) * Vcn
-        n = np.floor(Tpwmu / Th).astype(int)
-        v_pwm = Vdc1 / 2 * np.ones((qs, Npsim))
-        v_pwm[0, Tpwmu < (T1 + n * Th)] = -Vdc1 / 2
-        v_pwm[0, Tpwmu > ((n + 1) * Th - T1)] = -Vdc1 / 2
-        v_pwm[1, Tpwmu < (T2 + n * Th)] = -Vdc1 / 2
-        v_pwm[1, Tpwmu > ((n + 1) * Th - T2)] = -Vdc1 / 2
-        v_pwm[2, Tpwmu < (T3 + n * Th)] = -Vdc1 / 2
-        v_pwm[2, Tpwmu > ((n + 1) * Th - T3)] = -Vdc1 / 2
-
-    if is_plot:
-        fig, axs = plt.subplots(2)
-        axs[0].plot(v_pwm[0])
-        axs[0].plot(Tpwmu, v_pwm[1])
-        axs[0].plot(Tpwmu, v_pwm[2])
-        axs[1].plot(Tpwmu, Van)
-        axs[1].plot(Tpwmu, V_offset)
-        axs[1].plot(Tpwmu, Vas)
-
-        fig.show()
-        plt.show()
-
-        if type_DPWM == 8:
-            fig, axs = plt.subplots(3)
-            axs[0].plot(Tpwmu, Vas, "red", label="Sine wave")
-            axs[0].plot(Tpwmu, triangle, "green", label="Carrier wave")
-            axs[1].plot(Tpwmu, v_pwm[0], "blue", label="Square wave")
-            axs[2].plot(Tpwmu, ws, "blue", label="Square wave")
-
-            axs[0].set_title("SPWM generation")
-            axs[0].set_ylabel("Frequency [Hz]")
-            axs[0].legend()
-            axs[1].set_xlabel("Time [s]")
-            axs[1].set_ylabel("Frequency [Hz]")
-            axs[1].legend()
-
-            fig.show()
-            plt.show()
-
-    return v_pwm, Vas, M_I
+    return Vas, Vbs, Vcs, V_offset
 
 
 def comp_carrier(time, fswi, type_carrier):
@@ -340,3 +374,146 @@ def comp_carrier(time, fswi, type_carrier):
         Y = signal.sawtooth(wswiT, 0.5)
 
     return Y
+
+
+def comp_volt_PWM_harm(
+    freq0,
+    fswi,
+    qs,
+    Vdc1,
+    U0,
+    rot_dir,
+    type_DPWM: int,
+    PF_angle=0,
+    is_sin=True,
+    fmax=None,
+    Nn=200,
+    Ny=2048,
+):
+    """Compute the harmonics of the naturally sampled PWM phase voltages with the
+    double Fourier series formulation (carrier angle x, fundamental angle y)
+
+        v(x, y) = Vdc1/2 * sum_m sum_n C_mn exp(j(m*x + n*y))
+
+    For a symmetrical carrier, the integral along x is analytic:
+        C_0n = R_n (Fourier coefficients of the normalized reference r(y))
+        C_mn = 2/(pi*m) * FT_n[sin(m*pi/2*(1 + r(y)))]
+    SPWM references are sinusoidal so that C_mn = 2/(pi*m) * J_n(m*pi*M/2) * sin((m+n)*pi/2)
+    (Bessel functions of first kind), for DPWM/SVPWM the integral along y is
+    computed with a FFT of the reference including the zero-sequence offset.
+
+    Parameters
+    ----------
+    freq0: float
+        fundamental frequency
+    fswi: float
+        switching frequency
+    qs: int
+        number of phases
+    Vdc1: float
+        bus voltage
+    U0: float
+        Phase Voltage
+    rot_dir: int
+        rotation direction
+    type_DPWM : int
+        PWM strategy (cf comp_volt_PWM_NUM)
+    PF_angle: float
+        power factor angle
+    is_sin: bool
+        True to use sine references, cosine otherwise
+    fmax: float
+        Maximum frequency to compute (default: 4 * fswi)
+    Nn: int
+        Number of sidebands on each side of the carrier harmonics (the
+        discontinuous PWM strategies have slowly decreasing sidebands)
+    Ny: int
+        Number of points per fundamental period for the FFT along y
+
+    Returns
+    -------
+    freqs: ndarray
+        Frequency vector [Hz]
+    Vharm: ndarray
+        Complex single-sided amplitude of the phase voltages (qs, Nfreq) [V]
+    """
+
+    if fmax is None:
+        fmax = 4 * fswi
+    # Carrier groups whose sidebands reach fmax (from above as well)
+    Nm = int(np.ceil((fmax + Nn * freq0) / fswi))
+    Nb = int(np.floor(fmax / freq0))  # Number of baseband harmonics
+    m = np.arange(1, Nm + 1)[:, None]
+    n = np.arange(-Nn, Nn + 1)[None, :]
+
+    M_I = 2 * np.sqrt(2) * U0 / Vdc1
+    ws = 2 * np.pi * freq0
+
+    if type_DPWM == 8 and M_I <= 1:
+        # Closed-form Bessel coefficients, y is the angle of M_I*cos(y)
+        if rot_dir == -1:
+            Phase = [0, -1, 1]
+        else:
+            Phase = [0, 1, -1]
+        psi = np.array(Phase[:qs]) * 2 * np.pi / 3 - (np.pi / 2 if is_sin else 0)
+        Cmn = (
+            2
+            / (np.pi * m)
+            * jv(np.abs(n), m * np.pi * M_I / 2)
+            * np.sin((m + np.abs(n)) * np.pi / 2)
+        )
+        Cmn = Cmn[None, :, :] * np.exp(1j * n[None, :, :] * psi[:, None, None])
+        # Baseband is the reference itself
+        C0n = np.zeros((qs, Nb + 1), dtype=complex)
+        if Nb >= 1:
+            C0n[:, 1] = M_I / 2 * np.exp(1j * psi)
+    else:
+        # Integral along y with a FFT over one fundamental period
+        if Ny <= 2 * max(Nn, Nb):
+            raise PWMHarmError(
+                "ERROR: Ny must be larger than 2*max(Nn, fmax/freq0) in comp_volt_PWM_harm"
+            )
+        time = np.arange(Ny) / (Ny * freq0)
+        Vas, Vbs, Vcs, V_offset = comp_volt_ref(
+            Tpwmu=time,
+            ws=ws,
+            Vdc1=Vdc1,
+            M_I=M_I,
+            rot_dir=rot_dir,
+            type_DPWM=type_DPWM,
+            PF_angle=PF_angle,
+            is_sin=is_sin,
+        )
+        if type_DPWM == 8:
+            V_offset = 0
+        ref = np.array([Vas, Vbs, Vcs])[:qs] + V_offset
+        ref = np.clip(ref / (Vdc1 / 2), -1, 1)
+        C0n = np.fft.fft(ref, axis=-1)[:, : Nb + 1] / Ny
+        # (qs, Nm, Ny) integrand along y
+        g = np.sin(m[None, :, :] * np.pi / 2 * (1 + ref[:, None, :]))
+        Cmn = np.fft.fft(g, axis=-1)[:, :, n[0] % Ny] / Ny
+        Cmn = Cmn * (2 / (np.pi * m))[None, :, :]
+        if type_DPWM != 8:
+            # Pulses are centered on the middle of the switching period
+            Cmn = Cmn * ((-1.0) ** m)[None, :, :]
+
+    # Sum the terms sharing the same frequency, the carrier groups (m > 0) negative
+    # frequencies are folded as complex conjugate (their (-m, -n) counterparts)
+    fmn = np.broadcast_to(m * fswi + n * freq0, Cmn.shape[1:]).ravel()
+    Cmn = Cmn.reshape(qs, -1)
+    Cmn = np.where(fmn >= 0, Cmn, np.conj(Cmn))
+    Cmn = np.where(fmn == 0, 2 * Cmn.real, Cmn)
+    fmn = np.concatenate((np.arange(Nb + 1) * freq0, np.abs(fmn)))
+    Cmn = np.concatenate((C0n, Cmn), axis=1)
+
+    is_kept = fmn <= fmax
+    freqs, i_freq = np.unique(np.round(fmn[is_kept], 8), return_inverse=True)
+    Smn = np.zeros((qs, freqs.size), dtype=complex)
+    for ii in range(qs):
+        Smn[ii] = np.bincount(i_freq, Cmn[ii, is_kept].real, freqs.size)
+        Smn[ii] += 1j * np.bincount(i_freq, Cmn[ii, is_kept].imag, freqs.size)
+
+    # Two-sided to single-sided amplitude
+    Vharm = Vdc1 / 2 * np.where(freqs > 0, 2, 1) * Smn
+
+    return freqs, Vharm
@@ -1,5 +1,9 @@
+from functools import lru_cache
+
 from numpy import (
     array,
+    asarray,
+    empty,
     matmul,
     sqrt,
     cos,
@@ -11,8 +15,8 @@ from numpy import (
     floor,
     pi,
     linspace,
-    column_stack,
     vstack,
+    stack,
 )
 
 EPS = int(floor(-log10(finfo(float).eps)))
@@ -20,14 +24,13 @@ EPS = int(floor(-log10(finfo(float).eps)))
 # TODO: add homopolar component
 
 
-def ab2n(Z_ab, n=3, rot_dir=-1):
-    """
-    2 phase equivalent to n phase coordinate transformation, i.e. Clarke transformation
+@lru_cache(maxsize=None)
+def get_ab2n_matrix(n=3, rot_dir=-1):
+    """Return the (read-only) 2 phase equivalent to n phase transformation matrix
+    (cached according to n and rot_dir)
 
     Parameters
     ----------
-    Z_ab : ndarray
-        matrix (N x 2) of 2 phase equivalent values
     n : integer
         number of phases
     rot_dir : integer
@@ -35,8 +38,8 @@ def ab2n(Z_ab, n=3, rot_dir=-1):
 
     Returns
     -------
-    Z_n : ndarray
-        transformed matrix (N x n) of n phase values
+    ab_2_n : ndarray
+        transformation matrix (2 x n)
 
     """
     ii = linspace(0, n - 1, n)
@@ -44,10 +47,56 @@ def ab2n(Z_ab, n=3, rot_dir=-1):
         rot_dir * 2 * ii * pi / n
     )  # Phasor depending on fundamental field rotation direction
 
-    # Transformation matrix
     ab_2_n = vstack((cos(alpha).round(decimals=EPS), -sin(alpha).round(decimals=EPS)))
+    ab_2_n.flags.writeable = False
 
-    Z_n = matmul(Z_ab, ab_2_n)
+    return ab_2_n
+
+
+@lru_cache(maxsize=None)
+def get_n2ab_matrix(n=3, rot_dir=-1):
+    """Return the (read-only) n phase to 2 phase equivalent transformation matrix
+    (cached according to n and rot_dir)
+
+    Parameters
+    ----------
+    n : integer
+        number of phases
+    rot_dir : integer
+        rotation direction of the fundamental of magnetic field (rot_dir = +/- 1)
+
+    Returns
+    -------
+    n_2_ab : ndarray
+        transformation matrix (n x 2)
+
+    """
+    n_2_ab = 2 / n * get_ab2n_matrix(n=n, rot_dir=rot_dir).T
+    n_2_ab.flags.writeable = False
+
+    return n_2_ab
+
+
+def ab2n(Z_ab, n=3, rot_dir=-1):
+    """
+    2 phase equivalent to n phase coordinate transformation, i.e. Clarke transformation
+
+    Parameters
+    ----------
+    Z_ab : ndarray
+        matrix (N x 2) of 2 phase equivalent values
+    n : integer
+        number of phases
+    rot_dir : integer
+        rotation direction of the fundamental of magnetic field (rot_dir = +/- 1)
+
+    Returns
+    -------
+    Z_n : ndarray
+        transformed matrix (N x n) of n phase values
+
+    """
+    Z_n = matmul(Z_ab, get_ab2n_matrix(n=n, rot_dir=rot_dir))
 
     return Z_n
 
@@ -70,21 +119,7 @@ def n2ab(Z_n, n=3, rot_dir=-1):
         transformed matrix (N x 2) of 2 phase equivalent values
 
     """
-    ii = linspace(0, n - 1, n)
-    alpha = (
-        rot_dir * 2 * ii * pi / n
-    )  # Phasor depending on fundamental field rotation direction
-
-    # Transformation matrix
-    n_2_ab = (
-        2
-        / n
-        * column_stack(
-            (cos(alpha).round(decimals=EPS), -sin(alpha).round(decimals=EPS))
-        )
-    )
-
-    Z_ab = matmul(Z_n, n_2_ab)
+    Z_ab = matmul(Z_n, get_n2ab_matrix(n=n, rot_dir=rot_dir))
 
     return Z_ab
 
@@ -156,7 +191,10 @@ def n2dq(Z_n, theta, n=3, rot_dir=-1, is_dq_rms=True):
     Parameters
     ----------
     Z_n : ndarray
-        matrix (N x n) of n phase values
+        matrix (N x n) of n phase values, leading dimensions can be added to
+        transform several operating points at once (... x N x n)
+    theta : ndarray
+        angle of the rotor coordinate system (N)
     n : integer
         number of phases
     rot_dir : integer
@@ -171,7 +209,15 @@ def n2dq(Z_n, theta, n=3, rot_dir=-1, is_dq_rms=True):
 
     """
 
-    Z_dq = ab2dq(n2ab(Z_n, n=n, rot_dir=rot_dir), theta)
+    # Clarke then Park transformation in one pass on the last axis
+    Z_ab = matmul(Z_n, get_n2ab_matrix(n=n, rot_dir=rot_dir))
+    if Z_ab.ndim == 1:
+        Z_ab = Z_ab[newaxis, :]
+    sin_theta = sin(theta).round(decimals=EPS)
+    cos_theta = cos(theta).round(decimals=EPS)
+    Z_dq = empty(Z_ab.shape[:-1] + (2,))
+    Z_dq[..., 0] = Z_ab[..., 0] * cos_theta + Z_ab[..., 1] * sin_theta
+    Z_dq[..., 1] = -Z_ab[..., 0] * sin_theta + Z_ab[..., 1] * cos_theta
 
     if is_dq_rms == True:
         # Divide by sqrt(2) to go from (Id_peak, Iq_peak) to (Id_rms, Iq_rms)
@@ -181,12 +227,15 @@ def n2dq(Z_n, theta, n=3, rot_dir=-1, is_dq_rms=True):
 
 
 def dq2n(Z_dq, theta, n=3, rot_dir=-1, is_n_rms=False):
-    """n phase to dq equivalent coordinate transformation
+    """dq to n phase equivalent coordinate transformation
 
     Parameters
     ----------
     Z_dq : ndarray
-        matrix (N x 2) of dq phase values
+        matrix (N x 2) of dq phase values, leading dimensions can be added to
+        transform several operating points at once (... x N x 2)
+    theta : ndarray
+        angle of the rotor coordinate system (N)
     n : integer
         number of phases
     rot_dir : integer
@@ -201,7 +250,83 @@ def dq2n(Z_dq, theta, n=3, rot_dir=-1, is_n_rms=False):
 
     """
 
-    Z_n = ab2n(dq2ab(Z_dq, theta), n=n, rot_dir=rot_dir)
+    if Z_dq.ndim == 1:
+        Z_dq = Z_dq[newaxis, :]
+
+    # Park then Clarke transformation in one pass on the last axis
+    sin_theta = sin(theta).round(decimals=EPS)
+    cos_theta = cos(theta).round(decimals=EPS)
+    Z_a = Z_dq[..., 0] * cos_theta - Z_dq[..., 1] * sin_theta
+    Z_b = Z_dq[..., 0] * sin_theta + Z_dq[..., 1] * cos_theta
+    ab_2_n = get_ab2n_matrix(n=n, rot_dir=rot_dir)
+    Z_n = Z_a[..., newaxis] * ab_2_n[0] + Z_b[..., newaxis] * ab_2_n[1]
+
+    if is_n_rms == False:
+        # Multiply by sqrt(2) to from (I_n_rms) to (I_n_peak)
+        Z_n = Z_n * sqrt(2)
+
+    return Z_n
+
+
+def n2dq_harm(Z_n, n=3, rot_dir=-1, is_dq_rms=True):
+    """n phase complex amplitudes of the fundamental harmonic to dq equivalent values
+
+    Parameters
+    ----------
+    Z_n : ndarray
+        complex amplitudes (... x n) of the n phase values at the fundamental frequency
+    n : integer
+        number of phases
+    rot_dir : integer
+        rotation direction of the fundamental of magnetic field (rot_dir = +/- 1)
+    is_dq_rms : boolean
+        True to return dq currents in rms value (Pyleecan convention), False to return peak values
+
+    Returns
+    -------
+    Z_dq : ndarray
+        matrix (... x 2) of dq equivalent values
+
+    """
+    ab_2_n = get_ab2n_matrix(n=n, rot_dir=rot_dir)
+
+    # Average of the phase amplitudes in the rotating frame
+    Z_dq_c = matmul(Z_n, ab_2_n[0] + 1j * ab_2_n[1]) / n
+    Z_dq = stack((Z_dq_c.real, Z_dq_c.imag), axis=-1)
+
+    if is_dq_rms == True:
+        # Divide by sqrt(2) to go from (Id_peak, Iq_peak) to (Id_rms, Iq_rms)
+        Z_dq = Z_dq / sqrt(2)
+
+    return Z_dq
+
+
+def dq2n_harm(Z_dq, n=3, rot_dir=-1, is_n_rms=False):
+    """dq values to n phase complex amplitudes of the fundamental harmonic
+
+    Parameters
+    ----------
+    Z_dq : ndarray
+        matrix (... x 2) of dq values
+    n : integer
+        number of phases
+    rot_dir : integer
+        rotation direction of the fundamental of magnetic field (rot_dir = +/- 1)
+    is_n_rms : boolean
+        True to return n currents in rms value, False to return peak values (Pyleecan convention)
+
+    Returns
+    -------
+    Z_n : ndarray
+        complex amplitudes (... x n) of the n phase values at the fundamental frequency
+
+    """
+    ab_2_n = get_ab2n_matrix(n=n, rot_dir=rot_dir)
+
+    Z_dq = asarray(Z_dq)
+    Z_n = (Z_dq[..., 0, newaxis] + 1j * Z_dq[..., 1, newaxis]) * (
+        ab_2_n[0] - 1j * ab_2_n[1]
+    )
 
     if is_n_rms == False:
         # Multiply by sqrt(2) to from (I_n_rms) to (I_n_peak)
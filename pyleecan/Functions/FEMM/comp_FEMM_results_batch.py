@@ -0,0 +1,211 @@
+# -*- coding: utf-8 -*-
+from os import remove
+from os.path import isfile, join
+
+from numpy import array, cos, sin, pi, full, nan
+
+# Torque integral of mo_blockintegral
+TORQUE_INTEGRAL = 22
+
+
+def _lua_table(values):
+    """Return the Lua table constructor of a list of floats"""
+    return "{" + ", ".join([repr(float(val)) for val in values]) + "}"
+
+
+def gen_FEMM_results_lua(
+    path_results, angle, Rag, is_sliding_band, groups, circuits, bc_name="bc_ag2"
+):
+    """Return the Lua script writing in a single file the air-gap flux
+    density, the torque integral and the circuits properties of the current
+    FEMM solution
+
+    Parameters
+    ----------
+    path_results : str
+        path of the results text file to write
+    angle : ndarray
+        Angle vector for calculation (Na,) [rad]
+    Rag : float
+        Radius of the air-gap flux density points (without sliding band) [m]
+    is_sliding_band : bool
+        True to get the flux density on the sliding band (mo_getgapb)
+    groups : list
+        FEMM groups of the rotor for the torque computation
+    circuits : list
+        name of the circuits to get the properties of
+    bc_name : str
+        name of the sliding band boundary condition
+
+    Returns
+    -------
+    text_lua : str
+        Lua script
+    """
+    path_results = path_results.replace("\\", "/")
+    lines = ['fp = openfile("' + path_results + '", "w")']
+
+    # Air-gap flux density (Br, Bt with sliding band, else Bx, By)
+    if is_sliding_band:
+        lines.append("ang = " + _lua_table(angle * 180 / pi))
+        lines.append("for k = 1, " + str(angle.size) + " do")
+        lines.append('    b1, b2 = mo_getgapb("' + bc_name + '", ang[k])')
+    else:
+        lines.append("px = " + _lua_table(Rag * cos(angle)))
+        lines.append("py = " + _lua_table(Rag * sin(angle)))
+        lines.append("for k = 1, " + str(angle.size) + " do")
+        lines.append("    b1, b2 = mo_getb(px[k], py[k])")
+    lines.append('    write(fp, b1, " ", b2, "\\n")')
+    lines.append("end")
+
+    # Torque
+    lines.append('mo_seteditmode("area")')
+    for group in groups:
+        lines.append("mo_groupselectblock(" + str(group) + ")")
+    lines.append("write(fp, mo_blockintegral(" + str(TORQUE_INTEGRAL) + '), "\\n")')
+    lines.append("mo_clearblock()")
+
+    # Circuits properties (current, voltage, flux linkage)
+    for name in circuits:
+        lines.append('i, v, phi = mo_getcircuitproperties("' + name + '")')
+        lines.append('write(fp, i, " ", v, " ", phi, "\\n")')
+
+    lines.append("closefile(fp)")
+    return "\n".join(lines) + "\n"
+
+
+def read_FEMM_results(path_results, angle, is_sliding_band, nb_circuit):
+    """Read the results file written by the Lua script of gen_FEMM_results_lua
+
+    Parameters
+    ----------
+    path_results : str
+        path of the results text file
+    angle : ndarray
+        Angle vector for calculation (Na,) [rad]
+    is_sliding_band : bool
+        True if the flux density is given in polar coordinates
+    nb_circuit : int
+        number of circuits in the file
+
+    Returns
+    -------
+    results : dict
+        "Br", "Bt": air-gap flux density (Na,) [T]
+        "Tem": torque of the simulated part of the machine [Nm]
+        "circuit": circuits current, voltage and flux linkage (nb_circuit, 3)
+    """
+    with open(path_results, "r") as result_file:
+        values = array(result_file.read().split(), dtype=float)
+
+    Na = angle.size
+    if values.size != 2 * Na + 1 + 3 * nb_circuit:
+        raise FEMMResultsError(
+            "Wrong number of values in "
+            + path_results
+            + " ("
+            + str(values.size)
+            + " instead of "
+            + str(2 * Na + 1 + 3 * nb_circuit)
+            + ")"
+        )
+
+    B1 = values[0 : 2 * Na : 2]
+    B2 = values[1 : 2 * Na : 2]
+    if is_sliding_band:
+        Br, Bt = B1, B2
+    else:
+        Br = B1 * cos(angle) + B2 * sin(angle)
+        Bt = -B1 * sin(angle) + B2 * cos(angle)
+
+    return {
+        "Br": Br,
+        "Bt": Bt,
+        "Tem": values[2 * Na],
+        "circuit": values[2 * Na + 1 :].reshape((nb_circuit, 3)),
+    }
+
+
+def comp_FEMM_results_batch(
+    femm,
+    save_path,
+    angle,
+    Rag,
+    is_sliding_band,
+    FEMM_dict,
+    circuits,
+    sym=1,
+    id_worker=0,
+):
+    """Get the air-gap flux density, the torque and the circuits properties of
+    the current FEMM solution with a single Lua script (one IPC call instead
+    of one per angle point, torque and circuit).
+
+    Parameters
+    ----------
+    femm : FEMMHandler
+        client to send command to a FEMM instance
+    save_path : str
+        folder to write the Lua script and the results file in
+    angle : ndarray
+        Angle vector for calculation (Na,) [rad]
+    Rag : float
+        Radius of the air-gap flux density points (without sliding band) [m]
+    is_sliding_band : bool
+        True to get the flux density on the sliding band
+    FEMM_dict : dict
+        dict containig FEMM parameters
+    circuits : list
+        name of the circuits to get the properties of (missing circuits of the
+        FEMM model are set to nan)
+    sym : int
+        symmetry factor of the torque
+    id_worker : int
+        worker index (parallelization)
+
+    Returns
+    -------
+    results : dict
+        "Br", "Bt": air-gap flux density (Na,) [T]
+        "Tem": torque [Nm]
+        "circuit": circuits current, voltage and flux linkage (Ncircuit, 3)
+    """
+    idworker = str(id_worker)
+    path_lua = join(save_path, "get_results_FEMM" + idworker + ".lua")
+    path_results = join(save_path, "results_batch" + idworker + ".txt")
+
+    groups = [
+        FEMM_dict["groups"][key]
+        for key in ["GROUP_RC", "GROUP_RH", "GROUP_RW", "GROUP_RM"]
+    ]
+    circuit_list = [name for name in circuits if name in FEMM_dict["circuits"]]
+
+    with open(path_lua, "w") as file_lua:
+        file_lua.write(
+            gen_FEMM_results_lua(
+                path_results, angle, Rag, is_sliding_band, groups, circuit_list
+            )
+        )
+    # Run the script in the FEMM Lua console
+    femm.callfemm('dofile("' + path_lua.replace("\\", "/") + '")')
+    remove(path_lua)
+
+    if not isfile(path_results):
+        raise FEMMResultsError("FEMM results file " + path_results + " not found")
+    results = read_FEMM_results(path_results, angle, is_sliding_band, len(circuit_list))
+    remove(path_results)
+
+    results["Tem"] = sym * results["Tem"]
+    circuit = full((len(circuits), 3), nan)
+    for ii, name in enumerate(circuits):
+        if name in circuit_list:
+            circuit[ii] = results["circuit"][circuit_list.index(name)]
+    results["circuit"] = circuit
+
+    return results
+
+
+class FEMMResultsError(Exception):
+    """Raised when the FEMM results file is not consistent"""
+
+    pass
@@ -0,0 +1,70 @@
+# -*- coding: utf-8 -*-
+from atexit import register
+from threading import Lock
+
+# Idle FEMM handlers (with an open FEMM instance) that can be reused by the
+# next simulations (e.g. the steps of a VarSimu)
+_HANDLER_POOL = list()
+_POOL_LOCK = Lock()
+
+
+def get_handler_list(nb_handler, handler_class):
+    """Return nb_handler FEMM handlers with an open FEMM instance, reusing the
+    idle handlers of the pool first
+
+    Parameters
+    ----------
+    nb_handler : int
+        number of handlers to return
+    handler_class : type
+        class of the handlers (_FEMMHandler)
+
+    Returns
+    -------
+    handler_list : list
+        list of FEMM handlers
+    """
+    handler_list = list()
+    with _POOL_LOCK:
+        for femm in list(_HANDLER_POOL):
+            if len(handler_list) == nb_handler:
+                break
+            if type(femm) is handler_class:
+                _HANDLER_POOL.remove(femm)
+                handler_list.append(femm)
+
+    while len(handler_list) < nb_handler:
+        femm = handler_class()
+        femm.openfemm(1)  # Minimized FEMM window
+        handler_list.append(femm)
+    return handler_list
+
+
+def release_handler_list(handler_list, is_keep=True):
+    """Put the handlers back in the pool (or close them)
+
+    Parameters
+    ----------
+    handler_list : list
+        list of FEMM handlers
+    is_keep : bool
+        True to keep the FEMM instances open for the next simulations
+    """
+    for femm in handler_list:
+        if is_keep:
+            with _POOL_LOCK:
+                _HANDLER_POOL.append(femm)
+        else:
+            femm.closefemm()
+
+
+def close_handler_pool():
+    """Close all the FEMM instances of the pool"""
+    with _POOL_LOCK:
+        handler_list = list(_HANDLER_POOL)
+        del _HANDLER_POOL[:]
+    for femm in handler_list:
+        femm.closefemm()
+
+
+register(close_handler_pool)
@@ -82,7 +82,7 @@ def construct_dict_from_group(group):
                 value = val[()]
                 if "array_list" in val.attrs.keys():  # List saved as an array
                     value = value.tolist()
-                elif value == "NoneValue":  # Handle None values
+                elif isinstance(value, str) and value == "NoneValue":  # None
                     value = None
                 elif isinstance(value, bool_):  # bool
                     value = bool(value)
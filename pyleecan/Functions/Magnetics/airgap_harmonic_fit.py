@@ -0,0 +1,229 @@
+# -*- coding: utf-8 -*-
+from numpy import (
+    arange,
+    array,
+    atleast_1d,
+    concatenate,
+    cos,
+    hypot,
+    arctan2,
+    log,
+    ones,
+    sin,
+    stack,
+    where,
+)
+from numpy.linalg import lstsq, norm
+
+from ...Classes.MeshMat import MeshMat
+from ...Classes.SolutionVector import SolutionVector
+from ...Methods.Mesh.NodeMat import get_position
+
+
+def get_airgap_wavenumber(Nmax, per_a=1, is_antiper_a=False):
+    """Return the spatial wavenumbers of the air-gap field of a machine with
+    the given periodicity (0 included only without anti-periodicity)
+
+    Parameters
+    ----------
+    Nmax : int
+        maximum wavenumber
+    per_a : int
+        number of spatial periodicities of the machine
+    is_antiper_a : bool
+        True if there is a spatial anti-periodicity after the periodicities
+
+    Returns
+    -------
+    wavenumber : ndarray
+        wavenumbers of the harmonic fit
+    """
+    if is_antiper_a:
+        return arange(per_a, Nmax + 1, 2 * per_a)
+    else:
+        return arange(0, Nmax + 1, per_a)
+
+
+def comp_airgap_basis(radius, angle, wavenumber, Rref):
+    """Return the harmonic basis of the Laplace solution in the air-gap annulus
+    A = a0 + b0*ln(r/Rref) + sum_n (an*(r/Rref)^n + bn*(r/Rref)^-n)*cos(n*angle)
+    + (cn*(r/Rref)^n + dn*(r/Rref)^-n)*sin(n*angle)
+    and of the flux density Br = dA/dtheta/r, Bt = -dA/dr
+
+    Parameters
+    ----------
+    radius : ndarray
+        radius of the points (Npt,) or scalar [m]
+    angle : ndarray
+        angle of the points (Npt,) [rad]
+    wavenumber : ndarray
+        wavenumbers of the harmonic fit
+    Rref : float
+        reference radius of the fit (middle of the air-gap) [m]
+
+    Returns
+    -------
+    basis_A : ndarray
+        basis of the vector potential (Npt, Ncoeff)
+    basis_Br : ndarray
+        basis of the radial flux density (Npt, Ncoeff)
+    basis_Bt : ndarray
+        basis of the tangential flux density (Npt, Ncoeff)
+    """
+    angle = atleast_1d(angle)
+    radius = atleast_1d(radius) * ones(angle.shape)
+    rho = radius / Rref
+    col_A, col_Br, col_Bt = list(), list(), list()
+    for n in wavenumber:
+        if n == 0:
+            col_A.extend([ones(rho.shape), log(rho)])
+            col_Br.extend([0 * rho, 0 * rho])
+            col_Bt.extend([0 * rho, -1 / radius])
+        else:
+            rho_p, rho_m = rho ** n, rho ** -n
+            cos_n, sin_n = cos(n * angle), sin(n * angle)
+            col_A.extend([rho_p * cos_n, rho_m * cos_n, rho_p * sin_n, rho_m * sin_n])
+            col_Br.extend(
+                [
+                    -n * rho_p * sin_n / radius,
+                    -n * rho_m * sin_n / radius,
+                    n * rho_p * cos_n / radius,
+                    n * rho_m * cos_n / radius,
+                ]
+            )
+            col_Bt.extend(
+                [
+                    -n * rho_p * cos_n / radius,
+                    n * rho_m * cos_n / radius,
+                    -n * rho_p * sin_n / radius,
+                    n * rho_m * sin_n / radius,
+                ]
+            )
+    return stack(col_A, axis=1), stack(col_Br, axis=1), stack(col_Bt, axis=1)
+
+
+def fit_airgap_potential(point, A, wavenumber, Rref):
+    """Fit the harmonic (Laplace) solution of the air-gap annulus on the
+    vector potential of points of the air-gap, for all the time steps at once
+
+    Parameters
+    ----------
+    point : ndarray
+        coordinates of the points in the air-gap (Npt, 2) [m]
+    A : ndarray
+        vector potential of the points (Nt, Npt) or (Npt,) [Wb/m]
+    wavenumber : ndarray
+        wavenumbers of the harmonic fit
+    Rref : float
+        reference radius of the fit (middle of the air-gap) [m]
+
+    Returns
+    -------
+    coeff : ndarray
+        coefficients of the harmonic fit (Nt, Ncoeff)
+    """
+    A = array(A, ndmin=2)
+    radius = hypot(point[:, 0], point[:, 1])
+    angle = arctan2(point[:, 1], point[:, 0])
+    basis_A, _, _ = comp_airgap_basis(radius, angle, wavenumber, Rref)
+    if basis_A.shape[1] > basis_A.shape[0]:
+        raise AirgapFitError(
+            "Not enough points in the air-gap ("
+            + str(basis_A.shape[0])
+            + ") to fit "
+            + str(basis_A.shape[1])
+            + " coefficients, reduce the maximum wavenumber"
+        )
+    # Scaled columns for the conditioning of the least squares problem
+    scale = norm(basis_A, axis=0)
+    scale = where(scale > 0, scale, 1)
+    coeff = lstsq(basis_A / scale, A.T, rcond=None)[0]
+    return (coeff / scale[:, None]).T
+
+
+def comp_airgap_flux_fit(coeff, wavenumber, Rref, radius, angle):
+    """Compute the air-gap flux density at any radius and angles from the
+    harmonic fit of the vector potential (one matrix product per component)
+
+    Parameters
+    ----------
+    coeff : ndarray
+        coefficients of the harmonic fit (Nt, Ncoeff)
+    wavenumber : ndarray
+        wavenumbers of the harmonic fit
+    Rref : float
+        reference radius of the fit [m]
+    radius : float
+        radius of the air-gap flux density [m]
+    angle : ndarray
+        angles of the air-gap flux density (Na,) [rad]
+
+    Returns
+    -------
+    Br : ndarray
+        radial flux density (Nt, Na) [T]
+    Bt : ndarray
+        tangential flux density (Nt, Na) [T]
+    """
+    _, basis_Br, basis_Bt = comp_airgap_basis(radius, angle, wavenumber, Rref)
+    return coeff @ basis_Br.T, coeff @ basis_Bt.T
+
+
+def get_airgap_potential(meshsolution, Rint, Rext, label="A"):
+    """Return the vector potential of the points (nodes or cell centers) of a
+    MeshSolution located in the air-gap annulus
+
+    Parameters
+    ----------
+    meshsolution : MeshSolution
+        MeshSolution with the vector potential solution
+    Rint : float
+        inner radius of the air-gap [m]
+    Rext : float
+        outer radius of the air-gap [m]
+    label : str
+        label of the vector potential solution (z component for a vector)
+
+    Returns
+    -------
+    point : ndarray
+        coordinates of the points in the air-gap (Npt, 2) [m]
+    A : ndarray
+        vector potential of the points (Nt, Npt) [Wb/m]
+    """
+    solution = meshsolution.get_solution(label=label)
+    mesh = meshsolution.get_mesh()
+    if isinstance(solution, SolutionVector):
+        field = solution.field.components["comp_z"]
+    else:
+        field = solution.field
+    A = array(field.values, ndmin=2)
+    indice = field.get_axes("indice")[0].get_values()
+
+    # Coordinates of the points of the solution
+    if solution.type_cell in ["point", "node"]:
+        if isinstance(mesh, MeshMat):
+            point = mesh.node.get_coord(indice)
+        else:
+            point = mesh.get_node()[indice]
+    elif isinstance(mesh, MeshMat):
+        center_list, indice_list = list(), list()
+        for cell in mesh.cell.values():
+            center_list.append(
+                mesh.node.get_coord(cell.get_connectivity()).mean(axis=1)
+            )
+            indice_list.append(cell.indice)
+        pos, _ = get_position(concatenate(indice_list), indice)
+        point = concatenate(center_list, axis=0)[pos]
+    else:
+        point = mesh.get_mesh_pv().cell_centers().points[indice]
+
+    radius = hypot(point[:, 0], point[:, 1])
+    is_airgap = (radius > Rint) & (radius < Rext)
+    return point[is_airgap, :2], A[:, is_airgap]
+
+
+class AirgapFitError(Exception):
+    """Raised when the harmonic fit of the air-gap field is not possible"""
+
+    pass
@@ -0,0 +1,118 @@
+# -*- coding: utf-8 -*-
+from numpy import (
+    argsort,
+    array,
+    column_stack,
+    empty,
+    max as np_max,
+    min as np_min,
+    ptp,
+    round as np_round,
+    sum as np_sum,
+    unique,
+    where,
+)
+from numpy.linalg import norm, svd
+from scipy.spatial import Delaunay
+
+
+def _get_simplex(X, rtol=1e-9):
+    """Return the simplices (vertex indices) of the piecewise linear
+    interpolant of the normalized points X (N, dim). The points are projected
+    on their affine hull (e.g. a line when Id and Iq vary together) so that
+    the simplices are never degenerated"""
+    # Principal directions of the points (affine rank)
+    X = X - X.mean(axis=0)
+    _, sing_val, Vh = svd(X, full_matrices=False)
+    rank = int(np_sum(sing_val > rtol * sing_val[0])) if sing_val[0] > 0 else 0
+    if rank == 0 or X.shape[0] <= rank:
+        return empty((0, rank + 1), dtype=int)
+    X = X @ Vh[:rank].T
+
+    if rank == 1:  # Intervals between consecutive (distinct) points
+        order = argsort(X[:, 0], kind="stable")
+        simplex = column_stack((order[:-1], order[1:]))
+        return simplex[X[order[1:], 0] - X[order[:-1], 0] > rtol]
+    return Delaunay(X).simplices
+
+
+def comp_refined_OP(OP, value, tol, nb_max, limit=None, limit_value=None):
+    """Return the operating points to add to refine the piecewise linear
+    interpolant of the results: the longest edge of a simplex (triangle in the
+    Id/Iq plane, interval when the operating points are aligned) is split when the results vary by more than tol (relative to
+    their range) on the simplex, or when the limit boundary crosses a simplex
+    larger than tol (relative to the operating points range)
+
+    Parameters
+    ----------
+    OP : ndarray
+        computed operating points (N, Ncol), e.g. (N0, Id, Iq)
+    value : ndarray
+        results of the operating points (N, Nsymbol)
+    tol : float
+        relative tolerance of the refinement
+    nb_max : int
+        maximum number of operating points to add
+    limit : ndarray
+        results with a limit (N,) (None to ignore)
+    limit_value : float
+        value of the limit
+
+    Returns
+    -------
+    OP_new : ndarray
+        operating points to add (Nnew, Ncol), sorted by decreasing priority
+    """
+    OP = array(OP, dtype=float)
+    OP_new = empty((0, OP.shape[1]))
+
+    # Normalized coordinates of the varying columns
+    OP_min = np_min(OP, axis=0)
+    OP_range = ptp(OP, axis=0)
+    is_var = OP_range > 0
+    if not is_var.any():
+        return OP_new
+    X = (OP[:, is_var] - OP_min[is_var]) / OP_range[is_var]
+    simplex = _get_simplex(X)
+    if simplex.shape[0] == 0:
+        return OP_new
+
+    # Variation of the normalized results on each simplex
+    value = array(value, dtype=float).reshape((OP.shape[0], -1))
+    value_range = ptp(value, axis=0)
+    value_range = where(value_range > 0, value_range, 1)
+    value_simplex = value[simplex] / value_range  # (Nsimplex, dim+1, Nsymbol)
+    variation = np_max(
+        np_max(value_simplex, axis=1) - np_min(value_simplex, axis=1), axis=1
+    )
+
+    # Longest edge of each simplex
+    nb_vertex = simplex.shape[1]
+    edge_list = [(ii, jj) for ii in range(nb_vertex) for jj in range(ii + 1, nb_vertex)]
+    edge_length = column_stack(
+        [norm(X[simplex[:, ii]] - X[simplex[:, jj]], axis=1) for ii, jj in edge_list]
+    )
+    edge = array(edge_list)[edge_length.argmax(axis=1)]
+    length = edge_length.max(axis=1)
+
+    # Refinement criteria (score to sort the operating points to add)
+    score = where(variation > tol, variation, 0)
+    if limit is not None and limit_value is not None:
+        limit_simplex = array(limit, dtype=float)[simplex]
+        is_cross = (np_min(limit_simplex, axis=1) < limit_value) & (
+            np_max(limit_simplex, axis=1) > limit_value
+        )
+        score = where(is_cross & (length > tol), score + length, score)
+
+    # Middle of the longest edge of the simplices to refine (once per edge)
+    index = argsort(-score, kind="stable")
+    index = index[score[index] > 0]
+    if index.size == 0:
+        return OP_new
+    idx_simplex = array(
+        [simplex[index, edge[index, 0]], simplex[index, edge[index, 1]]]
+    )
+    OP_mid = (OP[idx_simplex[0]] + OP[idx_simplex[1]]) / 2
+    key = np_round((OP_mid - OP_min) / where(OP_range > 0, OP_range, 1), 12)
+    _, idx_unique = unique(key, axis=0, return_index=True)
+    return OP_mid[sorted(idx_unique)][:nb_max]
@@ -0,0 +1,261 @@
+# -*- coding: utf-8 -*-
+import json
+from hashlib import sha256
+from os import makedirs
+from os.path import dirname, isdir, isfile
+
+from cloudpickle import dumps, loads
+from h5py import Empty, File
+from numpy import bool_, ndarray, number, void
+
+from ....Functions.Load.import_class import import_class
+from .... import __version__
+
+# Version of the store layout
+STORE_VERSION = 2
+# Key of the reference simulation in the store
+REF_KEY = "ref"
+
+
+def _get_key(index):
+    """Return the key of a simulation in the store (index None for the reference)"""
+    return REF_KEY if index is None else str(index)
+
+
+def _get_param_hash(paramexplorer_list):
+    """Return a hash of the symbols and values of the ParamExplorers (to check
+    that a store matches the multi-simulation to resume)"""
+    param_list = list()
+    for paramexplorer in paramexplorer_list:
+        value_list = [
+            value.as_dict() if hasattr(value, "as_dict") else value
+            for value in paramexplorer.get_value()
+        ]
+        param_list.append([paramexplorer.symbol, value_list])
+    param_str = json.dumps(
+        param_list,
+        sort_keys=True,
+        default=lambda obj: obj.tolist() if hasattr(obj, "tolist") else str(obj),
+    )
+    return sha256(param_str.encode("utf-8")).hexdigest()
+
+
+def _write_value(group, name, value):
+    """Write a DataKeeper value in a dataset of the group: numbers and numeric
+    arrays are stored as they are (readable without pyleecan), any other value
+    is pickled"""
+    if name in group:
+        del group[name]
+    if value is None:
+        group[name] = Empty("f")
+        group[name].attrs["type"] = "none"
+    elif isinstance(value, str):
+        group[name] = value
+        group[name].attrs["type"] = "str"
+    elif isinstance(value, (bool, int, float, complex, bool_, number)) or (
+        isinstance(value, ndarray) and value.dtype.kind in "biufc"
+    ):
+        group[name] = value
+        group[name].attrs["type"] = "array"
+    else:
+        group[name] = void(dumps(value))
+        group[name].attrs["type"] = "pickle"
+
+
+def _read_value(dataset):
+    """Read a value written by _write_value"""
+    value_type = dataset.attrs["type"]
+    if value_type == "none":
+        return None
+    elif value_type == "str":
+        return dataset.asstr()[()]
+    elif value_type == "array":
+        value = dataset[()]
+        return value.item() if value.ndim == 0 else value
+    else:
+        return loads(dataset[()].tobytes())
+
+
+def init_store(path_store, xoutput, keeper_list, is_resume=True):
+    """Create the HDF5 store of a multi-simulation or open an existing one to
+    resume the multi-simulation
+
+    Parameters
+    ----------
+    path_store : str
+        path of the HDF5 file
+    xoutput : XOutput
+        XOutput of the multi-simulation (nb_simu and paramexplorer_list set)
+    keeper_list : [DataKeeper]
+        DataKeepers of the multi-simulation
+    is_resume : bool
+        True to keep the simulations of an existing store, False to overwrite it
+
+    Returns
+    -------
+    index_list : [int]
+        indices of the simulations already stored (to skip)
+    """
+    symbol_list = [keeper.symbol for keeper in keeper_list]
+    param_hash = _get_param_hash(xoutput.paramexplorer_list)
+    if is_resume and isfile(path_store):
+        with File(path_store, "r") as file:
+            if (
+                file.attrs.get("nb_simu", None) != xoutput.nb_simu
+                or json.loads(file.attrs["symbol_list"]) != symbol_list
+                or file.attrs.get("param_hash", None) != param_hash
+            ):
+                raise ResultStoreError(
+                    "The multi-simulation doesn't match the one of the store "
+                    + path_store
+                    + " (different number of simulations, ParamExplorer values"
+                    + " or DataKeepers)"
+                )
+            return sorted(
+                [
+                    int(key)
+                    for key, group in file["step"].items()
+                    if key != REF_KEY and group.attrs.get("is_complete", False)
+                ]
+            )
+
+    if dirname(path_store) != "" and not isdir(dirname(path_store)):
+        makedirs(dirname(path_store))
+    with File(path_store, "w") as file:
+        file.attrs["version"] = STORE_VERSION
+        file.attrs["pyleecan_version"] = __version__
+        file.attrs["nb_simu"] = xoutput.nb_simu
+        file.attrs["symbol_list"] = json.dumps(symbol_list)
+        file.attrs["param_hash"] = param_hash
+        # DataKeeper description (to create the XOutput from the store)
+        keeper_group = file.create_group("keeper")
+        for keeper in keeper_list:
+            group = keeper_group.create_group(keeper.symbol)
+            group.attrs["name"] = "" if keeper.name is None else keeper.name
+            group.attrs["unit"] = "" if keeper.unit is None else keeper.unit
+        _write_value(file, "paramexplorer_list", xoutput.paramexplorer_list)
+        file.create_group("step")
+        file.create_group("output")
+    return list()
+
+
+def write_step(path_store, index, keeper_list, output=None):
+    """Write the DataKeeper results (and the Output) of a simulation in the
+    store. The simulation is marked complete only once everything is written so
+    that an interrupted write is computed again when resuming.
+
+    Parameters
+    ----------
+    path_store : str
+        path of the HDF5 file
+    index : int
+        index of the simulation (None for the reference simulation)
+    keeper_list : [DataKeeper]
+        DataKeepers with the result of the simulation
+    output : Output
+        Output of the simulation to store (None to store only the results)
+    """
+    key = _get_key(index)
+    with File(path_store, "a") as file:
+        if key in file["step"]:
+            del file["step"][key]
+        group = file["step"].create_group(key)
+        for keeper in keeper_list:
+            value = keeper.result_ref if index is None else keeper.result[index]
+            _write_value(group, keeper.symbol, value)
+        if output is not None:
+            _write_value(file["output"], key, output)
+        group.attrs["is_complete"] = True
+
+
+def read_step(path_store, index):
+    """Read the DataKeeper results of a simulation from the store
+
+    Parameters
+    ----------
+    path_store : str
+        path of the HDF5 file
+    index : int
+        index of the simulation (None for the reference simulation)
+
+    Returns
+    -------
+    result_dict : dict
+        DataKeeper results of the simulation (key: symbol)
+    """
+    with File(path_store, "r") as file:
+        group = file["step"][_get_key(index)]
+        return {symbol: _read_value(dataset) for symbol, dataset in group.items()}
+
+
+def read_output(path_store, index):
+    """Read the Output of a simulation from the store
+
+    Parameters
+    ----------
+    path_store : str
+        path of the HDF5 file
+    index : int
+        index of the simulation (None for the reference simulation)
+
+    Returns
+    -------
+    output : Output
+        Output of the simulation (None if not stored)
+    """
+    key = _get_key(index)
+    with File(path_store, "r") as file:
+        if key not in file["output"]:
+            return None
+        return _read_value(file["output"][key])
+
+
+def load_store(path_store):
+    """Create a XOutput with the DataKeeper results of a store (e.g. of an
+    interrupted multi-simulation), the Outputs are loaded on demand
+
+    Parameters
+    ----------
+    path_store : str
+        path of the HDF5 file
+
+    Returns
+    -------
+    xoutput : XOutput
+        XOutput with the results of the store (None for the missing simulations)
+    """
+    XOutput = import_class("pyleecan.Classes", "XOutput")
+    DataKeeper = import_class("pyleecan.Classes", "DataKeeper")
+
+    with File(path_store, "r") as file:
+        nb_simu = int(file.attrs["nb_simu"])
+        xoutput = XOutput(
+            nb_simu=nb_simu,
+            paramexplorer_list=_read_value(file["paramexplorer_list"]),
+            path_store=path_store,
+        )
+        xoutput.output_list = [None] * nb_simu
+        for symbol in json.loads(file.attrs["symbol_list"]):
+            group = file["keeper"][symbol]
+            xoutput.xoutput_dict[symbol] = DataKeeper(
+                name=group.attrs["name"],
+                symbol=symbol,
+                unit=group.attrs["unit"],
+                result=[None] * nb_simu,
+            )
+        for key, group in file["step"].items():
+            if not group.attrs.get("is_complete", False):
+                continue
+            for symbol, dataset in group.items():
+                keeper = xoutput.xoutput_dict[symbol]
+                if key == REF_KEY:
+                    keeper.result_ref = _read_value(dataset)
+                else:
+                    keeper.result[int(key)] = _read_value(dataset)
+    return xoutput
+
+
+class ResultStoreError(Exception):
+    """Raised when a store doesn't match the multi-simulation to resume"""
+
+    pass
@@ -0,0 +1,101 @@
+# -*- coding: utf-8 -*-
+from contextlib import contextmanager
+from sys import platform
+from time import perf_counter, process_time
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+try:
+    import psutil
+except ImportError:
+    psutil = None
+
+# Columns of the profile table (Output.profile)
+PROFILE_COLUMNS = [
+    "index",  # Index of the simulation (None for the reference/single simulation)
+    "stage",  # Name of the stage (e.g. "Magnetics.comp_flux_airgap")
+    "wall_time",  # Elapsed time [s]
+    "cpu_time",  # CPU time of the process (all threads) [s]
+    "max_rss",  # Peak resident memory of the process at the end of the stage [B]
+    "delta_max_rss",  # Increase of the peak resident memory during the stage [B]
+]
+
+
+def get_max_rss():
+    """Return the peak resident memory of the process (None if unknown)
+
+    Returns
+    -------
+    max_rss : int
+        peak resident set size [B]
+    """
+    if resource is not None:
+        max_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        # kilobytes on Linux, bytes on macOS
+        return int(max_rss) if platform == "darwin" else int(max_rss) * 1024
+    if psutil is not None:
+        mem_info = psutil.Process().memory_info()
+        # Peak working set on Windows
+        return int(getattr(mem_info, "peak_wset", mem_info.rss))
+    return None
+
+
+def init_profile():
+    """Return an empty profile table"""
+    return {col: list() for col in PROFILE_COLUMNS}
+
+
+def append_profile(profile, profile_add):
+    """Add the rows of a profile table at the end of another one
+
+    Parameters
+    ----------
+    profile : dict
+        profile table to update
+    profile_add : dict
+        profile table to add
+    """
+    for col in PROFILE_COLUMNS:
+        profile[col].extend(profile_add[col])
+
+
+@contextmanager
+def profile_stage(output, stage):
+    """Record the wall time, the CPU time and the peak resident memory of a
+    simulation stage in output.profile (only if output.simu.is_profile)
+
+    Parameters
+    ----------
+    output : Output
+        Output of the simulation
+    stage : str
+        name of the stage
+    """
+    simu = None if output is None else output.simu
+    if simu is None or not simu.is_profile:
+        yield
+        return
+
+    rss_start = get_max_rss()
+    cpu_start = process_time()
+    wall_start = perf_counter()
+    yield
+    wall_time = perf_counter() - wall_start
+    cpu_time = process_time() - cpu_start
+    max_rss = get_max_rss()
+
+    if output.profile is None:
+        output.profile = init_profile()
+    row = {
+        "index": simu.index,
+        "stage": stage,
+        "wall_time": wall_time,
+        "cpu_time": cpu_time,
+        "max_rss": max_rss,
+        "delta_max_rss": None if max_rss is None else max_rss - rss_start,
+    }
+    for col in PROFILE_COLUMNS:
+        output.profile[col].append(row[col])
@@ -0,0 +1,104 @@
+# -*- coding: utf-8 -*-
+from logging import getLogger
+from os import makedirs
+from os.path import isdir
+from subprocess import PIPE, Popen, TimeoutExpired
+from threading import Thread
+
+from ...loggers import DEFAULT_LOG_NAME
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+
+class FEAJobError(Exception):
+    """Raised when an external FEA solver process fails or times out"""
+
+    pass
+
+
+def _get_limit_fct(max_memory):
+    """Return the function to set the resource limits of the solver process
+    (POSIX only)"""
+    if max_memory is None or resource is None:
+        return None
+
+    def set_limit():
+        resource.setrlimit(resource.RLIMIT_AS, (max_memory, max_memory))
+
+    return set_limit
+
+
+def _stream(stream, log_fct, prefix):
+    """Send each line of a process stream to the logger"""
+    for line in iter(stream.readline, b""):
+        log_fct(prefix + line.decode("UTF-8", errors="replace").rstrip())
+    stream.close()
+
+
+def run_FEA_job(
+    cmd, cwd=None, name=None, timeout=None, logger=None, max_memory=None, env=None
+):
+    """Run an external FEA solver process (ElmerGrid, ElmerSolver...) and stream
+    its output to the logger line by line
+
+    Parameters
+    ----------
+    cmd : list
+        command line to execute
+    cwd : str
+        case directory (created if needed)
+    name : str
+        name of the process in the log (default: binary name)
+    timeout : float
+        the process is killed after timeout [s] (default: no timeout)
+    logger : Logger
+        logger to stream the process output to (default: Pyleecan logger)
+    max_memory : int
+        maximum memory of the process [bytes] (POSIX only)
+    env : dict
+        environment variables of the process (default: current ones)
+    """
+    if logger is None:
+        logger = getLogger(DEFAULT_LOG_NAME)
+    if name is None:
+        name = str(cmd[0])
+    if cwd is not None and not isdir(cwd):
+        makedirs(cwd)
+
+    logger.info("Calling " + name + ": " + " ".join(map(str, cmd)))
+    process = Popen(
+        [str(arg) for arg in cmd],
+        cwd=cwd,
+        env=env,
+        stdout=PIPE,
+        stderr=PIPE,
+        preexec_fn=_get_limit_fct(max_memory),
+    )
+    thread_list = [
+        Thread(target=_stream, args=(process.stdout, logger.info, name + ": ")),
+        Thread(
+            target=_stream, args=(process.stderr, logger.warning, name + " [Error]: ")
+        ),
+    ]
+    for thread in thread_list:
+        thread.start()
+    try:
+        process.wait(timeout=timeout)
+    except TimeoutExpired:
+        process.kill()
+        process.wait()
+        raise FEAJobError(
+            name + " was stopped after the timeout of " + str(timeout) + " s"
+        )
+    finally:
+        for thread in thread_list:
+            thread.join()
+
+    if process.returncode != 0:
+        raise FEAJobError(
+            name + " process error: Return Code [" + str(process.returncode) + "]"
+        )
+    logger.info(name + " call complete!")
@@ -0,0 +1,191 @@
+# -*- coding: utf-8 -*-
+
+from numpy import (
+    array,
+    einsum,
+    sqrt,
+    zeros,
+    repeat,
+    tile,
+    broadcast_to,
+    concatenate,
+    add,
+)
+from scipy.sparse import coo_matrix
+
+from ...Classes.RefQuad4 import RefQuad4
+from ...Classes.RefTriangle3 import RefTriangle3
+
+# Quadrature points and weights (reference coordinates)
+_GAUSS = {
+    # 3 points rule (exact for order 2) on the reference triangle
+    "triangle": (
+        array([[1 / 6, 1 / 6], [2 / 3, 1 / 6], [1 / 6, 2 / 3]]),
+        array([1 / 6, 1 / 6, 1 / 6]),
+    ),
+    # 2x2 Gauss rule on the reference square [-1, 1]^2
+    "quad": (
+        array([[-1, -1], [1, -1], [1, 1], [-1, 1]]) / sqrt(3),
+        array([1.0, 1.0, 1.0, 1.0]),
+    ),
+}
+
+
+def _get_ref_cell(cell_type):
+    """Return the reference cell of the linear cells"""
+    if cell_type == "triangle":
+        return RefTriangle3()
+    elif cell_type == "quad":
+        return RefQuad4()
+    else:
+        raise NotImplementedError(
+            "Cell type " + str(cell_type) + " not available for plane stress"
+        )
+
+
+def comp_B_matrix(nodes, connect, cell_type, points):
+    """Compute the strain-displacement matrices of the cells at the given
+    reference points
+
+    Parameters
+    ----------
+    nodes : ndarray
+        nodes coordinates (Nn x 2)
+    connect : ndarray
+        cells connectivity (Ne x Nnode)
+    cell_type : str
+        "triangle" or "quad"
+    points : ndarray
+        reference points (Ngp x 2)
+
+    Returns
+    -------
+    B : ndarray
+        strain-displacement matrices (Ne x Ngp x 3 x 2*Nnode), dofs ordered as
+        [ux_0, uy_0, ux_1, ...]
+    detJ : ndarray
+        jacobian determinants (Ne x Ngp)
+    N : ndarray
+        shape functions values (Ngp x Nnode)
+    """
+    ref_cell = _get_ref_cell(cell_type)
+    N = ref_cell.shape_function_batch(points)  # (Ngp, Nnode)
+    dN = ref_cell.grad_shape_function_batch(points)  # (Ngp, 2, Nnode)
+
+    # J[e, g, i, j] = d x_j / d xi_i
+    J, detJ = ref_cell.jacobian_batch(points, nodes[connect])
+    Jinv = zeros(J.shape)
+    Jinv[..., 0, 0] = J[..., 1, 1] / detJ
+    Jinv[..., 1, 1] = J[..., 0, 0] / detJ
+    Jinv[..., 0, 1] = -J[..., 0, 1] / detJ
+    Jinv[..., 1, 0] = -J[..., 1, 0] / detJ
+    # derivatives in the real cell (Ne, Ngp, Nnode, 2)
+    dNx = einsum("egij,gjn->egni", Jinv, dN)
+
+    Nnode = connect.shape[1]
+    B = zeros(dNx.shape[:2] + (3, 2 * Nnode))
+    B[..., 0, 0::2] = dNx[..., 0]
+    B[..., 1, 1::2] = dNx[..., 1]
+    B[..., 2, 0::2] = dNx[..., 1]
+    B[..., 2, 1::2] = dNx[..., 0]
+    return B, detJ, N
+
+
+def comp_D_matrix(E, nu):
+    """Return the plane stress elasticity matrices (... x 3 x 3)
+
+    Parameters
+    ----------
+    E : ndarray
+        Young modulus [Pa]
+    nu : ndarray
+        Poisson ratio [-]
+    """
+    E = array(E, dtype=float)
+    nu = array(nu, dtype=float)
+    coeff = E / (1 - nu ** 2)
+    D = zeros(E.shape + (3, 3))
+    D[..., 0, 0] = coeff
+    D[..., 1, 1] = coeff
+    D[..., 0, 1] = coeff * nu
+    D[..., 1, 0] = coeff * nu
+    D[..., 2, 2] = coeff * (1 - nu) / 2
+    return D
+
+
+def assemble_plane_stress(nodes, cells, E, nu, rho, thickness=1):
+    """Assemble the stiffness and mass matrices of a 2D plane stress model with
+    linear triangle and quadrangle cells, as well as the centrifugal load vector
+    for a rotation speed of 1 rad/s around the origin.
+    All the cells of one type are integrated at once.
+
+    Parameters
+    ----------
+    nodes : ndarray
+        nodes coordinates (Nn x 2) [m]
+    cells : dict
+        dict of connectivity (Ne x Nnode) with key the cell type ("triangle", "quad")
+    E : dict
+        Young modulus [Pa] of each cell (array Ne or float) with key the cell type
+    nu : dict
+        Poisson ratio [-] of each cell (array Ne or float) with key the cell type
+    rho : dict
+        Mass density [kg/m3] of each cell (array Ne or float) with key the cell type
+    thickness : float
+        Thickness of the model [m]
+
+    Returns
+    -------
+    K : csr_matrix
+        stiffness matrix (2*Nn x 2*Nn)
+    M : csr_matrix
+        mass matrix (2*Nn x 2*Nn)
+    F : ndarray
+        centrifugal load vector for 1 rad/s (2*Nn)
+    """
+    Ndof = 2 * nodes.shape[0]
+    rows, cols, K_val, M_val = list(), list(), list(), list()
+    F = zeros(Ndof)
+
+    for cell_type, connect in cells.items():
+        connect = array(connect, dtype=int)
+        if connect.size == 0:
+            continue
+        Ne, Nnode = connect.shape
+        points, weights = _GAUSS[cell_type]
+        B, detJ, N = comp_B_matrix(nodes, connect, cell_type, points)
+        dV = thickness * abs(detJ) * weights[None, :]  # (Ne, Ngp)
+
+        D = broadcast_to(comp_D_matrix(E[cell_type], nu[cell_type]), (Ne, 3, 3))
+        rho_e = broadcast_to(array(rho[cell_type], dtype=float), (Ne,))
+
+        # Stiffness matrices (Ne, 2*Nnode, 2*Nnode)
+        Ke = einsum("egia,eij,egjb,eg->eab", B, D, B, dV)
+
+        # Consistent mass matrices (Ne, 2*Nnode, 2*Nnode)
+        Me_s = einsum("ga,gb,eg->eab", N, N, dV) * rho_e[:, None, None]
+        Me = zeros(Ke.shape)
+        Me[:, 0::2, 0::2] = Me_s
+        Me[:, 1::2, 1::2] = Me_s
+
+        # Centrifugal load rho*omega**2*x (Ne, Nnode, 2)
+        xg = einsum("ga,eaj->egj", N, nodes[connect])
+        Fe = einsum("ga,egj,eg->eaj", N, xg, dV) * rho_e[:, None, None]
+
+        # Global dofs of the cells (Ne, 2*Nnode)
+        dofs = zeros((Ne, 2 * Nnode), dtype=int)
+        dofs[:, 0::2] = 2 * connect
+        dofs[:, 1::2] = 2 * connect + 1
+
+        rows.append(repeat(dofs, 2 * Nnode, axis=1).ravel())
+        cols.append(tile(dofs, (1, 2 * Nnode)).ravel())
+        K_val.append(Ke.ravel())
+        M_val.append(Me.ravel())
+        add.at(F, dofs.ravel(), Fe.reshape(Ne, -1).ravel())
+
+    rows = concatenate(rows)
+    cols = concatenate(cols)
+    K = coo_matrix((concatenate(K_val), (rows, cols)), shape=(Ndof, Ndof)).tocsr()
+    M = coo_matrix((concatenate(M_val), (rows, cols)), shape=(Ndof, Ndof)).tocsr()
+
+    return K, M, F
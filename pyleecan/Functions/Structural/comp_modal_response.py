@@ -0,0 +1,142 @@
+# -*- coding: utf-8 -*-
+
+from numpy import arctan2, argsort, array, empty_like, exp, einsum, pi, roll, sqrt
+from numpy import abs as np_abs
+
+
+def get_circle_nodes(nodes, R, rtol=1e-3):
+    """Return the nodes on a circle of radius R with their angle and the
+    angular width [rad] they are representative of (half of the gaps to the
+    previous and next nodes)
+
+    Parameters
+    ----------
+    nodes : ndarray
+        nodes coordinates (Nn x 2) [m]
+    R : float
+        radius of the circle [m]
+    rtol : float
+        relative tolerance to select the nodes on the circle
+
+    Returns
+    -------
+    ind : ndarray
+        indices of the nodes on the circle (Nc)
+    theta : ndarray
+        angle of the nodes (Nc) [rad]
+    dtheta : ndarray
+        angular width of the nodes (Nc) [rad], sum(dtheta) = 2*pi
+    """
+    r = sqrt(nodes[:, 0] ** 2 + nodes[:, 1] ** 2)
+    ind = (np_abs(r - R) <= rtol * R).nonzero()[0]
+    theta = arctan2(nodes[ind, 1], nodes[ind, 0])
+
+    # gaps between sorted nodes (the nodes in the slot openings of a stator
+    # bore carry the force of the opening)
+    isort = argsort(theta)
+    gap = (roll(theta[isort], -1) - theta[isort]) % (2 * pi)
+    dtheta = empty_like(theta)
+    dtheta[isort] = (gap + roll(gap, 1)) / 2
+
+    return ind, theta, dtheta
+
+
+def comp_modal_response(
+    nodes,
+    freqs_mode,
+    shapes,
+    freqs,
+    wavenumber,
+    Prad,
+    Ptan=None,
+    Rint=None,
+    Rext=None,
+    damping=0.02,
+    k_freq=None,
+    rtol=1e-3,
+):
+    """Compute the radial displacement of the outer surface of a 2D structure
+    due to rotating surface force waves on its inner surface by modal
+    superposition, vectorized over all the (frequency, wavenumber) pairs and
+    the frequency scaling factors (speeds).
+
+    The force is sum(Re(P[f,r] * exp(1j*(2*pi*f*t + r*theta)))) (SciDataTool
+    convention) and the displacement is given with the same convention. For
+    k_freq = N0 / N0_ref, the frequencies are scaled by k_freq and the force
+    amplitudes are unchanged.
+
+    Parameters
+    ----------
+    nodes : ndarray
+        nodes coordinates (Nn x 2) [m]
+    freqs_mode : ndarray
+        natural frequencies (Nmode) [Hz]
+    shapes : ndarray
+        mode shapes normalized for a unit length model (Nmode x Nn x 2)
+    freqs : ndarray
+        frequencies of the force (Nf) [Hz]
+    wavenumber : ndarray
+        wavenumbers of the force and of the displacement (Nr)
+    Prad : ndarray
+        complex radial surface force (Nf x Nr) [N/m^2]
+    Ptan : ndarray
+        complex tangential surface force (Nf x Nr) [N/m^2]
+    Rint : float
+        radius where the force is applied (default: minimum radius of the nodes)
+    Rext : float
+        radius where the displacement is computed (default: maximum radius of the nodes)
+    damping : float
+        modal damping ratio [-]
+    k_freq : list
+        frequency scaling factors (default [1])
+    rtol : float
+        relative tolerance to select the nodes on the circles
+
+    Returns
+    -------
+    Yr : ndarray
+        complex radial displacement (Nk x Nf x Nr) [m]
+    """
+    if k_freq is None:
+        k_freq = [1]
+    k_freq = array(k_freq, dtype=float)
+    freqs = array(freqs, dtype=float)
+    wavenumber = array(wavenumber)
+    r = sqrt(nodes[:, 0] ** 2 + nodes[:, 1] ** 2)
+    if Rint is None:
+        Rint = r.min()
+    if Rext is None:
+        Rext = r.max()
+
+    # modal force of each force wave (Nmode x Nr): projection on the mode shapes
+    ind, theta, dtheta = get_circle_nodes(nodes, Rint, rtol=rtol)
+    phi = shapes[:, ind, :]
+    phi_r = phi[..., 0] * (nodes[ind, 0] / r[ind]) + phi[..., 1] * (
+        nodes[ind, 1] / r[ind]
+    )
+    wave = exp(1j * wavenumber[None, :] * theta[:, None]) * (Rint * dtheta)[:, None]
+    G = phi_r @ wave
+    if Ptan is not None:
+        phi_t = -phi[..., 0] * (nodes[ind, 1] / r[ind]) + phi[..., 1] * (
+            nodes[ind, 0] / r[ind]
+        )
+        Gt = phi_t @ wave
+
+    # modal force (Nf x Nmode)
+    Fm = einsum("mr,fr->fm", G, Prad)
+    if Ptan is not None:
+        Fm += einsum("mr,fr->fm", Gt, Ptan)
+
+    # wavenumber content of the radial displacement of each mode (Nr x Nmode)
+    ind, theta, dtheta = get_circle_nodes(nodes, Rext, rtol=rtol)
+    ur = shapes[:, ind, 0] * (nodes[ind, 0] / r[ind]) + shapes[:, ind, 1] * (
+        nodes[ind, 1] / r[ind]
+    )
+    A = (exp(-1j * wavenumber[:, None] * theta[None, :]) * dtheta / (2 * pi)) @ ur.T
+
+    # modal receptance for all the speeds at once (Nk x Nf x Nmode)
+    wm = 2 * pi * array(freqs_mode)
+    w = 2 * pi * k_freq[:, None, None] * freqs[None, :, None]
+    H = 1 / (wm ** 2 - w ** 2 + 2j * damping * wm * w)
+
+    return einsum("rm,kfm,fm->kfr", A, H, Fm)
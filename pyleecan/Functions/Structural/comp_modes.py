@@ -0,0 +1,97 @@
+# -*- coding: utf-8 -*-
+
+from numpy import argsort, pi, sqrt, zeros
+from scipy.sparse.linalg import eigsh, splu, LinearOperator
+
+from .assemble_plane_stress import assemble_plane_stress
+
+
+def comp_modes(
+    nodes, cells, E, nu, rho, Nmode=10, freq_min=1, thickness=1, factorization=None
+):
+    """Compute the lowest natural frequencies and mode shapes of a 2D plane stress
+    model with a shift-invert sparse eigenvalue solver.
+
+    The assembled matrices and the factorization can be stored in a
+    ModalFactorization: a next call with the same geometry and materials up to
+    a scaling (e.g. other E or rho for all the cells) solves the eigenvalue
+    problem again without assembly nor factorization.
+
+    Parameters
+    ----------
+    nodes : ndarray
+        nodes coordinates (Nn x 2) [m]
+    cells : dict
+        dict of connectivity (Ne x Nnode) with key the cell type ("triangle", "quad")
+    E : dict
+        Young modulus [Pa] of each cell (array Ne or float) with key the cell type
+    nu : dict
+        Poisson ratio [-] of each cell (array Ne or float) with key the cell type
+    rho : dict
+        Mass density [kg/m3] of each cell (array Ne or float) with key the cell type
+    Nmode : int
+        Number of modes to compute
+    freq_min : float
+        Modes below freq_min [Hz] are rigid body modes and are removed
+        (the shift of the solver is -(2*pi*freq_min)**2)
+    thickness : float
+        Thickness of the model [m]
+    factorization : ModalFactorization
+        matrices and factorization to reuse and update (None to ignore)
+
+    Returns
+    -------
+    freqs : ndarray
+        natural frequencies (Nmode) [Hz]
+    shapes : ndarray
+        mass normalized mode shapes (Nmode x Nn x 2)
+    """
+    # shift-invert around a negative value (K - sigma*M is positive definite
+    # even with rigid body modes)
+    sigma = -((2 * pi * freq_min) ** 2)
+
+    scaling = None
+    if factorization is not None:
+        scaling = factorization.get_scaling(nodes, cells, E, nu, rho, thickness)
+
+    if scaling is None:
+        K, M, _ = assemble_plane_stress(nodes, cells, E, nu, rho, thickness=thickness)
+
+        # remove the unused nodes
+        is_used = K.diagonal() != 0
+        K = K[is_used][:, is_used]
+        M = M[is_used][:, is_used]
+
+        lu = splu((K - sigma * M).tocsc())
+        OPinv = LinearOperator(K.shape, matvec=lu.solve, dtype=float)
+        if factorization is not None:
+            factorization.set(
+                nodes, cells, E, nu, rho, thickness, K, M, is_used, lu, sigma
+            )
+    else:
+        # K = kE * K0 and M = krho * M0: with the shift sigma0 * kE / krho,
+        # K - sigma * M = kE * (K0 - sigma0 * M0) uses the stored factorization
+        kE, krho = scaling
+        K = kE * factorization.K
+        M = krho * factorization.M
+        is_used = factorization.is_used
+        sigma = factorization.sigma * kE / krho
+        lu = factorization.lu
+        OPinv = LinearOperator(K.shape, matvec=lambda x: lu.solve(x) / kE, dtype=float)
+
+    # 3 extra modes for the possible rigid body modes
+    Nev = min(Nmode + 3, K.shape[0] - 2)
+    eigval, eigvec = eigsh(K, k=Nev, M=M, sigma=sigma, OPinv=OPinv, which="LM")
+
+    isort = argsort(eigval)
+    eigval, eigvec = eigval[isort], eigvec[:, isort]
+    freqs = sqrt(abs(eigval)) / (2 * pi)
+    is_elastic = freqs >= freq_min
+    freqs = freqs[is_elastic][:Nmode]
+    eigvec = eigvec[:, is_elastic][:, :Nmode]
+
+    shapes = zeros((freqs.size, is_used.size))
+    shapes[:, is_used] = eigvec.T
+    shapes = shapes.reshape((freqs.size, nodes.shape[0], 2))
+
+    return freqs, shapes
@@ -0,0 +1,47 @@
+# -*- coding: utf-8 -*-
+
+from numpy import arange, arctan2, exp, sqrt, abs as np_abs
+
+
+def comp_order_circ(nodes, shapes, Rref=None, rtol=1e-3, order_max=None):
+    """Return the circumferential order of mode shapes, i.e. the wavenumber of
+    the radial displacement with the highest amplitude on a circle of radius Rref
+
+    Parameters
+    ----------
+    nodes : ndarray
+        nodes coordinates (Nn x 2) [m]
+    shapes : ndarray
+        mode shapes (Nmode x Nn x 2)
+    Rref : float
+        radius of the nodes to use (default: maximum radius of the nodes)
+    rtol : float
+        relative tolerance to select the nodes on the circle
+    order_max : int
+        maximum circumferential order (default: half the number of nodes on
+        the circle)
+
+    Returns
+    -------
+    order_circ : ndarray
+        circumferential order of each mode (Nmode)
+    """
+    r = sqrt(nodes[:, 0] ** 2 + nodes[:, 1] ** 2)
+    if Rref is None:
+        Rref = r.max()
+    is_circ = np_abs(r - Rref) <= rtol * Rref
+    theta = arctan2(nodes[is_circ, 1], nodes[is_circ, 0])
+
+    # radial displacement of all the modes on the circle (Nmode x Nc)
+    ur = (
+        shapes[:, is_circ, 0] * nodes[None, is_circ, 0]
+        + shapes[:, is_circ, 1] * nodes[None, is_circ, 1]
+    ) / r[None, is_circ]
+
+    # spatial Fourier transform of all the modes at once
+    if order_max is None:
+        order_max = theta.size // 2
+    orders = arange(order_max + 1)
+    coeff = ur @ exp(-1j * orders[None, :] * theta[:, None])
+
+    return orders[np_abs(coeff).argmax(axis=1)]
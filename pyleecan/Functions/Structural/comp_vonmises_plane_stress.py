@@ -0,0 +1,67 @@
+# -*- coding: utf-8 -*-
+
+from numpy import array, einsum, sqrt, zeros, add, broadcast_to
+
+from .assemble_plane_stress import comp_B_matrix, comp_D_matrix
+
+# Reference coordinates of the cells center
+_CENTER = {"triangle": array([[1 / 3, 1 / 3]]), "quad": array([[0.0, 0.0]])}
+
+
+def comp_vonmises_plane_stress(nodes, cells, E, nu, U, is_node=True):
+    """Compute the von Mises stress of a 2D plane stress model at the cells center,
+    for several displacement fields at once
+
+    Parameters
+    ----------
+    nodes : ndarray
+        nodes coordinates (Nn x 2) [m]
+    cells : dict
+        dict of connectivity (Ne x Nnode) with key the cell type ("triangle", "quad")
+    E : dict
+        Young modulus [Pa] of each cell (array Ne or float) with key the cell type
+    nu : dict
+        Poisson ratio [-] of each cell (array Ne or float) with key the cell type
+    U : ndarray
+        displacements (... x Nn x 2) [m]
+    is_node : bool
+        True to average the cells values on the nodes (weighted by the cell area)
+
+    Returns
+    -------
+    vonmises : ndarray or dict
+        nodal von Mises stress (... x Nn) [Pa] if is_node else dict of the cells
+        von Mises stress (... x Ne) with key the cell type
+    """
+    vm_dict = dict()
+    vm_node = zeros(U.shape[:-2] + (nodes.shape[0],))
+    weight = zeros(nodes.shape[0])
+
+    for cell_type, connect in cells.items():
+        connect = array(connect, dtype=int)
+        if connect.size == 0:
+            continue
+        Ne = connect.shape[0]
+        B, detJ, _ = comp_B_matrix(nodes, connect, cell_type, _CENTER[cell_type])
+        D = broadcast_to(comp_D_matrix(E[cell_type], nu[cell_type]), (Ne, 3, 3))
+
+        # strains and stresses of all the cells (..., Ne, 3)
+        Ue = U[..., connect, :].reshape(U.shape[:-2] + (Ne, -1))
+        strain = einsum("eia,...ea->...ei", B[:, 0], Ue)
+        stress = einsum("eij,...ej->...ei", D, strain)
+        sx, sy, txy = stress[..., 0], stress[..., 1], stress[..., 2]
+        vm = sqrt(sx ** 2 - sx * sy + sy ** 2 + 3 * txy ** 2)
+        vm_dict[cell_type] = vm
+
+        if is_node:
+            # area weighted average on the nodes
+            area = abs(detJ[:, 0])
+            for jj in range(connect.shape[1]):
+                add.at(vm_node.T, connect[:, jj], (vm * area).T)
+                add.at(weight, connect[:, jj], area)
+
+    if is_node:
+        weight[weight == 0] = 1  # nodes without cell
+        return vm_node / weight
+    else:
+        return vm_dict
@@ -0,0 +1,98 @@
+# -*- coding: utf-8 -*-
+
+from numpy import array, array_equal, broadcast_to
+
+
+class ModalFactorization:
+    """Assembled matrices and factorization of a modal analysis (cf comp_modes)
+    to solve again the same geometry with scaled materials.
+
+    The copies of a StructModal share it. The factorization can't be
+    serialized: a saved or pickled object is empty and the next modal analysis
+    assembles and factorizes again.
+    """
+
+    def __init__(self):
+        self.clear()
+
+    def clear(self):
+        """Remove the stored matrices and factorization"""
+        self.signature = None  # geometry and normalized materials
+        self.E_ref = None  # Young modulus of the first cell [Pa]
+        self.rho_ref = None  # Mass density of the first cell [kg/m3]
+        self.K = None  # stiffness matrix of the used dof
+        self.M = None  # mass matrix of the used dof
+        self.is_used = None  # used dof (nodes of the cells)
+        self.lu = None  # factorization of K - sigma * M
+        self.sigma = None  # shift of the factorization
+        self.nb_factorization = 0  # number of factorizations done
+
+    def get_scaling(self, nodes, cells, E, nu, rho, thickness):
+        """Return the scaling (kE, krho) of the materials relative to the
+        stored factorization (None if the problem is not a scaling of it)"""
+        signature, E_ref, rho_ref = _get_signature(nodes, cells, E, nu, rho, thickness)
+        if self.lu is None or not _is_equal(signature, self.signature):
+            return None
+        return E_ref / self.E_ref, rho_ref / self.rho_ref
+
+    def set(self, nodes, cells, E, nu, rho, thickness, K, M, is_used, lu, sigma):
+        """Store the matrices and the factorization of a problem"""
+        self.signature, self.E_ref, self.rho_ref = _get_signature(
+            nodes, cells, E, nu, rho, thickness
+        )
+        self.K, self.M, self.is_used = K, M, is_used
+        self.lu, self.sigma = lu, sigma
+        self.nb_factorization += 1
+
+    def __getstate__(self):
+        # The factorization is not serializable (new empty object)
+        return dict()
+
+    def __setstate__(self, state):
+        self.clear()
+
+    def __eq__(self, other):
+        # Stored data only speed up the computation (same results)
+        return isinstance(other, ModalFactorization)
+
+    def __ne__(self, other):
+        return not self.__eq__(other)
+
+    def __repr__(self):
+        if self.K is None:
+            return "ModalFactorization(empty)"
+        return "ModalFactorization(Ndof=" + str(self.K.shape[0]) + ")"
+
+
+def _get_signature(nodes, cells, E, nu, rho, thickness):
+    """Return the data defining the problem up to a scaling of the materials
+    (materials normalized by the ones of the first cell)"""
+    keys = list(cells.keys())
+    E_ref = float(array(E[keys[0]]).ravel()[0])
+    rho_ref = float(array(rho[keys[0]]).ravel()[0])
+    signature = [array(nodes, dtype=float), thickness]
+    for key in keys:
+        Ne = cells[key].shape[0]
+        signature.extend(
+            [
+                key,
+                array(cells[key], dtype=int),
+                broadcast_to(array(E[key], dtype=float) / E_ref, (Ne,)),
+                broadcast_to(array(nu[key], dtype=float), (Ne,)),
+                broadcast_to(array(rho[key], dtype=float) / rho_ref, (Ne,)),
+            ]
+        )
+    return signature, E_ref, rho_ref
+
+
+def _is_equal(signature, other):
+    """Compare two signatures (list of arrays and scalars)"""
+    if other is None or len(signature) != len(other):
+        return False
+    for value, value_other in zip(signature, other):
+        if hasattr(value, "shape"):
+            if not array_equal(value, value_other):
+                return False
+        elif value != value_other:
+            return False
+    return True
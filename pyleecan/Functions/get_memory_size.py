@@ -0,0 +1,72 @@
+# -*- coding: utf-8 -*-
+from sys import getsizeof
+from types import BuiltinFunctionType, FunctionType, MethodType, ModuleType
+
+from numpy import ndarray
+
+# Objects without content to explore
+_ATOMIC_TYPES = (str, bytes, bytearray, int, float, complex, bool, type(None), range)
+# Objects that are not part of the data (shared with the rest of the program)
+_SKIP_TYPES = (type, ModuleType, FunctionType, BuiltinFunctionType, MethodType)
+# Attributes to ignore (link to the object that contains the current one)
+_SKIP_ATTR = ["parent", "_parent"]
+
+
+def get_memory_size(obj, seen=None):
+    """Return the memory size of an object including all the objects it
+    contains (ndarray data, SciDataTool objects, lists, dicts...). The parent
+    of the pyleecan objects and the objects already counted are not counted.
+
+    Parameters
+    ----------
+    obj : object
+        object to get the size of
+    seen : set
+        id of the objects already counted (updated), to count the objects shared
+        between several calls only once
+
+    Returns
+    -------
+    size : int
+        memory size [B]
+    """
+    if seen is None:
+        seen = set()
+
+    size = 0
+    obj_list = [obj]  # Objects to explore (no recursion for deep objects)
+    while obj_list:
+        obj = obj_list.pop()
+        if id(obj) in seen or isinstance(obj, _SKIP_TYPES):
+            continue
+        seen.add(id(obj))
+
+        if isinstance(obj, _ATOMIC_TYPES):
+            size += getsizeof(obj)
+        elif isinstance(obj, ndarray):
+            # getsizeof includes the data of the ndarray that own their data
+            size += getsizeof(obj)
+            if obj.base is not None:  # View: count the original array once
+                obj_list.append(obj.base)
+            elif obj.dtype.hasobject:
+                obj_list.extend(obj.ravel().tolist())
+        elif isinstance(obj, dict):
+            size += getsizeof(obj)
+            obj_list.extend(obj.keys())
+            obj_list.extend(obj.values())
+        elif isinstance(obj, (list, tuple, set, frozenset)):
+            size += getsizeof(obj)
+            obj_list.extend(obj)
+        else:
+            # The __sizeof__ of pyleecan and SciDataTool objects already
+            # includes (part of) their properties
+            size += object.__sizeof__(obj)
+            if hasattr(obj, "__dict__"):
+                size += getsizeof(obj.__dict__)
+                for name, value in obj.__dict__.items():
+                    if name not in _SKIP_ATTR:
+                        obj_list.append(value)
+            for name in getattr(type(obj), "__slots__", []):
+                if name not in _SKIP_ATTR and hasattr(obj, name):
+                    obj_list.append(getattr(obj, name))
+    return size
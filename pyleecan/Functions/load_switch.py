@@ -139,6 +139,7 @@ load_switch = {
     "OutGeo": OutGeo,
     "OutGeoLam": OutGeoLam,
     "OutInternal": OutInternal,
+    "OutInterp": OutInterp,
     "OutLoss": OutLoss,
     "OutMag": OutMag,
     "OutMagElmer": OutMagElmer,
@@ -207,6 +208,9 @@ load_switch = {
     "SolutionVector": SolutionVector,
     "SolverInputFile": SolverInputFile,
     "StructElmer": StructElmer,
+    "StructModal": StructModal,
+    "StructModalVibro": StructModalVibro,
+    "StructPlaneStress": StructPlaneStress,
     "Structural": Structural,
     "SurfLine": SurfLine,
     "SurfRing": SurfRing,
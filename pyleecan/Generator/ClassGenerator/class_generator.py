@@ -146,6 +146,9 @@ def generate_class(gen_dict, class_name, path_to_gen):
         class_file.write("import numpy as np\n")
         class_file.write("import random\n")
         import_type_list.remove("function")
+    elif any([prop["type"] in [None, ""] for prop in class_dict["properties"]]):
+        # Properties without type may be ndarray
+        class_file.write("import numpy as np\n")
 
     # Import types from other package
     types_imported = []
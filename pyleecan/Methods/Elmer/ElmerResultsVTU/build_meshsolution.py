@@ -1,7 +1,10 @@
 # -*- coding: utf-8 -*-
-from numpy import arange
+from concurrent.futures import ProcessPoolExecutor
+from itertools import repeat
+from os.path import split, splitext
+
+from numpy import arange, concatenate, empty
 from meshio import read
-from os.path import join, split, splitext
 
 from SciDataTool import DataTime, Data1D, VectorField
 
@@ -16,108 +19,162 @@ from ....Methods.Elmer.ElmerResultsVTU import ElmerResultsVTUError
 # TODO add groups, see get_meshsolution of MagFEMM
 
 
-def build_meshsolution(self):
-    """Get the mesh and solution data from an Elmer VTU results file
+def _read_vtu(file_path, key_list, is_cell_data):
+    """Read the requested data of a VTU file (cell data of all the cell blocks
+    are concatenated), only the arrays are returned to limit the exchanges
+    with the worker processes"""
+    meshvtu = read(file_path)
+    data_dict = dict()
+    if is_cell_data:
+        for key in key_list:
+            if key in meshvtu.cell_data:
+                data_dict[key] = concatenate(meshvtu.cell_data[key], axis=0)
+    else:
+        for key in key_list:
+            if key in meshvtu.point_data:
+                data_dict[key] = meshvtu.point_data[key]
+    return data_dict
+
+
+def build_meshsolution(self, Time=None):
+    """Get the mesh and solution data from Elmer VTU results file(s). If the
+    file_path contains a wildcard, all the time steps are read (in parallel for
+    nb_worker > 1) on the mesh of the first one and stacked in a single
+    time-resolved MeshSolution.
 
     Parameters
     ----------
     self : ElmerResultsVTU
         a ElmerResultsVTU object
+    Time : Data1D
+        Time axis of the steps (default: step index for several files)
 
     Returns
     -------
-    success: bool
-        Information if meshsolution could be created
+    meshsol: MeshSolution
+        a MeshSolution object with the Elmer results
 
     """
-    # create meshsolution
-    meshsol = MeshSolution(label=self.label)
-
-    # get the mesh
-    save_path, fn = split(self.file_path)
-    file_name, file_ext = splitext(fn)
-    if file_ext != ".vtu":
-        raise ElmerResultsVTUError("ElmerResultsVTU: Results file must be of type VTU.")
-
-    meshvtk = MeshVTK(path=save_path, name=file_name, format="vtu")
+    logger = self.get_logger()
+
+    file_list = self.get_file_list()
+    for file_path in file_list:
+        if splitext(file_path)[1] != ".vtu":
+            raise ElmerResultsVTUError(
+                "ElmerResultsVTU: Results file must be of type VTU."
+            )
+    Nt = len(file_list)
+    is_time = Nt > 1 or Time is not None
+
+    # create meshsolution, the mesh of the first step is shared by all the steps
+    meshsol = MeshSolution(label=self.label, is_same_mesh=True)
+    save_path, fn = split(file_list[0])
+    meshvtk = MeshVTK(path=save_path, name=splitext(fn)[0], format="vtu")
     # TODO maybe convert to MeshMat before
     meshsol.mesh = [meshvtk]
 
-    # get the solution data on the mesh
-    meshsolvtu = read(self.file_path)
-    pt_data = meshsolvtu.point_data  # point_data is of type dict
+    # get the solution data of all the steps
+    key_list = list(self.store_dict.keys())
+    args = (file_list, repeat(key_list), repeat(self.is_cell_data))
+    if self.nb_worker is not None and self.nb_worker > 1 and Nt > 1:
+        with ProcessPoolExecutor(max_workers=min(self.nb_worker, Nt)) as executor:
+            data_list = list(executor.map(_read_vtu, *args))
+    else:
+        data_list = list(map(_read_vtu, *args))
 
     # setup axes
-    indices = arange(meshsolvtu.points.shape[0])
-    Indices = Data1D(name="indice", values=indices, is_components=True)
+    Nind = None
+    for value in data_list[0].values():
+        Nind = value.shape[0]
+    if Nind is None:
+        logger.warning("ElmerResultsVTU.build_meshsolution(): No data to store")
+        meshsol.solution = []
+        return meshsol
+    Indices = Data1D(name="indice", values=arange(Nind), is_components=True)
+    if Time is None and is_time:
+        Time = Data1D(name="time", unit="", values=arange(Nt))
+    elif Time is not None and Time.get_length() != Nt:
+        raise ElmerResultsVTUError(
+            "ElmerResultsVTU: "
+            + str(Nt)
+            + " results files for a time axis of size "
+            + str(Time.get_length())
+        )
+    axes = [Time, Indices] if is_time else [Indices]
+    type_cell = "triangle" if self.is_cell_data else "point"
 
     # store only data from store dict if available
     comp_ext = ["x", "y", "z"]
 
     sol_list = []  # list of solutions
 
-    for key, value in pt_data.items():
-        # check if value should be stored
-        if key in self.store_dict.keys():
-            siz = value.shape[1]
-            # only regard max. 3 components
-            if siz > 3:
-                logger.warning(
-                    f'ElmerResultsVTU.build_meshsolution(): size of data "{key}" > 3'
-                    + " - "
-                    + "Data will be truncated."
-                )
-                siz = 3
-
-            components = []
-            comp_name = []
-
-            # loop though components
-            for i in range(siz):
-                # setup name, symbol and component name extension
-                if siz == 1:
-                    ext = ""
-                else:
-                    ext = comp_ext[i]
-
-                # setup data object
-                data = DataTime(
-                    name=self.store_dict[key]["name"] + " " + ext,
-                    unit=self.store_dict[key]["unit"],
-                    symbol=self.store_dict[key]["symbol"] + ext,
-                    axes=[Indices],
-                    values=value[:, i],
-                    normalizations={"ref": self.store_dict[key]["norm"]},
-                )
-                components.append(data)
-                comp_name.append("comp_" + ext)
-
-            # setup solution depending on number of field components
+    for key, value in data_list[0].items():
+        siz = 1 if value.ndim == 1 else value.shape[1]
+        # only regard max. 3 components
+        if siz > 3:
+            logger.warning(
+                f'ElmerResultsVTU.build_meshsolution(): size of data "{key}" > 3'
+                + " - "
+                + "Data will be truncated."
+            )
+            siz = 3
+
+        # stack all the steps in a contiguous array (Nt, Nind, siz)
+        values = empty((Nt, Nind, siz), dtype=value.dtype)
+        for ii, data_dict in enumerate(data_list):
+            values[ii] = data_dict[key].reshape((Nind, -1))[:, :siz]
+        if not is_time:
+            values = values[0]
+
+        components = []
+        comp_name = []
+
+        # loop though components
+        for i in range(siz):
+            # setup name, symbol and component name extension
             if siz == 1:
-                field = components[0]
-                sol_list.append(
-                    SolutionData(
-                        field=field,
-                        type_cell="point",
-                        label=self.store_dict[key]["symbol"],
-                    )
-                )
+                ext = ""
             else:
-                comps = {}
-                for i in range(siz):
-                    comps[comp_name[i]] = components[i]
-                field = VectorField(
-                    name=self.store_dict[key]["name"],
-                    symbol=self.store_dict[key]["symbol"],
-                    components=comps,
+                ext = comp_ext[i]
+
+            # setup data object
+            data = DataTime(
+                name=self.store_dict[key]["name"] + " " + ext,
+                unit=self.store_dict[key]["unit"],
+                symbol=self.store_dict[key]["symbol"] + ext,
+                axes=axes,
+                values=values[..., i],
+                normalizations={"ref": self.store_dict[key]["norm"]},
+            )
+            components.append(data)
+            comp_name.append("comp_" + ext)
+
+        # setup solution depending on number of field components
+        if siz == 1:
+            field = components[0]
+            sol_list.append(
+                SolutionData(
+                    field=field,
+                    type_cell=type_cell,
+                    label=self.store_dict[key]["symbol"],
                 )
-                sol_list.append(
-                    SolutionVector(
-                        field=field,
-                        type_cell="point",
-                        label=self.store_dict[key]["symbol"],
-                    )
+            )
+        else:
+            comps = {}
+            for i in range(siz):
+                comps[comp_name[i]] = components[i]
+            field = VectorField(
+                name=self.store_dict[key]["name"],
+                symbol=self.store_dict[key]["symbol"],
+                components=comps,
+            )
+            sol_list.append(
+                SolutionVector(
+                    field=field,
+                    type_cell=type_cell,
+                    label=self.store_dict[key]["symbol"],
                 )
+            )
 
     meshsol.solution = sol_list
 
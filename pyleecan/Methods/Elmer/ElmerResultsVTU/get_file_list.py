@@ -0,0 +1,37 @@
+# -*- coding: utf-8 -*-
+from glob import glob
+from os.path import basename, splitext
+from re import findall
+
+from ....Methods.Elmer.ElmerResultsVTU import ElmerResultsVTUError
+
+
+def _get_step(file_path):
+    """Return the step number of a VTU file (last integer of the name)"""
+    numbers = findall(r"\d+", splitext(basename(file_path))[0])
+    return int(numbers[-1]) if numbers else -1
+
+
+def get_file_list(self):
+    """Get the list of VTU files to read: the file_path itself or all the
+    files matching its wildcard, sorted by step number (step_t10 after step_t9)
+
+    Parameters
+    ----------
+    self : ElmerResultsVTU
+        a ElmerResultsVTU object
+
+    Returns
+    -------
+    file_list: [str]
+        list of the VTU files
+    """
+    if "*" not in self.file_path:
+        return [self.file_path]
+
+    file_list = sorted(glob(self.file_path), key=_get_step)
+    if len(file_list) == 0:
+        raise ElmerResultsVTUError(
+            "ElmerResultsVTU: No results file matching " + self.file_path
+        )
+    return file_list
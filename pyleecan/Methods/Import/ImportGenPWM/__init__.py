@@ -0,0 +1,8 @@
+# -*- coding: utf-8 -*-
+from ....Methods.Import import ImportError
+
+
+class PWMHarmError(ImportError):
+    """Raised when the PWM parameters are not supported by the analytical spectrum"""
+
+    pass
@@ -0,0 +1,63 @@
+# -*- coding: utf-8 -*-
+
+from SciDataTool import Data1D, DataFreq
+from ....Functions.Electrical.comp_PWM import comp_volt_PWM_harm
+from ....Functions.Winding.gen_phase_list import gen_name
+from ....Methods.Import.ImportGenPWM import PWMHarmError
+
+
+def comp_harmonics(self, fmax=None, Nn=200, Ny=2048):
+    """Compute the PWM phase voltage harmonics analytically (double Fourier
+    series, cf comp_volt_PWM_harm) without generating the time signal
+
+    Parameters
+    ----------
+    self : ImportGenPWM
+        An ImportGenPWM object
+    fmax : float
+        Maximum frequency to compute [Hz] (default: 4 * switching frequency)
+    Nn : int
+        Number of sidebands on each side of the carrier harmonics
+        (the discontinuous PWM strategies have slowly decreasing sidebands)
+    Ny : int
+        Number of points per fundamental period for DPWM/SVPWM references
+
+    Returns
+    -------
+    Us: DataFreq
+        Phase voltages spectrum (single-sided complex amplitude) [V]
+
+    """
+
+    if self.fmode != 0 or self.fswimode != 0:
+        raise PWMHarmError(
+            "ERROR: ImportGenPWM.comp_harmonics requires a fixed speed and switching frequency (fmode=0, fswimode=0)"
+        )
+    if self.type_carrier in [1, 2, 3]:
+        raise PWMHarmError(
+            "ERROR: ImportGenPWM.comp_harmonics requires a symmetrical carrier (type_carrier not in [1, 2, 3])"
+        )
+
+    freqs, Vharm = comp_volt_PWM_harm(
+        freq0=self.f,
+        fswi=self.fswi,
+        qs=3,
+        Vdc1=self.Vdc1,
+        U0=self.U0,
+        rot_dir=-1,
+        type_DPWM=self.typePWM,
+        PF_angle=0,
+        fmax=fmax,
+        Nn=Nn,
+        Ny=Ny,
+    )
+
+    Phase = Data1D(name="phase", unit="", values=gen_name(3), is_components=True)
+    Freqs = Data1D(name="freqs", unit="Hz", values=freqs)
+    return DataFreq(
+        name="Stator voltage",
+        unit="V",
+        symbol="Us",
+        axes=[Phase, Freqs],
+        values=Vharm,
+    )
@@ -0,0 +1,60 @@
+# -*- coding: utf-8 -*-
+
+import numpy as np
+
+
+def comp_spectrum(self, freqs=None, fmax=None, Nt_chunk=None, Nmax_mem=2 ** 22):
+    """Compute the PWM phase voltage spectrum without storing the time signal
+
+    The Fourier coefficients at the requested frequencies are accumulated
+    block by block (cf get_data_chunks), the memory is bounded by
+    Nmax_mem complex values whatever the signal duration.
+
+    Parameters
+    ----------
+    self : ImportGenPWM
+        An ImportGenPWM object
+    freqs : ndarray
+        Frequencies to compute [Hz] (default: multiples of 1/duration up to fmax)
+    fmax : float
+        Maximum frequency if freqs is None [Hz] (default: 4 * switching frequency)
+    Nt_chunk : int
+        Number of time samples per block (default: computed from Nmax_mem)
+    Nmax_mem : int
+        Maximum size of the (Nt_chunk, Nfreq) Fourier kernel
+
+    Returns
+    -------
+    freqs: ndarray
+        Frequency vector [Hz]
+    Vspec: ndarray
+        Complex single-sided amplitude of the phase voltages (3, Nfreq) [V]
+
+    """
+
+    Nt = int(self.fs * self.duration)
+    dt = self.duration / (Nt - 1) if Nt > 1 else 0
+
+    if freqs is None:
+        if fmax is None:
+            fmax = 4 * max(self.fswi, self.fswi_max if self.fswimode == 1 else 0)
+        df = 1 / self.duration
+        freqs = np.arange(0, fmax + df / 2, df)
+    freqs = np.asarray(freqs, dtype=float)
+    Nf = freqs.size
+
+    if Nt_chunk is None:
+        Nt_chunk = max(1, min(Nt, Nmax_mem // max(Nf, 1)))
+
+    # Kernel of the first block, the other blocks are phase shifted
+    w = -2j * np.pi * freqs * dt
+    kernel = np.exp(np.outer(np.arange(Nt_chunk), w))
+    Vspec = np.zeros((3, Nf), dtype=complex)
+    for i_start, PWM in self.get_data_chunks(Nt_chunk=Nt_chunk, is_int8=True):
+        Nblock = PWM.shape[0]
+        Vspec += np.exp(i_start * w)[None, :] * PWM.T.dot(kernel[:Nblock, :])
+
+    # Switching states to phase voltage, single-sided amplitude
+    Vspec *= self.Vdc1 / 2 / Nt
+    Vspec[:, freqs > 0] *= 2
+    return freqs, Vspec
@@ -7,16 +7,19 @@ Created on Tue Jul 28 11:57:25 2020
 
 
 import numpy as np
-from ....Functions.Electrical.comp_PWM import comp_volt_PWM_NUM
 
 
-def get_data(self):
+def get_data(self, is_int8=False, Nt_chunk=2 ** 18):
     """Generate the PWM matrix
 
     Parameters
     ----------
     self : ImportGenPWM
         An ImportGenPWM object
+    is_int8 : bool
+        True to return the switching states (-1/1) as int8
+    Nt_chunk : int
+        Maximum number of time samples computed at once (cf get_data_chunks)
 
     Returns
     -------
@@ -24,29 +27,8 @@ def get_data(self):
         The generated PWM matrix
 
     """
-    # Tpwmu=np.arange(fs*duration)/fs,
-    Tpwmu = np.linspace(0, self.duration, self.fs * self.duration, endpoint=True)
-    v_pwm, Vas, M_I = comp_volt_PWM_NUM(
-        Tpwmu=Tpwmu,
-        freq0=self.f,
-        freq0_max=self.fmax,
-        fmode=self.fmode,
-        fswimode=self.fswimode,
-        fswi=self.fswi,
-        fswi_max=self.fswi_max,
-        qs=3,
-        Vdc1=self.Vdc1,
-        U0=self.U0,
-        type_carrier=self.type_carrier,
-        rot_dir=-1,
-        type_DPWM=self.typePWM,
-        PF_angle=0,
-        is_plot=False,
-    )
-
-    ref = np.zeros(np.size(v_pwm[0])).astype(np.float32)
-    PWM1 = np.where(v_pwm[0] < ref, -1, 1)  # .astype(np.float32)
-    PWM2 = np.where(v_pwm[1] < ref, -1, 1)  # .astype(np.float32)
-    PWM3 = np.where(v_pwm[2] < ref, -1, 1)  # .astype(np.float32)
-    Triphase = np.column_stack([PWM1, PWM2, PWM3])
+    Nt = int(self.fs * self.duration)
+    Triphase = np.zeros((Nt, 3), dtype=np.int8 if is_int8 else int)
+    for i_start, PWM in self.get_data_chunks(Nt_chunk=Nt_chunk, is_int8=is_int8):
+        Triphase[i_start : i_start + PWM.shape[0], :] = PWM
     return Triphase
@@ -0,0 +1,61 @@
+# -*- coding: utf-8 -*-
+
+import numpy as np
+from ....Functions.Electrical.comp_PWM import comp_volt_PWM_NUM
+
+
+def get_data_chunks(self, Nt_chunk=2 ** 18, is_int8=False):
+    """Generate the PWM matrix block by block (generator)
+
+    Each block is computed on its own slice of the time vector used by
+    get_data so that the carrier and reference phases are continuous between
+    blocks, while the memory used by the intermediate signals is bounded by
+    Nt_chunk.
+
+    Parameters
+    ----------
+    self : ImportGenPWM
+        An ImportGenPWM object
+    Nt_chunk : int
+        Maximum number of time samples per block
+    is_int8 : bool
+        True to return the switching states (-1/1) as int8
+
+    Returns
+    -------
+    i_start: int
+        Index of the first time sample of the block
+    matrix: ndarray
+        The PWM matrix of the block (min(Nt_chunk, Nt_left), 3)
+
+    """
+
+    Nt = int(self.fs * self.duration)
+    # Same time vector as linspace(0, duration, Nt, endpoint=True)
+    dt = self.duration / (Nt - 1) if Nt > 1 else 0
+    dtype = np.int8 if is_int8 else int
+
+    for i_start in range(0, Nt, Nt_chunk):
+        i_end = min(i_start + Nt_chunk, Nt)
+        Tpwmu = np.arange(i_start, i_end) * dt
+        if i_end == Nt:
+            Tpwmu[-1] = self.duration
+        v_pwm = comp_volt_PWM_NUM(
+            Tpwmu=Tpwmu,
+            freq0=self.f,
+            freq0_max=self.fmax,
+            fmode=self.fmode,
+            fswimode=self.fswimode,
+            fswi=self.fswi,
+            fswi_max=self.fswi_max,
+            qs=3,
+            Vdc1=self.Vdc1,
+            U0=self.U0,
+            type_carrier=self.type_carrier,
+            rot_dir=-1,
+            type_DPWM=self.typePWM,
+            PF_angle=0,
+            is_plot=False,
+            Tf=self.duration,
+        )[0]
+        yield i_start, np.where(v_pwm.T < 0, -1, 1).astype(dtype, copy=False)
@@ -1,14 +1,59 @@
 # -*- coding: utf-8 -*-
 
-import quadpy
+import numpy as np
+
+# Symmetric quadrature rules of the reference triangle (0,0), (1,0), (0,1):
+# nb of points: (degree of exactness, [(weight, barycentric coordinates), ...])
+# Strang & Fix / Dunavant rules, the weights sum to the area of the triangle
+_A6, _B6 = 0.445948490915965, 0.091576213509771
+_A7, _B7 = 0.470142064105115, 0.101286507323456
+TRI_RULES = {
+    1: (1, [(1 / 2, (1 / 3, 1 / 3, 1 / 3))]),
+    3: (2, [(1 / 6, (2 / 3, 1 / 6, 1 / 6))]),
+    4: (3, [(-27 / 96, (1 / 3, 1 / 3, 1 / 3)), (25 / 96, (0.6, 0.2, 0.2))]),
+    6: (
+        4,
+        [
+            (0.223381589678011 / 2, (1 - 2 * _A6, _A6, _A6)),
+            (0.109951743655322 / 2, (1 - 2 * _B6, _B6, _B6)),
+        ],
+    ),
+    7: (
+        5,
+        [
+            (0.225 / 2, (1 / 3, 1 / 3, 1 / 3)),
+            (0.132394152788506 / 2, (1 - 2 * _A7, _A7, _A7)),
+            (0.125939180544827 / 2, (1 - 2 * _B7, _B7, _B7)),
+        ],
+    ),
+}
 
 
 def get_gauss_points(self):
-    """Return the gauss points and weights for Triangle3 cell"""
+    """Return the gauss points and weights for Triangle3 cell
+    (available number of points: 1, 3, 4, 6 or 7 for an exact integration of
+    polynomials of degree 1, 2, 3, 4 or 5)"""
 
     nb_gauss_points = self.nb_gauss_point
-    scheme = quadpy.tn.grundmann_moeller(2, nb_gauss_points)
-    gauss_pts = scheme.points
-    weights = scheme.weights
+    if nb_gauss_points not in TRI_RULES:
+        raise ValueError(
+            "FPGNTri: "
+            + str(nb_gauss_points)
+            + " gauss points rule not available (available: "
+            + str(list(TRI_RULES.keys()))
+            + ")"
+        )
+
+    gauss_pts = list()
+    weights = list()
+    for weight, bary in TRI_RULES[nb_gauss_points][1]:
+        # all the distinct permutations of the barycentric coordinates
+        perm_list = list()
+        for ii in range(3):
+            perm = (bary[ii], bary[(ii + 1) % 3])
+            if perm not in perm_list:
+                perm_list.append(perm)
+        gauss_pts.extend(perm_list)
+        weights.extend([weight] * len(perm_list))
 
-    return gauss_pts, weights, nb_gauss_points
+    return np.array(gauss_pts), np.array(weights), nb_gauss_points
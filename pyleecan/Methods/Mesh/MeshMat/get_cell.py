@@ -1,5 +1,5 @@
 # -*- coding: utf-8 -*-
-import collections
+import collections.abc
 
 import numpy as np
 
@@ -20,7 +20,7 @@ def get_cell(self, indices=None):
         Dict of connectivities
 
     """
-    if not isinstance(indices, collections.Iterable) and indices is not None:
+    if not isinstance(indices, collections.abc.Iterable) and indices is not None:
         indices = (indices,)
 
     cells = dict()
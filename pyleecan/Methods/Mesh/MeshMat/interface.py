@@ -1,19 +1,23 @@
 # -*- coding: utf-8 -*-
-from ....Classes.NodeMat import NodeMat
+
 from ....Classes.CellMat import CellMat
 from ....Classes.Interpolation import Interpolation
 from ....Classes.FPGNSeg import FPGNSeg
 from ....Classes.ScalarProductL2 import ScalarProductL2
 from ....Classes.RefSegmentP1 import RefSegmentP1
-
-from ....definitions import PACKAGE_NAME
-from collections import Counter
 import numpy as np
 from itertools import combinations
 
 
+def _edge_key(node1, node2, nb_key):
+    """Return a unique integer for each edge whatever the order of its nodes"""
+    return np.minimum(node1, node2) * nb_key + np.maximum(node1, node2)
+
+
 def interface(self, other_mesh):
     """Define a MeshMat object corresponding to the exact intersection between two meshes (nodes must be in both meshes).
+    The edges of both meshes are hashed (sorted node pairs) so that the common
+    edges are found with a single array intersection per pair of cell sides.
 
     Parameters
     ----------
@@ -22,22 +26,19 @@ def interface(self, other_mesh):
     other_mesh : Mesh
         an other Mesh object
 
-        Returns
+    Returns
     -------
+    new_mesh : MeshMat
+        a Mesh object with the "line" cells of the interface
     """
 
-    # Dynamic import
     new_mesh = self.copy()
     new_mesh._is_renum = True
-
-    # new_mesh.node = NodeMat()
     new_mesh.cell = dict()
 
     for key in self.cell:
-
         # Developer info: IDK if this code works with other than triangle cells. To be checked.
         if self.cell[key].nb_node_per_cell == 3:  # Triangle case
-
             new_mesh.cell["line"] = CellMat(nb_node_per_cell=2)
             interp = Interpolation()
             interp.gauss_point = FPGNSeg()
@@ -45,63 +46,39 @@ def interface(self, other_mesh):
             interp.scalar_product = ScalarProductL2()
             new_mesh.cell["line"].interpolation = interp
 
-            connect = self.cell[key].get_connectivity()
-            connect2 = other_mesh.cell[key].get_connectivity()
-
-            nodes_tags = np.unique(connect)
-            other_nodes_tags = np.unique(connect2)
-
-            # Find the nodes on the interface (they are in both in and out)
-            interface_nodes_tags = np.intersect1d(nodes_tags, other_nodes_tags)
-            nb_interf_nodes = len(interface_nodes_tags)
-
-            comb = combinations(range(self.cell[key].nb_node_per_cell), 2)
-
-            for duo in list(comb):
-                col1i = np.mod(duo[0], 3)
-                col2i = np.mod(duo[1], 3)
-                col1 = connect[:, col1i]
-                col2 = connect[:, col2i]
-
-                col1_bin = np.zeros(len(col1))
-                col2_bin = np.zeros(len(col1))
-
-                for node in interface_nodes_tags:
-                    Icol1i = np.where(col1 == node)[0]
-                    Icol2i = np.where(col2 == node)[0]
-                    col1_bin[Icol1i] = 1
-                    col2_bin[Icol2i] = 1
-
-                # Position in vector where 2 nodes of the same element are on the interface (potential line element)
-                I_target = np.where(col1_bin + col2_bin == 2)[0]
-
-                comb2 = combinations(range(other_mesh.cell[key].nb_node_per_cell), 2)
-                for duo2 in list(comb2):
-                    col1j = np.mod(duo2[0], 3)
-                    col2j = np.mod(duo2[1], 3)
-                    col12 = connect2[:, col1j]
-                    col22 = connect2[:, col2j]
-
-                    col12_bin = np.zeros(len(col12))
-                    col22_bin = np.zeros(len(col12))
-
-                    for node in interface_nodes_tags:
-                        Icol1i = np.where(col12 == node)[0]
-                        Icol2i = np.where(col22 == node)[0]
-                        col12_bin[Icol1i] = 1
-                        col22_bin[Icol2i] = 1
-
-                    # Same but in the second mesh
-                    I_target2 = np.where(col12_bin + col22_bin == 2)[0]
-
-                    for itag in I_target2:
-                        e_tag1 = col12[itag]
-                        e_tag2 = col22[itag]
-                        Iline = np.where(
-                            ((col1[I_target] == e_tag1) & (col2[I_target] == e_tag2))
-                            | ((col2[I_target] == e_tag1) & (col1[I_target] == e_tag2))
-                        )[0]
-                        if Iline.size != 0:
-                            new_mesh.add_cell([e_tag1, e_tag2], "line")
+            connect = np.array(self.cell[key].get_connectivity(), dtype=int)
+            connect = connect.reshape((-1, 3))
+            connect2 = np.array(other_mesh.cell[key].get_connectivity(), dtype=int)
+            connect2 = connect2.reshape((-1, 3))
+            if connect.size == 0 or connect2.size == 0:
+                continue
+            nb_key = max(connect.max(), connect2.max()) + 1
+
+            # Edges of the other mesh that are also edges of self, in the order
+            # of the sides of self, then of the sides and cells of other mesh
+            edge_list = list()
+            for duo in combinations(range(3), 2):
+                key_self = _edge_key(connect[:, duo[0]], connect[:, duo[1]], nb_key)
+                for duo2 in combinations(range(3), 2):
+                    col12 = connect2[:, duo2[0]]
+                    col22 = connect2[:, duo2[1]]
+                    key_other = _edge_key(col12, col22, nb_key)
+                    Iline = np.nonzero(np.isin(key_other, key_self))[0]
+                    edge_list.append(
+                        np.array([col12[Iline], col22[Iline], key_other[Iline]]).T
+                    )
+            edges = np.concatenate(edge_list, axis=0)
+
+            # Each edge is kept once (first occurrence)
+            _, Ifirst = np.unique(edges[:, 2], return_index=True)
+            edges = edges[np.sort(Ifirst), :2]
+
+            if edges.shape[0] > 0:
+                # Same convention as add_cell: 1D connectivity for a single cell
+                if edges.shape[0] == 1:
+                    edges = edges[0]
+                new_mesh.cell["line"].connectivity = edges
+                new_mesh.cell["line"].nb_cell = edges.size // 2
+                new_mesh.cell["line"].indice = np.arange(edges.size // 2)
 
     return new_mesh
@@ -0,0 +1,7 @@
+# -*- coding: utf-8 -*-
+
+
+class MeshSolutionError(Exception):
+    """Raised when a MeshSolution operation is not possible"""
+
+    pass
@@ -5,7 +5,46 @@ import numpy as np
 from pyleecan.Classes.CellMat import CellMat
 from pyleecan.Classes.MeshMat import MeshMat
 from pyleecan.Classes.NodeMat import NodeMat
-from pyleecan.Classes.SolutionMat import SolutionMat
+from pyleecan.Methods.Mesh.NodeMat import get_position
+
+
+def _extract_mesh(mesh_init, cell_indice, label):
+    """Return the sub mesh with the cells of cell_indice (and the used nodes)
+    and the indices of the selected cells for each cell type"""
+    mesh_new = MeshMat(
+        _is_renum=True, sym=mesh_init.sym, is_antiper_a=mesh_init.is_antiper_a
+    )
+    mesh_new.label = label
+    indice_dict = dict()
+    node_indice = list()
+    for key, cell in mesh_init.cell.items():
+        indice = np.array(cell.indice, dtype=int).ravel()
+        connect = np.array(cell.get_connectivity(), dtype=int).reshape(
+            (indice.size, cell.nb_node_per_cell)
+        )
+        # selected cells sorted by indice
+        Isel = np.nonzero(np.isin(indice, cell_indice))[0]
+        Isel = Isel[np.argsort(indice[Isel], kind="stable")]
+        indice_dict[key] = indice[Isel]
+        mesh_new.cell[key] = CellMat(
+            connectivity=connect[Isel],
+            nb_cell=Isel.size,
+            nb_node_per_cell=cell.nb_node_per_cell,
+            indice=indice[Isel],
+            interpolation=cell.interpolation,
+        )
+        node_indice.append(connect[Isel].ravel())
+    node_indice = np.unique(np.concatenate(node_indice))
+
+    # only the used nodes are kept
+    node_init = mesh_init.node
+    pos, _ = get_position(node_init.indice, node_indice)
+    mesh_new.node = NodeMat(
+        coordinate=node_init.coordinate[pos],
+        nb_node=node_indice.size,
+        indice=node_indice,
+    )
+    return mesh_new, indice_dict, node_indice
 
 
 def get_group(self, group_names):
@@ -16,7 +55,7 @@ def get_group(self, group_names):
      ----------
      self : MeshSolution
          an MeshSolution object
-     group_name : [str]
+     group_names : [str]
          list of the name of the group(s) (e.g. ["stator"])
 
      Returns
@@ -25,6 +64,14 @@ def get_group(self, group_names):
          a new MeshSolution object which is subpart of self
     """
 
+    if isinstance(group_names, str) and group_names not in self.group:
+        raise KeyError(
+            group_names
+            + " group doesn't exist (available groups: "
+            + str(list(self.group.keys()))
+            + ")"
+        )
+
     is_same_mesh = self.is_same_mesh
     dimension = self.dimension
 
@@ -40,50 +87,22 @@ def get_group(self, group_names):
                 # The groups before and after "/" are stored in different lists
                 # to perform the interface.
                 is_interface = True
-                group_indices_init = group_indices.copy()
+                sep_list.append(np.array(group_indices, dtype=int))
                 group_indices = list()
-                sep_list.append(group_indices_init)
             else:
-                group_indices.extend(self.group[grp])
+                group_indices.extend(np.array(self.group[grp]).ravel().tolist())
                 label = label + grp + "_"
     elif isinstance(group_names, str):
-        if group_names not in self.group:
-            raise KeyError(
-                group_names
-                + " group doesn't exist (available groups: "
-                + str(list(self.group.keys()))
-                + ")"
-            )
-        group_indices.extend(self.group[group_names])
+        group_indices.extend(np.array(self.group[group_names]).ravel().tolist())
         label = label + group_names
 
-    sep_list.append(np.sort(group_indices))
+    sep_list.append(np.array(group_indices, dtype=int))
 
     # 2) extract the corresponding connectivity and create a new mesh
     mesh_init = self.get_mesh()
-    node_init = mesh_init.get_node()
     mesh_list = list()
     for sep in sep_list:
-        connect_dict, nb_cell, indice_dict = mesh_init.get_cell(sep)
-
-        node_indice = list()
-        mesh_new = MeshMat(
-            _is_renum=True, sym=mesh_init.sym, is_antiper_a=mesh_init.is_antiper_a
-        )
-        for key in connect_dict:
-            node_indice.extend(np.unique(connect_dict[key]))
-            mesh_new.cell[key] = CellMat(
-                connectivity=connect_dict[key],
-                nb_cell=len(connect_dict[key]),
-                nb_node_per_cell=mesh_init.cell[key].nb_node_per_cell,
-                indice=indice_dict[key],
-                interpolation=mesh_init.cell[key].interpolation,
-            )
-        node_indice = np.unique(node_indice)
-
-        mesh_new.node = NodeMat(init_dict=mesh_init.node.as_dict())
-        mesh_new.label = label
-
+        mesh_new, indice_dict, node_indice = _extract_mesh(mesh_init, sep, label)
         mesh_list.append(mesh_new)
 
     # 3) if interface, create the corresponding new mesh (e.g. with triangle mesh,
@@ -106,7 +125,7 @@ def get_group(self, group_names):
         if type_cell_sol == "node":
             new_sol = sol.get_solution(indice=node_indice.tolist())
         elif not is_interface:  # Interface is only available for node solution.
-            new_sol = sol.get_solution(indice=indice_dict[type_cell_sol])
+            new_sol = sol.get_solution(indice=indice_dict[type_cell_sol].tolist())
 
         if new_sol is not None:
             sol_list.append(new_sol)
@@ -116,15 +135,16 @@ def get_group(self, group_names):
         mesh_interface.clear_node()
         mesh = mesh_interface
     else:
-        mesh_new.clear_node()
         mesh = mesh_new
 
-    meshsol_grp = self.copy()
-    meshsol_grp.label = label
-    meshsol_grp.mesh = [mesh]
-    meshsol_grp.is_same_mesh = is_same_mesh
-    meshsol_grp.solution = sol_list
-    meshsol_grp.dimension = dimension
+    meshsol_grp = type(self)(
+        label=label,
+        mesh=[mesh],
+        is_same_mesh=is_same_mesh,
+        solution=sol_list,
+        dimension=dimension,
+        path=self.path,
+    )
     meshsol_grp.group = self.group
 
     return meshsol_grp
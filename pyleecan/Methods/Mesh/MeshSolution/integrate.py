@@ -0,0 +1,221 @@
+# -*- coding: utf-8 -*-
+from math import ceil
+
+import numpy as np
+
+from ....Classes.FPGNSeg import FPGNSeg
+from ....Classes.FPGNTri import FPGNTri
+from ....Classes.RefLine3 import RefLine3
+from ....Classes.RefQuad4 import RefQuad4
+from ....Classes.RefQuad9 import RefQuad9
+from ....Classes.RefSegmentP1 import RefSegmentP1
+from ....Classes.RefTriangle3 import RefTriangle3
+from ....Classes.RefTriangle6 import RefTriangle6
+from ....Classes.SolutionMat import SolutionMat
+from ....Methods.Mesh.NodeMat import get_position
+from . import MeshSolutionError
+
+# Default reference cell of the cell types (if no interpolation is defined)
+REF_CELL_DICT = {
+    "triangle": RefTriangle3,
+    "triangle3": RefTriangle3,
+    "triangle6": RefTriangle6,
+    "quad": RefQuad4,
+    "quad4": RefQuad4,
+    "quad9": RefQuad9,
+    "line": RefSegmentP1,
+    "line3": RefLine3,
+}
+# Number of points of the triangle rule for each polynomial order (cf FPGNTri)
+TRI_NB_POINT = [1, 1, 3, 4, 6, 7]
+# Max number of values at the gauss points computed at once
+CHUNK_SIZE = int(1e7)
+
+
+def _get_ref_cell(key, cell):
+    """Return the reference cell of a cell type"""
+    interp = cell.interpolation
+    if interp is not None and interp.ref_cell is not None:
+        return interp.ref_cell
+    if key not in REF_CELL_DICT:
+        raise MeshSolutionError("No reference cell for the cells '" + key + "'")
+    return REF_CELL_DICT[key]()
+
+
+def _get_gauss_points(ref_cell, order):
+    """Return the gauss points and weights to integrate exactly the polynomials
+    of the given order on the reference cell"""
+    if isinstance(ref_cell, (RefTriangle3, RefTriangle6)):
+        nb_pt = TRI_NB_POINT[min(max(order, 0), len(TRI_NB_POINT) - 1)]
+        gauss_pts, weights, _ = FPGNTri(nb_gauss_point=nb_pt).get_gauss_points()
+        return gauss_pts, weights
+
+    nb_pt = max(1, ceil((order + 1) / 2))
+    gauss_pts, weights, _ = FPGNSeg(nb_gauss_point=nb_pt).get_gauss_points()
+    if isinstance(ref_cell, (RefQuad4, RefQuad9)):  # tensor product rule
+        x, y = np.meshgrid(gauss_pts[:, 0], gauss_pts[:, 0], indexing="ij")
+        gauss_pts = np.array([x.ravel(), y.ravel()]).T
+        weights = np.outer(weights, weights).ravel()
+    return gauss_pts, weights
+
+
+def _get_field(sol, mesh):
+    """Return the field values with the indice axis first, the indices and the
+    names of the other axes"""
+    axes_name, _ = sol.get_axes_list()
+    if axes_name is None or "indice" not in axes_name:
+        raise MeshSolutionError("The solution '" + str(sol.label) + "' has no indice")
+    args = [name for name in axes_name if name != "component"]
+    field = np.asarray(sol.get_field(*args, is_squeeze=False))
+    ind_axis = axes_name.index("indice")
+    field = np.moveaxis(field, ind_axis, 0)
+    other_name = [name for name in axes_name if name != "indice"]
+
+    indice = None
+    if isinstance(sol, SolutionMat):
+        indice = sol.indice
+    else:
+        axes = sol.field.get_axes()
+        for axis in axes:
+            if axis.name == "indice":
+                indice = axis.get_values()
+    if indice is None:  # values in the order of the mesh nodes/cells
+        if sol.type_cell == "node":
+            indice = mesh.node.indice
+        else:
+            indice = mesh.cell[sol.type_cell].indice
+    return field, np.array(indice, dtype=int).ravel(), other_name
+
+
+def _integrate(meshsol, sol, group, order, fct=None):
+    """Integrate fct(field) over the cells of the group (all the cells if None)
+
+    Returns
+    -------
+    result : ndarray
+        integral of fct(field) (other axes of the field)
+    measure : float
+        area (length for line cells) of the integration domain
+    other_name : [str]
+        name of the axes of result
+    """
+    mesh = meshsol.get_mesh()
+    field, indice, other_name = _get_field(sol, mesh)
+    if fct is None:
+        fct = lambda value: value
+
+    # Selected cells
+    if group is None:
+        cell_sel = None
+    else:
+        if isinstance(group, str):
+            group = [group]
+        cell_sel = list()
+        for grp in group:
+            if grp not in meshsol.group:
+                raise MeshSolutionError(
+                    grp
+                    + " group doesn't exist (available groups: "
+                    + str(list(meshsol.group.keys()))
+                    + ")"
+                )
+            cell_sel.append(np.array(meshsol.group[grp], dtype=int).ravel())
+        cell_sel = np.concatenate(cell_sel)
+
+    # Integration over the cells of the highest dimension (node solution) or
+    # over the cells of the solution
+    cell_list = list()
+    for key, cell in mesh.cell.items():
+        if cell.nb_cell == 0 or (sol.type_cell not in ["node", key]):
+            continue
+        ref_cell = _get_ref_cell(key, cell)
+        dim_ref = ref_cell.grad_shape_function_batch(np.zeros(2)).shape[0]
+        cell_list.append((dim_ref, key, cell, ref_cell))
+    if len(cell_list) == 0:
+        raise MeshSolutionError(
+            "No cell to integrate the solution '" + str(sol.label) + "'"
+        )
+    dim_max = max([dim_ref for dim_ref, _, _, _ in cell_list])
+
+    result = 0
+    measure = 0
+    for dim_ref, key, cell, ref_cell in cell_list:
+        if dim_ref < dim_max:
+            continue
+        cell_indice = np.array(cell.indice, dtype=int).ravel()
+        connect = np.array(cell.get_connectivity(), dtype=int).reshape(
+            (cell_indice.size, cell.nb_node_per_cell)
+        )
+        if cell_sel is not None:
+            Isel = np.isin(cell_indice, cell_sel)
+            cell_indice, connect = cell_indice[Isel], connect[Isel]
+        if cell_indice.size == 0:
+            continue
+
+        gauss_pts, weights = _get_gauss_points(ref_cell, order)
+        vertice = mesh.get_node(connect)
+        _, detJ = ref_cell.jacobian_batch(gauss_pts, vertice)
+        w_dJ = np.abs(detJ) * weights[np.newaxis, :]  # (Ncell, Ngauss)
+        measure += np.sum(w_dJ)
+
+        # Position of the values of each cell in the field
+        if sol.type_cell == "node":
+            pos, is_found = get_position(indice, connect)
+            func = ref_cell.shape_function_batch(gauss_pts)  # (Ngauss, Nnode)
+        else:
+            pos, is_found = get_position(indice, cell_indice)
+        if not np.all(is_found):
+            raise MeshSolutionError(
+                "The solution '" + str(sol.label) + "' is not defined on all the cells"
+            )
+
+        # Values at the gauss points (Ngauss, Ncell, ...) by chunks of cells
+        nb_value = max(1, int(np.prod(field.shape[1:])) * weights.size)
+        nb_chunk = max(1, CHUNK_SIZE // nb_value)
+        for start in range(0, cell_indice.size, nb_chunk):
+            stop = start + nb_chunk
+            if sol.type_cell == "node":
+                value = np.tensordot(func, field[pos[start:stop]], axes=([1], [1]))
+            else:
+                value = field[np.newaxis, pos[start:stop]]
+                value = np.broadcast_to(value, (weights.size,) + value.shape[1:])
+            result = result + np.tensordot(
+                w_dJ[start:stop].T, fct(value), axes=([0, 1], [0, 1])
+            )
+
+    return result, measure, other_name
+
+
+def integrate(self, label=None, index=None, group=None, order=2, is_average=False):
+    """Integrate a solution over the cells of the mesh (or of some groups) with
+    the gauss quadrature of the cells, for all the other axes (time,
+    component...) at once. Node solutions are interpolated with the shape
+    functions, cell solutions are constant on each cell.
+
+    Parameters
+    ----------
+    self : MeshSolution
+        a MeshSolution object
+    label : str
+        label of the solution
+    index : int
+        index of the solution
+    group : str or [str]
+        name of the group(s) of cells to integrate over (default: all the cells)
+    order : int
+        polynomial order to integrate exactly
+    is_average : bool
+        True to divide by the area (length for line cells) of the domain
+
+    Returns
+    -------
+    result : ndarray
+        integral of the solution (axes of the solution without "indice")
+    """
+
+    sol = self.get_solution(label=label, index=index)
+    result, measure, _ = _integrate(self, sol, group, order)
+    if is_average:
+        result = result / measure
+
+    return result
@@ -0,0 +1,44 @@
+# -*- coding: utf-8 -*-
+
+import numpy as np
+
+from .integrate import _integrate
+
+
+def norm(self, label=None, index=None, group=None, order=2, is_rms=False):
+    """Return the L2 norm sqrt(integral(|F|**2)) of a solution over the cells of
+    the mesh (or of some groups) for all the other axes (time...) at once, the
+    components of vector solutions being summed.
+
+    Parameters
+    ----------
+    self : MeshSolution
+        a MeshSolution object
+    label : str
+        label of the solution
+    index : int
+        index of the solution
+    group : str or [str]
+        name of the group(s) of cells to integrate over (default: all the cells)
+    order : int
+        polynomial order to integrate exactly (of |F|**2)
+    is_rms : bool
+        True to divide by the area (length for line cells) of the domain
+        (root mean square value)
+
+    Returns
+    -------
+    result : ndarray
+        norm of the solution (axes of the solution without "indice" and "component")
+    """
+
+    sol = self.get_solution(label=label, index=index)
+    result, measure, other_name = _integrate(
+        self, sol, group, order, fct=lambda value: np.abs(value) ** 2
+    )
+    if "component" in other_name:
+        result = np.sum(result, axis=other_name.index("component"))
+    if is_rms:
+        result = result / measure
+
+    return np.sqrt(result)
@@ -0,0 +1,32 @@
+# -*- coding: utf-8 -*-
+
+from numpy import argsort, array, clip, searchsorted, zeros
+
+
+def get_position(indice, node_indice):
+    """Return the position of node indices in the array of the mesh node
+    indices (any shape, e.g. a connectivity), with a single sort of the mesh
+    indices instead of a search per node
+
+    Parameters
+    ----------
+    indice : ndarray
+        indices of all the nodes of the mesh (Nn)
+    node_indice : ndarray
+        indices of the targeted nodes
+
+    Returns
+    -------
+    pos : ndarray
+        position of each targeted node (same shape as node_indice)
+    is_found : ndarray
+        False for the node indices that are not in the mesh
+    """
+    node_indice = array(node_indice, dtype=int)
+    if indice is None or indice.size == 0:
+        return zeros(node_indice.shape, dtype=int), zeros(node_indice.shape, dtype=bool)
+    sorter = argsort(indice, kind="stable")
+    pos_sort = searchsorted(indice, node_indice, sorter=sorter)
+    pos = sorter[clip(pos_sort, 0, indice.size - 1)]
+    is_found = indice[pos] == node_indice
+    return pos, is_found
@@ -1,6 +1,8 @@
 # -*- coding: utf-8 -*-
 
-import numpy as np
+from numpy import array
+
+from ....Methods.Mesh.NodeMat import get_position
 
 
 def get_coord(self, node_indice):
@@ -11,21 +13,21 @@ def get_coord(self, node_indice):
     self : NodeMat
         an NodeMat object
     node_indice : np.array
-        an array of node indice
+        an array of node indice (any shape, e.g. a connectivity matrix)
 
     Returns
     -------
     coord: np.array
-        an array of node coordinates
+        an array of node coordinates (node_indice.shape x dim)
 
     """
 
-    coord = list()
-    indices_all = self.indice
-    coordinate = self.coordinate
-
-    for ind in node_indice:
-        Ipos = np.where(indices_all == ind)[0][0]
-        coord.append(self.coordinate[Ipos, :])
+    node_indice = array(node_indice, dtype=int)
+    pos, is_found = get_position(self.indice, node_indice)
+    if not is_found.all():
+        raise IndexError(
+            "NodeMat.get_coord: node indices not found "
+            + str(node_indice[~is_found].tolist())
+        )
 
-    return np.array(coord)
+    return self.coordinate[pos]
@@ -0,0 +1,33 @@
+# -*- coding: utf-8 -*-
+
+import numpy as np
+
+
+def get_real_point_batch(self, vertice, ref_pt):
+    """Return the coordinates in many cells of points in the reference cell.
+
+    Parameters
+    ----------
+    self : RefCell
+        a RefCell object
+    vertice : ndarray
+        vertices of the cells (Ncell x Nnode x dim) or of one cell (Nnode x dim)
+    ref_pt : ndarray
+        reference points, same for all the cells (Npt x 2) or different for
+        each cell (Ncell x Npt x 2)
+
+    Returns
+    -------
+    real_points : ndarray
+        points coordinates (Ncell x Npt x 2)
+    """
+
+    vertice = np.asarray(vertice, dtype=float)
+    if vertice.ndim == 2:  # one cell
+        vertice = vertice[np.newaxis]
+
+    func = self.shape_function_batch(ref_pt)  # (..., Npt, Nnode)
+    if func.ndim == 2:  # same points for all the cells
+        func = func[np.newaxis]
+
+    return np.matmul(func, vertice[:, :, 0:2])
@@ -0,0 +1,65 @@
+# -*- coding: utf-8 -*-
+
+import numpy as np
+
+
+def get_ref_point_batch(self, vertice, point, nb_iter_max=20, tol=1e-12):
+    """Return the coordinates in the reference cell of points in many cells
+    (Newton iterations, a single one for the linear cells). For line cells the
+    second coordinate is the normal distance to the line (same scaling as the
+    first one).
+
+    Parameters
+    ----------
+    self : RefCell
+        a RefCell object
+    vertice : ndarray
+        vertices of the cells (Ncell x Nnode x dim) or of one cell (Nnode x dim)
+    point : ndarray
+        points coordinates: (Ncell x dim) one point per cell,
+        (Ncell x Npt x dim) Npt points per cell or (Npt x dim) for one cell
+    nb_iter_max : int
+        maximum number of Newton iterations
+    tol : float
+        tolerance on the reference coordinates
+
+    Returns
+    -------
+    point_ref : ndarray
+        coordinates of the reference points (same shape as point, with dim=2)
+    """
+
+    vertice = np.asarray(vertice, dtype=float)
+    point = np.asarray(point, dtype=float)[..., 0:2]
+    shape = point.shape
+    if vertice.ndim == 2:  # one cell
+        vertice = vertice[np.newaxis]
+        point = point.reshape((1, -1, 2))
+    elif point.ndim == 2:  # one point per cell
+        point = point[:, np.newaxis]
+
+    point_ref = np.zeros(point.shape)
+    for _ in range(nb_iter_max):
+        res = point - self.get_real_point_batch(vertice, point_ref)
+        jacob, _ = self.jacobian_batch(point_ref, vertice)
+        if jacob.shape[-2] == 2:
+            delta = np.linalg.solve(np.swapaxes(jacob, -1, -2), res[..., np.newaxis])[
+                ..., 0
+            ]
+        else:  # line cells: projection on the tangent
+            tan = jacob[..., 0, :]
+            delta = np.zeros(point.shape)
+            delta[..., 0] = np.sum(res * tan, axis=-1) / np.sum(tan ** 2, axis=-1)
+        point_ref = point_ref + delta
+        if np.max(np.abs(delta), initial=0) < tol:
+            break
+
+    if jacob.shape[-2] == 1:  # normal coordinate of line cells
+        res = point - self.get_real_point_batch(vertice, point_ref)
+        jacob, _ = self.jacobian_batch(point_ref, vertice)
+        tan = jacob[..., 0, :]
+        point_ref[..., 1] = (tan[..., 0] * res[..., 1] - tan[..., 1] * res[..., 0]) / (
+            np.sum(tan ** 2, axis=-1)
+        )
+
+    return point_ref.reshape(shape)
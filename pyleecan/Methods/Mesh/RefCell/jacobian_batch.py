@@ -0,0 +1,44 @@
+# -*- coding: utf-8 -*-
+
+import numpy as np
+
+
+def jacobian_batch(self, points, vertice):
+    """Compute the jacobian matrices and determinants of many cells at many
+    reference points at once.
+
+    Parameters
+    ----------
+    self : RefCell
+        a RefCell object
+    points : ndarray
+        reference points, same for all the cells (Npt x 2) or different for
+        each cell (Ncell x Npt x 2)
+    vertice : ndarray
+        vertices of the cells (Ncell x Nnode x dim) or of one cell (Nnode x dim)
+
+    Returns
+    -------
+    jacob : ndarray
+        jacobian matrices d x_j / d xi_i (Ncell x Npt x dim_ref x 2)
+    det_jacob : ndarray
+        jacobian determinants (Ncell x Npt), for line cells the norm of the
+        tangent vector
+    """
+
+    vertice = np.asarray(vertice, dtype=float)
+    if vertice.ndim == 2:  # one cell
+        vertice = vertice[np.newaxis]
+    vert = vertice[:, :, 0:2]
+
+    grad_func = self.grad_shape_function_batch(points)  # (..., Npt, dim_ref, Nnode)
+    if grad_func.ndim == 3:  # same points for all the cells
+        grad_func = grad_func[np.newaxis]
+    jacob = np.matmul(grad_func, vert[:, np.newaxis])
+
+    if jacob.shape[-2] == jacob.shape[-1]:
+        det_jacob = np.linalg.det(jacob)
+    else:  # line cells in 2D
+        det_jacob = np.linalg.norm(jacob[..., 0, :], axis=-1)
+
+    return jacob, det_jacob
@@ -0,0 +1,36 @@
+# -*- coding: utf-8 -*-
+
+import numpy as np
+
+
+def is_inside_batch(self, vertice, point):
+    """Check if points are inside the cells defined by the vertices.
+
+    Parameters
+    ----------
+    self : RefLine3
+        a RefLine3 object
+    vertice : ndarray
+        vertices of the cells (Ncell x 3 x dim) or of one cell (3 x dim)
+    point : ndarray
+        points coordinates (see get_ref_point_batch)
+
+    Returns
+    -------
+    is_inside : ndarray
+        true if the point is inside the cell
+    a : ndarray
+        distance criterion along the cell
+    b : ndarray
+        distance criterion normal to the cell
+    """
+    epsilon = self.epsilon
+    point_ref = self.get_ref_point_batch(vertice, point)
+    s = point_ref[..., 0]
+    t = point_ref[..., 1]
+
+    a = np.abs(s) - (1 + epsilon)
+    b = np.abs(t) - (epsilon * ((1 - s ** 2) + 1))
+    is_inside = (a < 0) & (b < 0)
+
+    return is_inside, a, b
@@ -0,0 +1,24 @@
+# -*- coding: utf-8 -*-
+
+import numpy as np
+
+
+def shape_function_batch(self, points):
+    """Return the values of quadratic shape functions in reference 3 node line for many points
+    (nodes at -1, 1 and 0)
+
+    Parameters
+    ----------
+    self : RefLine3
+        a RefLine3 object
+    points : ndarray
+        reference points (... x 2), only the first coordinate is used
+
+    Returns
+    -------
+    values : ndarray
+        shape functions values (... x 3)
+    """
+    x = np.asarray(points, dtype=float)[..., 0]
+
+    return np.stack([x * (x - 1) / 2, x * (x + 1) / 2, 1 - x ** 2], axis=-1)
@@ -0,0 +1,27 @@
+# -*- coding: utf-8 -*-
+
+import numpy as np
+
+from .shape_function_batch import NODE_REF
+
+
+def grad_shape_function_batch(self, points):
+    """Return the gradient of bilinear shape functions in reference square for many points
+
+    Parameters
+    ----------
+    self : RefQuad4
+        a RefQuad4 object
+    points : ndarray
+        reference points (... x 2)
+
+    Returns
+    -------
+    values : ndarray
+        shape functions gradients (... x 2 x 4)
+    """
+    points = np.asarray(points, dtype=float)
+    x, y = points[..., np.newaxis, 0], points[..., np.newaxis, 1]
+    sx, sy = NODE_REF[:, 0], NODE_REF[:, 1]
+
+    return np.stack([sx * (1 + sy * y) / 4, sy * (1 + sx * x) / 4], axis=-2)
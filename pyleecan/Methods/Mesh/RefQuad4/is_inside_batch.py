@@ -0,0 +1,32 @@
+# -*- coding: utf-8 -*-
+
+import numpy as np
+
+
+def is_inside_batch(self, vertice, point):
+    """Check if points are inside the cells defined by the vertices.
+
+    Parameters
+    ----------
+    self : RefQuad4
+        a RefQuad4 object
+    vertice : ndarray
+        vertices of the cells (Ncell x 4 x dim) or of one cell (4 x dim)
+    point : ndarray
+        points coordinates (see get_ref_point_batch)
+
+    Returns
+    -------
+    is_inside : ndarray
+        true if the point is inside the cell
+    a : ndarray
+        first reference coordinate of the points
+    b : ndarray
+        second reference coordinate of the points
+    """
+    point_ref = self.get_ref_point_batch(vertice, point)
+    a = point_ref[..., 0]
+    b = point_ref[..., 1]
+    is_inside = (np.abs(a) < 1 + self.epsilon) & (np.abs(b) < 1 + self.epsilon)
+
+    return is_inside, a, b
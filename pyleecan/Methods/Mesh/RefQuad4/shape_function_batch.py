@@ -0,0 +1,26 @@
+# -*- coding: utf-8 -*-
+
+import numpy as np
+
+# Coordinates of the nodes in the reference square [-1, 1]^2
+NODE_REF = np.array([[-1, -1], [1, -1], [1, 1], [-1, 1]], dtype=float)
+
+
+def shape_function_batch(self, points):
+    """Return the values of bilinear shape functions in reference square for many points
+
+    Parameters
+    ----------
+    self : RefQuad4
+        a RefQuad4 object
+    points : ndarray
+        reference points (... x 2)
+
+    Returns
+    -------
+    values : ndarray
+        shape functions values (... x 4)
+    """
+    points = np.asarray(points, dtype=float)[..., np.newaxis, 0:2]
+
+    return np.prod(1 + NODE_REF * points, axis=-1) / 4
@@ -0,0 +1,30 @@
+# -*- coding: utf-8 -*-
+
+import numpy as np
+
+from .shape_function_batch import IND_X, IND_Y, _lagrange, _grad_lagrange
+
+
+def grad_shape_function_batch(self, points):
+    """Return the gradient of biquadratic shape functions in reference square for many points
+
+    Parameters
+    ----------
+    self : RefQuad9
+        a RefQuad9 object
+    points : ndarray
+        reference points (... x 2)
+
+    Returns
+    -------
+    values : ndarray
+        shape functions gradients (... x 2 x 9)
+    """
+    points = np.asarray(points, dtype=float)
+    x, y = points[..., 0], points[..., 1]
+    Lx, Ly = _lagrange(x), _lagrange(y)
+    dLx, dLy = _grad_lagrange(x), _grad_lagrange(y)
+
+    return np.stack(
+        [dLx[..., IND_X] * Ly[..., IND_Y], Lx[..., IND_X] * dLy[..., IND_Y]], axis=-2
+    )
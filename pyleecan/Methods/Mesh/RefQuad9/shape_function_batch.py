@@ -0,0 +1,40 @@
+# -*- coding: utf-8 -*-
+
+import numpy as np
+
+# Index of the 1D Lagrange polynomial (nodes -1, 0, 1) along x and y for each node:
+# corners, middle of the edges 0-1, 1-2, 2-3, 3-0 and center
+IND_X = np.array([0, 2, 2, 0, 1, 2, 1, 0, 1])
+IND_Y = np.array([0, 0, 2, 2, 0, 1, 2, 1, 1])
+
+
+def _lagrange(x):
+    """1D quadratic Lagrange polynomials on the nodes -1, 0, 1 (... x 3)"""
+    return np.stack([x * (x - 1) / 2, 1 - x ** 2, x * (x + 1) / 2], axis=-1)
+
+
+def _grad_lagrange(x):
+    """Derivatives of the 1D quadratic Lagrange polynomials (... x 3)"""
+    return np.stack([x - 1 / 2, -2 * x, x + 1 / 2], axis=-1)
+
+
+def shape_function_batch(self, points):
+    """Return the values of biquadratic shape functions in reference square for many points
+
+    Parameters
+    ----------
+    self : RefQuad9
+        a RefQuad9 object
+    points : ndarray
+        reference points (... x 2)
+
+    Returns
+    -------
+    values : ndarray
+        shape functions values (... x 9)
+    """
+    points = np.asarray(points, dtype=float)
+    Lx = _lagrange(points[..., 0])
+    Ly = _lagrange(points[..., 1])
+
+    return Lx[..., IND_X] * Ly[..., IND_Y]
@@ -0,0 +1,24 @@
+# -*- coding: utf-8 -*-
+
+import numpy as np
+
+
+def grad_shape_function_batch(self, points):
+    """Return the gradient of linear shape functions in reference 2 node segment for many points
+
+    Parameters
+    ----------
+    self : RefSegmentP1
+        a RefSegmentP1 object
+    points : ndarray
+        reference points (... x 2)
+
+    Returns
+    -------
+    values : ndarray
+        shape functions gradients (... x 1 x 2)
+    """
+    points = np.asarray(points, dtype=float)
+    values = np.array([[-1 / 2, 1 / 2]])
+
+    return np.broadcast_to(values, points.shape[:-1] + values.shape).copy()
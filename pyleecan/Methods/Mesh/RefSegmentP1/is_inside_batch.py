@@ -0,0 +1,50 @@
+# -*- coding: utf-8 -*-
+
+import numpy as np
+
+
+def is_inside_batch(self, vertice, point, normal_t=None):
+    """Check if points are inside the cells defined by the vertices.
+
+    Parameters
+    ----------
+    self : RefSegmentP1
+        a RefSegmentP1 object
+    vertice : ndarray
+        vertices of the cells (Ncell x 2 x dim) or of one cell (2 x dim)
+    point : ndarray
+        points coordinates (see get_ref_point_batch)
+    normal_t : ndarray
+        normal of another cell. Additional facultative criterion.
+
+    Returns
+    -------
+    is_inside : ndarray
+        true if the point is inside the cell
+    a : ndarray
+        distance criterion along the cell
+    b : ndarray
+        distance criterion normal to the cell
+    """
+    epsilon = self.epsilon
+    point_ref = self.get_ref_point_batch(vertice, point)
+    s = point_ref[..., 0]
+    t = point_ref[..., 1]
+
+    a = np.abs(s) - (1 + epsilon)
+    b = np.abs(t) - (epsilon * ((1 - s ** 2) + 1))
+    is_inside = (a < 0) & (b < 0)
+
+    # Check that normals are almost aligned
+    if normal_t is not None:
+        vertice = np.asarray(vertice, dtype=float)
+        tan = vertice[..., 0, 0:2] - vertice[..., 1, 0:2]
+        normal_s = np.stack([tan[..., 1], -tan[..., 0]], axis=-1)
+        normal_s = normal_s / np.linalg.norm(normal_s, axis=-1, keepdims=True)
+        scal_st = np.sum(np.asarray(normal_t)[..., 0:2] * normal_s, axis=-1)
+        is_colinear = np.abs(scal_st) > 1 - 2 * epsilon
+        if is_inside.ndim > is_colinear.ndim:  # several points per cell
+            is_colinear = is_colinear[..., np.newaxis]
+        is_inside = is_inside & is_colinear
+
+    return is_inside, a, b
@@ -0,0 +1,24 @@
+# -*- coding: utf-8 -*-
+
+import numpy as np
+
+
+def shape_function_batch(self, points):
+    """Return the values of linear shape functions in reference 2 node segment for many points
+    (linear extrapolation outside of [-1, 1])
+
+    Parameters
+    ----------
+    self : RefSegmentP1
+        a RefSegmentP1 object
+    points : ndarray
+        reference points (... x 2), only the first coordinate is used
+
+    Returns
+    -------
+    values : ndarray
+        shape functions values (... x 2)
+    """
+    x = np.asarray(points, dtype=float)[..., 0]
+
+    return np.stack([(1 - x) / 2, (1 + x) / 2], axis=-1)
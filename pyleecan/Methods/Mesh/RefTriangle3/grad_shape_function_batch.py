@@ -0,0 +1,24 @@
+# -*- coding: utf-8 -*-
+
+import numpy as np
+
+
+def grad_shape_function_batch(self, points):
+    """Return the gradient of linear shape functions in reference triangle for many points
+
+    Parameters
+    ----------
+    self : RefTriangle3
+        a RefTriangle3 object
+    points : ndarray
+        reference points (... x 2)
+
+    Returns
+    -------
+    values : ndarray
+        shape functions gradients (... x 2 x 3)
+    """
+    points = np.asarray(points, dtype=float)
+    values = np.array([[-1, 1, 0], [-1, 0, 1]], dtype=float)
+
+    return np.broadcast_to(values, points.shape[:-1] + values.shape).copy()
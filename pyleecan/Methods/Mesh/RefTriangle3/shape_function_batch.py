@@ -0,0 +1,24 @@
+# -*- coding: utf-8 -*-
+
+import numpy as np
+
+
+def shape_function_batch(self, points):
+    """Return the values of linear shape functions in reference triangle for many points
+
+    Parameters
+    ----------
+    self : RefTriangle3
+        a RefTriangle3 object
+    points : ndarray
+        reference points (... x 2)
+
+    Returns
+    -------
+    values : ndarray
+        shape functions values (... x 3)
+    """
+    points = np.asarray(points, dtype=float)
+    x, y = points[..., 0], points[..., 1]
+
+    return np.stack([1 - x - y, x, y], axis=-1)
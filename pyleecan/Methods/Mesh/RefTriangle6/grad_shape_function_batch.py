@@ -0,0 +1,29 @@
+# -*- coding: utf-8 -*-
+
+import numpy as np
+
+
+def grad_shape_function_batch(self, points):
+    """Return the gradient of quadratic shape functions in reference triangle for many points
+
+    Parameters
+    ----------
+    self : RefTriangle6
+        a RefTriangle6 object
+    points : ndarray
+        reference points (... x 2)
+
+    Returns
+    -------
+    values : ndarray
+        shape functions gradients (... x 2 x 6)
+    """
+    points = np.asarray(points, dtype=float)
+    x, y = points[..., 0], points[..., 1]
+    z = 1 - x - y
+    zero = np.zeros(x.shape)
+
+    dx = [1 - 4 * z, 4 * x - 1, zero, 4 * (z - x), 4 * y, -4 * y]
+    dy = [1 - 4 * z, zero, 4 * y - 1, -4 * x, 4 * x, 4 * (z - y)]
+
+    return np.stack([np.stack(dx, axis=-1), np.stack(dy, axis=-1)], axis=-2)
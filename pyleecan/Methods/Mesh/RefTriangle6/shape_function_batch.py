@@ -0,0 +1,36 @@
+# -*- coding: utf-8 -*-
+
+import numpy as np
+
+
+def shape_function_batch(self, points):
+    """Return the values of quadratic shape functions in reference triangle for many points
+    (nodes 3, 4 and 5 in the middle of the edges 0-1, 1-2 and 2-0)
+
+    Parameters
+    ----------
+    self : RefTriangle6
+        a RefTriangle6 object
+    points : ndarray
+        reference points (... x 2)
+
+    Returns
+    -------
+    values : ndarray
+        shape functions values (... x 6)
+    """
+    points = np.asarray(points, dtype=float)
+    x, y = points[..., 0], points[..., 1]
+    z = 1 - x - y
+
+    return np.stack(
+        [
+            z * (2 * z - 1),
+            x * (2 * x - 1),
+            y * (2 * y - 1),
+            4 * x * z,
+            4 * x * y,
+            4 * y * z,
+        ],
+        axis=-1,
+    )
@@ -0,0 +1,41 @@
+# -*- coding: utf-8 -*-
+
+import numpy as np
+
+
+def scalar_product_batch(self, funca, funcb, detJ, weights):
+    """Scalar products of shape functions with L2 gauss integration on many cells at once
+
+    Parameters
+    ----------
+    self : ScalarProductL2
+        a ScalarProductL2 object
+    funca : ndarray
+        first functions at the gauss points (Ngauss x Na), same for all the
+        cells, or (Ncell x Ngauss x Na)
+    funcb : ndarray
+        second functions at the gauss points (Ngauss x Nb) or (Ncell x Ngauss x Nb)
+    detJ : ndarray
+        jacobian determinant evaluated for each cell and gauss point (Ncell x Ngauss)
+    weights : ndarray
+        gauss weights (Ngauss)
+
+    Returns
+    -------
+    l2_scal : ndarray
+        L2 scalar products of each cell (Ncell x Na x Nb)
+    """
+
+    detJ = np.asarray(detJ, dtype=float)
+    if detJ.ndim == 1:  # one cell
+        detJ = detJ[np.newaxis]
+    w_dJ = detJ * np.asarray(weights, dtype=float).ravel()[np.newaxis]
+
+    funca = np.asarray(funca)
+    funcb = np.asarray(funcb)
+    if funca.ndim == 2:
+        funca = funca[np.newaxis]
+    if funcb.ndim == 2:
+        funcb = funcb[np.newaxis]
+
+    return np.matmul(np.swapaxes(funca * w_dJ[..., np.newaxis], -1, -2), funcb)
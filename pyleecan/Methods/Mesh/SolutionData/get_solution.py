@@ -1,5 +1,5 @@
 # -*- coding: utf-8 -*-
-from numpy import take
+from numpy import array, isin
 from SciDataTool import Data1D
 
 
@@ -31,14 +31,15 @@ def get_solution(self, indice=None):
 
         org_indice = axes[ax_idx].get_values()
 
-        if set(indice) - set(org_indice):
+        is_found = isin(indice, org_indice)
+        if not is_found.all():
             logger.warning(
                 "At least one input indice is not part of the solution. "
                 + "Respective indice will be skipped."
             )
 
         # skip indice that are not part of the solution
-        new_indice = [ii for ii in indice if ii in org_indice]
+        new_indice = array(indice)[is_found].tolist()
 
         # create requested axes list to get field values (see SciDataTool slicing ref.)
         args = [
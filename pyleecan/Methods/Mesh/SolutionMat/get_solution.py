@@ -1,5 +1,7 @@
 # -*- coding: utf-8 -*-
-from numpy import take, where, array
+from numpy import take, array
+
+from ....Methods.Mesh.NodeMat import get_position
 
 
 def get_solution(self, indice=None):
@@ -34,17 +36,16 @@ def get_solution(self, indice=None):
     if not indice:
         indice = s_indice
 
-    if set(indice) - set(s_indice):
+    # get array index of the indice that are part of the solution
+    array_indice, is_found = get_position(array(s_indice), indice)
+    if not is_found.all():
         logger.warning(
             "At least one input indice is not part of the solution. "
             + "Respective indice will be skipped."
         )
-
     # skip indice that are not part of the solution
-    new_indice = [ii for ii in indice if ii in s_indice]
-
-    # get array index of new_indice
-    array_indice = [where(array(s_indice) == ii)[0][0] for ii in new_indice]
+    array_indice = array_indice[is_found]
+    new_indice = array(indice)[is_found].tolist()
 
     # setup requested solution
     axis_size[Iindice] = len(new_indice)
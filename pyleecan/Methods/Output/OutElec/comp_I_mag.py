@@ -42,8 +42,10 @@ def comp_I_mag(self, time, is_stator, phase=None):
         else:
             Npcp = 1
 
-        # Get current DataTime
-        if is_stator:
+        # Get current Data (harmonics are synthesized on the requested time vector)
+        if is_stator and self.Is is None and self.Is_harm is not None:
+            I_data = self.Is_harm
+        elif is_stator:
             I_data = self.get_Is()
         else:
             I_data = self.Ir
@@ -17,17 +17,27 @@ def get_Is(self):
     """
     # Calculate stator currents if Is is not in OutElec
     if self.Is is None:
-        # Generate current according to Id/Iq
-        Isdq = array([self.Id_ref, self.Iq_ref])
         time = self.Time.get_values(is_oneperiod=True)
         qs = self.parent.simu.machine.stator.winding.qs
-        felec = self.felec
 
-        # Get rotation direction of the fundamental magnetic field created by the winding
-        rot_dir = self.parent.get_rot_dir()
-
-        # Get stator current function of time
-        Is = dq2n(Isdq, 2 * pi * felec * time, n=qs, rot_dir=rot_dir, is_n_rms=False)
+        if self.Is_harm is not None:
+            # Synthesize the time samples from the current harmonics
+            Is = self.Is_harm.get_along(
+                "time=axis_data", "phase", axis_data={"time": time}
+            )[self.Is_harm.symbol]
+            Is = transpose(Is.reshape((qs, time.size)))
+        else:
+            # Generate current according to Id/Iq
+            Isdq = array([self.Id_ref, self.Iq_ref])
+            felec = self.felec
+
+            # Get rotation direction of the fundamental magnetic field created by the winding
+            rot_dir = self.parent.get_rot_dir()
+
+            # Get stator current function of time
+            Is = dq2n(
+                Isdq, 2 * pi * felec * time, n=qs, rot_dir=rot_dir, is_n_rms=False
+            )
 
         Phase = Data1D(
             name="phase",
@@ -0,0 +1,45 @@
+from numpy import array
+
+from SciDataTool import Data1D, DataFreq
+
+from ....Functions.Electrical.coordinate_transformation import dq2n_harm
+from ....Functions.Winding.gen_phase_list import gen_name
+
+
+def get_Is_harm(self):
+    """Return the stator current harmonics DataFreq object (only the present
+    frequencies are stored, cf InputCurrent.Is_harm)
+
+    Parameters
+    ----------
+    self : OutElec
+        an OutElec object
+
+    """
+    # Calculate stator current harmonics if Is_harm is not in OutElec
+    if self.Is_harm is None:
+        # Fundamental harmonic according to Id/Iq
+        Isdq = array([self.Id_ref, self.Iq_ref])
+        qs = self.parent.simu.machine.stator.winding.qs
+
+        # Get rotation direction of the fundamental magnetic field created by the winding
+        rot_dir = self.parent.get_rot_dir()
+
+        # Get stator current complex amplitude at felec
+        Is = dq2n_harm(Isdq, n=qs, rot_dir=rot_dir, is_n_rms=False)
+
+        Phase = Data1D(
+            name="phase",
+            unit="",
+            values=gen_name(qs),
+            is_components=True,
+        )
+        Freqs = Data1D(name="freqs", unit="Hz", values=array([self.felec]))
+        self.Is_harm = DataFreq(
+            name="Stator current",
+            unit="A",
+            symbol="Is",
+            axes=[Phase, Freqs],
+            values=Is[:, None],
+        )
+    return self.Is_harm
@@ -0,0 +1,2 @@
+class OutInterpError(Exception):
+    pass
@@ -0,0 +1,125 @@
+from numpy import (
+    add,
+    array,
+    asarray,
+    nan,
+    prod,
+    ptp,
+    ravel_multi_index,
+    searchsorted,
+    sum as np_sum,
+    unique,
+    zeros,
+)
+from numpy.linalg import norm, svd
+from scipy.interpolate import (
+    LinearNDInterpolator,
+    RBFInterpolator,
+    RegularGridInterpolator,
+)
+
+from ....Methods.Output.OutInterp import OutInterpError
+
+RTOL = 1e-9  # Relative tolerance on the normalized coordinates
+
+
+def get_interpolant(self):
+    """Build the interpolant of the samples (the scipy interpolator is built at
+    each call of get_value: keep the interpolant to evaluate several sets of
+    points without building it again). The results of the samples with the
+    same coordinates are averaged (e.g. results of an Id/Iq grid as a function
+    of Iq only) and the scattered methods interpolate on the affine hull of the
+    samples (e.g. Id and Iq varying together)
+
+    Parameters
+    ----------
+    self : OutInterp
+        an OutInterp object
+
+    Returns
+    -------
+    interpolant : function
+        vectorized interpolant: coordinates (Npoint, Ndim) => results (Npoint, ...)
+
+    Raises
+    ------
+    OutInterpError
+    """
+    if self.point is None or self.value is None:
+        raise OutInterpError("OutInterp.point and OutInterp.value must be set")
+    point = array(self.point, dtype=float)
+    if point.ndim == 1:
+        point = point[:, None]
+    value = asarray(self.value)
+    if point.shape[0] != value.shape[0]:
+        raise OutInterpError(
+            "OutInterp.point and OutInterp.value must have the same number of samples"
+        )
+    fill_value = nan if self.fill_value is None else self.fill_value
+
+    # Samples with the same coordinates: mean of their results
+    point, inverse, count = unique(
+        point, axis=0, return_inverse=True, return_counts=True
+    )
+    value_sum = zeros((point.shape[0],) + value.shape[1:])
+    add.at(value_sum, inverse.ravel(), value)
+    value = value_sum / count.reshape((-1,) + (1,) * (value.ndim - 1))
+    if point.shape[0] < 2:
+        raise OutInterpError(
+            "At least two samples with different coordinates are needed to "
+            + "interpolate "
+            + str(self.symbol)
+        )
+
+    if self.method == "grid":
+        # Samples on a tensor grid (any order)
+        axis_list = [unique(point[:, ii]) for ii in range(point.shape[1])]
+        shape = tuple(axis.size for axis in axis_list)
+        index = ravel_multi_index(
+            [searchsorted(axis, point[:, ii]) for ii, axis in enumerate(axis_list)],
+            shape,
+        )
+        if index.size != prod(shape):
+            raise OutInterpError(
+                "The samples of "
+                + str(self.symbol)
+                + " are not on a tensor grid (use the linear or rbf method)"
+            )
+        grid = value[index.argsort()].reshape(shape + value.shape[1:])
+        interp = RegularGridInterpolator(
+            axis_list, grid, bounds_error=False, fill_value=self.fill_value
+        )
+        return lambda query: interp(asarray(query, dtype=float))
+
+    # The scattered methods are not scale invariant: normalized coordinates
+    shift = point.min(axis=0)
+    scale = ptp(point, axis=0)
+    scale[scale == 0] = 1
+    X = (point - shift) / scale
+    # Coordinates in the principal directions of the samples (affine rank):
+    # the triangulation of aligned samples is degenerated
+    center = X.mean(axis=0)
+    _, sing_val, Vh = svd(X - center, full_matrices=False)
+    basis = Vh[: int(np_sum(sing_val > RTOL * sing_val[0]))]
+    Y = (X - center) @ basis.T
+    if self.method == "linear" and Y.shape[1] == 1:
+        order = Y[:, 0].argsort()
+        interp = RegularGridInterpolator(
+            (Y[order, 0],), value[order], bounds_error=False, fill_value=fill_value
+        )
+    elif self.method == "linear":
+        interp = LinearNDInterpolator(Y, value, fill_value=fill_value)
+    elif self.method == "rbf":
+        interp = RBFInterpolator(Y, value, kernel=self.kernel, smoothing=self.smoothing)
+    else:
+        raise OutInterpError("Unknown interpolation method " + str(self.method))
+
+    def interpolant(query):
+        Xq = (asarray(query, dtype=float) - shift) / scale - center
+        Yq = Xq @ basis.T
+        result = interp(Yq)
+        if self.method == "linear":  # Out of the affine hull of the samples
+            result[norm(Xq - Yq @ basis, axis=1) > RTOL] = fill_value
+        return result
+
+    return interpolant
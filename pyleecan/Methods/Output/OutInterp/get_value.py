@@ -0,0 +1,25 @@
+from numpy import asarray
+
+
+def get_value(self, point):
+    """Evaluate the interpolation table at any points (vectorized)
+
+    Parameters
+    ----------
+    self : OutInterp
+        an OutInterp object
+    point : ndarray
+        coordinates (..., Ndim) in the order of param_list (any shape for a
+        single coordinate)
+
+    Returns
+    -------
+    value : ndarray
+        interpolated results (...) + shape of the results of a sample
+    """
+    point = asarray(point, dtype=float)
+    is_1D = self.point.ndim == 1 or self.point.shape[1] == 1
+    if is_1D and (point.ndim == 0 or point.shape[-1] != 1):
+        point = point[..., None]
+    value = self.get_interpolant()(point.reshape((-1, point.shape[-1])))
+    return value.reshape(point.shape[:-1] + value.shape[1:])
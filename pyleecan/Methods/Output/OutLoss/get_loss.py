@@ -2,7 +2,7 @@
 
 
 def get_loss(self, part_label="Stator", index=None):
-    """Convenience method to get some specific loss component time data.
+    """Convenience method to get some specific loss component data.
 
     Parameter
     ---------
@@ -17,8 +17,9 @@ def get_loss(self, part_label="Stator", index=None):
 
     Return
     ------
-    DataTime : DataTime
-        Time data of the requested loss component
+    data : DataND
+        Data of the requested loss component (DataTime, or DataFreq for the
+        winding losses computed from harmonic currents)
 
     """
     logger = self.get_logger()
@@ -0,0 +1,59 @@
+# -*- coding: utf-8 -*-
+
+
+def get_loss_group(self, part_label="Stator", group_names=None, index=None):
+    """Convenience method to get the losses of some groups of a machine part by
+    integration of the stored loss density distribution.
+
+    Parameter
+    ---------
+    self : OutLoss
+        an OutLoss object
+
+    part_label : str
+        Label of the machine part, e.g. 'Stator'
+
+    group_names : [str]
+        Name of the groups (default: the whole part)
+
+    index : int
+        Index of the Loss Model
+
+    Return
+    ------
+    LossSum : DataFreq
+        Losses [W] of each group (speed, group, freqs, Components)
+
+    """
+    logger = self.get_logger()
+
+    meshsolution = self.get_loss_dist(part_label=part_label, index=index)
+    if meshsolution is None:
+        logger.warning(
+            f"OutLoss.get_loss_group(): Part '{part_label}' got no loss distribution "
+            + "(get_meshsolution must be True)."
+        )
+        return None
+
+    # get the loss model
+    if index is None:
+        index = list(self.loss_index[part_label].keys())[0]
+    output = self.parent
+    model = output.simu.loss.model_list[self.loss_index[part_label][index]]
+    if not hasattr(model, "comp_loss_sum"):
+        logger.warning(
+            f"OutLoss.get_loss_group(): Loss model '{model.name}' has no loss density."
+        )
+        return None
+
+    N0 = output.elec.N0
+    N0_list = model.N0 if model.N0 else [N0]
+    k_freq = [n / N0 for n in N0_list]
+
+    return model.comp_loss_sum(
+        meshsolution,
+        k_freq=k_freq,
+        group_names=group_names,
+        coeff=model.get_loss_coeff(output, part_label),
+        is_stored=True,
+    )
@@ -1,9 +1,26 @@
-from sys import getsizeof
-from ....Functions.Load.import_class import import_class
+from ....Functions.get_memory_size import get_memory_size
+
+# Properties of Output to print (and to detail)
+PROP_LIST = [
+    "path_result",
+    "logger_name",
+    "simu",
+    "geo",
+    "elec",
+    "mag",
+    "force",
+    "struct",
+    "loss",
+    "post",
+    "profile",
+]
+DETAIL_LIST = ["simu", "geo", "elec", "mag", "force", "struct", "loss"]
 
 
 def print_memory(self, tab_level=0, detail_level=1, is_print=True):
-    """Print an estimation of the memory usage for each property of the object
+    """Print the memory usage of each property of the object (including the
+    content of the arrays and of the objects of the property, the objects shared
+    between properties are counted once)
 
     Parameters
     ----------
@@ -26,42 +43,22 @@ def print_memory(self, tab_level=0, detail_level=1, is_print=True):
     for _ in range(tab_level):
         tab += "    "
 
-    Output = import_class("pyleecan.Classes", "Output")
-    if type(self) is Output:
-        mem_str = tab + "Total Output size: " + str(getsizeof(self)) + " o\n"
-    else:  # XOutput (print only the Output part of the size)
-        mem_str = tab + "Total Output size: " + str(Output.__sizeof__(self)) + " o\n"
+    # Size of each property (shared objects are counted in the first property)
+    seen = {id(self)}
+    size_dict = dict()
+    for prop_name in PROP_LIST:
+        size_dict[prop_name] = get_memory_size(getattr(self, prop_name), seen)
+    # XOutput: print only the Output part of the size
+    total = object.__sizeof__(self) + sum(size_dict.values())
+
+    mem_str = tab + "Total Output size: " + str(total) + " o\n"
     if detail_level == 0:
         print(mem_str)
         return
-    mem_str += tab + "path_result: " + str(getsizeof(self.path_result)) + " o\n"
-    mem_str += tab + "logger_name: " + str(getsizeof(self.logger_name)) + " o\n"
-
-    mem_str += tab + "simu: " + str(getsizeof(self.simu)) + " o\n"
-    if detail_level > 1:
-        mem_str += detail_prop(self, "simu", tab_level=tab_level + 1)
-
-    mem_str += tab + "geo: " + str(getsizeof(self.geo)) + " o\n"
-    if detail_level > 1:
-        mem_str += detail_prop(self, "geo", tab_level=tab_level + 1)
-
-    mem_str += tab + "elec: " + str(getsizeof(self.elec)) + " o\n"
-    if detail_level > 1:
-        mem_str += detail_prop(self, "elec", tab_level=tab_level + 1)
-
-    mem_str += tab + "mag: " + str(getsizeof(self.mag)) + " o\n"
-    if detail_level > 1:
-        mem_str += detail_prop(self, "mag", tab_level=tab_level + 1)
-
-    mem_str += tab + "force: " + str(getsizeof(self.force)) + " o\n"
-    if detail_level > 1:
-        mem_str += detail_prop(self, "force", tab_level=tab_level + 1)
-
-    mem_str += tab + "struct: " + str(getsizeof(self.struct)) + " o\n"
-    if detail_level > 1:
-        mem_str += detail_prop(self, "struct", tab_level=tab_level + 1)
-
-    mem_str += tab + "post: " + str(getsizeof(self.post)) + " o\n"
+    for prop_name in PROP_LIST:
+        mem_str += tab + prop_name + ": " + str(size_dict[prop_name]) + " o\n"
+        if detail_level > 1 and prop_name in DETAIL_LIST:
+            mem_str += detail_prop(self, prop_name, tab_level=tab_level + 1)
 
     if is_print:
         print(mem_str)
@@ -77,6 +74,7 @@ def detail_prop(self, prop_name, tab_level=1):
         tab += "    "
 
     mem_str = ""
+    seen = set()
     prop = getattr(self, prop_name)
     for attr in dir(prop):
         if (
@@ -93,7 +91,7 @@ def detail_prop(self, prop_name, tab_level=1):
                 + "."
                 + attr
                 + ": "
-                + str(getsizeof(getattr(prop, attr)))
+                + str(get_memory_size(getattr(prop, attr), seen))
                 + " o\n"
             )
     return mem_str
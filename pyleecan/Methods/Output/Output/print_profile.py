@@ -0,0 +1,49 @@
+from numpy import array, nanmax
+
+
+def print_profile(self, is_print=True):
+    """Print the time and memory of each stage of the simulation(s) recorded
+    with Simulation.is_profile (the stages of the different simulations of a
+    XOutput are aggregated)
+
+    Parameters
+    ----------
+    self : Output
+        An Output object
+    is_print: bool
+        True print, else return str
+
+    Returns
+    -------
+    profile_str: str
+        if is_print == False, return the table of the profile
+    """
+
+    if self.profile is None or len(self.profile["stage"]) == 0:
+        profile_str = "No profile (Simulation.is_profile is False)"
+    else:
+        stage_array = array(self.profile["stage"])
+        wall_time = array(self.profile["wall_time"], dtype=float)
+        cpu_time = array(self.profile["cpu_time"], dtype=float)
+        max_rss = array(self.profile["max_rss"], dtype=float)
+
+        profile_str = "{:<32}{:>6}{:>12}{:>12}{:>12}{:>14}\n".format(
+            "Stage", "Calls", "Wall [s]", "Mean [s]", "CPU [s]", "Max RSS [MB]"
+        )
+        # Stages in the order of their first call
+        stage_list = list(dict.fromkeys(self.profile["stage"]))
+        for stage in stage_list:
+            Istage = stage_array == stage
+            profile_str += "{:<32}{:>6d}{:>12.3f}{:>12.3f}{:>12.3f}{:>14.1f}\n".format(
+                stage,
+                int(Istage.sum()),
+                wall_time[Istage].sum(),
+                wall_time[Istage].mean(),
+                cpu_time[Istage].sum(),
+                nanmax(max_rss[Istage]) / 2 ** 20,
+            )
+
+    if is_print:
+        print(profile_str)
+    else:
+        return profile_str
@@ -1,6 +1,8 @@
 def __getitem__(self, idx):
     """Method to behave like a list or a dict and iterate in the object"""
-    if isinstance(idx, int) or isinstance(idx, slice):
-        return self.output_list.__getitem__(idx)
+    if isinstance(idx, int):
+        return self.get_output(idx)
+    elif isinstance(idx, slice):
+        return [self.get_output(ii) for ii in range(len(self.output_list))[idx]]
     else:
         return self.xoutput_dict.__getitem__(idx)
@@ -1,3 +1,3 @@
 def __iter__(self):
     """Method to behave like a list and iterate in the object"""
-    return iter(self.output_list)
+    return (self.get_output(ii) for ii in range(len(self.output_list)))
@@ -1,3 +1,3 @@
 def __reversed__(self):
     """Built-in to implement reverse iteration"""
-    return reversed(self.output_list)
+    return (self.get_output(ii) for ii in reversed(range(len(self.output_list))))
@@ -0,0 +1,93 @@
+from numpy import array, isnan, nan, ptp
+
+from ....Functions.Load.import_class import import_class
+from ....Methods.Output.XOutput import XOutputError
+
+
+def get_interp(self, symbol, param_list=None, method="linear", **kwargs):
+    """Build an interpolation table (surrogate model) of the results of a
+    DataKeeper as a function of parameters of the multi-simulation, to evaluate
+    them at any point without running simulations (e.g. drive cycle)
+
+    Parameters
+    ----------
+    self : XOutput
+        an XOutput object
+    symbol : str
+        DataKeeper symbol of the results to interpolate
+    param_list : list
+        Symbols of the coordinates (ParamExplorer with scalar values or
+        DataKeeper). Default: the varying ParamExplorers with scalar values, or
+        the varying speed and currents (N0, Id, Iq) for a variable load
+    method : str
+        "grid", "linear" or "rbf" (cf OutInterp)
+    **kwargs
+        Other properties of the OutInterp (kernel, smoothing, fill_value)
+
+    Returns
+    -------
+    interp : OutInterp
+        interpolation table of the results
+
+    Raises
+    ------
+    XOutputError
+    """
+    OutInterp = import_class("pyleecan.Classes", "OutInterp")
+
+    if symbol not in self.keys():
+        raise XOutputError("Unknown DataKeeper symbol " + str(symbol))
+
+    if param_list is None:
+        param_list = list()
+        for symbol_list in [
+            [pe.symbol for pe in self.paramexplorer_list],
+            ["N0", "Id", "Iq"],
+        ]:
+            for param in symbol_list:
+                coord = _get_coordinate(self, param, is_error=False)
+                if coord is not None and ptp(coord[~isnan(coord)]) > 0:
+                    param_list.append(param)
+            if len(param_list) > 0:
+                break
+        if len(param_list) == 0:
+            raise XOutputError("No varying parameter to interpolate " + symbol)
+
+    # Samples without error only
+    point = array([_get_coordinate(self, param) for param in param_list]).T
+    is_valid = ~isnan(point).any(axis=1)
+    is_valid &= array([result is not None for result in self[symbol].result])
+    value = array(
+        [result for ii, result in enumerate(self[symbol].result) if is_valid[ii]]
+    )
+
+    return OutInterp(
+        symbol=symbol,
+        unit=self[symbol].unit,
+        param_list=param_list,
+        point=point[is_valid],
+        value=value,
+        method=method,
+        **kwargs
+    )
+
+
+def _get_coordinate(xoutput, symbol, is_error=True):
+    """Return the values of a ParamExplorer or DataKeeper as a coordinate
+    (None => nan) or None if they are not scalar (or unknown) and not is_error"""
+    if symbol in xoutput.keys():
+        value_list = xoutput[symbol].result
+    elif symbol in [pe.symbol for pe in xoutput.paramexplorer_list]:
+        value_list = xoutput.get_paramexplorer(symbol).get_value()
+    elif is_error:
+        raise XOutputError("Unknown symbol " + str(symbol))
+    else:
+        return None
+    try:
+        return array(
+            [nan if value is None else value for value in value_list], dtype=float
+        )
+    except (TypeError, ValueError):
+        if is_error:
+            raise XOutputError("The values of " + symbol + " are not scalar")
+        return None
@@ -0,0 +1,25 @@
+from ....Functions.Simulation.VarSimu.result_store import read_output
+
+
+def get_output(self, index):
+    """Return the Output of a simulation of the multi-simulation, the Outputs
+    streamed in path_store (not kept in output_list) are loaded on demand
+
+    Parameters
+    ----------
+    self : XOutput
+        A XOutput object
+    index : int
+        index of the simulation
+
+    Returns
+    -------
+    output : Output
+        Output of the simulation (None if not available)
+    """
+
+    output = self.output_list[index]
+    if output is None and self.path_store is not None:
+        # Not cached to keep only the requested Output in memory
+        output = read_output(self.path_store, range(len(self.output_list))[index])
+    return output
@@ -1,8 +1,9 @@
-from sys import getsizeof
+from ....Functions.get_memory_size import get_memory_size
 
 
 def print_memory(self, tab_level=0, detail_level=1, is_print=True):
-    """Print an estimation of the memory usage for each property of the object
+    """Print the memory usage of each property of the object (including the
+    content of the arrays and of the objects of the property)
 
     Parameters
     ----------
@@ -25,7 +26,7 @@ def print_memory(self, tab_level=0, detail_level=1, is_print=True):
     for _ in range(tab_level):
         tab += "    "
 
-    mem_str = tab + "Total XOutput size: " + str(getsizeof(self)) + " o\n"
+    mem_str = tab + "Total XOutput size: " + str(get_memory_size(self)) + " o\n"
     if detail_level == 0:
         print(mem_str)
         return
@@ -40,14 +41,16 @@ def print_memory(self, tab_level=0, detail_level=1, is_print=True):
     S1 = 0
     if self.paramexplorer_list is not None:
         for obj in self.paramexplorer_list:
-            S1 += getsizeof(obj)
+            S1 += get_memory_size(obj)
     mem_str += tab + "    paramexplorer_list: " + str(S1) + " o\n"
     # output_list
     S2 = 0
     out_list_str = ""
     if self.output_list is not None:
         for ii, obj in enumerate(self.output_list):
-            S = getsizeof(obj)
+            if obj is None:  # Not kept or in the store only
+                continue
+            S = get_memory_size(obj)
             S2 += S
             out_list_str += (
                 tab + "        output_list[" + str(ii) + "]: " + str(S) + " o\n"
@@ -62,9 +65,9 @@ def print_memory(self, tab_level=0, detail_level=1, is_print=True):
     S3 = 0
     if self.xoutput_dict is not None:
         for key, value in self.xoutput_dict.items():
-            S3 += getsizeof(key) + getsizeof(value)
+            S3 += get_memory_size(key) + get_memory_size(value)
     mem_str += tab + "    xoutput_dict: " + str(S3) + " o\n"
-    mem_str += tab + "    nb_simu: " + str(getsizeof(self.nb_simu)) + " o\n"
+    mem_str += tab + "    nb_simu: " + str(get_memory_size(self.nb_simu)) + " o\n"
 
     if is_print:
         print(mem_str)
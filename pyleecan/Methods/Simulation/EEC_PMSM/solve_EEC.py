@@ -57,7 +57,13 @@ def solve_EEC(self, output):
 
     # Compute currents
     output.elec.Is = None
-    output.elec.Is = output.elec.get_Is()
+    if output.elec.Is_harm is not None:
+        # Keep the currents as harmonics (time samples computed on demand)
+        if "Ud" in self.parameters:
+            output.elec.Is_harm = None
+            output.elec.Is_harm = output.elec.get_Is_harm()
+    else:
+        output.elec.Is = output.elec.get_Is()
 
     # Compute voltage
     output.elec.Us = None
@@ -1,6 +1,7 @@
 # -*- coding: utf-8 -*-
 
 from ....Methods.Simulation.Input import InputError
+from ....Functions.Simulation.profile_stage import profile_stage
 
 
 def run(self):
@@ -21,11 +22,13 @@ def run(self):
     axes_dict = self.comp_axes(output)
 
     # Compute the magnetic force according to the Force model
-    out_dict = self.comp_force(output, axes_dict)
+    with profile_stage(output, "Force.comp_force"):
+        out_dict = self.comp_force(output, axes_dict)
 
     # Store force quantities contained in out_dict in OutForce, as Data object if necessary
     output.force.store(out_dict, axes_dict)
 
     # Compute the air-gap surface force transfer if required
     if self.is_agsf_transfer:
-        self.comp_AGSF_transfer(output, self.max_wavenumber_transfer)
+        with profile_stage(output, "Force.comp_AGSF_transfer"):
+            self.comp_AGSF_transfer(output, self.max_wavenumber_transfer)
@@ -61,7 +61,7 @@ def element_loop(
         nb_node = mesh.node.nb_node  # Total nodes number
 
         # Nodal forces init
-        f = np.zeros((nb_node, dim, Nt_tot), dtype=np.float)
+        f = np.zeros((nb_node, dim, Nt_tot), dtype=float)
 
         # ref_cell = mesh.cell[key].interpolation.ref_cell // pas besoin d'interpoler car tout est cst
 
@@ -95,9 +95,7 @@ def element_loop(
 
             # elt magnetostrictive tensor
             if self.tensor["magnetostriction"]:
-                tme = self.comp_magnetostrictive_tensor(
-                    mue, Me, Nt_tot, polynomial_coeffs
-                )
+                tme = self.comp_magnetostrictive_tensor(Me, Nt_tot, polynomial_coeffs)
                 total_tensor += tme
 
             # Triangle orientation, needed for normal orientation. 1 if trigo oriented, -1 otherwise
@@ -3,9 +3,9 @@
 from ....Classes.OutElec import OutElec
 from ....Classes.Simulation import Simulation
 from ....Methods.Simulation.Input import InputError
-from numpy import ndarray, pi, mean, transpose, zeros
-from ....Functions.Electrical.coordinate_transformation import n2dq
-from SciDataTool import Data1D, DataTime
+from numpy import ndarray, pi, mean, transpose, zeros, isclose, where
+from ....Functions.Electrical.coordinate_transformation import n2dq, n2dq_harm
+from SciDataTool import Data1D, DataTime, DataFreq
 from ....Functions.Winding.gen_phase_list import gen_name
 
 
@@ -45,7 +45,44 @@ def gen_input(self):
 
     # Load and check Is
     if qs > 0:
-        if self.Is is None:
+        if self.Is is None and self.Is_harm is not None:
+            Is_harm = self.Is_harm.get_data()
+            if (
+                not isinstance(Is_harm, DataFreq)
+                or [axis.name for axis in Is_harm.axes] != ["phase", "freqs"]
+                or Is_harm.values.shape[0] != qs
+            ):
+                raise InputError(
+                    "ERROR: InputCurrent.Is_harm must be a DataFreq with axes "
+                    + "[phase, freqs] and "
+                    + str(qs)
+                    + " phases"
+                )
+            # Creating the data object (only the present frequencies are stored)
+            Phase = Data1D(
+                name="phase",
+                unit="",
+                values=gen_name(qs),
+                is_components=True,
+            )
+            freqs = Is_harm.axes[1].get_values()
+            output.Is_harm = DataFreq(
+                name="Stator current",
+                unit="A",
+                symbol="Is",
+                axes=[Phase, Data1D(name="freqs", unit="Hz", values=freqs)],
+                values=Is_harm.values,
+            )
+            output.Is = None
+            # Compute corresponding Id/Iq reference from the fundamental
+            Ifund = Is_harm.values[:, where(isclose(freqs, output.felec))[0]]
+            if Ifund.shape[1] == 0:
+                output.Id_ref, output.Iq_ref = 0, 0
+            else:
+                Idq = n2dq_harm(Ifund[:, 0], n=qs, is_dq_rms=True)
+                output.Id_ref = Idq[0]
+                output.Iq_ref = Idq[1]
+        elif self.Is is None:
             if self.Id_ref is None and self.Iq_ref is None:
                 raise InputError(
                     "ERROR: InputCurrent.Is, InputCurrent.Id_ref, and InputCurrent.Iq_ref missing"
@@ -71,6 +71,10 @@ def gen_input(self):
         simu.parent.elec.N0 = N0
     output = OutMag()
     output.store(out_dict=out_dict, axes_dict=axes_dict)
+    # Axes and radius of the enforced flux (as computed by Magnetics)
+    output.Time = axes_dict["Time"]
+    output.Angle = axes_dict["Angle"]
+    output.Rag = simu.machine.comp_Rgap_mec()
     simu.parent.mag = output
 
     # Define the electrical Output to set the Operating Point
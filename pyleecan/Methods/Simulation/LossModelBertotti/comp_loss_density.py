@@ -1,6 +1,6 @@
 # -*- coding: utf-8 -*-
 from SciDataTool import DataFreq, Data1D
-from numpy import newaxis, abs, sqrt, stack
+from numpy import abs, stack
 
 
 def comp_loss_density(self, meshsolution):
@@ -33,31 +33,31 @@ def comp_loss_density(self, meshsolution):
     # TODO Calculate principle axes and transform for exponentials other than 2
     # TODO maybe use rad. and tan. comp. as intermediate solution
 
-    # loop over field components
-    HY, ED, EX = None, None, None
+    # get the spectrum of all the field components
+    B_list = list()
     for component in sol.field.components.values():
         axes_names = ["freqs" if x.name == "time" else x.name for x in component.axes]
 
         # TODO add filter function to limit max. order of harmonics
         mag_dict = component.get_magnitude_along(*axes_names)
-        symbol = component.symbol
-
-        # TODO better data check (axis size, ...)
-        freqs = mag_dict["freqs"]
-        # freqs[freqs<0] = 0 # to only regard positive freqs
-        k = 1  # 1 / sqrt(2)
-        f_norm = abs(freqs[:, newaxis] / F_REF)
-        B_norm = k * mag_dict[symbol] / B_REF
-        # factor 1 / sqrt(2) to account for SciDataTool FFT of double sided spectrum
-        # TODO is this factor also true for powers other than 2 ?
-
-        HY_ = Coeff[0] * f_norm * B_norm ** Coeff[1]
-        ED_ = Coeff[2] * (f_norm * B_norm) ** Coeff[3]
-        EX_ = Coeff[4] * (f_norm * B_norm) ** Coeff[5]
-
-        HY = HY_ if HY is None else HY + HY_
-        ED = ED_ if ED is None else ED + ED_
-        EX = EX_ if EX is None else EX + EX_
+        B_list.append(mag_dict[component.symbol])
+
+    # TODO better data check (axis size, ...)
+    freqs = mag_dict["freqs"]
+    freqs_idx = axes_names.index("freqs")
+    f_shape = [1] * len(axes_names)
+    f_shape[freqs_idx] = freqs.size
+
+    # compute all the components, harmonics and elements at once
+    k = 1  # 1 / sqrt(2)
+    f_norm = abs(freqs / F_REF).reshape(f_shape)
+    B_norm = k * stack(B_list, axis=0) / B_REF
+    # factor 1 / sqrt(2) to account for SciDataTool FFT of double sided spectrum
+    # TODO is this factor also true for powers other than 2 ?
+
+    HY = (Coeff[0] * f_norm * B_norm ** Coeff[1]).sum(axis=0)
+    ED = (Coeff[2] * (f_norm * B_norm) ** Coeff[3]).sum(axis=0)
+    EX = (Coeff[4] * (f_norm * B_norm) ** Coeff[5]).sum(axis=0)
 
     loss = HY + ED + EX
 
@@ -0,0 +1,90 @@
+# -*- coding: utf-8 -*-
+from numpy import array, moveaxis
+from SciDataTool import DataFreq, Data1D
+
+
+def comp_loss_sum(
+    self, meshsolution, k_freq=None, group_names=None, coeff=1, is_stored=False
+):
+    """Compute the losses of each group, harmonic and component for a list of
+    frequency scaling factors (e.g. N0 / N0_ref for a speed sweep) at once.
+    The per element and per harmonic loss density is computed once (cf
+    get_loss_density), the speeds are obtained by scaling each component with
+    k_freq**alpha (alpha=1 for hysteresis).
+
+    Parameters
+    ----------
+    self : LossModelBertotti
+        a LossModelBertotti object
+    meshsolution : MeshSolution
+        a MeshSolution object with the flux density solution "B"
+    k_freq : list
+        list of frequency scaling factors (default [1])
+    group_names : [str]
+        list of the name of the group(s) for the loss breakdown
+        (default: all the elements of the MeshSolution)
+    coeff : float
+        multiplicative coefficient to get the losses in W (e.g. L1*rho*sym)
+    is_stored : bool
+        True to integrate the loss density already stored in the MeshSolution
+        (cf get_loss_density) instead of computing it from "B"
+
+    Returns
+    -------
+    loss_sum: DataFreq
+        losses (speed, group, freqs, Components), freqs being the frequencies
+        at the reference speed
+    """
+
+    if k_freq is None:
+        k_freq = [1]
+    k_freq = array(k_freq, dtype=float)
+
+    # get the loss density (Nf, Ne, 3)
+    if is_stored:
+        LossDensComps = meshsolution.get_solution(label="LossDensComps").field
+    else:
+        _, LossDensComps = self.get_loss_density(meshsolution)
+    axes_names = [axis.name for axis in LossDensComps.axes]
+    other_names = [name for name in axes_names if name != "indice"]
+
+    if group_names is None:
+        group_list = [None]
+        group_names = [meshsolution.label]
+    else:
+        group_list = group_names
+
+    # integral over the elements of each group (Ngrp, Nf, 3)
+    loss_grp = list()
+    for grp in group_list:
+        loss = meshsolution.integrate(label="LossDensComps", group=grp, order=0)
+        loss_grp.append(
+            moveaxis(
+                loss,
+                [other_names.index("freqs"), other_names.index("Components")],
+                [0, 1],
+            )
+        )
+    loss_grp = array(loss_grp) * coeff
+
+    # losses for all the speeds at once (Nk, Ngrp, Nf, 3)
+    alphas = array([1, self.alpha_ed, self.alpha_ex])  # hyst. is prop. to freq.
+    k = k_freq[:, None] ** alphas[None, :]
+    loss_sum = k[:, None, None, :] * loss_grp[None, ...]
+
+    Speed = Data1D(name="speed", unit="", values=k_freq)
+    Group = Data1D(name="group", unit="", values=group_names, is_components=True)
+    axes = [
+        Speed,
+        Group,
+        LossDensComps.axes[axes_names.index("freqs")].copy(),
+        LossDensComps.axes[axes_names.index("Components")].copy(),
+    ]
+
+    return DataFreq(
+        name="Losses sum",
+        unit="W",
+        symbol="LossSum",
+        axes=axes,
+        values=loss_sum,
+    )
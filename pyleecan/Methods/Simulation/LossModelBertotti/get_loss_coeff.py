@@ -0,0 +1,33 @@
+# -*- coding: utf-8 -*-
+
+
+def get_loss_coeff(self, output, part_label):
+    """Return the coefficient to get the losses [W] of the whole machine part
+    from the integral of the loss density [W/kg] over the simulated cross
+    section (length * mass density * symmetry factor)
+
+    Parameters
+    ----------
+    self : LossModelBertotti
+        a LossModelBertotti object
+    output : Output
+        an Output object
+    part_label : str
+        label of the machine part, e.g. 'Stator'
+
+    Returns
+    -------
+    coeff : float
+        L1 * rho * sym
+    """
+    simu = output.simu
+    lam = simu.machine.get_lam_by_label(part_label)
+
+    # Set the symmetry factor according to the machine
+    if simu.mag.is_periodicity_a:
+        sym, is_antiper_a, _, _ = output.get_machine_periodicity()
+        sym *= is_antiper_a + 1
+    else:
+        sym = 1
+
+    return lam.L1 * lam.mat_type.struct.rho * sym
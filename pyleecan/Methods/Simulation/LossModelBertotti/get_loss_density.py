@@ -0,0 +1,38 @@
+# -*- coding: utf-8 -*-
+
+from ....Classes.SolutionData import SolutionData
+
+
+def get_loss_density(self, meshsolution):
+    """Compute the loss density per element and per harmonic (at the simulated
+    speed) and store it in the MeshSolution (solutions "LossDens" and
+    "LossDensComps") to be integrated on the groups (cf comp_loss_sum).
+
+    Parameters
+    ----------
+    self : LossModelBertotti
+        a LossModelBertotti object
+    meshsolution : MeshSolution
+        a MeshSolution object with the flux density solution "B"
+
+    Returns
+    -------
+    loss_density: DataFreq
+        loss density [W/kg] (freqs, indice)
+    loss_density_comps: DataFreq
+        loss density [W/kg] of each component (freqs, indice, Components)
+    """
+
+    loss_density, loss_density_comps = self.comp_loss_density(meshsolution)
+
+    meshsolution.solution = [
+        sol
+        for sol in meshsolution.solution
+        if sol.label not in ["LossDens", "LossDensComps"]
+    ]
+    meshsolution.solution.append(SolutionData(field=loss_density, label="LossDens"))
+    meshsolution.solution.append(
+        SolutionData(field=loss_density_comps, label="LossDensComps")
+    )
+
+    return loss_density, loss_density_comps
@@ -1,7 +1,19 @@
 # -*- coding: utf-8 -*-
 
-from numpy import array, nan, tile, newaxis, ones_like
-from SciDataTool import DataTime, Data1D
+from numpy import (
+    array,
+    nan,
+    tile,
+    newaxis,
+    ones_like,
+    concatenate,
+    conj,
+    unique,
+    round as np_round,
+    zeros,
+    add,
+)
+from SciDataTool import DataTime, DataFreq, Data1D
 
 from ....Classes.SolutionData import SolutionData
 from ....Functions.getattr_recursive import getattr_recursive
@@ -29,7 +41,21 @@ def comp_loss(self, output, part_label):
     # check that lamination has a winding
     if hasattr(lam, "winding") and lam.winding is not None:
         R = lam.comp_resistance_wind(T=self.temperature)
-        if lam.is_stator:
+        if lam.is_stator and output.elec.Is is None and output.elec.Is_harm is not None:
+            # Harmonic mode: the squared current is computed on the harmonics
+            # (the mean losses are the 0 Hz component, the time data can be
+            # requested with get_along("time=axis_data", axis_data=...))
+            current = output.elec.Is_harm
+            freqs, I2 = _square_harm(current.axes[1].get_values(), current.values)
+            data = DataFreq(
+                name=self.name,
+                unit="W",
+                symbol="Loss",
+                axes=[current.axes[0], Data1D(name="freqs", unit="Hz", values=freqs)],
+                values=R * I2,
+            )
+            return data, None
+        elif lam.is_stator:
             current = output.elec.get_Is()
         else:
             current = output.elec.get_Ir()
@@ -50,3 +76,41 @@ def comp_loss(self, output, part_label):
     else:
         logger.warning("LossModelWinding.comp_loss(): Lamination has no winding.")
         return None, None
+
+
+def _square_harm(freqs, values):
+    """Compute the single-sided spectrum of the square of a real signal given by
+    its single-sided spectrum, i.e. the self convolution of the present harmonics
+
+    Parameters
+    ----------
+    freqs : ndarray
+        frequency vector (Nf) [Hz]
+    values : ndarray
+        single-sided complex amplitudes (... x Nf)
+
+    Returns
+    -------
+    freqs_sq : ndarray
+        frequency vector of the squared signal (Nf_sq) [Hz]
+    values_sq : ndarray
+        single-sided complex amplitudes of the squared signal (... x Nf_sq)
+    """
+    # Two-sided spectrum
+    is_dc = freqs == 0
+    half = values / 2
+    half[..., is_dc] = values[..., is_dc]
+    f2 = concatenate((freqs, -freqs[~is_dc]))
+    c2 = concatenate((half, conj(half[..., ~is_dc])), axis=-1)
+
+    # All the products of two harmonics, kept on the positive frequencies only
+    f_prod = (f2[:, None] + f2[None, :]).ravel()
+    c_prod = (c2[..., :, None] * c2[..., None, :]).reshape(c2.shape[:-1] + (-1,))
+    is_pos = np_round(f_prod, 9) >= 0
+    freqs_sq, index = unique(np_round(f_prod[is_pos], 9), return_inverse=True)
+    values_sq = zeros(c2.shape[:-1] + (freqs_sq.size,), dtype=complex)
+    add.at(values_sq.T, index, c_prod[..., is_pos].T)
+
+    # Back to single-sided spectrum
+    values_sq[..., freqs_sq > 0] *= 2
+    return freqs_sq, values_sq
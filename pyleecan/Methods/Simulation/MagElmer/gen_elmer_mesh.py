@@ -1,7 +1,6 @@
 # -*- coding: utf-8 -*-
-import subprocess
-
 from ....Functions.get_path_binary import get_path_binary
+from ....Functions.Simulation.run_FEA_job import run_FEA_job, FEAJobError
 
 
 def gen_elmer_mesh(self, output):
@@ -35,17 +34,10 @@ def gen_elmer_mesh(self, output):
         "-out",
         elmermesh_folder,
     ]
-    self.get_logger().info("Calling ElmerGrid: " + " ".join(map(str, cmd_elmergrid)))
-    elmergrid = subprocess.Popen(
-        cmd_elmergrid, stdout=subprocess.PIPE, stderr=subprocess.PIPE
-    )
-    (stdout, stderr) = elmergrid.communicate()
-    elmergrid.wait()
-    self.get_logger().info(stdout.decode("UTF-8"))
-    if elmergrid.returncode != 0:
-        self.get_logger().info("ElmerGrid [Error]: " + stderr.decode("UTF-8"))
+    try:
+        run_FEA_job(cmd_elmergrid, name="ElmerGrid", logger=self.get_logger())
+    except FEAJobError as error:
+        self.get_logger().info("ElmerGrid [Error]: " + str(error))
         return False
-    elmergrid.terminate()
-    self.get_logger().info("ElmerGrid call complete!")
 
     return True
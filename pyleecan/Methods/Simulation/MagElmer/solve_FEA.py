@@ -1,5 +1,4 @@
 import numpy as np
-import subprocess
 
 from numpy import (
     zeros,
@@ -23,6 +22,7 @@ from ....Methods.Simulation.MagElmer import surface_label
 from ....Functions.Winding.find_wind_phase_color import get_phase_id
 from .... import __version__
 from ....Functions.get_path_binary import get_path_binary
+from ....Functions.Simulation.run_FEA_job import run_FEA_job, FEAJobError
 
 from ....Classes.HoleM50 import HoleM50
 from ....Classes.HoleM51 import HoleM51
@@ -923,22 +923,13 @@ def solve_FEA(self, output, sym, angle, time, angle_rotor, Is, Ir):
         ElmerSolver_binary,
         elmer_settings,
     ]
-    self.get_logger().info(
-        "Calling ElmerSolver: " + " ".join(map(str, cmd_elmersolver))
-    )
-    elmersolver = subprocess.Popen(
-        cmd_elmersolver, stdout=subprocess.PIPE, stderr=subprocess.PIPE
-    )
-    (stdout, stderr) = elmersolver.communicate()
-    elmersolver.wait()
-    self.get_logger().info(stdout.decode("UTF-8"))
-    if elmersolver.returncode != 0:
-        self.get_logger().info("ElmerSolver [Error]: " + stderr.decode("UTF-8"))
+    try:
+        run_FEA_job(cmd_elmersolver, name="ElmerSolver", logger=self.get_logger())
+    except FEAJobError as error:
+        self.get_logger().info("ElmerSolver [Error]: " + str(error))
         return False
-    elmersolver.terminate()
-    self.get_logger().info("ElmerSolver call complete!")
 
-    self.get_meshsolution(output)
+    self.get_meshsolution(output, time=time[:timelen])
 
     Na = angle.size
     Nt = time.size - 1
@@ -4,10 +4,10 @@ from numpy import zeros, pi, roll, cos, sin
 
 # from scipy.interpolate import interp1d
 
-from ....Classes._FEMMHandler import _FEMMHandler
 from ....Functions.FEMM.update_FEMM_simulation import update_FEMM_simulation
 from ....Functions.FEMM.comp_FEMM_torque import comp_FEMM_torque
 from ....Functions.FEMM.comp_FEMM_Phi_wind import comp_FEMM_Phi_wind
+from ....Functions.FEMM.comp_FEMM_results_batch import comp_FEMM_results_batch
 
 
 def solve_FEMM(
@@ -26,6 +26,7 @@ def solve_FEMM(
     filename=None,
     start_t=0,
     end_t=None,
+    is_get_mesh=True,
 ):
     """
     Solve FEMM model to calculate airgap flux density, torque instantaneous/average/ripple values,
@@ -71,6 +72,8 @@ def solve_FEMM(
         Index of first time step (0 by default, used for parallelization)
     end_t: int
         Index of last time step (Nt by default, used for parallelization)
+    is_get_mesh: bool
+        False to skip the creation of the mesh (already known, parallelization)
 
     Returns
     -------
@@ -83,7 +86,7 @@ def solve_FEMM(
             femm.openfemm(1)
         except:
             # Create a new FEMM handler in case of parallelization on another FEMM instance
-            femm = _FEMMHandler()
+            femm = type(femm)()
             output.mag.internal.handler_list.append(femm)
             # Open the document
             femm.openfemm(1)
@@ -114,6 +117,16 @@ def solve_FEMM(
             lam = machine.get_lam_by_label(key)
             qs[key] = lam.winding.qs  # Winding phase number
             Npcp[key] = lam.winding.Npcp  # parallel paths
+        if self.is_batch_post:
+            # Circuits of each lamination in the order of Phi_wind
+            circ_dict = {}
+            circuits = list()
+            for key in out_dict["Phi_wind"].keys():
+                label = "Circs" if machine.get_lam_by_label(key).is_stator else "Circr"
+                circ_dict[key] = slice(len(circuits), len(circuits) + qs[key])
+                circuits.extend([label + str(q) for q in range(qs[key])])
+    else:
+        circuits = list()
 
     # Account for initial angular shift of stator and rotor and apply it to the sliding band
     angle_shift = self.angle_rotor_shift - self.angle_stator_shift
@@ -158,34 +171,65 @@ def solve_FEMM(
         # Load results
         femm.mi_loadsolution()
 
-        # Get the flux result
-        if self.is_sliding_band:
-            for jj in range(Na):
-                out_dict["Br"][ii, jj], out_dict["Bt"][ii, jj] = femm.mo_getgapb(
-                    "bc_ag2", angle[jj] * 180 / pi
-                )
+        if self.is_batch_post:
+            # Get the flux, torque and circuits results with a single Lua script
+            results = comp_FEMM_results_batch(
+                femm,
+                save_path,
+                angle,
+                Rag,
+                self.is_sliding_band,
+                FEMM_dict,
+                circuits,
+                sym=sym,
+                id_worker=start_t,
+            )
+            out_dict["Br"][ii, :] = results["Br"]
+            out_dict["Bt"][ii, :] = results["Bt"]
+            out_dict["Tem"][ii] = results["Tem"]
+            if "Phi_wind" in out_dict:
+                for key in out_dict["Phi_wind"].keys():
+                    # flux linkage rescaled to account for end winding flux
+                    out_dict["Phi_wind"][key][ii, :] = (
+                        sym
+                        * results["circuit"][circ_dict[key], 2]
+                        * L1
+                        / FEMM_dict["Lfemm"]
+                        / Npcp[key]
+                    )
         else:
-            for jj in range(Na):
-                B = femm.mo_getb(Rag * cos(angle[jj]), Rag * sin(angle[jj]))
-                out_dict["Br"][ii, jj] = B[0] * cos(angle[jj]) + B[1] * sin(angle[jj])
-                out_dict["Bt"][ii, jj] = -B[0] * sin(angle[jj]) + B[1] * cos(angle[jj])
+            # Get the flux result
+            if self.is_sliding_band:
+                for jj in range(Na):
+                    out_dict["Br"][ii, jj], out_dict["Bt"][ii, jj] = femm.mo_getgapb(
+                        "bc_ag2", angle[jj] * 180 / pi
+                    )
+            else:
+                for jj in range(Na):
+                    B = femm.mo_getb(Rag * cos(angle[jj]), Rag * sin(angle[jj]))
+                    out_dict["Br"][ii, jj] = B[0] * cos(angle[jj]) + B[1] * sin(
+                        angle[jj]
+                    )
+                    out_dict["Bt"][ii, jj] = -B[0] * sin(angle[jj]) + B[1] * cos(
+                        angle[jj]
+                    )
 
-        # Compute the torque
-        out_dict["Tem"][ii] = comp_FEMM_torque(femm, FEMM_dict, sym=sym)
+            # Compute the torque
+            out_dict["Tem"][ii] = comp_FEMM_torque(femm, FEMM_dict, sym=sym)
 
-        if "Phi_wind" in out_dict:
-            # Phi_wind computation
-            # TODO fix inconsistency for multi lam machines here
-            for key in out_dict["Phi_wind"].keys():
-                out_dict["Phi_wind"][key][ii, :] = comp_FEMM_Phi_wind(
-                    femm,
-                    qs[key],
-                    Npcp[key],
-                    is_stator=machine.get_lam_by_label(key).is_stator,
-                    Lfemm=FEMM_dict["Lfemm"],
-                    L1=L1,
-                    sym=sym,
-                )
+            if "Phi_wind" in out_dict:
+                # Phi_wind computation
+                # TODO fix inconsistency for multi lam machines here
+                for key in out_dict["Phi_wind"].keys():
+                    out_dict["Phi_wind"][key][ii, :] = comp_FEMM_Phi_wind(
+                        femm,
+                        qs[key],
+                        Npcp[key],
+                        is_stator=machine.get_lam_by_label(key).is_stator,
+                        Lfemm=FEMM_dict["Lfemm"],
+                        L1=L1,
+                        sym=sym,
+                    )
 
         # Load mesh data & solution
         if (self.is_sliding_band or Nt == 1) and (self.is_get_meshsolution):
@@ -195,16 +239,17 @@ def solve_FEMM(
                 save_path,
                 j_t0=ii,
                 id_worker=start_t,
-                is_get_mesh=ii == start_t,
+                is_get_mesh=is_get_mesh and ii == start_t,
             )
 
             # Store magnetic flux density, field and relative permeability for the current time step
 
             # Initialize mesh and magnetic quantities for first time step
             if ii == start_t:
-                meshFEMM = [tmpmeshFEMM]
+                if tmpmeshFEMM is not None:
+                    meshFEMM = [tmpmeshFEMM]
                 groups = tmpgroups
-                Nelem = meshFEMM[0].cell["triangle"].nb_cell
+                Nelem = tmpB.shape[0]
                 Nt0 = end_t - start_t
                 B_elem = zeros([Nt0, Nelem, 3])
                 H_elem = zeros([Nt0, Nelem, 3])
@@ -220,8 +265,11 @@ def solve_FEMM(
     # Shift to take into account stator position
     if self.angle_stator_shift != 0:
         roll_id = int(self.angle_stator_shift * Na / (2 * pi))
-        out_dict["Br"] = roll(out_dict["Br"], roll_id, axis=1)
-        out_dict["Bt"] = roll(out_dict["Bt"], roll_id, axis=1)
+        # Only the computed time steps (the arrays are shared by the workers)
+        for key in ["Br", "Bt"]:
+            out_dict[key][start_t:end_t] = roll(
+                out_dict[key][start_t:end_t], roll_id, axis=1
+            )
 
         # # Interpolate on updated angular position # TODO to improve accuracy
         # angle_new = (angle - self.angle_stator_shift) % (2 * pi / sym)
@@ -1,12 +1,14 @@
 from multiprocessing import cpu_count
 from multiprocessing.dummy import Pool
 from os import remove
+from queue import Queue, Empty
+from threading import Lock
 
 from shutil import copyfile
 
-from numpy import concatenate
+from numpy import zeros
 
-from ....Classes._FEMMHandler import _FEMMHandler
+from ....Functions.FEMM.handler_pool import get_handler_list, release_handler_list
 
 
 def solve_FEMM_parallel(
@@ -23,14 +25,18 @@ def solve_FEMM_parallel(
     angle_rotor,
 ):
     """
-    Same as solve_FEMM including parallelization on several workers
+    Same as solve_FEMM including parallelization on several workers.
+    The time steps are handed out one by one: each worker takes the next time
+    step as soon as it is done with the previous one, so that slow time steps
+    don't leave the other workers idle. The FEMM instances are taken from a
+    pool and are reused by the next simulations of a multi-simulation.
 
     Parameters
     ----------
     self: MagFEMM
         A MagFEMM object
     femm: FEMMHandler
-        Object to handle FEMM
+        Object to handle FEMM (closed, its class is used for the workers)
     output: Output
         An Output object
     out_dict: dict
@@ -74,67 +80,85 @@ def solve_FEMM_parallel(
 
     # The following function must be in solve_FEMM_parallel to access
     # to its variable without passing them in arguments
-    def solve_FEMM_single(femm_handler, filename, start_t, end_t):
+    def solve_FEMM_worker(id_worker):
         """
-        Call FEMM to compute airgap flux density from start_t to end_t timesteps
+        Call FEMM to compute the time steps of the queue until it is empty
 
-        This function is called in threads, the shared memory enable to modify global variable
-        defined in solve_FEMM_parallel such as Br and Bt
+        This function is called in threads, the shared memory enable to modify
+        the arrays defined in solve_FEMM_parallel (out_dict and mesh_dict) at
+        the index of each time step
 
         Parameters
         ----------
-
-        femm_handler : _FEMMHandler
-            FEMM handler
-        filename : str
-            .fem file path
-        start_t : int
-            first timestep to compute
-        end_t: int
-            last timestep to compute
+        id_worker : int
+            index of the worker (FEMM handler and .fem file)
 
         Returns
         -------
-        B: ndarray
-            3D Magnetic flux density for time steps of the current FEMM instance and each element (Nt0, Nelem, 3) [T]
-        H : ndarray
-            3D Magnetic field for time steps of the current FEMM instance and each element (Nt0, Nelem, 3) [A/m]
-        mu : ndarray
-            Magnetic relative permeability for time steps of the current FEMM instance and each element (Nt0, Nelem) []
-        mesh: MeshMat
-            Object containing magnetic mesh at first time step of the current FEMM instance
-        groups: dict
-            Dict whose values are group label and values are array of indices of related elements
-
+        time_list : list
+            time steps computed by the worker
         """
-
-        B_elem, H_elem, mu_elem, meshFEMM, groups = self.solve_FEMM(
-            femm_handler,
-            output,
-            out_dict,
-            FEMM_dict,
-            sym=sym,
-            Nt=Nt,
-            angle=angle,
-            Is=Is,
-            Ir=Ir,
-            angle_rotor=angle_rotor,
-            is_close_femm=True,
-            filename=filename,
-            start_t=start_t,
-            end_t=end_t,
-        )
-
-        return B_elem, H_elem, mu_elem, meshFEMM, groups
-
-    # Init mesh solution as None since array allocation can only be done once
-    # number of elements is known, i.e. after first time step resolution
-    B_elem, H_elem, mu_elem, meshFEMM, groups = None, None, None, None, None
+        femm_handler = handler_list[id_worker]
+        femm_handler.opendocument(femm_files[id_worker])
+        time_list = list()
+        while True:
+            try:
+                ii = task_queue.get_nowait()
+            except Empty:
+                return time_list
+            # The mesh is extracted only once
+            with lock:
+                is_get_mesh = mesh_dict["is_get_mesh"]
+                mesh_dict["is_get_mesh"] = False
+            try:
+                B_elem, H_elem, mu_elem, meshFEMM, groups = self.solve_FEMM(
+                    femm_handler,
+                    output,
+                    out_dict,
+                    FEMM_dict,
+                    sym=sym,
+                    Nt=Nt,
+                    angle=angle,
+                    Is=Is,
+                    Ir=Ir,
+                    angle_rotor=angle_rotor,
+                    is_close_femm=False,
+                    start_t=ii,
+                    end_t=ii + 1,
+                    is_get_mesh=is_get_mesh,
+                )
+            except Exception:
+                # Stop the other workers
+                while not task_queue.empty():
+                    try:
+                        task_queue.get_nowait()
+                    except Empty:
+                        pass
+                raise
+            time_list.append(ii)
+
+            # Store the results of the time step in the arrays of all time steps
+            if B_elem is not None:
+                with lock:
+                    if mesh_dict["B"] is None:
+                        Nelem = B_elem.shape[1]
+                        mesh_dict["B"] = zeros((Nt, Nelem, 3))
+                        mesh_dict["H"] = zeros((Nt, Nelem, 3))
+                        mesh_dict["mu"] = zeros((Nt, Nelem))
+                    if meshFEMM is not None:
+                        mesh_dict["mesh"] = meshFEMM
+                        mesh_dict["groups"] = groups
+                mesh_dict["B"][ii] = B_elem[0]
+                mesh_dict["H"][ii] = H_elem[0]
+                mesh_dict["mu"][ii] = mu_elem[0]
 
     # Loading parameters for readibility
     fem_file = self.get_path_save_fem(output)
     nb_worker = self.nb_worker
     logger = self.get_logger()
+    simu = output.simu
+    # Keep the FEMM instances open for the next steps of a multi-simulation
+    is_keep_femm = simu is not None and simu.layer is not None and simu.layer > 0
 
     # Check method parameters
     if nb_worker > cpu_count():
@@ -149,64 +173,61 @@ def solve_FEMM_parallel(
         )
         nb_worker = Nt
 
-    # Copy femm file and create lists to split the tasks
-    nb_task_worker = []  # nb of task for each worker
-    nb_task_to_split = Nt  # number of task remaining to split
-    for w in range(nb_worker, 0, -1):
-        # Copy the file
-        copyfile(fem_file, fem_file[:-4] + "_" + str(w) + ".fem")
-        # Compute the number of task for this worker
-        nb_task_worker.append(nb_task_to_split // w + ((nb_task_to_split % w) > 0))
-        # Remove the number of task of this worker from the number of remaining tasks
-        nb_task_to_split -= nb_task_worker[-1]
-
-    # Define the argument lists:
-    #   - femm_handler
-    #   - femm_file
-    #   - start_time : index of the first time step to compute
-    #   - end_time : index of the last time step to compute
-    femm_handler = [_FEMMHandler() for i in range(nb_worker)]
+    # Copy femm file for each worker
     femm_files = [
         fem_file[:-4] + "_" + str(i) + ".fem" for i in range(1, nb_worker + 1)
     ]
-    start_time_list = [sum(nb_task_worker[:i]) for i in range(nb_worker)]
-    end_time_list = [sum(nb_task_worker[: i + 1]) for i in range(nb_worker)]
-
-    # Gathering the different arguments for each instance
-    args = [
-        [i, j, k, l]
-        for i, j, k, l in zip(femm_handler, femm_files, start_time_list, end_time_list)
-    ]
-
-    # append femm_handler to handler_list
-    output.mag.internal.handler_list.extend(femm_handler)
-
-    # Creating threads pool
-    pool = Pool(nb_worker)
+    for femm_file in femm_files:
+        copyfile(fem_file, femm_file)
+
+    # Time steps to compute (handed out one by one to the workers)
+    task_queue = Queue()
+    for ii in range(Nt):
+        task_queue.put(ii)
+
+    # Mesh and magnetic quantities of all the time steps (the arrays are
+    # allocated once the number of elements is known, i.e. after the first
+    # time step resolution)
+    mesh_dict = {
+        "B": None,
+        "H": None,
+        "mu": None,
+        "mesh": None,
+        "groups": None,
+        "is_get_mesh": True,
+    }
+    lock = Lock()
+
+    # FEMM instances (reused from the previous simulations if any)
+    handler_list = get_handler_list(nb_worker, type(femm))
+    output.mag.internal.handler_list.extend(handler_list)
 
     # Computing FEMM in parallel
-    results = pool.starmap(solve_FEMM_single, args)
-
-    # Building mesh solution
-    if self.is_get_meshsolution:
-        B_elem = concatenate([res[0] for res in results], axis=0)
-        H_elem = concatenate([res[1] for res in results], axis=0)
-        mu_elem = concatenate([res[2] for res in results], axis=0)
-        meshFEMM = results[0][3]
-        groups = results[0][4]
+    pool = Pool(nb_worker)
+    try:
+        time_lists = pool.map(solve_FEMM_worker, range(nb_worker))
+    finally:
+        pool.close()
+        for femm_handler in handler_list:
+            output.mag.internal.handler_list.remove(femm_handler)
+        release_handler_list(handler_list, is_keep=is_keep_femm)
+    logger.debug(
+        "Number of time steps per FEMM worker: "
+        + str([len(time_list) for time_list in time_lists])
+    )
 
     # Remove temporary .fem and .ans files
-    for w in range(nb_worker, 0, -1):
-        try:
-            remove(fem_file[:-4] + "_" + str(w) + ".fem")
-        except:
-            filename = fem_file[:-4] + "_" + str(w) + ".fem"
-            self.get_logger().warning("Could not remove file: " + filename)
-
-        try:
-            remove(fem_file[:-4] + "_" + str(w) + ".ans")
-        except:
-            filename = fem_file[:-4] + "_" + str(w) + ".ans"
-            self.get_logger().warning("Could not remove file: " + filename)
-
-    return B_elem, H_elem, mu_elem, meshFEMM, groups
+    for femm_file in femm_files:
+        for filename in [femm_file, femm_file[:-4] + ".ans"]:
+            try:
+                remove(filename)
+            except:
+                self.get_logger().warning("Could not remove file: " + filename)
+
+    return (
+        mesh_dict["B"],
+        mesh_dict["H"],
+        mesh_dict["mu"],
+        mesh_dict["mesh"],
+        mesh_dict["groups"],
+    )
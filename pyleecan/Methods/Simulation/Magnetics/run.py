@@ -1,5 +1,6 @@
 # -*- coding: utf-8 -*-
 from ....Methods.Simulation.Input import InputError
+from ....Functions.Simulation.profile_stage import profile_stage
 
 
 def run(self):
@@ -21,7 +22,8 @@ def run(self):
     axes_dict = self.comp_axes(output)
 
     # Calculate airgap flux
-    out_dict = self.comp_flux_airgap(output, axes_dict)
+    with profile_stage(output, "Magnetics.comp_flux_airgap"):
+        out_dict = self.comp_flux_airgap(output, axes_dict)
 
     # Store magnetic quantities contained in out_dict in OutMag, as Data object if necessary
     output.mag.store(out_dict, axes_dict)
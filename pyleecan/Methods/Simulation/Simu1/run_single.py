@@ -3,6 +3,7 @@
 from ....Methods.Simulation.Input import InputError
 from ....Classes.PostFunction import PostFunction
 from ....Classes.PostMethod import PostMethod
+from ....Functions.Simulation.profile_stage import profile_stage
 
 
 def run_single(self):
@@ -19,31 +20,52 @@ def run_single(self):
     if self.parent is None:
         raise InputError("ERROR: Simulation object must be inside an Output object")
     output = self.parent
-    output.geo = self.machine.comp_output_geo()
+    output.profile = None  # Profile of the current run only
+    if self.geo_enforced is None:
+        with profile_stage(output, "Machine.comp_output_geo"):
+            output.geo = self.machine.comp_output_geo()
+    else:  # Geometry computed by another simulation (same machine)
+        # Own copy: the geometry is updated by each simulation (e.g. rot_dir)
+        output.geo = self.geo_enforced.copy()
+
+    # Stages with results already in the output (reused from another simulation)
+    reused_list = self.reused_stage_list
+    if reused_list:
+        logger.info(
+            "Skipping " + ", ".join(reused_list) + " (reference simulation results)"
+        )
 
     # Init the input of the first module
-    self.input.gen_input()
+    if "Electrical" not in reused_list:
+        with profile_stage(output, "Input.gen_input"):
+            self.input.gen_input()
 
     # Run the modules
-    if self.elec is not None:
-        self.elec.run()
-    if self.mag is not None:
-        self.mag.run()
+    if self.elec is not None and "Electrical" not in reused_list:
+        with profile_stage(output, "Electrical.run"):
+            self.elec.run()
+    if self.mag is not None and "Magnetics" not in reused_list:
+        with profile_stage(output, "Magnetics.run"):
+            self.mag.run()
 
-    if self.force is not None:
-        self.force.run()
+    if self.force is not None and "Force" not in reused_list:
+        with profile_stage(output, "Force.run"):
+            self.force.run()
     # if self.HT is not None:
     #     self.HT.run()
-    if self.struct is not None:
-        self.struct.run()
+    if self.struct is not None and "Structural" not in reused_list:
+        with profile_stage(output, "Structural.run"):
+            self.struct.run()
     # if self.ac is not None:
     #     self.ac.run()
 
-    if self.loss is not None:
-        self.loss.run()
+    if self.loss is not None and "Loss" not in reused_list:
+        with profile_stage(output, "Loss.run"):
+            self.loss.run()
     # Running postprocessings
 
     if self.postproc_list:
         logger.info("Running simulation postprocessings...")
         for postproc in self.postproc_list:
-            postproc.run(output)
+            with profile_stage(output, type(postproc).__name__ + ".run"):
+                postproc.run(output)
@@ -1,8 +1,6 @@
 # -*- coding: utf-8 -*-
-from os.path import join
-import subprocess
-
 from ....Functions.get_path_binary import get_path_binary
+from ....Functions.Simulation.run_FEA_job import run_FEA_job, FEAJobError
 
 
 class ElmerProcessError(Exception):
@@ -11,32 +9,23 @@ class ElmerProcessError(Exception):
     pass
 
 
-def _execute(binary_name, cwd, logger, parameter=None):
-    """Function to execute Elmer Binaries in the current working directory 'cwd'"""
+def _execute(binary_name, cwd, logger, parameter=None, timeout=None):
+    """Function to execute Elmer Binaries in the current working directory 'cwd'
+    (the output of the process is streamed to the logger)"""
     # Elmer must be installed and in the PATH
     binary = get_path_binary(binary_name)
+    if binary is None:
+        raise ElmerProcessError(f"{binary_name} executable not found")
 
-    cmd = ['"' + binary + '"']
-    logger.info(f"Calling {binary_name}: " + " ".join(map(str, cmd)))
-
+    cmd = [binary]
     if parameter:
         cmd.extend(parameter)
 
-    popen = subprocess.Popen(
-        " ".join(cmd),
-        stdout=subprocess.PIPE,
-        universal_newlines=True,
-        shell=True,
-        cwd=cwd,
-    )
-
-    for stdout_line in iter(popen.stdout.readline, ""):
-        yield stdout_line
-    popen.stdout.close()
-    return_code = popen.wait()
-    if return_code:
+    try:
+        run_FEA_job(cmd, cwd=cwd, name=binary_name, timeout=timeout, logger=logger)
+    except FEAJobError as error:
         raise ElmerProcessError(
-            f"Elmer Process Error while executing {' '.join(cmd)}: Return Code [{return_code}]"
+            f"Elmer Process Error while executing {' '.join(cmd)}: {error}"
         )
 
 
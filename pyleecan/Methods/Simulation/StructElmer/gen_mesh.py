@@ -89,7 +89,8 @@ def _gen_mesh(cwd, out_name, lam_name, mag_name=None, logger=None):
     """
     # command line parameter to ElmerGrid
     parameter = []
-    parameter.append("14 2")
+    parameter.append("14")
+    parameter.append("2")
     parameter.append(lam_name)
     if mag_name is not None:
         parameter.append("-in")
@@ -103,7 +104,6 @@ def _gen_mesh(cwd, out_name, lam_name, mag_name=None, logger=None):
     parameter.append("-names")
 
     # execute ElmerGrid
-    for info in _execute("ElmerGrid", cwd, logger, parameter=parameter):
-        print(info, end="")
+    _execute("ElmerGrid", cwd, logger, parameter=parameter)
 
     return True
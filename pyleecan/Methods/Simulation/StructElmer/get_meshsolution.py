@@ -52,7 +52,7 @@ def get_meshsolution(self, output):
     }
 
     ElmerVtu.label = "Elmer Structural"
-    ElmerVtu.file_path = join(fea_path, "Results", "case_t0001.vtu")
+    ElmerVtu.file_path = join(fea_path, "Results", "case_t*.vtu")
 
     output.struct.meshsolution = ElmerVtu.build_meshsolution()
 
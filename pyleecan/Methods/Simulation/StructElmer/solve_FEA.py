@@ -19,5 +19,4 @@ def solve_FEA(self, output):
 
     logger = self.get_logger()
 
-    for info in _execute("ElmerSolver", cwd, logger):
-        print(info, end="")
+    _execute("ElmerSolver", cwd, logger)
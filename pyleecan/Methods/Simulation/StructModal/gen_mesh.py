@@ -0,0 +1,48 @@
+# -*- coding: utf-8 -*-
+from os.path import join
+
+from ....Functions.GMSH.draw_GMSH import draw_GMSH
+from ....Methods.Simulation.StructElmer import (
+    boundary_prop,
+    boundary_list,
+    surface_label,
+)
+from ....Methods.Simulation.StructPlaneStress.gen_mesh import _read_mesh
+
+
+def gen_mesh(self, output):
+    """Generate and load the GMSH mesh of the whole stator lamination
+
+    Parameters
+    ----------
+    self : StructModal
+        a StructModal object
+    output : Output
+        Output object that contains the simulation
+
+    Returns
+    -------
+    mesh_dict : dict
+        mesh dict (cf StructPlaneStress.gen_mesh)
+    """
+    # get the save path and file names
+    save_dir = self.get_path_save_fea(output)
+    file_msh = join(save_dir, "GMSH_Stator_Model.msh")
+
+    # the whole stator is needed to get all the circumferential orders
+    draw_GMSH(
+        output=output,
+        sym=1,
+        boundary_prop=boundary_prop,
+        boundary_list=boundary_list,
+        surface_label=surface_label,
+        is_lam_only_S=True,
+        kmesh_fineness=self.Kmesh_fineness,
+        user_mesh_dict=self.FEA_dict_enforced,
+        path_save=file_msh,
+        is_set_labels=True,
+        transform_list=self.transform_list,
+    )
+
+    # TODO add the winding mass
+    return _read_mesh(file_msh, "Lamination")
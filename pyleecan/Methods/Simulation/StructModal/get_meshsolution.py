@@ -0,0 +1,53 @@
+# -*- coding: utf-8 -*-
+from numpy import arange
+
+from ....Classes.Mode import Mode
+from ....Functions.Structural.comp_order_circ import comp_order_circ
+from ....Methods.Simulation.StructPlaneStress.get_meshsolution import _build_mesh
+from ....Functions.MeshSolution.build_meshsolution import build_meshsolution
+
+
+def get_meshsolution(self, output, mesh_dict, freqs, shapes):
+    """Build the MeshSolution with one Mode object per mode (with its
+    circumferential order) and store it in output.struct.meshsolution
+
+    Parameters
+    ----------
+    self : StructModal
+        a StructModal object
+    output : Output
+        Output object that contains the simulation
+    mesh_dict : dict
+        mesh dict (cf StructPlaneStress.gen_mesh)
+    freqs : ndarray
+        natural frequencies (Nmode) [Hz]
+    shapes : ndarray
+        mass normalized mode shapes (Nmode x Nn x 2)
+    """
+    nodes = mesh_dict["node"]
+    mesh, group = _build_mesh(mesh_dict, label="Modal")
+
+    # circumferential order on the outer radius of the stator
+    order_circ = comp_order_circ(nodes, shapes)
+
+    mode_list = list()
+    for ii in range(freqs.size):
+        mode_list.append(
+            Mode(
+                nat_freq=freqs[ii],
+                order_circ=int(order_circ[ii]),
+                order_long=0,  # 2D model
+                field=shapes[ii],
+                indice=arange(nodes.shape[0]),
+                axis_name=["indice", "comp"],
+                axis_size=[nodes.shape[0], 2],
+                type_cell="node",
+                label="mode_" + str(ii),
+            )
+        )
+
+    output.struct.meshsolution = build_meshsolution(
+        list_solution=mode_list, list_mesh=[mesh], label="Modal", group=group
+    )
+
+    return True
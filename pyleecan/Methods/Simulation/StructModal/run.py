@@ -0,0 +1,28 @@
+# -*- coding: utf-8 -*-
+
+from ....Methods.Simulation.Input import InputError
+
+
+def run(self):
+    """Run the Structural module"""
+    if self.parent is None:
+        raise InputError(
+            "ERROR: The Structural object must be in a Simulation object to run"
+        )
+    if self.parent.parent is None:
+        raise InputError(
+            "ERROR: The Simulation object must be in an Output object to run"
+        )
+
+    output = self.parent.parent
+
+    self.comp_axes(output)
+
+    # setup the mesh
+    mesh_dict = self.gen_mesh(output)
+
+    # Compute the natural frequencies and mode shapes
+    freqs, shapes = self.solve_FEA(output, mesh_dict)
+
+    # Post processing
+    self.get_meshsolution(output, mesh_dict, freqs, shapes)
@@ -0,0 +1,50 @@
+# -*- coding: utf-8 -*-
+
+from ....Functions.Structural.comp_modes import comp_modes
+from ....Functions.Structural.modal_factorization import ModalFactorization
+
+
+def solve_FEA(self, output, mesh_dict):
+    """Compute the lowest natural frequencies and mode shapes of the stator
+    (shift-invert sparse solver, factorization stored in self.factorization
+    and reused when only the scale of the materials changes)
+
+    Parameters
+    ----------
+    self : StructModal
+        a StructModal object
+    output : Output
+        Output object that contains the simulation
+    mesh_dict : dict
+        mesh dict (cf StructPlaneStress.gen_mesh)
+
+    Returns
+    -------
+    freqs : ndarray
+        natural frequencies (Nmode) [Hz]
+    shapes : ndarray
+        mass normalized mode shapes (Nmode x Nn x 2)
+    """
+    logger = self.get_logger()
+
+    mat = output.simu.machine.stator.mat_type.struct
+    # TODO check anisotropy
+    E = {key: mat.Ex for key in mesh_dict["cell"]}
+    nu = {key: mat.nu_xy for key in mesh_dict["cell"]}
+    rho = {key: mat.rho for key in mesh_dict["cell"]}
+
+    if self.factorization is None:
+        self.factorization = ModalFactorization()
+    freqs, shapes = comp_modes(
+        mesh_dict["node"],
+        mesh_dict["cell"],
+        E,
+        nu,
+        rho,
+        Nmode=self.Nmode,
+        freq_min=self.freq_min,
+        factorization=self.factorization,
+    )
+    logger.info("StructModal: " + str(freqs.size) + " modes computed")
+
+    return freqs, shapes
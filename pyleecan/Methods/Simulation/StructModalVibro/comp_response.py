@@ -0,0 +1,100 @@
+# -*- coding: utf-8 -*-
+from numpy import array, pi, sum as np_sum, abs as np_abs
+from SciDataTool import DataFreq, Data1D
+
+from ....Functions.Structural.comp_modal_response import comp_modal_response
+from ....Methods.Simulation.Input import InputError
+
+
+def comp_response(self, output, mesh_dict, freqs_mode, shapes):
+    """Compute the radial displacement, velocity and acceleration of the stator
+    outer surface and the Equivalent Radiated Power due to the air-gap surface
+    force by modal superposition, for all the speeds of N0_list at once.
+    The force spectrum is computed at the simulation speed and scaled in
+    frequency for the other speeds (constant force amplitude).
+
+    Parameters
+    ----------
+    self : StructModalVibro
+        a StructModalVibro object
+    output : Output
+        Output object that contains the simulation (with output.force.AGSF)
+    mesh_dict : dict
+        mesh dict (cf StructPlaneStress.gen_mesh)
+    freqs_mode : ndarray
+        natural frequencies (Nmode) [Hz]
+    shapes : ndarray
+        mass normalized mode shapes (Nmode x Nn x 2)
+    """
+    logger = self.get_logger()
+
+    if output.force is None or output.force.AGSF is None:
+        raise InputError("ERROR: StructModalVibro requires output.force.AGSF")
+
+    stator = output.simu.machine.stator
+    N0_ref = self.parent.input.N0
+    N0_list = self.N0_list if self.N0_list else [N0_ref]
+    k_freq = array(N0_list, dtype=float) / N0_ref
+
+    # Force spectrum on the stator bore (Nf x Nr)
+    AGSF = output.force.AGSF
+    result = AGSF.get_rphiz_along("freqs", "wavenumber")
+    freqs = result["freqs"]
+    wavenumber = result["wavenumber"]
+    Prad = result["radial"]
+    Ptan = result["tangential"] if "tangential" in AGSF.components else None
+
+    # Radial displacement of the outer surface (Nk x Nf x Nr)
+    Yr = comp_modal_response(
+        mesh_dict["node"],
+        freqs_mode,
+        shapes,
+        freqs,
+        wavenumber,
+        Prad,
+        Ptan=Ptan,
+        Rint=stator.Rint,
+        Rext=stator.Rext,
+        damping=self.damping,
+        k_freq=k_freq,
+    )
+    jw = 2j * pi * k_freq[:, None, None] * freqs[None, :, None]
+    Vr = jw * Yr
+
+    # Equivalent Radiated Power (radiation efficiency of 1), mean square
+    # velocity over the outer surface and over time
+    S = 2 * pi * stator.Rext * stator.L1
+    ERP = self.rho_air * self.c_air * S * np_sum(np_abs(Vr) ** 2, axis=2) / 2
+
+    # Store the results
+    Speed = Data1D(name="speed", unit="rpm", values=array(N0_list, dtype=float))
+    Freqs = Data1D(name="freqs", unit="Hz", values=freqs)
+    Wavenumber = Data1D(name="wavenumber", unit="", values=wavenumber)
+    axes = [Speed, Freqs, Wavenumber]
+    output.struct.Yr = DataFreq(
+        name="Radial displacement", unit="m", symbol="Y_r", axes=axes, values=Yr
+    )
+    output.struct.Vr = DataFreq(
+        name="Radial velocity", unit="m/s", symbol="V_r", axes=axes, values=Vr
+    )
+    output.struct.Ar = DataFreq(
+        name="Radial acceleration",
+        unit="m/s^2",
+        symbol="A_r",
+        axes=axes,
+        values=jw * Vr,
+    )
+    output.struct.ERP = DataFreq(
+        name="Equivalent Radiated Power",
+        unit="W",
+        symbol="ERP",
+        axes=[Speed, Freqs],
+        values=ERP,
+    )
+    logger.info(
+        "StructModalVibro: response computed for "
+        + str(k_freq.size)
+        + " speed(s) with "
+        + str(freqs_mode.size)
+        + " modes"
+    )
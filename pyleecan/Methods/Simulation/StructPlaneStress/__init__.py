@@ -0,0 +1,4 @@
+# -*- coding: utf-8 -*-
+
+# Name of the boundaries with zero normal displacement (symmetry)
+SYM_BOUNDARIES = ["MASTER_ROTOR_BOUNDARY", "SLAVE_ROTOR_BOUNDARY"]
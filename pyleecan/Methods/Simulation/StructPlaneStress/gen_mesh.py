@@ -0,0 +1,149 @@
+# -*- coding: utf-8 -*-
+from os.path import join
+
+from meshio import read
+from numpy import array, concatenate, round as np_round, unique
+
+from ....Functions.GMSH.draw_GMSH import draw_GMSH
+from ....Methods.Simulation.StructElmer import (
+    boundary_prop,
+    boundary_list,
+    surface_label,
+)
+from ....Methods.Simulation.StructPlaneStress import SYM_BOUNDARIES
+
+# meshio cell types to plane stress cell types
+CELL_TYPES = {"triangle": "triangle", "quad": "quad"}
+
+
+def gen_mesh(self, output):
+    """Generate the GMSH mesh of the rotor lamination (and magnets) and load it
+
+    Parameters
+    ----------
+    self : StructPlaneStress
+        a StructPlaneStress object
+    output : Output
+        Output object that contains the simulation
+
+    Returns
+    -------
+    mesh_dict : dict
+        "node": nodes coordinates (Nn x 2), "cell": dict of connectivity with key
+        the cell type, "body": dict of the body name of each cell ("Lamination"
+        or "Magnets") with key the cell type, "boundary": dict of the nodes
+        indices with key the boundary name
+    """
+    # readability
+    machine = output.simu.machine
+    _, _, sym_r, is_antipert_r = machine.comp_periodicity()
+
+    sym_r = sym_r * (1 + is_antipert_r)
+
+    # get the save path and file names
+    save_dir = self.get_path_save_fea(output)
+
+    # draw initial gmsh model
+    file_gmsh_geo = join(save_dir, "GMSH_Machine_Model.geo")
+
+    draw_GMSH(
+        output=output,
+        sym=sym_r,
+        boundary_prop=boundary_prop,
+        boundary_list=boundary_list,
+        surface_label=surface_label,
+        is_lam_only_S=False,
+        is_lam_only_R=False,
+        is_sliding_band=False,
+        user_mesh_dict=self.FEA_dict_enforced,
+        path_save=file_gmsh_geo,
+        is_set_labels=True,
+    )
+
+    # preprocess GMSH model to get rotor lamination and magnet
+    file_list = [("Lamination", join(save_dir, "lamination.msh"), True)]
+    if self.include_magnets:
+        file_list.append(("Magnets", join(save_dir, "magnets.msh"), False))
+
+    for _, file_msh, is_lam in file_list:
+        self.process_mesh(
+            file_gmsh_geo,
+            file_msh,
+            is_get_lam=is_lam,
+            is_get_magnet=not is_lam,
+        )
+
+    # load and merge the meshes (the magnets are bonded to the lamination)
+    return _merge_mesh([_read_mesh(file_msh, body) for body, file_msh, _ in file_list])
+
+
+def _read_mesh(file_path, body):
+    """Read a GMSH mesh file and return the mesh dict (see gen_mesh)"""
+    mesh = read(file_path)
+
+    # name of the physical groups
+    tag_dict = {int(val[0]): name for name, val in mesh.field_data.items()}
+    phys_list = mesh.cell_data.get("gmsh:physical", [None] * len(mesh.cells))
+
+    mesh_dict = {
+        "node": mesh.points[:, :2],
+        "cell": dict(),
+        "body": dict(),
+        "boundary": dict(),
+    }
+    for cell_block, phys in zip(mesh.cells, phys_list):
+        if cell_block.type in CELL_TYPES:
+            key = CELL_TYPES[cell_block.type]
+            connect = cell_block.data
+            if key in mesh_dict["cell"]:
+                connect = concatenate((mesh_dict["cell"][key], connect))
+            mesh_dict["cell"][key] = connect
+            mesh_dict["body"][key] = array([body] * connect.shape[0])
+        elif cell_block.type == "line" and phys is not None:
+            for tag in unique(phys):
+                name = tag_dict.get(int(tag), "")
+                if name in SYM_BOUNDARIES:
+                    nodes = unique(cell_block.data[phys == tag])
+                    if name in mesh_dict["boundary"]:
+                        nodes = unique(
+                            concatenate((mesh_dict["boundary"][name], nodes))
+                        )
+                    mesh_dict["boundary"][name] = nodes
+
+    return mesh_dict
+
+
+def _merge_mesh(mesh_list, decimals=9):
+    """Merge several mesh dict (see gen_mesh), the nodes at the same position are
+    merged"""
+    # unique nodes
+    node_all = concatenate([mesh_dict["node"] for mesh_dict in mesh_list])
+    _, index, inverse = unique(
+        np_round(node_all, decimals), axis=0, return_index=True, return_inverse=True
+    )
+    inverse = inverse.ravel()
+    offset = 0
+    merged = {
+        "node": node_all[index],
+        "cell": dict(),
+        "body": dict(),
+        "boundary": dict(),
+    }
+    for mesh_dict in mesh_list:
+        renum = inverse[offset : offset + mesh_dict["node"].shape[0]]
+        offset += mesh_dict["node"].shape[0]
+        for key, connect in mesh_dict["cell"].items():
+            connect = renum[connect]
+            body = mesh_dict["body"][key]
+            if key in merged["cell"]:
+                connect = concatenate((merged["cell"][key], connect))
+                body = concatenate((merged["body"][key], body))
+            merged["cell"][key] = connect
+            merged["body"][key] = body
+        for name, nodes in mesh_dict["boundary"].items():
+            nodes = renum[nodes]
+            if name in merged["boundary"]:
+                nodes = concatenate((merged["boundary"][name], nodes))
+            merged["boundary"][name] = unique(nodes)
+
+    return merged
@@ -0,0 +1,109 @@
+# -*- coding: utf-8 -*-
+from numpy import arange, array, concatenate, where
+
+from SciDataTool import Data1D, DataTime
+
+from ....Classes.CellMat import CellMat
+from ....Classes.MeshMat import MeshMat
+from ....Classes.NodeMat import NodeMat
+from ....Classes.RefQuad4 import RefQuad4
+from ....Classes.RefTriangle3 import RefTriangle3
+from ....Classes.SolutionData import SolutionData
+from ....Functions.MeshSolution.build_meshsolution import build_meshsolution
+from ....Functions.MeshSolution.build_solution_vector import build_solution_vector
+
+
+def get_meshsolution(self, output, mesh_dict, U, VM):
+    """Build the MeshSolution with the displacement and the von Mises stress of
+    each speed and store it in output.struct.meshsolution
+
+    Parameters
+    ----------
+    self : StructPlaneStress
+        a StructPlaneStress object
+    output : Output
+        Output object that contains the simulation
+    mesh_dict : dict
+        mesh dict (cf gen_mesh)
+    U : ndarray
+        displacements (Nspeed x Nn x 2) [m]
+    VM : ndarray
+        nodal von Mises stress (Nspeed x Nn) [Pa]
+    """
+    # logger
+    logger = self.get_logger()
+
+    # if meshsolution is not requested set meshsolution to None
+    if not self.is_get_mesh:
+        logger.info("StructPlaneStress: MeshSolution is not stored by request.")
+        output.struct.meshsolution = None
+        return False
+
+    nodes = mesh_dict["node"]
+
+    mesh, group = _build_mesh(mesh_dict, label="Plane stress")
+
+    # setup the solutions
+    N0_list = self.N0_list if self.N0_list else [self.parent.input.N0]
+    Speed = Data1D(name="speed", unit="rpm", values=array(N0_list, dtype=float))
+    Indices = Data1D(name="indice", values=arange(nodes.shape[0]), is_components=True)
+
+    disp = build_solution_vector(
+        field=U,
+        axis_list=[Speed, Indices],
+        name="Displacement",
+        symbol="disp",
+        unit="m",
+    )
+    disp.type_cell = "node"
+
+    vonmises = SolutionData(
+        field=DataTime(
+            name="Von Mises Stress",
+            unit="Pa",
+            symbol="vonmises",
+            axes=[Speed, Indices],
+            values=VM,
+        ),
+        type_cell="node",
+        label="vonmises",
+    )
+
+    output.struct.meshsolution = build_meshsolution(
+        list_solution=[disp, vonmises],
+        list_mesh=[mesh],
+        label="Plane stress",
+        group=group,
+    )
+
+    return True
+
+
+def _build_mesh(mesh_dict, label=""):
+    """Return the MeshMat and the dict of cell indices of each body of a mesh
+    dict (cf gen_mesh), the cells are numbered in the order of mesh_dict["cell"]"""
+    nodes = mesh_dict["node"]
+    mesh = MeshMat(label=label)
+    mesh.node = NodeMat(
+        coordinate=nodes, nb_node=nodes.shape[0], indice=arange(nodes.shape[0])
+    )
+    group = dict()
+    offset = 0
+    for key, connect in mesh_dict["cell"].items():
+        Ne = connect.shape[0]
+        mesh.cell[key] = CellMat(
+            connectivity=connect,
+            nb_cell=Ne,
+            nb_node_per_cell=connect.shape[1],
+            indice=offset + arange(Ne),
+        )
+        if key == "triangle":
+            mesh.cell[key].interpolation.ref_cell = RefTriangle3(epsilon=1e-9)
+        elif key == "quad":
+            mesh.cell[key].interpolation.ref_cell = RefQuad4()
+        for name in set(mesh_dict["body"][key]):
+            ind = offset + where(mesh_dict["body"][key] == name)[0]
+            group[name] = concatenate((group.get(name, array([], dtype=int)), ind))
+        offset += Ne
+
+    return mesh, {name: ind.tolist() for name, ind in group.items()}
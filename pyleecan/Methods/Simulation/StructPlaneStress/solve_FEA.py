@@ -0,0 +1,141 @@
+# -*- coding: utf-8 -*-
+
+from numpy import (
+    arange,
+    arctan2,
+    array,
+    concatenate,
+    cos,
+    isin,
+    ones,
+    pi,
+    sin,
+    unique,
+    zeros,
+)
+from scipy.sparse import coo_matrix
+from scipy.sparse.linalg import splu
+
+from ....Functions.Structural.assemble_plane_stress import assemble_plane_stress
+from ....Functions.Structural.comp_vonmises_plane_stress import (
+    comp_vonmises_plane_stress,
+)
+from ....Methods.Simulation.StructPlaneStress import SYM_BOUNDARIES
+
+
+def solve_FEA(self, output, mesh_dict):
+    """Assemble the plane stress model, factorize the stiffness matrix once and
+    solve the centrifugal load cases of all the speeds as multiple right-hand sides
+
+    Parameters
+    ----------
+    self : StructPlaneStress
+        a StructPlaneStress object
+    output : Output
+        Output object that contains the simulation
+    mesh_dict : dict
+        mesh dict (cf gen_mesh)
+
+    Returns
+    -------
+    U : ndarray
+        displacements (Nspeed x Nn x 2) [m]
+    VM : ndarray
+        nodal von Mises stress (Nspeed x Nn) [Pa]
+    """
+    logger = self.get_logger()
+
+    # materials of the bodies
+    mat_dict = {"Lamination": output.simu.machine.rotor.mat_type}
+    if self.include_magnets:
+        mat_dict["Magnets"] = output.simu.machine.rotor.hole[0].magnet_0.mat_type
+
+    E, nu, rho = dict(), dict(), dict()
+    for key, body in mesh_dict["body"].items():
+        E[key], nu[key], rho[key] = zeros((3, body.size))
+        for name, mat in mat_dict.items():
+            is_body = body == name
+            E[key][is_body] = mat.struct.Ex
+            nu[key][is_body] = mat.struct.nu_xy
+            rho[key][is_body] = mat.struct.rho
+            # TODO check anisotropy
+
+    nodes = mesh_dict["node"]
+    cells = mesh_dict["cell"]
+    K, _, F = assemble_plane_stress(nodes, cells, E, nu, rho)
+
+    # reduced dofs: unused nodes are removed, normal displacement is zero on the
+    # symmetry boundaries (only the displacement along the boundary remains)
+    T = _comp_reduction_basis(nodes, cells, mesh_dict["boundary"])
+    Kr = (T.T @ K @ T).tocsc()
+
+    # rotation speeds [rad/s]
+    N0_list = self.N0_list if self.N0_list else [self.parent.input.N0]
+    omega = 2 * pi * array(N0_list, dtype=float) / 60
+
+    # single factorization and all speeds at once
+    logger.info(
+        "StructPlaneStress: solving "
+        + str(omega.size)
+        + " speeds with "
+        + str(Kr.shape[0])
+        + " dofs"
+    )
+    lu = splu(Kr)
+    Fr = (T.T @ F)[:, None] * omega[None, :] ** 2
+    Ur = lu.solve(Fr)
+    U = (T @ Ur).T.reshape((omega.size, nodes.shape[0], 2))
+
+    VM = comp_vonmises_plane_stress(nodes, cells, E, nu, U)
+
+    return U, VM
+
+
+def _comp_reduction_basis(nodes, cells, boundary_dict):
+    """Return the sparse matrix T (2*Nn x Nr) such as U = T * Ur with Ur the
+    reduced dofs (unused nodes removed, zero normal displacement on the symmetry
+    boundaries and rigid body motions blocked if the model has no symmetry)"""
+    Nn = nodes.shape[0]
+    used = unique(concatenate([connect.ravel() for connect in cells.values()]))
+
+    # nodes on the symmetry boundaries (radial lines)
+    sym_nodes = list()
+    for name in SYM_BOUNDARIES:
+        if name in boundary_dict:
+            sym_nodes.extend(boundary_dict[name])
+    sym_nodes = array(sym_nodes, dtype=int)
+
+    if sym_nodes.size == 0:
+        # full model: block the rigid body motions with radial sliding supports
+        # on the nodes with extreme x and y values
+        sym_nodes = used[
+            [
+                nodes[used, 0].argmax(),
+                nodes[used, 0].argmin(),
+                nodes[used, 1].argmax(),
+            ]
+        ]
+
+    angle = arctan2(nodes[sym_nodes, 1], nodes[sym_nodes, 0])
+    is_sym = isin(used, sym_nodes)
+    free_nodes = used[~is_sym]
+
+    rows, cols, vals = list(), list(), list()
+    # 2 free dofs for the free nodes
+    Nf = free_nodes.size
+    rows.extend([2 * free_nodes, 2 * free_nodes + 1])
+    cols.extend([2 * arange(Nf), 2 * arange(Nf) + 1])
+    vals.extend([ones(Nf), ones(Nf)])
+    # 1 radial dof (along the boundary line) for the nodes on the symmetry boundaries
+    sym_nodes, index = unique(sym_nodes, return_index=True)
+    angle = angle[index]
+    Ns = sym_nodes.size
+    col = 2 * Nf + arange(Ns)
+    rows.extend([2 * sym_nodes, 2 * sym_nodes + 1])
+    cols.extend([col, col])
+    vals.extend([cos(angle), sin(angle)])
+
+    return coo_matrix(
+        (concatenate(vals), (concatenate(rows), concatenate(cols))),
+        shape=(2 * Nn, 2 * Nf + Ns),
+    ).tocsr()
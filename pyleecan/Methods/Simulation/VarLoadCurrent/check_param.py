@@ -1,2 +1,20 @@
+from ....Methods.Simulation.VarSimu.check_param import VarSimuError
+
+
 def check_param(self):
     super(type(self), self).check_param()
+
+    # Adaptive sampling
+    if len(self.adapt_symbol_list) > 0:
+        if self.path_store is not None:
+            raise VarSimuError(
+                "Adaptive sampling of VarLoadCurrent is not available with path_store"
+            )
+        if self.is_torque or self.is_power:
+            raise VarSimuError(
+                "Adaptive sampling of VarLoadCurrent is not available with is_torque or is_power (unknown for the added operating points)"
+            )
+        if self.adapt_limit_symbol is not None and self.adapt_limit_value is None:
+            raise VarSimuError(
+                "VarLoadCurrent.adapt_limit_value must be set with adapt_limit_symbol"
+            )
@@ -0,0 +1,92 @@
+from numpy import array, concatenate, full, isnan, nan
+from scipy.spatial import QhullError
+
+from ....Functions.Simulation.VarLoad.comp_refined_OP import comp_refined_OP
+from ....Methods.Simulation.VarSimu.check_param import VarSimuError
+
+
+def generate_refined_simulation_list(self, ref_simu, xoutput):
+    """Adaptive sampling: generate the simulations of the operating points to
+    add where the piecewise linear interpolant of the results of the computed
+    operating points is not accurate enough (variation above adapt_tol or
+    boundary of the limit). The operating points are added to OP_matrix and
+    the XOutput is extended accordingly
+
+    Parameters
+    ----------
+    self : VarLoadCurrent
+        A VarLoadCurrent object
+    ref_simu : Simulation
+        Reference simulation to copy / update
+    xoutput : XOutput
+        XOutput with the results of the computed simulations (to update)
+
+    Returns
+    -------
+    simulation_list : [Simulation]
+        simulations to compute (empty when the refinement is done)
+    """
+    if len(self.adapt_symbol_list) == 0 or self.nb_simu >= self.adapt_nb_simu_max:
+        return list()
+
+    # Results of the computed operating points (the ones in error are ignored)
+    symbol_list = list(self.adapt_symbol_list)
+    if self.adapt_limit_symbol is not None:
+        symbol_list.append(self.adapt_limit_symbol)
+    for symbol in symbol_list:
+        if symbol not in xoutput.xoutput_dict:
+            raise VarSimuError(
+                "Adaptive sampling: no DataKeeper with the symbol " + symbol
+            )
+    value = array(
+        [
+            [nan if result is None else result for result in xoutput[symbol].result]
+            for symbol in symbol_list
+        ],
+        dtype=float,
+    ).T
+    is_valid = ~isnan(value).any(axis=1)
+    nb_symbol = len(self.adapt_symbol_list)
+
+    logger = self.get_logger()
+    try:
+        OP_new = comp_refined_OP(
+            OP=self.OP_matrix[is_valid, :3],
+            value=value[is_valid, :nb_symbol],
+            tol=self.adapt_tol,
+            nb_max=min(self.adapt_batch_size, self.adapt_nb_simu_max - self.nb_simu),
+            limit=None if self.adapt_limit_symbol is None else value[is_valid, -1],
+            limit_value=self.adapt_limit_value,
+        )
+    except QhullError as error:  # Degenerated operating points
+        logger.warning(
+            self.NAME + ": adaptive sampling stopped, " + str(error).split("\n")[0]
+        )
+        return list()
+    if OP_new.shape[0] == 0:
+        return list()
+
+    logger.info(
+        self.NAME
+        + ": adding "
+        + str(OP_new.shape[0])
+        + " operating points to refine the results"
+    )
+
+    # Torque/Power of the new operating points are unknown
+    OP_add = full((OP_new.shape[0], self.OP_matrix.shape[1]), nan)
+    OP_add[:, :3] = OP_new
+    self.OP_matrix = concatenate((self.OP_matrix, OP_add), axis=0)
+    simu_dict = self.generate_simulation_list(ref_simu, OP_matrix=OP_add)
+
+    # Extend the XOutput for the new simulations
+    nb_add = OP_add.shape[0]
+    xoutput.paramexplorer_list[0].value.extend(simu_dict["paramexplorer_list"][0].value)
+    for keeper in xoutput.xoutput_dict.values():
+        keeper.result.extend([None] * nb_add)
+    if self.is_keep_all_output:
+        xoutput.output_list.extend([None] * nb_add)
+    self.nb_simu += nb_add
+    xoutput.nb_simu = self.nb_simu
+
+    return simu_dict["simulation_list"]
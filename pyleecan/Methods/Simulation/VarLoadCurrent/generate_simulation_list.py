@@ -3,7 +3,7 @@ import numpy as np
 from ....Classes.ParamExplorerSet import ParamExplorerSet
 
 
-def generate_simulation_list(self, ref_simu=None):
+def generate_simulation_list(self, ref_simu=None, OP_matrix=None):
     """Generate all the simulation for the multi-simulation
 
     Parameters
@@ -12,6 +12,8 @@ def generate_simulation_list(self, ref_simu=None):
         A VarSimu object
     ref_simu : Simulation
         Reference simulation to copy / update
+    OP_matrix : ndarray
+        Operating points of the simulations (self.OP_matrix if None)
 
     Returns
     -------
@@ -20,13 +22,19 @@ def generate_simulation_list(self, ref_simu=None):
     """
 
     # Get InputCurrent list
-    list_input = self.get_input_list()
+    list_input = self.get_input_list(OP_matrix)
 
     multisim_dict = {
         "paramexplorer_list": [],  # Setter's values
         "simulation_list": [],
     }
 
+    # The load doesn't modify the machine: it is shared with all the simulations
+    # (read-only) instead of being copied (cf set_reused_data)
+    machine = ref_simu.machine
+    if self.is_reuse_machine:
+        ref_simu.machine = None
+
     # Create Simulations 1 per load
     for input_obj in list_input:
         # Generate the simulation
@@ -34,9 +42,13 @@ def generate_simulation_list(self, ref_simu=None):
 
         # Edit simulation
         new_simu.input = input_obj
+        if self.is_reuse_machine:
+            new_simu.machine = machine
         # Add simulation to the list
         multisim_dict["simulation_list"].append(new_simu)
 
+    ref_simu.machine = machine
+
     # Create ParamExplorerSet
     #   This version uses a single ParamExplorerSet to define the simulation
     #   Other parameters can be stored in a dedicated ParamExplorerSet if needed
@@ -0,0 +1,19 @@
+def generate_refined_simulation_list(self, ref_simu, xoutput):
+    """Generate the simulations to add to the multi-simulation once the
+    simulation list is computed (to refine the results)
+
+    Parameters
+    ----------
+    self : VarSimu
+        A VarSimu object
+    ref_simu : Simulation
+        Reference simulation to copy / update
+    xoutput : XOutput
+        XOutput with the results of the computed simulations (to update)
+
+    Returns
+    -------
+    simulation_list : [Simulation]
+        simulations to compute (none by default)
+    """
+    return list()
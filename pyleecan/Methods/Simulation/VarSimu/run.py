@@ -5,6 +5,13 @@ from ....Functions.Simulation.VarSimu.log_datakeeper_step_result import (
     log_datakeeper_step_result,
 )
 from ....Functions.Load.import_class import import_class
+from ....Functions.FEMM.handler_pool import close_handler_pool
+from ....Functions.Simulation.profile_stage import init_profile, append_profile
+from ....Functions.Simulation.VarSimu.result_store import (
+    init_store,
+    read_step,
+    write_step,
+)
 
 
 def run(self):
@@ -31,6 +38,8 @@ def run(self):
     ref_simu.var_simu = self.var_simu  # var_simu default is None
     ref_simu.index = None
     ref_simu.layer = self.parent.layer + 1
+    ref_simu.geo_enforced = None  # The machine may be modified by the steps
+    ref_simu.reused_stage_list = list()
 
     # Generate simulation list and ParamExplorerValue list
     simu_dict = self.generate_simulation_list(ref_simu)
@@ -62,6 +71,27 @@ def run(self):
         xoutput.xoutput_dict[datakeeper.symbol] = keeper_list[-1]
         keeper_list[-1].result = [None] * self.nb_simu
 
+    # Stream the results of each simulation in a HDF5 store (if requested)
+    # The simulations already in the store are not computed again
+    if self.path_store is not None:
+        xoutput.path_store = self.path_store
+        stored_index_list = init_store(
+            self.path_store, xoutput, keeper_list, is_resume=self.is_resume
+        )
+        if len(stored_index_list) > 0:
+            logger.info(
+                "Resuming "
+                + self.NAME
+                + ": "
+                + str(len(stored_index_list))
+                + "/"
+                + str(self.nb_simu)
+                + " simulations loaded from "
+                + self.path_store
+            )
+    else:
+        stored_index_list = list()
+
     # Run Reference simulation
     if ref_simu.layer == 2:
         logger.info("    Computing reference simulation for " + self.NAME)
@@ -83,6 +113,8 @@ def run(self):
         post_keeper_postproc_list=self.post_keeper_postproc_list,
         simu_type=self.NAME,
     )
+    if self.path_store is not None:
+        write_step(self.path_store, None, keeper_list)
     # Save reference xoutput (if requested)
     if self.is_keep_all_output:
         if ref_simu_index is None:
@@ -101,56 +133,104 @@ def run(self):
     for key, value in ref_out_dict.items():
         setattr(xoutput, key, value)
 
-    # Reuse some intermediate results from reference simulation (if requested)
-    for ii, simu in enumerate(simulation_list):
-        # Log only for first simulation
-        self.set_reused_data(
-            simu,
-            xoutput_ref,
-            is_log=ii == 0,
-            simu_type=self.NAME,
-        )
+    # Time and memory of each stage of all the simulations (reference first)
+    if ref_simu.is_profile:
+        xoutput.profile = init_profile()
+        if xoutput_ref.profile is not None:
+            append_profile(xoutput.profile, xoutput_ref.profile)
 
-    # Update the postprocessing list if needed
-    if self.pre_keeper_postproc_list is not None:
-        # Different post between simu list and ref simu
-        for simu in simulation_list:
-            simu.postproc_list = self.pre_keeper_postproc_list
-
-    # Execute the simulation list
-    for idx, simu_step in enumerate(simulation_list):
-        # Display simulation progress
-        log_step_simu(
-            idx, self.nb_simu, xoutput.paramexplorer_list, logger, simu_step.layer
-        )
-        simu_step.index = idx
-        if idx != ref_simu_index:
-            # Run the simulation & call DataKeeper and post-proc handling errors
-            xoutput_step = run_multisim_step(
-                simu_step,
-                keeper_list,  # datakeeper.result will be updated (if needed)
-                self.stop_if_error,
-                post_keeper_postproc_list=self.post_keeper_postproc_list,
+    # Execute the simulation list, then the simulations added to refine the
+    # results (adaptive sampling, if any)
+    idx_start = 0  # Index of the first simulation of the list
+    while len(simulation_list) > 0:
+        # Reuse some intermediate results from reference simulation (if requested)
+        for ii, simu in enumerate(simulation_list):
+            # Log only for first simulation
+            self.set_reused_data(
+                simu,
+                xoutput_ref,
+                is_log=idx_start + ii == 0,
                 simu_type=self.NAME,
             )
-            if self.is_keep_all_output:
-                xoutput.output_list[idx] = xoutput_step
-        else:
-            if simu_step.layer == 2:
-                logger.info(
-                    "    Simulation matches reference one: Skipping computation"
+
+        # Update the postprocessing list if needed
+        if self.pre_keeper_postproc_list is not None:
+            # Different post between simu list and ref simu
+            for simu in simulation_list:
+                simu.postproc_list = self.pre_keeper_postproc_list
+
+        for idx, simu_step in enumerate(simulation_list, start=idx_start):
+            # Display simulation progress
+            log_step_simu(
+                idx, self.nb_simu, xoutput.paramexplorer_list, logger, simu_step.layer
+            )
+            simu_step.index = idx
+            if idx in stored_index_list:
+                logger.info("Simulation already in the store: Skipping computation")
+                # Load the results from the store (the Output is loaded on demand)
+                result_dict = read_step(self.path_store, idx)
+                for keeper in keeper_list:
+                    keeper.result[idx] = result_dict.get(keeper.symbol, None)
+                if self.is_keep_all_output and idx == ref_simu_index:
+                    xoutput.output_list[idx] = xoutput_ref
+                log_datakeeper_step_result(simu_step, keeper_list, idx, self.NAME)
+            elif idx != ref_simu_index:
+                # Reuse the results of the first stages with unchanged inputs
+                if self.is_incremental:
+                    self.set_reused_output(simu_step, xoutput_ref)
+                # Run the simulation & call DataKeeper and post-proc handling errors
+                xoutput_step = run_multisim_step(
+                    simu_step,
+                    keeper_list,  # datakeeper.result will be updated (if needed)
+                    self.stop_if_error,
+                    post_keeper_postproc_list=self.post_keeper_postproc_list,
+                    simu_type=self.NAME,
                 )
+                if self.path_store is not None:
+                    # The Output is kept in the store only (loaded on demand)
+                    write_step(
+                        self.path_store,
+                        idx,
+                        keeper_list,
+                        output=xoutput_step if self.is_keep_all_output else None,
+                    )
+                elif self.is_keep_all_output:
+                    xoutput.output_list[idx] = xoutput_step
+                if (
+                    simu_step.is_profile
+                    and xoutput_step is not None
+                    and xoutput_step.profile is not None
+                ):
+                    append_profile(xoutput.profile, xoutput_step.profile)
             else:
-                logger.info("Simulation matches reference one: Skipping computation")
-            # Copy results from reference
-            for keeper in keeper_list:
-                keeper.result[idx] = keeper.result_ref
-            if self.is_keep_all_output:
-                xoutput.output_list[idx] = xoutput_ref
-            # Print DataKeeper content
-            log_datakeeper_step_result(simu_step, keeper_list, idx, self.NAME)
-        progress += 1
-        print_progress_bar(nb_simu, progress, simu_step.layer)
+                if simu_step.layer == 2:
+                    logger.info(
+                        "    Simulation matches reference one: Skipping computation"
+                    )
+                else:
+                    logger.info(
+                        "Simulation matches reference one: Skipping computation"
+                    )
+                # Copy results from reference
+                for keeper in keeper_list:
+                    keeper.result[idx] = keeper.result_ref
+                if self.is_keep_all_output:
+                    xoutput.output_list[idx] = xoutput_ref
+                if self.path_store is not None:
+                    write_step(self.path_store, idx, keeper_list)
+                # Print DataKeeper content
+                log_datakeeper_step_result(simu_step, keeper_list, idx, self.NAME)
+            progress += 1
+            print_progress_bar(nb_simu, progress, simu_step.layer)
+
+        # Simulations to add (adaptive sampling)
+        idx_start = self.nb_simu
+        simulation_list = self.generate_refined_simulation_list(ref_simu, xoutput)
+        nb_simu = self.nb_simu + 1  # Count reference simulation in progress bar
+
+    # Close the FEMM instances kept open for the simulation steps (if any)
+    if self.parent.layer == 0:
+        close_handler_pool()
 
     # Running postprocessings
     if self.postproc_list:
@@ -36,3 +36,29 @@ def set_reused_data(self, simu, output, is_log=True, simu_type="VarSimu"):
             )
         simu.mag.import_file = output.mag.internal.FEMM_dict["path_save"]
         simu.mag.FEMM_dict_enforced = output.mag.internal.FEMM_dict
+
+    if self.is_reuse_machine and simu.machine is not None:
+        machine_ref = output.simu.machine
+        # Winding properties computed (and stored) during the reference simulation
+        ignore_list = [
+            "machine." + lam + ".winding." + prop
+            for lam in ["stator", "rotor"]
+            for prop in ["wind_mat", "per_a", "is_aper_a"]
+        ]
+        if simu.machine is machine_ref or (
+            len(simu.machine.compare(machine_ref, "machine", ignore_list)) == 0
+        ):
+            if is_log:
+                self.get_logger().info(
+                    TAB
+                    + simu_type
+                    + ": Sharing the machine and geometry of the reference "
+                    + "simulation (machine not modified)"
+                )
+            # Shared read-only: the step copy is freed and the geometry / winding
+            # matrix of the reference simulation are not computed again (the
+            # geometry is copied in the Output of each simulation)
+            simu.machine = machine_ref
+            machine_ref.parent = output.simu
+            simu.geo_enforced = output.geo
+            output.geo.parent = output
@@ -0,0 +1,81 @@
+# -*- coding: utf-8 -*-
+
+from ....Functions.Load.import_class import import_class
+
+# Stages of the simulation (in order) with their Simulation/Output property
+STAGE_LIST = [
+    ("Electrical", "elec"),
+    ("Magnetics", "mag"),
+    ("Force", "force"),
+    ("Structural", "struct"),
+    ("Loss", "loss"),
+]
+
+# Simulation properties without effect on the results of the stages
+# (or set by the multi-simulation to reuse some data)
+IGNORE_LIST = [
+    "simu.name",
+    "simu.desc",
+    "simu.logger_name",
+    "simu.index",
+    "simu.path_result",
+    "simu.layer_log_warn",
+    "simu.is_profile",
+    "simu.postproc_list",
+    "simu.geo_enforced",
+    "simu.reused_stage_list",
+    "simu.mag.import_file",
+    "simu.mag.FEMM_dict_enforced",
+]
+
+
+def _is_in(diff, name):
+    """True if the difference is on the property name (or one of its own)"""
+    return diff == name or diff.startswith(name + ".") or diff.startswith(name + " ")
+
+
+def set_reused_output(self, simu, output):
+    """Compute the differences between a simulation and the reference one to
+    reuse the results of the reference simulation for the first stages whose
+    inputs are unchanged (the following stages are computed)
+
+    Parameters
+    ----------
+    self : VarSimu
+        a VarSimu object
+    simu : Simulation
+        The simulation to update (before running it)
+    output : Output
+        Output from the reference simulation
+
+    Returns
+    -------
+    reused_stage_list : list
+        Name of the stages not computed by the simulation
+    """
+    Output = import_class("pyleecan.Classes", "Output")
+
+    if simu.var_simu is not None or simu.machine is not output.simu.machine:
+        return list()  # Nested multi-simulation or modified machine
+
+    # First stage with a different input
+    nb_reused = len(STAGE_LIST)
+    for diff in simu.compare(output.simu, name="simu"):
+        if any(_is_in(diff, name) for name in IGNORE_LIST):
+            continue
+        for ii, (_, prop) in enumerate(STAGE_LIST):
+            if _is_in(diff, "simu." + prop):
+                nb_reused = min(nb_reused, ii)
+                break
+        else:  # Machine, input...
+            return list()
+    if nb_reused == 0:
+        return list()
+
+    # The results of the reused stages are copied in the Output of the simulation
+    output_simu = Output(simu=simu)  # simu.parent is set
+    for _, prop in STAGE_LIST[:nb_reused]:
+        value = getattr(output, prop)
+        setattr(output_simu, prop, None if value is None else value.copy())
+    simu.reused_stage_list = [stage for stage, _ in STAGE_LIST[:nb_reused]]
+    return simu.reused_stage_list
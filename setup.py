@@ -49,7 +49,6 @@ install_requires = [
     "h5py>=3.2.1",
     "nbformat",
     "nbconvert",
-    "quadpy",
     "ezdxf>=0.14.2",
     "pytest-qt>=3.3.0",
     "pyuff>=1.25",